@@ -1,83 +1,222 @@
-from mapping_suite_sdk.adapters.extractor import (ArchivePackageExtractor,
-                                                  GithubPackageExtractor
-                                                  )
-from mapping_suite_sdk.adapters.loader import (TechnicalMappingSuiteLoader,
-                                               VocabularyMappingSuiteLoader,
-                                               TestDataSuitesLoader,
-                                               SPARQLTestSuitesLoader,
-                                               SHACLTestSuitesLoader,
-                                               MappingPackageMetadataLoader,
-                                               MappingPackageIndexLoader,
-                                               TestResultSuiteLoader,
-                                               ConceptualMappingFileLoader,
-                                               MappingPackageLoader
-                                               )
-from mapping_suite_sdk.adapters.repository import (MongoDBRepository,
+"""
+Mapping Suite SDK.
+
+The public API is imported lazily: importing the package is cheap, and each adapter, with
+its dependencies (e.g. GitPython, pymongo or the OpenTelemetry SDK), is only imported when
+one of its names is first accessed.
+"""
+import importlib
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mapping_suite_sdk.adapters.eligibility import (MappingPackageEligibilityIndex,
+                                                        MappingPackageEligibilityTable,
+                                                        MongoDBMappingPackageEligibilityIndex,
+                                                        )
+    from mapping_suite_sdk.adapters.extractor import (ArchivePackageExtractor,
+                                                      GithubPackageExtractor
+                                                      )
+    from mapping_suite_sdk.adapters.load_report import (collect_mssdk_load_report,
+                                                        MappingPackageLoadReport,
+                                                        MappingPackageLoadPhase,
+                                                        )
+    from mapping_suite_sdk.adapters.metrics import (add_metric_reader_to_mssdk_meter_provider,
+                                                    )
+    from mapping_suite_sdk.adapters.mongodb_metrics import MongoDBMetricsListener
+    from mapping_suite_sdk.adapters.loader import (TechnicalMappingSuiteLoader,
+                                                   VocabularyMappingSuiteLoader,
+                                                   TestDataSuitesLoader,
+                                                   SPARQLTestSuitesLoader,
+                                                   SHACLTestSuitesLoader,
+                                                   MappingPackageMetadataLoader,
+                                                   MappingPackageIndexLoader,
+                                                   TestResultSuiteLoader,
+                                                   ConceptualMappingFileLoader,
+                                                   MappingPackageLoader
                                                    )
-from mapping_suite_sdk.adapters.serialiser import (TechnicalMappingSuiteSerialiser,
-                                                   VocabularyMappingSuiteSerialiser,
-                                                   TestDataSuitesSerialiser,
-                                                   SPARQLTestSuitesSerialiser,
-                                                   SHACLTestSuitesSerialiser,
-                                                   MappingPackageMetadataSerialiser,
-                                                   ConceptualMappingFileSerialiser,
-                                                   MappingPackageSerialiser
+    from mapping_suite_sdk.adapters.model_codec import BinaryModelCodec
+    from mapping_suite_sdk.adapters.profiler import (set_mssdk_profiling,
+                                                     get_mssdk_profiling,
+                                                     refresh_mssdk_profiling,
+                                                     )
+    from mapping_suite_sdk.adapters.repository import (MongoDBRepository,
+                                                       AsyncMongoDBRepository,
+                                                       MongoDBMappingPackageRepository,
+                                                       MongoClientRegistry,
+                                                       register_mongodb_indexes,
+                                                       get_mongodb_indexes,
+                                                       get_mssdk_mongo_client_registry,
+                                                       )
+    from mapping_suite_sdk.adapters.filesystem_repository import FileSystemRepository
+    from mapping_suite_sdk.adapters.sqlite_repository import (SQLiteRepository,
+                                                              register_sqlite_indexed_fields,
+                                                              get_sqlite_indexed_fields,
+                                                              )
+    from mapping_suite_sdk.adapters.versioned_repository import (MongoDBVersionedMappingPackageRepository,
+                                                                 MappingPackageRevision,
+                                                                 )
+    from mapping_suite_sdk.adapters.serialiser import (TechnicalMappingSuiteSerialiser,
+                                                       VocabularyMappingSuiteSerialiser,
+                                                       TestDataSuitesSerialiser,
+                                                       SPARQLTestSuitesSerialiser,
+                                                       SHACLTestSuitesSerialiser,
+                                                       MappingPackageMetadataSerialiser,
+                                                       ConceptualMappingFileSerialiser,
+                                                       MappingPackageSerialiser
+                                                       )
+    from mapping_suite_sdk.adapters.tracer import (add_span_processor_to_mssdk_tracer_provider,
+                                                   set_mssdk_tracing,
+                                                   get_mssdk_tracing,
+                                                   refresh_mssdk_tracing,
+                                                   set_mssdk_tracing_sample_ratio,
+                                                   get_mssdk_tracing_sample_ratio,
+                                                   set_mssdk_traced_names,
+                                                   get_mssdk_traced_names,
+                                                   set_mssdk_file_span_threshold,
+                                                   get_mssdk_file_span_threshold,
                                                    )
-from mapping_suite_sdk.adapters.tracer import (add_span_processor_to_mssdk_tracer_provider,
-                                               set_mssdk_tracing,
-                                               get_mssdk_tracing,
-                                               )
-from mapping_suite_sdk.services.load_mapping_package import (load_mapping_package_from_folder,
-                                                             load_mapping_package_from_archive,
-                                                             load_mapping_packages_from_github,
-                                                             load_mapping_package_from_mongo_db
-                                                             )
-from mapping_suite_sdk.services.serialise_mapping_package import (serialise_mapping_package,
+    from mapping_suite_sdk.services.load_mapping_package import (load_mapping_package_from_folder,
+                                                                 load_mapping_package_from_archive,
+                                                                 load_mapping_packages_from_archive,
+                                                                 iter_mapping_packages_from_archive,
+                                                                 load_mapping_package_metadata_from_archive,
+                                                                 load_mapping_packages_from_github,
+                                                                 load_mapping_package_from_mongo_db,
+                                                                 load_mapping_package_from_mongo_db_async
+                                                                 )
+    from mapping_suite_sdk.services.serialise_mapping_package import (serialise_mapping_package,
+                                                                      )
+    from mapping_suite_sdk.services.diff_mapping_packages import (diff_mapping_packages,
                                                                   )
+    from mapping_suite_sdk.services.transfer_mapping_packages import (export_mapping_packages,
+                                                                      import_mapping_packages,
+                                                                      )
 
-__all__ = [
+# Names of the public API, by module
+_MSSDK_API_MODULES: Dict[str, Tuple[str, ...]] = {
     ## Adapters
-    # extractor.py
-    "ArchivePackageExtractor",
-    "GithubPackageExtractor",
+    "mapping_suite_sdk.adapters.eligibility": (
+        "MappingPackageEligibilityIndex",
+        "MappingPackageEligibilityTable",
+        "MongoDBMappingPackageEligibilityIndex",
+    ),
+    "mapping_suite_sdk.adapters.extractor": (
+        "ArchivePackageExtractor",
+        "GithubPackageExtractor",
+    ),
+    "mapping_suite_sdk.adapters.loader": (
+        "TechnicalMappingSuiteLoader",
+        "VocabularyMappingSuiteLoader",
+        "TestDataSuitesLoader",
+        "SPARQLTestSuitesLoader",
+        "SHACLTestSuitesLoader",
+        "MappingPackageMetadataLoader",
+        "MappingPackageIndexLoader",
+        "TestResultSuiteLoader",
+        "ConceptualMappingFileLoader",
+        "MappingPackageLoader",
+    ),
+    "mapping_suite_sdk.adapters.repository": (
+        "MongoDBRepository",
+        "AsyncMongoDBRepository",
+        "MongoDBMappingPackageRepository",
+        "MongoClientRegistry",
+        "register_mongodb_indexes",
+        "get_mongodb_indexes",
+        "get_mssdk_mongo_client_registry",
+    ),
+    "mapping_suite_sdk.adapters.filesystem_repository": (
+        "FileSystemRepository",
+    ),
+    "mapping_suite_sdk.adapters.sqlite_repository": (
+        "SQLiteRepository",
+        "register_sqlite_indexed_fields",
+        "get_sqlite_indexed_fields",
+    ),
+    "mapping_suite_sdk.adapters.versioned_repository": (
+        "MongoDBVersionedMappingPackageRepository",
+        "MappingPackageRevision",
+    ),
+    "mapping_suite_sdk.adapters.serialiser": (
+        "TechnicalMappingSuiteSerialiser",
+        "VocabularyMappingSuiteSerialiser",
+        "TestDataSuitesSerialiser",
+        "SPARQLTestSuitesSerialiser",
+        "SHACLTestSuitesSerialiser",
+        "MappingPackageMetadataSerialiser",
+        "ConceptualMappingFileSerialiser",
+        "MappingPackageSerialiser",
+    ),
+    "mapping_suite_sdk.adapters.load_report": (
+        "collect_mssdk_load_report",
+        "MappingPackageLoadReport",
+        "MappingPackageLoadPhase",
+    ),
+    "mapping_suite_sdk.adapters.metrics": (
+        "add_metric_reader_to_mssdk_meter_provider",
+    ),
+    "mapping_suite_sdk.adapters.mongodb_metrics": (
+        "MongoDBMetricsListener",
+    ),
+    "mapping_suite_sdk.adapters.model_codec": (
+        "BinaryModelCodec",
+    ),
+    "mapping_suite_sdk.adapters.profiler": (
+        "set_mssdk_profiling",
+        "get_mssdk_profiling",
+        "refresh_mssdk_profiling",
+    ),
+    "mapping_suite_sdk.adapters.tracer": (
+        "add_span_processor_to_mssdk_tracer_provider",
+        "set_mssdk_tracing",
+        "get_mssdk_tracing",
+        "refresh_mssdk_tracing",
+        "set_mssdk_tracing_sample_ratio",
+        "get_mssdk_tracing_sample_ratio",
+        "set_mssdk_traced_names",
+        "get_mssdk_traced_names",
+        "set_mssdk_file_span_threshold",
+        "get_mssdk_file_span_threshold",
+    ),
 
-    # loader.py
-    "TechnicalMappingSuiteLoader",
-    "VocabularyMappingSuiteLoader",
-    "TestDataSuitesLoader",
-    "SPARQLTestSuitesLoader",
-    "SHACLTestSuitesLoader",
-    "MappingPackageMetadataLoader",
-    "MappingPackageIndexLoader",
-    "TestResultSuiteLoader",
-    "ConceptualMappingFileLoader",
-    "MappingPackageLoader",
+    ## Services
+    "mapping_suite_sdk.services.load_mapping_package": (
+        "load_mapping_package_from_folder",
+        "load_mapping_package_from_archive",
+        "load_mapping_packages_from_archive",
+        "iter_mapping_packages_from_archive",
+        "load_mapping_package_metadata_from_archive",
+        "load_mapping_packages_from_github",
+        "load_mapping_package_from_mongo_db",
+        "load_mapping_package_from_mongo_db_async",
+    ),
+    "mapping_suite_sdk.services.serialise_mapping_package": (
+        "serialise_mapping_package",
+    ),
+    "mapping_suite_sdk.services.diff_mapping_packages": (
+        "diff_mapping_packages",
+    ),
+    "mapping_suite_sdk.services.transfer_mapping_packages": (
+        "export_mapping_packages",
+        "import_mapping_packages",
+    ),
+}
+_MSSDK_API_NAME_MODULES: Dict[str, str] = {name: module_name
+                                           for module_name, names in _MSSDK_API_MODULES.items()
+                                           for name in names}
 
-    # repository.py
-    "MongoDBRepository",
+__all__ = list(_MSSDK_API_NAME_MODULES)
 
-    # serialiser.py
-    "TechnicalMappingSuiteSerialiser",
-    "VocabularyMappingSuiteSerialiser",
-    "TestDataSuitesSerialiser",
-    "SPARQLTestSuitesSerialiser",
-    "SHACLTestSuitesSerialiser",
-    "MappingPackageMetadataSerialiser",
-    "ConceptualMappingFileSerialiser",
-    "MappingPackageSerialiser",
 
-    # tracer.py
-    "add_span_processor_to_mssdk_tracer_provider",
-    "set_mssdk_tracing",
-    "get_mssdk_tracing",
+def __getattr__(name: str) -> Any:
+    """Import the module of a name of the public API on first access, and cache the name in the package."""
+    module_name = _MSSDK_API_NAME_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-    ## Services
-    # load_mapping_package.py
-    "load_mapping_package_from_folder",
-    "load_mapping_package_from_archive",
-    "load_mapping_packages_from_github",
-    "load_mapping_package_from_mongo_db",
 
-    # serialise_mapping_package.py
-    "serialise_mapping_package",
-]
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
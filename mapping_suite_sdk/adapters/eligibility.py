@@ -0,0 +1,433 @@
+"""
+Eligibility module for the Mapping Suite SDK.
+
+This module provides the selection of the mapping packages applicable to a notice,
+based on the eligibility constraints of the package metadata (eForms subtype,
+eForms SDK version and validity period), for single notices and for batches of notices.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from mapping_suite_sdk.adapters.repository import MongoDBRepository
+from mapping_suite_sdk.adapters.tracer import traced_class
+from mapping_suite_sdk.models.mapping_package import MappingPackage, MappingPackageMetadata
+
+### Keys of the eligibility constraints
+ELIGIBILITY_EFORMS_SUBTYPE_KEY = "eforms_subtype"
+ELIGIBILITY_EFORMS_SDK_VERSIONS_KEY = "eforms_sdk_versions"
+ELIGIBILITY_START_DATE_KEY = "start_date"
+ELIGIBILITY_END_DATE_KEY = "end_date"
+
+# Path of the eligibility constraints within a stored mapping package document
+MONGODB_ELIGIBILITY_CONSTRAINTS_PATH = "metadata.metadata_constraints.constraints"
+
+_EFORMS_SDK_VERSION_PREFIX = "eforms-sdk-"
+
+### Batch matching results
+ELIGIBILITY_NO_MATCH = -1
+ELIGIBILITY_AMBIGUOUS = -2
+
+### Batch matching ambiguity policies
+ELIGIBILITY_AMBIGUITY_MARK = "mark"
+ELIGIBILITY_AMBIGUITY_FIRST = "first"
+
+NoticeDate = Union[date, datetime, str]
+
+
+def normalise_eforms_sdk_version(eforms_sdk_version: str) -> str:
+    """Normalise an eForms SDK version (e.g. "eforms-sdk-1.9" and "1.9" both become "1.9")."""
+    eforms_sdk_version = str(eforms_sdk_version).strip()
+    if eforms_sdk_version.startswith(_EFORMS_SDK_VERSION_PREFIX):
+        return eforms_sdk_version[len(_EFORMS_SDK_VERSION_PREFIX):]
+    return eforms_sdk_version
+
+
+def to_eligibility_date(value: Optional[NoticeDate]) -> Optional[date]:
+    """Convert a date, datetime or ISO 8601 string to a date (None stays None).
+
+    Strings keep the date they are written with, whatever their time and offset. Datetimes with a
+    timezone are converted to UTC first, as MongoDB stores datetimes in UTC.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(str(value)).date()
+
+
+def get_eligibility_constraint_values(metadata: MappingPackageMetadata, key: str) -> List[str]:
+    """Get the values of a list constraint; an empty list means the package is not constrained."""
+    values = metadata.eligibility_constraints.constraints.get(key)
+    if values is None:
+        return []
+    if isinstance(values, (list, tuple, set)):
+        return [str(value) for value in values]
+    return [str(values)]
+
+
+class MappingPackageSelectorABC(ABC):
+    """Abstract base class for the selection of the mapping packages applicable to a notice.
+
+    A package is applicable to a notice when the notice subtype is one of the package
+    eForms subtypes, the notice SDK version is one of the package eForms SDK versions and
+    the notice date is within the package start and end dates. Missing or empty constraints
+    do not restrict the applicability of a package.
+    """
+
+    @abstractmethod
+    def select(self,
+               eforms_subtype: str,
+               eforms_sdk_version: str,
+               notice_date: Optional[NoticeDate] = None) -> List[MappingPackage]:
+        """Select the mapping packages applicable to a notice.
+
+        Args:
+            eforms_subtype: eForms subtype of the notice (e.g. "29")
+            eforms_sdk_version: eForms SDK version of the notice (e.g. "1.9" or "eforms-sdk-1.9")
+            notice_date: Optional date of the notice. If not provided, the validity period is ignored
+
+        Returns:
+            List[MappingPackage]: The applicable mapping packages, possibly empty
+        """
+        raise NotImplementedError
+
+
+class _IntervalTreeNode:
+    """Node of a centered interval tree: the intervals containing its center, and the trees of the others."""
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, intervals: List[Tuple[date, date, int]]):
+        endpoints = sorted(endpoint for start_date, end_date, _ in intervals for endpoint in (start_date, end_date))
+        # The center is an endpoint, so at least one interval contains it and both subtrees are smaller
+        self.center = endpoints[len(endpoints) // 2]
+        centered = [interval for interval in intervals if interval[0] <= self.center <= interval[1]]
+        self.by_start = sorted(centered, key=lambda interval: interval[0])
+        self.by_end = sorted(centered, key=lambda interval: interval[1], reverse=True)
+        left = [interval for interval in intervals if interval[1] < self.center]
+        right = [interval for interval in intervals if interval[0] > self.center]
+        self.left = _IntervalTreeNode(left) if left else None
+        self.right = _IntervalTreeNode(right) if right else None
+
+
+class _EligibilityBucket:
+    """Packages of an index key, in an interval tree over their validity periods for the date lookup.
+
+    The tree is built on the first lookup after packages are added. A lookup visits one node per
+    level of the tree, and only reads the intervals it returns in each, so it takes O(log n + k)
+    time for the k packages applicable at the notice date.
+    """
+
+    def __init__(self):
+        self.intervals: List[Tuple[date, date, int]] = []
+        self._tree: Optional[_IntervalTreeNode] = None
+        self._is_tree_built = True
+
+    def add(self, position: int, start_date: Optional[date], end_date: Optional[date]) -> None:
+        self.intervals.append((start_date or date.min, end_date or date.max, position))
+        self._is_tree_built = False
+
+    def select(self, notice_date: Optional[date]) -> List[int]:
+        if notice_date is None:
+            return [position for _, _, position in self.intervals]
+
+        if not self._is_tree_built:
+            # Periods ending before they start apply to no date
+            valid_intervals = [interval for interval in self.intervals if interval[0] <= interval[1]]
+            self._tree = _IntervalTreeNode(valid_intervals) if valid_intervals else None
+            self._is_tree_built = True
+
+        positions: List[int] = []
+        node = self._tree
+        while node is not None:
+            if notice_date < node.center:
+                # The centered intervals end at or after the center, so those started by the date contain it
+                for start_date, _, position in node.by_start:
+                    if start_date > notice_date:
+                        break
+                    positions.append(position)
+                node = node.left
+            elif notice_date > node.center:
+                for _, end_date, position in node.by_end:
+                    if end_date < notice_date:
+                        break
+                    positions.append(position)
+                node = node.right
+            else:
+                positions.extend(position for _, _, position in node.by_start)
+                node = None
+        return positions
+
+
+@traced_class
+class MappingPackageEligibilityIndex(MappingPackageSelectorABC):
+    """In-memory inverted index over the eligibility constraints of mapping packages.
+
+    Packages are indexed by (eForms subtype, eForms SDK version), with unconstrained
+    subtypes or versions indexed under a wildcard key, so that a lookup only reads the
+    four buckets matching the notice. Within a bucket, the validity periods of the packages
+    are kept in an interval tree, so finding the k packages applicable at the notice date
+    takes O(log n + k) time.
+
+    Example:
+        >>> index = MappingPackageEligibilityIndex(repository.read_many())
+        >>> packages = index.select(eforms_subtype="29", eforms_sdk_version="1.9", notice_date="2024-05-01")
+    """
+
+    def __init__(self, mapping_packages: Iterable[MappingPackage] = ()):
+        self._mapping_packages: List[MappingPackage] = []
+        self._buckets: Dict[Tuple[Optional[str], Optional[str]], _EligibilityBucket] = {}
+        for mapping_package in mapping_packages:
+            self.add(mapping_package)
+
+    def add(self, mapping_package: MappingPackage) -> None:
+        """Add a mapping package to the index."""
+        metadata = mapping_package.metadata
+        position = len(self._mapping_packages)
+        self._mapping_packages.append(mapping_package)
+
+        eforms_subtypes = get_eligibility_constraint_values(metadata, ELIGIBILITY_EFORMS_SUBTYPE_KEY) or [None]
+        eforms_sdk_versions = [normalise_eforms_sdk_version(version) for version in
+                               get_eligibility_constraint_values(metadata, ELIGIBILITY_EFORMS_SDK_VERSIONS_KEY)]
+        constraints = metadata.eligibility_constraints.constraints
+        start_date = to_eligibility_date(constraints.get(ELIGIBILITY_START_DATE_KEY))
+        end_date = to_eligibility_date(constraints.get(ELIGIBILITY_END_DATE_KEY))
+
+        for eforms_subtype in eforms_subtypes:
+            for eforms_sdk_version in eforms_sdk_versions or [None]:
+                bucket = self._buckets.setdefault((eforms_subtype, eforms_sdk_version), _EligibilityBucket())
+                bucket.add(position, start_date, end_date)
+
+    def select(self,
+               eforms_subtype: str,
+               eforms_sdk_version: str,
+               notice_date: Optional[NoticeDate] = None) -> List[MappingPackage]:
+        eforms_subtype = str(eforms_subtype)
+        eforms_sdk_version = normalise_eforms_sdk_version(eforms_sdk_version)
+        notice_date = to_eligibility_date(notice_date)
+
+        positions = set()
+        for key in ((eforms_subtype, eforms_sdk_version), (eforms_subtype, None),
+                    (None, eforms_sdk_version), (None, None)):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                positions.update(bucket.select(notice_date))
+
+        return [self._mapping_packages[position] for position in sorted(positions)]
+
+    def __len__(self) -> int:
+        return len(self._mapping_packages)
+
+
+@traced_class
+class MongoDBMappingPackageEligibilityIndex(MappingPackageSelectorABC):
+    """Selection of the mapping packages applicable to a notice, directly from MongoDB.
+
+    The lookup is translated to a query on the eligibility constraints of the stored
+    packages, backed by the indexes created by ensure_indexes. As MongoDB cannot index
+    two array fields in the same compound index, subtypes and SDK versions have separate
+    compound indexes, each including the validity period.
+
+    Dates may be stored as ISO 8601 strings, with or without a time part, or as BSON
+    datetimes. Only their date is compared, as by MappingPackageEligibilityIndex.
+    """
+
+    def __init__(self, mapping_package_repository: MongoDBRepository[MappingPackage]):
+        self.repository = mapping_package_repository
+
+    def ensure_indexes(self) -> List[str]:
+        """Create the indexes used by the lookup, if they don't exist yet.
+
+        Returns:
+            List[str]: Names of the indexes
+        """
+        date_keys = [(f"{MONGODB_ELIGIBILITY_CONSTRAINTS_PATH}.{ELIGIBILITY_START_DATE_KEY}", 1),
+                     (f"{MONGODB_ELIGIBILITY_CONSTRAINTS_PATH}.{ELIGIBILITY_END_DATE_KEY}", 1)]
+
+        return [
+            self.repository.collection.create_index(
+                [(f"{MONGODB_ELIGIBILITY_CONSTRAINTS_PATH}.{ELIGIBILITY_EFORMS_SUBTYPE_KEY}", 1), *date_keys]),
+            self.repository.collection.create_index(
+                [(f"{MONGODB_ELIGIBILITY_CONSTRAINTS_PATH}.{ELIGIBILITY_EFORMS_SDK_VERSIONS_KEY}", 1), *date_keys]),
+        ]
+
+    def build_query(self,
+                    eforms_subtype: str,
+                    eforms_sdk_version: str,
+                    notice_date: Optional[NoticeDate] = None) -> Dict[str, Any]:
+        """Build the MongoDB query selecting the packages applicable to a notice."""
+
+        def _matches_or_unconstrained(key: str, values: List[str]) -> Dict[str, Any]:
+            field = f"{MONGODB_ELIGIBILITY_CONSTRAINTS_PATH}.{key}"
+            return {"$or": [{field: {"$in": values}}, {field: None}, {field: {"$size": 0}}]}
+
+        eforms_sdk_version = normalise_eforms_sdk_version(eforms_sdk_version)
+        conditions = [
+            _matches_or_unconstrained(ELIGIBILITY_EFORMS_SUBTYPE_KEY, [str(eforms_subtype)]),
+            # Stored versions are not normalised, so both notations are matched
+            _matches_or_unconstrained(ELIGIBILITY_EFORMS_SDK_VERSIONS_KEY,
+                                      [eforms_sdk_version, f"{_EFORMS_SDK_VERSION_PREFIX}{eforms_sdk_version}"]),
+        ]
+        notice_date = to_eligibility_date(notice_date)
+        if notice_date is not None:
+            start_field = f"{MONGODB_ELIGIBILITY_CONSTRAINTS_PATH}.{ELIGIBILITY_START_DATE_KEY}"
+            end_field = f"{MONGODB_ELIGIBILITY_CONSTRAINTS_PATH}.{ELIGIBILITY_END_DATE_KEY}"
+            # Any value on the notice date, whatever its time, is before the start of the next day. Strings
+            # and datetimes are compared separately, as MongoDB only compares values of the same type
+            day_start = datetime.combine(notice_date, datetime.min.time())
+            next_day_start = day_start + timedelta(days=1)
+            conditions.append({"$or": [{start_field: None},
+                                       {start_field: {"$lt": next_day_start.date().isoformat()}},
+                                       {start_field: {"$lt": next_day_start}}]})
+            conditions.append({"$or": [{end_field: None},
+                                       {end_field: {"$gte": notice_date.isoformat()}},
+                                       {end_field: {"$gte": day_start}}]})
+
+        return {"$and": conditions}
+
+    def select(self,
+               eforms_subtype: str,
+               eforms_sdk_version: str,
+               notice_date: Optional[NoticeDate] = None) -> List[MappingPackage]:
+        return self.repository.read_many(self.build_query(eforms_subtype, eforms_sdk_version, notice_date))
+
+
+def _compile_eligibility_membership(values_per_package: List[List[str]],
+                                    package_count: int) -> Tuple[Dict[str, int], np.ndarray]:
+    """Compile a (value code x package) membership matrix.
+
+    The last row is used for values no package mentions; in every row, packages
+    without values (unconstrained) are members.
+    """
+    codes: Dict[str, int] = {}
+    for values in values_per_package:
+        for value in values:
+            codes.setdefault(value, len(codes))
+
+    matrix = np.zeros((len(codes) + 1, package_count), dtype=bool)
+    for position, values in enumerate(values_per_package):
+        if values:
+            matrix[[codes[value] for value in values], position] = True
+        else:
+            matrix[:, position] = True
+
+    return codes, matrix
+
+
+def _encode_notice_values(values: np.ndarray, codes: Dict[str, int],
+                          normalise: Callable[[str], str] = str) -> np.ndarray:
+    """Encode notice values to membership matrix rows, converting each distinct value once."""
+    unique_values, inverse = np.unique(values.astype(str), return_inverse=True)
+    unique_codes = np.array([codes.get(normalise(value), len(codes)) for value in unique_values], dtype=np.intp)
+    return unique_codes[inverse.reshape(-1)]
+
+
+@traced_class
+class MappingPackageEligibilityTable:
+    """Precompiled constraint table for matching batches of notices to mapping packages.
+
+    The eligibility constraints of the packages are compiled once into boolean membership
+    matrices (subtype x package and SDK version x package) and validity period arrays.
+    Matching a batch of notices then only uses vectorised NumPy operations: notice values
+    are encoded once per distinct value, and eligibility is computed for a chunk of notices
+    against all packages at once. Applicability follows the same rules as
+    MappingPackageEligibilityIndex.
+
+    Each notice gets the position of its package in the table, ELIGIBILITY_NO_MATCH if no
+    package is applicable, or, when several packages are applicable, ELIGIBILITY_AMBIGUOUS
+    (ambiguity="mark") or the first applicable package in table order (ambiguity="first").
+
+    Example:
+        >>> table = MappingPackageEligibilityTable(mapping_packages)
+        >>> assignments = table.match(np.array(["29", "16"]), np.array(["1.9", "1.10"]),
+        ...                           np.array(["2024-05-01", "2024-06-01"], dtype="datetime64[D]"))
+        >>> packages = [table.mapping_packages[position] for position in assignments if position >= 0]
+    """
+
+    def __init__(self, mapping_packages: Iterable[MappingPackage], chunk_size: int = 65_536):
+        self.mapping_packages: List[MappingPackage] = list(mapping_packages)
+        self.chunk_size = chunk_size
+        package_count = len(self.mapping_packages)
+
+        subtypes = [get_eligibility_constraint_values(mapping_package.metadata, ELIGIBILITY_EFORMS_SUBTYPE_KEY)
+                    for mapping_package in self.mapping_packages]
+        versions = [[normalise_eforms_sdk_version(version) for version in
+                     get_eligibility_constraint_values(mapping_package.metadata, ELIGIBILITY_EFORMS_SDK_VERSIONS_KEY)]
+                    for mapping_package in self.mapping_packages]
+        self._subtype_codes, self._subtype_matrix = _compile_eligibility_membership(subtypes, package_count)
+        self._version_codes, self._version_matrix = _compile_eligibility_membership(versions, package_count)
+
+        start_dates, end_dates = [], []
+        for mapping_package in self.mapping_packages:
+            constraints = mapping_package.metadata.eligibility_constraints.constraints
+            start_dates.append(to_eligibility_date(constraints.get(ELIGIBILITY_START_DATE_KEY)) or date.min)
+            end_dates.append(to_eligibility_date(constraints.get(ELIGIBILITY_END_DATE_KEY)) or date.max)
+        self._start_dates = np.array(start_dates, dtype="datetime64[D]")
+        self._end_dates = np.array(end_dates, dtype="datetime64[D]")
+
+    def match(self,
+              eforms_subtypes: np.ndarray,
+              eforms_sdk_versions: np.ndarray,
+              notice_dates: Optional[np.ndarray] = None,
+              ambiguity: str = ELIGIBILITY_AMBIGUITY_MARK) -> np.ndarray:
+        """Assign a mapping package to each notice of a batch.
+
+        Args:
+            eforms_subtypes: eForms subtypes of the notices
+            eforms_sdk_versions: eForms SDK versions of the notices, with or without the "eforms-sdk-" prefix
+            notice_dates: Optional dates of the notices (anything convertible to datetime64[D],
+                e.g. ISO 8601 strings). Notices without a date (NaT) ignore the validity periods
+            ambiguity: How notices with several applicable packages are assigned:
+                "mark" to assign ELIGIBILITY_AMBIGUOUS, "first" to assign the first applicable package
+
+        Returns:
+            np.ndarray: Package positions in the table (int64), one per notice, or
+                ELIGIBILITY_NO_MATCH / ELIGIBILITY_AMBIGUOUS
+
+        Raises:
+            ValueError: If the arrays don't have the same length or the ambiguity policy is unknown
+        """
+        if ambiguity not in (ELIGIBILITY_AMBIGUITY_MARK, ELIGIBILITY_AMBIGUITY_FIRST):
+            raise ValueError(f"Unknown ambiguity policy: {ambiguity}")
+
+        eforms_subtypes = np.asarray(eforms_subtypes)
+        eforms_sdk_versions = np.asarray(eforms_sdk_versions)
+        notice_count = len(eforms_subtypes)
+        if notice_dates is None:
+            notice_dates = np.full(notice_count, np.datetime64("NaT"), dtype="datetime64[D]")
+        else:
+            notice_dates = np.asarray(notice_dates, dtype="datetime64[D]")
+        if len(eforms_sdk_versions) != notice_count or len(notice_dates) != notice_count:
+            raise ValueError("Notice subtypes, SDK versions and dates must have the same length")
+
+        assignments = np.full(notice_count, ELIGIBILITY_NO_MATCH, dtype=np.int64)
+        if notice_count == 0 or not self.mapping_packages:
+            return assignments
+
+        subtype_rows = _encode_notice_values(eforms_subtypes, self._subtype_codes)
+        version_rows = _encode_notice_values(eforms_sdk_versions, self._version_codes, normalise_eforms_sdk_version)
+
+        for chunk_start in range(0, notice_count, self.chunk_size):
+            chunk = slice(chunk_start, chunk_start + self.chunk_size)
+            chunk_dates = notice_dates[chunk][:, np.newaxis]
+            eligible = self._subtype_matrix[subtype_rows[chunk]] & self._version_matrix[version_rows[chunk]]
+            eligible &= (((self._start_dates <= chunk_dates) & (self._end_dates >= chunk_dates))
+                         | np.isnat(chunk_dates))
+
+            match_counts = eligible.sum(axis=1)
+            chunk_assignments = np.where(match_counts > 0, eligible.argmax(axis=1), ELIGIBILITY_NO_MATCH)
+            if ambiguity == ELIGIBILITY_AMBIGUITY_MARK:
+                chunk_assignments[match_counts > 1] = ELIGIBILITY_AMBIGUOUS
+            assignments[chunk] = chunk_assignments
+
+        return assignments
+
+    def __len__(self) -> int:
+        return len(self.mapping_packages)
@@ -1,14 +1,77 @@
+import fnmatch
 import tempfile
 import zipfile
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from pathlib import Path
-from typing import Generator, Any, List, Optional
-
-from git import Repo
+from pathlib import Path, PurePosixPath
+from typing import Generator, Any, List, Optional, Union, BinaryIO
 
+from mapping_suite_sdk.adapters.load_report import measure_mssdk_load_phase, MSSDK_LOAD_PHASE_EXTRACT, \
+    MSSDK_LOAD_PHASE_CLONE
+from mapping_suite_sdk.adapters.metrics import measure_mssdk_duration, record_mssdk_compression_ratio, \
+    MSSDK_METRIC_EXTRACT_DURATION, MSSDK_METRIC_CLONE_DURATION
 from mapping_suite_sdk.adapters.tracer import traced_class
 
+### Default limits applied when extracting archives
+MSSDK_ARCHIVE_MAX_TOTAL_SIZE = 1024 * 1024 * 1024  # 1 GiB uncompressed
+MSSDK_ARCHIVE_MAX_FILE_SIZE = 256 * 1024 * 1024  # 256 MiB uncompressed per entry
+MSSDK_ARCHIVE_MAX_ENTRIES = 20_000
+MSSDK_ARCHIVE_MAX_COMPRESSION_RATIO = 200
+# Entries smaller than this are not subject to the compression ratio check,
+# as small highly repetitive files (e.g. blank CSVs) legitimately compress very well
+MSSDK_ARCHIVE_MIN_SIZE_FOR_RATIO_CHECK = 1024 * 1024
+_ARCHIVE_COPY_CHUNK_SIZE = 64 * 1024
+
+
+class ArchiveExtractionLimitError(ValueError):
+    """Raised when an archive exceeds one of the configured extraction limits."""
+    pass
+
+
+def _clone_repository(repository_url: str, destination_path: Path, branch_or_tag_name: Optional[str]) -> None:
+    """Shallow clone a repository, importing GitPython only when a repository is cloned."""
+    from git import Repo
+
+    if branch_or_tag_name:
+        Repo.clone_from(repository_url, destination_path, branch=branch_or_tag_name, depth=1)
+    else:
+        Repo.clone_from(repository_url, destination_path, depth=1)
+
+
+def _make_folders(folder_path: Path, created_paths: List[Path]) -> None:
+    """Create a folder and its missing parents, recording the created folders, outermost first."""
+    missing_paths = []
+    while not folder_path.exists():
+        missing_paths.append(folder_path)
+        folder_path = folder_path.parent
+    for missing_path in reversed(missing_paths):
+        missing_path.mkdir(exist_ok=True)
+        created_paths.append(missing_path)
+
+
+def _remove_created_paths(created_paths: List[Path]) -> None:
+    """Remove the files and folders created by a failed extraction, in the reverse order of creation."""
+    for created_path in reversed(created_paths):
+        try:
+            if created_path.is_dir():
+                created_path.rmdir()
+            else:
+                created_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _select_package_members(members: List[zipfile.ZipInfo], package_paths: List[Path]) -> List[zipfile.ZipInfo]:
+    """Select the archive entries of the given package folders, failing if a folder has none."""
+    selected_members: List[zipfile.ZipInfo] = []
+    for package_path in package_paths:
+        package_prefix = f"{package_path.as_posix().strip('/')}/"
+        package_members = [member for member in members if member.filename.startswith(package_prefix)]
+        if not package_members:
+            raise ValueError(f"Package folder not found in ZIP file: {package_path}")
+        selected_members.extend(package_members)
+    return selected_members
+
 
 class MappingPackageExtractorABC(ABC):
     """Abstract base class defining the interface for mapping package extract operations.
@@ -70,22 +133,56 @@ class ArchivePackageExtractor(MappingPackageExtractorABC):
     This class provides functionality to:
     - Extract ZIP files to a temporary directory with automatic cleanup
     - Extract ZIP files to a specified destination
+    - Enforce limits on total size, entry size, entry count and compression ratio while extracting
+    - Read single files and list entries using only the archive central directory
     - Pack directories into ZIP files without including the root directory name
     """
 
-    def extract(self, source_path: Path, destination_path: Path) -> Path:
-        """Extract a ZIP archive to a specified destination directory.
+    def __init__(
+            self,
+            max_total_size: Optional[int] = MSSDK_ARCHIVE_MAX_TOTAL_SIZE,
+            max_file_size: Optional[int] = MSSDK_ARCHIVE_MAX_FILE_SIZE,
+            max_entries: Optional[int] = MSSDK_ARCHIVE_MAX_ENTRIES,
+            max_compression_ratio: Optional[float] = MSSDK_ARCHIVE_MAX_COMPRESSION_RATIO
+    ):
+        """Initialise the extractor with the limits enforced on every extraction.
+
+        Args:
+            max_total_size: Maximum total uncompressed size of the archive, in bytes
+            max_file_size: Maximum uncompressed size of a single entry, in bytes
+            max_entries: Maximum number of entries (files and directories) in the archive
+            max_compression_ratio: Maximum ratio between uncompressed and compressed size of an entry
+
+        Any limit set to None is disabled.
+        """
+        self.max_total_size = max_total_size
+        self.max_file_size = max_file_size
+        self.max_entries = max_entries
+        self.max_compression_ratio = max_compression_ratio
+
+    def extract(self, source_path: Path, destination_path: Path, package_path: Optional[Path] = None) -> Path:
+        """Extract a ZIP archive, or a single package folder of it, to a specified destination directory.
+
+        The archive is checked against the extractor limits using its central directory
+        before anything is written, and entries are then streamed to disk in chunks while
+        the actual number of written bytes is checked again, so that archives with forged
+        headers are stopped as soon as they exceed a limit.
 
         Args:
             source_path: Path to the ZIP file to extract
             destination_path: Path where the content should be extracted
+            package_path: Optional path of a package folder within the archive
+                (e.g., Path("mappings/package_can_v1.9")). If provided, only the entries
+                of this folder are extracted
 
         Returns:
-            Path: Path to the directory containing the extracted contents
+            Path: Path to the directory containing the extracted contents, or to the
+                extracted package folder if package_path is provided
 
         Raises:
             FileNotFoundError: If the archive file doesn't exist
             ValueError: If the path is not a file
+            ArchiveExtractionLimitError: If the archive exceeds one of the extractor limits
             zipfile.BadZipFile: If the file is not a valid ZIP archive
 
         Example:
@@ -94,6 +191,35 @@ class ArchivePackageExtractor(MappingPackageExtractorABC):
             >>> dest_path = Path("output_dir")
             >>> extracted_path = ArchivePackageExtractor().extract(archive_path, dest_path)
         """
+        self._extract_archive(source_path, destination_path, [package_path] if package_path is not None else None)
+        return destination_path / package_path if package_path is not None else destination_path
+
+    def extract_packages(self, source_path: Path, destination_path: Path, package_paths: List[Path]) -> List[Path]:
+        """Extract several package folders of a ZIP archive to a specified destination directory.
+
+        Only the entries of the given package folders are written, and the archive is read once,
+        with the same limits as extract.
+
+        Args:
+            source_path: Path to the ZIP file to extract
+            destination_path: Path where the package folders should be extracted
+            package_paths: Paths of the package folders within the archive
+                (e.g., [Path("mappings/package_can_v1.9")])
+
+        Returns:
+            List[Path]: Paths to the extracted package folders, in the order of package_paths
+
+        Raises:
+            FileNotFoundError: If the archive file doesn't exist
+            ValueError: If the path is not a file or a package folder is not found in the archive
+            ArchiveExtractionLimitError: If the archive exceeds one of the extractor limits
+        """
+        self._extract_archive(source_path, destination_path, package_paths)
+        return [destination_path / package_path for package_path in package_paths]
+
+    def _extract_archive(self, source_path: Path, destination_path: Path,
+                         package_paths: Optional[List[Path]]) -> None:
+        """Extract a ZIP archive, or only the entries of the given package folders."""
         if not source_path.exists():
             raise FileNotFoundError(f"ZIP file not found: {source_path}")
 
@@ -104,13 +230,88 @@ class ArchivePackageExtractor(MappingPackageExtractorABC):
         destination_path.mkdir(parents=True, exist_ok=True)
 
         try:
-            with zipfile.ZipFile(source_path) as zip_ref:
-                zip_ref.extractall(destination_path)
-            return destination_path
-
+            with measure_mssdk_duration(MSSDK_METRIC_EXTRACT_DURATION), \
+                    measure_mssdk_load_phase(MSSDK_LOAD_PHASE_EXTRACT), zipfile.ZipFile(source_path) as zip_ref:
+                members = zip_ref.infolist()
+                self._check_archive_limits(members)
+                if package_paths is not None:
+                    members = _select_package_members(members, package_paths)
+                self._extract_members(zip_ref, members, destination_path)
+                record_mssdk_compression_ratio("extract",
+                                               sum(member.file_size for member in members),
+                                               sum(member.compress_size for member in members))
+
+        except ArchiveExtractionLimitError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to extract ZIP file: {e}")
 
+    def _check_archive_limits(self, members: List[zipfile.ZipInfo]) -> None:
+        """Check the sizes declared in the central directory against the extractor limits."""
+        if self.max_entries is not None and len(members) > self.max_entries:
+            raise ArchiveExtractionLimitError(
+                f"Archive has {len(members)} entries, exceeding the limit of {self.max_entries}")
+
+        total_size = 0
+        for member in members:
+            self._check_member_size(member, member.file_size)
+            total_size += member.file_size
+            if self.max_total_size is not None and total_size > self.max_total_size:
+                raise ArchiveExtractionLimitError(
+                    f"Archive uncompressed size exceeds the limit of {self.max_total_size} bytes")
+
+    def _check_member_size(self, member: zipfile.ZipInfo, size: int) -> None:
+        """Check the (declared or actually written) size of an entry against the extractor limits."""
+        if self.max_file_size is not None and size > self.max_file_size:
+            raise ArchiveExtractionLimitError(
+                f"Archive entry {member.filename} exceeds the file size limit of {self.max_file_size} bytes")
+
+        if (self.max_compression_ratio is not None
+                and size >= MSSDK_ARCHIVE_MIN_SIZE_FOR_RATIO_CHECK
+                and size > member.compress_size * self.max_compression_ratio):
+            raise ArchiveExtractionLimitError(
+                f"Archive entry {member.filename} exceeds the compression ratio limit "
+                f"of {self.max_compression_ratio}")
+
+    def _extract_members(self, zip_ref: zipfile.ZipFile, members: List[zipfile.ZipInfo],
+                         destination_path: Path) -> None:
+        """Stream archive entries to the destination, enforcing the limits on the written bytes.
+
+        Every entry is checked to stay within the destination before anything is written, and the
+        files and folders written so far are removed if an entry exceeds a limit while streaming.
+        """
+        root_path = destination_path.resolve()
+        target_paths: List[Path] = []
+        for member in members:
+            target_path = (root_path / member.filename).resolve()
+            if not target_path.is_relative_to(root_path):
+                raise ValueError(f"Archive entry {member.filename} points outside the destination folder")
+            target_paths.append(target_path)
+
+        created_paths: List[Path] = []
+        try:
+            total_written = 0
+            for member, target_path in zip(members, target_paths):
+                folder_path = target_path if member.is_dir() else target_path.parent
+                _make_folders(folder_path, created_paths)
+                if member.is_dir():
+                    continue
+
+                member_written = 0
+                created_paths.append(target_path)
+                with zip_ref.open(member) as source, target_path.open("wb") as target:
+                    while chunk := source.read(_ARCHIVE_COPY_CHUNK_SIZE):
+                        member_written += len(chunk)
+                        total_written += len(chunk)
+                        self._check_member_size(member, member_written)
+                        if self.max_total_size is not None and total_written > self.max_total_size:
+                            raise ArchiveExtractionLimitError(
+                                f"Archive uncompressed size exceeds the limit of {self.max_total_size} bytes")
+                        target.write(chunk)
+        except BaseException:
+            _remove_created_paths(created_paths)
+            raise
+
     @contextmanager
     def extract_temporary(self, source_path: Path) -> Generator[Path, None, None]:
         """Extract a ZIP archive to a temporary directory and yield its path.
@@ -141,9 +342,93 @@ class ArchivePackageExtractor(MappingPackageExtractorABC):
             temp_dir_path = Path(temp_dir)
             try:
                 yield self.extract(source_path, temp_dir_path)
+            except ArchiveExtractionLimitError:
+                raise
             except Exception as e:
                 raise ValueError(f"Failed to extract ZIP file: {e}")
 
+    def read_file(self, source: Union[Path, BinaryIO], file_path: Path) -> bytes:
+        """Read a single file from a ZIP archive without extracting the rest of it.
+
+        Only the central directory and the requested entry are read, which makes this
+        suitable for inspecting archives (e.g. reading metadata.json) cheaply.
+
+        Args:
+            source: Path to the ZIP file or a seekable binary stream containing it
+            file_path: Path of the file within the archive
+
+        Returns:
+            bytes: The uncompressed content of the file
+
+        Raises:
+            FileNotFoundError: If the archive or the file within the archive doesn't exist
+            ValueError: If the path is not a file or the stream is not a valid ZIP archive
+            ArchiveExtractionLimitError: If the file exceeds the extractor limits
+
+        Example:
+            >>> extractor = ArchivePackageExtractor()
+            >>> metadata_content = extractor.read_file(Path("package.zip"), Path("metadata.json"))
+        """
+        with _open_archive(source) as zip_ref:
+            try:
+                member = zip_ref.getinfo(file_path.as_posix())
+            except KeyError:
+                raise FileNotFoundError(f"File not found in ZIP archive: {file_path}")
+            self._check_member_size(member, member.file_size)
+
+            return zip_ref.read(member)
+
+    def list_files(self, source: Union[Path, BinaryIO]) -> List[zipfile.ZipInfo]:
+        """List the files of a ZIP archive from its central directory.
+
+        Args:
+            source: Path to the ZIP file or a seekable binary stream containing it
+
+        Returns:
+            List[zipfile.ZipInfo]: Entries of the archive, excluding directories. Each entry
+                exposes its path (filename), uncompressed size (file_size),
+                compressed size (compress_size) and CRC-32 (CRC)
+
+        Raises:
+            FileNotFoundError: If the archive file doesn't exist
+            ValueError: If the path is not a file or the stream is not a valid ZIP archive
+        """
+        with _open_archive(source) as zip_ref:
+            return [member for member in zip_ref.infolist() if not member.is_dir()]
+
+    def list_packages(self, source: Union[Path, BinaryIO], packages_path_pattern: str) -> List[Path]:
+        """List the package folders of a ZIP archive matching a pattern, without extracting it.
+
+        The pattern is matched component by component against the folders of the archive,
+        the same way glob matches directories (e.g., "mappings/package*" matches
+        "mappings/package_can_v1.9" but not "mappings/package_can_v1.9/test_data").
+
+        Args:
+            source: Path to the ZIP file or a seekable binary stream containing it
+            packages_path_pattern: Glob pattern to match package paths within the archive
+                (e.g., "mappings/package*" or "mappings/*_can_*")
+
+        Returns:
+            List[Path]: Sorted relative paths of the matching folders within the archive
+
+        Raises:
+            FileNotFoundError: If the archive file doesn't exist
+            ValueError: If the path is not a file or the stream is not a valid ZIP archive
+        """
+        pattern_parts = PurePosixPath(packages_path_pattern.strip("/")).parts
+        with _open_archive(source) as zip_ref:
+            folder_paths = set()
+            for member in zip_ref.infolist():
+                member_path = PurePosixPath(member.filename)
+                folder_paths.update(member_path.parents)
+                if member.is_dir():
+                    folder_paths.add(member_path)
+
+        return sorted(Path(folder_path) for folder_path in folder_paths
+                      if len(folder_path.parts) == len(pattern_parts) and
+                      all(fnmatch.fnmatchcase(part, pattern_part)
+                          for part, pattern_part in zip(folder_path.parts, pattern_parts)))
+
     def pack_directory(self, source_dir: Path, output_path: Path) -> Path:
         """Pack a directory's contents into a ZIP file without including the root directory name.
 
@@ -193,6 +478,10 @@ class ArchivePackageExtractor(MappingPackageExtractorABC):
                         relative_path = file_path.relative_to(source_dir)
                         # Add the file to the ZIP with the relative path as its name
                         zip_ref.write(file_path, relative_path)
+                members = zip_ref.infolist()
+            record_mssdk_compression_ratio("pack",
+                                           sum(member.file_size for member in members),
+                                           sum(member.compress_size for member in members))
 
             return output_path
 
@@ -200,6 +489,21 @@ class ArchivePackageExtractor(MappingPackageExtractorABC):
             raise ValueError(f"Failed to create ZIP file: {e}")
 
 
+def _open_archive(source: Union[Path, BinaryIO]) -> zipfile.ZipFile:
+    """Open a ZIP archive from a path or a seekable binary stream for reading."""
+    if isinstance(source, Path):
+        if not source.exists():
+            raise FileNotFoundError(f"ZIP file not found: {source}")
+
+        if not source.is_file():
+            raise ValueError(f"Specified path is not a file: {source}")
+
+    try:
+        return zipfile.ZipFile(source)
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Failed to read ZIP file: {e}")
+
+
 @traced_class
 class GithubPackageExtractor(MappingPackageExtractorABC):
     """A mapping package extractor for GitHub repositories.
@@ -280,10 +584,9 @@ class GithubPackageExtractor(MappingPackageExtractorABC):
             raise ValueError(f"Failed to clone repository: Folder {destination_path} does not exist")
 
         try:
-            if branch_or_tag_name:
-                Repo.clone_from(repository_url, destination_path, branch=branch_or_tag_name, depth=1)
-            else:
-                Repo.clone_from(repository_url, destination_path, depth=1)
+            with measure_mssdk_duration(MSSDK_METRIC_CLONE_DURATION), \
+                    measure_mssdk_load_phase(MSSDK_LOAD_PHASE_CLONE):
+                _clone_repository(repository_url, destination_path, branch_or_tag_name)
             return destination_path / package_path
         except Exception as e:
             raise ValueError(f"Failed to clone repository: {e}")
@@ -338,10 +641,9 @@ class GithubPackageExtractor(MappingPackageExtractorABC):
             temp_dir_path = Path(temp_dir)
             try:
                 # TODO: Can be optimised: before cloning, to check the path pattern by yielding all top level files by using GitHub API
-                if branch_or_tag_name:
-                    Repo.clone_from(repository_url, temp_dir_path, branch=branch_or_tag_name, depth=1)
-                else:
-                    Repo.clone_from(repository_url, temp_dir_path, depth=1)
+                with measure_mssdk_duration(MSSDK_METRIC_CLONE_DURATION), \
+                    measure_mssdk_load_phase(MSSDK_LOAD_PHASE_CLONE):
+                    _clone_repository(repository_url, temp_dir_path, branch_or_tag_name)
                 yield [package_path for package_path in temp_dir_path.glob(packages_path_pattern) if
                        package_path.is_dir()]
             except Exception as e:
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Type
+from urllib.parse import quote
+
+from mapping_suite_sdk.adapters.metrics import record_mssdk_cache_access
+from mapping_suite_sdk.adapters.model_document import model_to_document, replace_long_strings, \
+    resolve_blob_references, collect_blob_references, get_document_field, matches_filter
+from mapping_suite_sdk.adapters.repository import RepositoryABC, T, ModelNotFoundError, ModelAlreadyExistsError
+from mapping_suite_sdk.adapters.tracer import traced_class
+from mapping_suite_sdk.models.core import MSSDK_DEFAULT_STR_ENCODE
+
+### Strings at least this long are stored as content-addressed blobs instead of inline in the manifest
+MSSDK_FILESYSTEM_BLOB_MIN_SIZE = 256
+### Unreferenced blobs younger than this are kept by garbage collection, as a writer may not have stored
+### the manifest referencing them yet
+MSSDK_FILESYSTEM_BLOB_GC_GRACE_PERIOD = 3600
+
+_BLOBS_DIR_NAME = "blobs"
+_MANIFESTS_DIR_NAME = "manifests"
+_TEMPORARY_DIR_NAME = "tmp"
+_MANIFEST_SUFFIX = ".json"
+_SHARD_PREFIX_LENGTH = 2
+
+
+def _shard_path(directory: Path, digest: str) -> Path:
+    return directory / digest[:_SHARD_PREFIX_LENGTH] / digest
+
+
+@traced_class
+class FileSystemRepository(RepositoryABC[T]):
+    """Repository storing models on the local file system, as manifests and content-addressed blobs.
+
+    Each model is stored as a JSON manifest in which long strings (asset contents) are
+    replaced by references to blobs named after the SHA-256 of their content, so identical
+    assets are stored once across all models and collections of a root directory. Manifests
+    and blobs live in directories sharded by the first characters of their hash.
+
+    Files are written to a temporary file and published with an atomic rename (or hard link,
+    when the target must not be overwritten), so readers never see partial files and several
+    processes of one host can share a root directory. Concurrent updates of the same model
+    are last-writer-wins.
+    """
+
+    def __init__(
+            self,
+            model_class: Type[T],
+            root_path: Path,
+            collection_name: Optional[str] = None,
+            blob_min_size: int = MSSDK_FILESYSTEM_BLOB_MIN_SIZE
+    ):
+        self.model_class = model_class
+        self.root_path = Path(root_path)
+        self.collection_name = collection_name or model_class.__name__
+        self.blob_min_size = blob_min_size
+        self.blobs_path = self.root_path / _BLOBS_DIR_NAME
+        self.manifests_path = self.root_path / _MANIFESTS_DIR_NAME / self.collection_name
+        self.temporary_path = self.root_path / _TEMPORARY_DIR_NAME
+        for directory in (self.blobs_path, self.manifests_path, self.temporary_path):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def _manifest_path(self, model_id: str) -> Path:
+        model_id_digest = hashlib.sha256(model_id.encode(MSSDK_DEFAULT_STR_ENCODE)).hexdigest()
+        return self.manifests_path / model_id_digest[:_SHARD_PREFIX_LENGTH] / (
+                quote(model_id, safe="") + _MANIFEST_SUFFIX)
+
+    def _write_temporary_file(self, content: bytes) -> Path:
+        file_descriptor, temporary_file_path = tempfile.mkstemp(dir=self.temporary_path)
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            temporary_file.write(content)
+        return Path(temporary_file_path)
+
+    def _publish(self, content: bytes, target_path: Path, overwrite: bool) -> bool:
+        """Atomically publish content at a path, returning False if it exists and must not be overwritten."""
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file_path = self._write_temporary_file(content)
+        try:
+            if overwrite:
+                os.replace(temporary_file_path, target_path)
+                return True
+            try:
+                os.link(temporary_file_path, target_path)
+            except FileExistsError:
+                return False
+            return True
+        finally:
+            temporary_file_path.unlink(missing_ok=True)
+
+    def _store_blob(self, content: bytes) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = _shard_path(self.blobs_path, digest)
+        blob_exists = blob_path.exists()
+        record_mssdk_cache_access("filesystem_blobs", blob_exists)
+        if blob_exists:
+            try:
+                # Refresh the blob age, so that garbage collection doesn't delete it before its manifest is stored
+                os.utime(blob_path)
+                return digest
+            except FileNotFoundError:
+                # Garbage collection deleted the blob since the existence check
+                pass
+        self._publish(content, blob_path, overwrite=False)
+        return digest
+
+    def _read_blob(self, digest: str) -> bytes:
+        return _shard_path(self.blobs_path, digest).read_bytes()
+
+    def _serialise_manifest(self, model: T) -> bytes:
+        manifest = replace_long_strings(model_to_document(model), self.blob_min_size, self._store_blob)
+        return json.dumps(manifest).encode(MSSDK_DEFAULT_STR_ENCODE)
+
+    def _read_manifest(self, manifest_path: Path) -> Dict[str, Any]:
+        return json.loads(manifest_path.read_bytes())
+
+    def _iter_manifest_paths(self) -> Iterator[Path]:
+        return self.manifests_path.glob(f"*/*{_MANIFEST_SUFFIX}")
+
+    def _to_model(self, manifest: Dict[str, Any]) -> T:
+        return self.model_class.model_validate(resolve_blob_references(manifest, self._read_blob))
+
+    def create(self, model: T) -> T:
+        if not self._publish(self._serialise_manifest(model), self._manifest_path(model.id), overwrite=False):
+            raise ModelAlreadyExistsError(f"Asset with ID {model.id} already exists")
+        model.pin_id()
+
+        return model
+
+    def read(self, model_id: str) -> T:
+        try:
+            manifest = self._read_manifest(self._manifest_path(model_id))
+        except FileNotFoundError:
+            raise ModelNotFoundError(f"Asset with ID {model_id} not found")
+
+        return self._to_model(manifest)
+
+    def read_many(self, filters: Optional[Dict[str, Any]] = None) -> List[T]:
+        """Read the models matching the filters.
+
+        Filters map dotted field paths (as stored, i.e. using the field aliases) to a value,
+        or to a condition using the $in or $ne operators. A list field matches a value it contains.
+        """
+        return list(self.iter_many(filters))
+
+    def iter_many(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[T]:
+        """Iterate over the models matching the filters (see read_many), reading them as they are consumed."""
+        for manifest_path in self._iter_manifest_paths():
+            try:
+                manifest = self._read_manifest(manifest_path)
+            except FileNotFoundError:
+                continue
+            if not filters or all(matches_filter(get_document_field(manifest, field_path, self._read_blob), condition)
+                                  for field_path, condition in filters.items()):
+                yield self._to_model(manifest)
+
+    def update(self, model: T) -> T:
+        manifest_path = self._manifest_path(model.id)
+        if not manifest_path.exists():
+            raise ModelNotFoundError(f"Asset with ID {model.id} not found")
+
+        self._publish(self._serialise_manifest(model), manifest_path, overwrite=True)
+
+        return model
+
+    def delete(self, model_id: str) -> None:
+        try:
+            self._manifest_path(model_id).unlink()
+        except FileNotFoundError:
+            raise ModelNotFoundError(f"Asset with ID {model_id} not found")
+
+    def delete_many(self, model_ids: List[str]) -> None:
+        missing_ids = sorted(model_id for model_id in model_ids if not self._manifest_path(model_id).exists())
+        if missing_ids:
+            raise ModelNotFoundError(f"Assets with IDs {missing_ids} not found")
+
+        for model_id in model_ids:
+            self._manifest_path(model_id).unlink(missing_ok=True)
+
+    def update_many(self, models: List[T]) -> List[T]:
+        missing_ids = sorted(model.id for model in models if not self._manifest_path(model.id).exists())
+        if missing_ids:
+            raise ModelNotFoundError(f"Assets with IDs {missing_ids} not found")
+
+        for model in models:
+            self._publish(self._serialise_manifest(model), self._manifest_path(model.id), overwrite=True)
+
+        return models
+
+    def collect_garbage(self, grace_period: float = MSSDK_FILESYSTEM_BLOB_GC_GRACE_PERIOD) -> int:
+        """Delete the blobs no manifest of the root directory references anymore.
+
+        Blobs modified less than grace_period seconds ago are kept, so that blobs stored
+        by a concurrent writer before its manifest are not collected.
+
+        Args:
+            grace_period: Minimum age, in seconds, of the blobs to delete
+
+        Returns:
+            int: Number of deleted blobs
+        """
+        referenced_digests: Set[str] = set()
+        for manifest_path in (self.root_path / _MANIFESTS_DIR_NAME).glob(f"*/*/*{_MANIFEST_SUFFIX}"):
+            try:
+                collect_blob_references(self._read_manifest(manifest_path), referenced_digests)
+            except FileNotFoundError:
+                continue
+
+        deleted_blobs = 0
+        oldest_kept_time = time.time() - grace_period
+        for blob_path in self.blobs_path.glob("*/*"):
+            if blob_path.name not in referenced_digests and blob_path.stat().st_mtime < oldest_kept_time:
+                blob_path.unlink(missing_ok=True)
+                deleted_blobs += 1
+
+        return deleted_blobs
@@ -0,0 +1,194 @@
+"""
+Load report module for the Mapping Suite SDK.
+
+This module collects reports of mapping package loads, without any OpenTelemetry backend:
+the wall and CPU time, files and bytes read of each phase of the loads (repository clone,
+archive extraction, read of each suite, package validation and content ID hashing), and
+optionally the peak memory traced while loading.
+
+Nothing is measured outside collect_mssdk_load_report, so the phases cost a single check
+when no report is collected.
+"""
+
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pydantic import Field
+
+from mapping_suite_sdk.models.core import CoreModel, _CONTENT_ID_OBSERVER
+
+MSSDK_LOAD_PHASE_CLONE = "clone"
+MSSDK_LOAD_PHASE_EXTRACT = "extract"
+MSSDK_LOAD_PHASE_READ_PREFIX = "read."
+MSSDK_LOAD_PHASE_VALIDATION = "validation"
+MSSDK_LOAD_PHASE_ID_HASHING = "id_hashing"
+
+
+class MappingPackageLoadPhase(CoreModel):
+    """Resource usage of one phase of the loads of a report, summed over its runs."""
+    name: str = Field(..., description="Name of the phase, e.g. 'extract' or 'read.technical_mapping_suite'")
+    runs: int = Field(default=0, description="Number of times the phase ran")
+    wall_time: float = Field(default=0.0, description="Wall time of the phase, in seconds")
+    cpu_time: float = Field(default=0.0, description="CPU time of the threads running the phase, in seconds")
+    files_read: int = Field(default=0, description="Number of package files read")
+    bytes_read: int = Field(default=0, description="Bytes of package files read")
+
+
+class MappingPackageLoadReport(CoreModel):
+    """Report of the mapping package loads run while it was collected.
+
+    The phases may overlap: content IDs are hashed while the suites are read and the package
+    is validated, and the packages of multi-package loads are read concurrently.
+    """
+    status: str = Field(..., description="'success', or 'error' if the loads raised")
+    wall_time: float = Field(..., description="Wall time of the loads, in seconds")
+    cpu_time: float = Field(..., description="CPU time of the process during the loads, in seconds")
+    files_read: int = Field(..., description="Number of package files read")
+    bytes_read: int = Field(..., description="Bytes of package files read")
+    peak_memory: Optional[int] = Field(default=None,
+                                       description="Peak memory traced during the loads, in bytes, if traced")
+    phases: List[MappingPackageLoadPhase] = Field(default_factory=list,
+                                                  description="The phases of the loads, in the order they started")
+
+
+class _LoadReportCollector:
+    """Mutable phase totals of a load report being collected, shared by the threads of the loads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # The fields of the MappingPackageLoadPhase of each phase, by phase name
+        self.phases: Dict[str, Dict[str, Any]] = {}
+
+    def _get_phase(self, phase: str) -> Dict[str, Any]:
+        if phase not in self.phases:
+            self.phases[phase] = {"name": phase, "runs": 0, "wall_time": 0.0, "cpu_time": 0.0,
+                                  "files_read": 0, "bytes_read": 0}
+        return self.phases[phase]
+
+    def add_run(self, phase: str, wall_time: float, cpu_time: float) -> None:
+        with self.lock:
+            load_phase = self._get_phase(phase)
+            load_phase["runs"] += 1
+            load_phase["wall_time"] += wall_time
+            load_phase["cpu_time"] += cpu_time
+
+    def add_files_read(self, phase: str, files_read: int, bytes_read: int) -> None:
+        with self.lock:
+            load_phase = self._get_phase(phase)
+            load_phase["files_read"] += files_read
+            load_phase["bytes_read"] += bytes_read
+
+    def add_id_hashing(self, wall_time: float, cpu_time: float) -> None:
+        self.add_run(MSSDK_LOAD_PHASE_ID_HASHING, wall_time, cpu_time)
+
+
+_MSSDK_LOAD_REPORT: ContextVar[Optional[_LoadReportCollector]] = ContextVar("mssdk_load_report", default=None)
+
+
+class MappingPackageLoadReportRecorder:
+    """Handle of a load report being collected; the report is available once the collection ends."""
+
+    def __init__(self):
+        self.report: Optional[MappingPackageLoadReport] = None
+
+
+@contextmanager
+def collect_mssdk_load_report(
+        callback: Optional[Callable[[MappingPackageLoadReport], None]] = None,
+        trace_memory: bool = False) -> Iterator[MappingPackageLoadReportRecorder]:
+    """
+    Collect a report of the mapping package loads run in the body of the with statement.
+
+    Loads run in the threads of the SDK (e.g. load_mapping_packages_from_archive) are included,
+    as they run in copies of the current context.
+
+    Args:
+        callback: Optional function called with the report when the body exits, e.g. to log it
+        trace_memory: Whether to trace the peak memory with tracemalloc, which slows the loads down
+
+    Yields:
+        MappingPackageLoadReportRecorder: Handle whose report is set when the body exits
+
+    Example:
+        >>> with collect_mssdk_load_report(callback=lambda report: logger.info(report.model_dump())) as recorder:
+        ...     mapping_package = load_mapping_package_from_archive(Path("package.zip"))
+        >>> print(recorder.report.phases)
+    """
+    collector = _LoadReportCollector()
+    recorder = MappingPackageLoadReportRecorder()
+    stop_tracemalloc = False
+    start_memory = 0
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            stop_tracemalloc = True
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+
+    status = "success"
+    report_token = _MSSDK_LOAD_REPORT.set(collector)
+    observer_token = _CONTENT_ID_OBSERVER.set(collector.add_id_hashing)
+    start_time, start_cpu_time = time.perf_counter(), time.process_time()
+    try:
+        yield recorder
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        wall_time, cpu_time = time.perf_counter() - start_time, time.process_time() - start_cpu_time
+        _CONTENT_ID_OBSERVER.reset(observer_token)
+        _MSSDK_LOAD_REPORT.reset(report_token)
+        peak_memory = None
+        if trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1] - start_memory
+            if stop_tracemalloc:
+                tracemalloc.stop()
+
+        # The report is built without the collector observing the hashing of its own content IDs
+        with collector.lock:
+            phases = [MappingPackageLoadPhase(**phase) for phase in collector.phases.values()]
+        recorder.report = MappingPackageLoadReport(status=status,
+                                                   wall_time=wall_time,
+                                                   cpu_time=cpu_time,
+                                                   files_read=sum(phase.files_read for phase in phases),
+                                                   bytes_read=sum(phase.bytes_read for phase in phases),
+                                                   peak_memory=peak_memory,
+                                                   phases=phases)
+        if callback is not None:
+            callback(recorder.report)
+
+
+@contextmanager
+def measure_mssdk_load_phase(phase: str) -> Iterator[None]:
+    """
+    Record the wall and CPU time of the body of the with statement as a phase of the load report collected, if any.
+
+    Args:
+        phase: Name of the phase, e.g. MSSDK_LOAD_PHASE_EXTRACT
+    """
+    collector = _MSSDK_LOAD_REPORT.get()
+    if collector is None:
+        yield
+        return
+
+    start_time, start_cpu_time = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        collector.add_run(phase, time.perf_counter() - start_time, time.thread_time() - start_cpu_time)
+
+
+def is_mssdk_load_report_collected() -> bool:
+    """Check if a load report is collected in the current context."""
+    return _MSSDK_LOAD_REPORT.get() is not None
+
+
+def record_mssdk_load_files_read(suite: str, files_read: int, bytes_read: int) -> None:
+    """Add the files of a suite read, and their bytes, to the read phase of the suite in the load report collected."""
+    collector = _MSSDK_LOAD_REPORT.get()
+    if collector is not None:
+        collector.add_files_read(f"{MSSDK_LOAD_PHASE_READ_PREFIX}{suite}", files_read, bytes_read)
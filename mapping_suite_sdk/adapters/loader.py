@@ -3,7 +3,11 @@ from typing import Any, List, Protocol
 
 from pydantic import TypeAdapter
 
-from mapping_suite_sdk.adapters.tracer import traced_class
+from mapping_suite_sdk.adapters.load_report import measure_mssdk_load_phase, MSSDK_LOAD_PHASE_READ_PREFIX, \
+    MSSDK_LOAD_PHASE_VALIDATION
+from mapping_suite_sdk.adapters.metrics import measure_mssdk_duration, record_mssdk_files_read, \
+    MSSDK_METRIC_LOAD_DURATION
+from mapping_suite_sdk.adapters.tracer import traced_class, read_traced_file_text, read_traced_file_bytes
 from mapping_suite_sdk.models.asset import TechnicalMappingSuite, VocabularyMappingSuite, TestDataSuite, \
     SAPRQLTestSuite, SHACLTestSuite, TestResultSuite, RMLMappingAsset, \
     ConceptualMappingPackageAsset, VocabularyMappingAsset, TestDataAsset, SPARQLQueryAsset, SHACLShapesAsset
@@ -41,6 +45,7 @@ class MappingPackageAssetLoader(Protocol):
         raise NotImplementedError
 
 
+@traced_class
 class TechnicalMappingSuiteLoader(MappingPackageAssetLoader):
     """Loader for technical mapping suite files.
 
@@ -61,11 +66,14 @@ class TechnicalMappingSuiteLoader(MappingPackageAssetLoader):
         for tm_file in (package_folder_path / RELATIVE_TECHNICAL_MAPPING_SUITE_PATH).iterdir():
             if tm_file.is_file():
                 tm_files.append(
-                    RMLMappingAsset(path=tm_file.relative_to(package_folder_path), content=tm_file.read_text()))
+                    RMLMappingAsset(path=tm_file.relative_to(package_folder_path),
+                                    content=read_traced_file_text(tm_file, package_folder_path)))
+        record_mssdk_files_read("technical_mapping_suite", (tm_file.content for tm_file in tm_files))
 
         return TechnicalMappingSuite(path=RELATIVE_TECHNICAL_MAPPING_SUITE_PATH, files=tm_files)
 
 
+@traced_class
 class VocabularyMappingSuiteLoader(MappingPackageAssetLoader):
     """Loader for vocabulary mapping suite files.
 
@@ -86,11 +94,14 @@ class VocabularyMappingSuiteLoader(MappingPackageAssetLoader):
         for file in (package_folder_path / RELATIVE_VOCABULARY_MAPPING_SUITE_PATH).iterdir():
             if file.is_file():
                 files.append(
-                    VocabularyMappingAsset(path=file.relative_to(package_folder_path), content=file.read_text()))
+                    VocabularyMappingAsset(path=file.relative_to(package_folder_path),
+                                           content=read_traced_file_text(file, package_folder_path)))
+        record_mssdk_files_read("vocabulary_mapping_suite", (file.content for file in files))
 
         return VocabularyMappingSuite(path=RELATIVE_VOCABULARY_MAPPING_SUITE_PATH, files=files)
 
 
+@traced_class
 class TestDataSuitesLoader(MappingPackageAssetLoader):
     """Loader for test data suites.
 
@@ -112,11 +123,15 @@ class TestDataSuitesLoader(MappingPackageAssetLoader):
                 test_data_suites.append(TestDataSuite(path=ts_suite.relative_to(package_folder_path),
                                                       files=[
                                                           TestDataAsset(path=ts_file.relative_to(package_folder_path),
-                                                                        content=ts_file.read_text()) for ts_file in
-                                                          ts_suite.iterdir() if ts_file.is_file()]))
+                                                                        content=read_traced_file_text(
+                                                                            ts_file, package_folder_path))
+                                                          for ts_file in ts_suite.iterdir() if ts_file.is_file()]))
+        record_mssdk_files_read("test_data_suites",
+                                (ts_file.content for ts_suite in test_data_suites for ts_file in ts_suite.files))
         return test_data_suites
 
 
+@traced_class
 class SPARQLTestSuitesLoader(MappingPackageAssetLoader):
     """Loader for SPARQL test suites.
 
@@ -138,12 +153,16 @@ class SPARQLTestSuitesLoader(MappingPackageAssetLoader):
                 sparql_validation_suites.append(SAPRQLTestSuite(path=sparql_suite.relative_to(package_folder_path),
                                                                 files=[SPARQLQueryAsset(
                                                                     path=ts_file.relative_to(package_folder_path),
-                                                                    content=ts_file.read_text()) for ts_file
+                                                                    content=read_traced_file_text(
+                                                                        ts_file, package_folder_path)) for ts_file
                                                                     in
                                                                     sparql_suite.iterdir() if ts_file.is_file()]))
+        record_mssdk_files_read("test_suites_sparql", (ts_file.content for sparql_suite in sparql_validation_suites
+                                                       for ts_file in sparql_suite.files))
         return sparql_validation_suites
 
 
+@traced_class
 class SHACLTestSuitesLoader(MappingPackageAssetLoader):
     """Loader for SHACL test suites.
 
@@ -165,12 +184,16 @@ class SHACLTestSuitesLoader(MappingPackageAssetLoader):
                 shacl_validation_suites.append(SHACLTestSuite(path=shacl_suite.relative_to(package_folder_path),
                                                               files=[SHACLShapesAsset(
                                                                   path=ts_file.relative_to(package_folder_path),
-                                                                  content=ts_file.read_text()) for ts_file
+                                                                  content=read_traced_file_text(
+                                                                      ts_file, package_folder_path)) for ts_file
                                                                   in
                                                                   shacl_suite.iterdir() if ts_file.is_file()]))
+        record_mssdk_files_read("test_suites_shacl", (ts_file.content for shacl_suite in shacl_validation_suites
+                                                      for ts_file in shacl_suite.files))
         return shacl_validation_suites
 
 
+@traced_class
 class MappingPackageMetadataLoader(MappingPackageAssetLoader):
     """Loader for mapping package metadata.
 
@@ -187,9 +210,12 @@ class MappingPackageMetadataLoader(MappingPackageAssetLoader):
             MappingPackageMetadata: Parsed metadata object.
         """
         metadata_file_path: Path = package_folder_path / RELATIVE_SUITE_METADATA_PATH
-        return TypeAdapter(MappingPackageMetadata).validate_json(metadata_file_path.read_text())
+        metadata_content = read_traced_file_text(metadata_file_path, package_folder_path)
+        record_mssdk_files_read("metadata", [metadata_content])
+        return TypeAdapter(MappingPackageMetadata).validate_json(metadata_content)
 
 
+@traced_class
 class MappingPackageIndexLoader(MappingPackageAssetLoader):
     """Loader for mapping package index.
 
@@ -211,6 +237,7 @@ class MappingPackageIndexLoader(MappingPackageAssetLoader):
         raise NotImplementedError
 
 
+@traced_class
 class TestResultSuiteLoader(MappingPackageAssetLoader):
     """Loader for test result suite.
 
@@ -232,6 +259,7 @@ class TestResultSuiteLoader(MappingPackageAssetLoader):
         raise NotImplementedError
 
 
+@traced_class
 class ConceptualMappingFileLoader(MappingPackageAssetLoader):
     """Loader for conceptual mapping files.
 
@@ -248,10 +276,12 @@ class ConceptualMappingFileLoader(MappingPackageAssetLoader):
             ConceptualMappingPackageAsset: The loaded conceptual mapping file.
         """
         cm_file_path: Path = package_folder_path / RELATIVE_CONCEPTUAL_MAPPING_PATH
+        cm_file_content = read_traced_file_bytes(cm_file_path, package_folder_path)
+        record_mssdk_files_read("conceptual_mapping_asset", [cm_file_content])
 
         return ConceptualMappingPackageAsset(
             path=RELATIVE_CONCEPTUAL_MAPPING_PATH,
-            content=cm_file_path.read_bytes()
+            content=cm_file_content
         )
 
 
@@ -280,20 +310,31 @@ class MappingPackageLoader(MappingPackageAssetLoader):
         Returns:
             MappingPackage: Complete mapping package with all loaded components.
         """
-        metadata = MappingPackageMetadataLoader().load(package_folder_path)
-        conceptual_mapping_file = ConceptualMappingFileLoader().load(package_folder_path)
-        technical_mapping_suite = TechnicalMappingSuiteLoader().load(package_folder_path)
-        vocabulary_mapping_suite = VocabularyMappingSuiteLoader().load(package_folder_path)
-        test_data_suites = TestDataSuitesLoader().load(package_folder_path)
-        test_suites_sparql = SPARQLTestSuitesLoader().load(package_folder_path)
-        test_suites_shacl = SHACLTestSuitesLoader().load(package_folder_path)
-
-        return MappingPackage(
-            metadata=metadata,
-            conceptual_mapping_asset=conceptual_mapping_file,
-            technical_mapping_suite=technical_mapping_suite,
-            vocabulary_mapping_suite=vocabulary_mapping_suite,
-            test_data_suites=test_data_suites,
-            test_suites_sparql=test_suites_sparql,
-            test_suites_shacl=test_suites_shacl
-        )
+        with measure_mssdk_duration(MSSDK_METRIC_LOAD_DURATION):
+            metadata = _load_suite("metadata", MappingPackageMetadataLoader(), package_folder_path)
+            conceptual_mapping_file = _load_suite("conceptual_mapping_asset", ConceptualMappingFileLoader(),
+                                                  package_folder_path)
+            technical_mapping_suite = _load_suite("technical_mapping_suite", TechnicalMappingSuiteLoader(),
+                                                  package_folder_path)
+            vocabulary_mapping_suite = _load_suite("vocabulary_mapping_suite", VocabularyMappingSuiteLoader(),
+                                                   package_folder_path)
+            test_data_suites = _load_suite("test_data_suites", TestDataSuitesLoader(), package_folder_path)
+            test_suites_sparql = _load_suite("test_suites_sparql", SPARQLTestSuitesLoader(), package_folder_path)
+            test_suites_shacl = _load_suite("test_suites_shacl", SHACLTestSuitesLoader(), package_folder_path)
+
+            with measure_mssdk_load_phase(MSSDK_LOAD_PHASE_VALIDATION):
+                return MappingPackage(
+                    metadata=metadata,
+                    conceptual_mapping_asset=conceptual_mapping_file,
+                    technical_mapping_suite=technical_mapping_suite,
+                    vocabulary_mapping_suite=vocabulary_mapping_suite,
+                    test_data_suites=test_data_suites,
+                    test_suites_sparql=test_suites_sparql,
+                    test_suites_shacl=test_suites_shacl
+                )
+
+
+def _load_suite(suite: str, loader: MappingPackageAssetLoader, package_folder_path: Path) -> Any:
+    """Load a suite of a mapping package, as a read phase of the load report collected, if any."""
+    with measure_mssdk_load_phase(f"{MSSDK_LOAD_PHASE_READ_PREFIX}{suite}"):
+        return loader.load(package_folder_path)
@@ -0,0 +1,209 @@
+"""
+Metrics module for the Mapping Suite SDK.
+
+This module provides OpenTelemetry metrics of the SDK operations: the duration of package
+loading, serialisation, archive extraction and repository cloning, the files and bytes read
+and written per suite, archive compression ratios, MongoDB round trips and document sizes,
+and cache hits and misses.
+
+Nothing is measured until a metric reader is added with add_metric_reader_to_mssdk_meter_provider,
+so metrics cost a single check per operation when they are not collected, and the OpenTelemetry
+SDK is only imported then. MongoDBMetricsListener, which subclasses a pymongo listener, lives in
+the mongodb_metrics module and is only imported, with pymongo, when it is first accessed.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, AnyStr, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TYPE_CHECKING
+
+from mapping_suite_sdk.adapters.load_report import is_mssdk_load_report_collected, record_mssdk_load_files_read
+from mapping_suite_sdk.models.core import MSSDK_DEFAULT_STR_ENCODE
+
+if TYPE_CHECKING:
+    from opentelemetry.metrics import Meter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import MetricReader
+
+MSSDK_METRIC_LOAD_DURATION = "mssdk.package.load.duration"
+MSSDK_METRIC_SERIALISE_DURATION = "mssdk.package.serialise.duration"
+MSSDK_METRIC_EXTRACT_DURATION = "mssdk.archive.extract.duration"
+MSSDK_METRIC_CLONE_DURATION = "mssdk.repository.clone.duration"
+MSSDK_METRIC_FILES_READ = "mssdk.files.read"
+MSSDK_METRIC_BYTES_READ = "mssdk.bytes.read"
+MSSDK_METRIC_FILES_WRITTEN = "mssdk.files.written"
+MSSDK_METRIC_BYTES_WRITTEN = "mssdk.bytes.written"
+MSSDK_METRIC_COMPRESSION_RATIO = "mssdk.archive.compression_ratio"
+MSSDK_METRIC_MONGODB_ROUND_TRIPS = "mssdk.mongodb.round_trips"
+MSSDK_METRIC_MONGODB_DOCUMENT_SIZE = "mssdk.mongodb.document.size"
+MSSDK_METRIC_CACHE_HITS = "mssdk.cache.hits"
+MSSDK_METRIC_CACHE_MISSES = "mssdk.cache.misses"
+
+_MSSDK_METRICS_SERVICE_NAME = "mapping-suite-sdk"
+_DURATION_HISTOGRAMS = (MSSDK_METRIC_LOAD_DURATION, MSSDK_METRIC_SERIALISE_DURATION,
+                        MSSDK_METRIC_EXTRACT_DURATION, MSSDK_METRIC_CLONE_DURATION)
+
+
+class _MSSDKInstruments:
+    """The SDK instruments, created from the meter of one meter provider."""
+
+    def __init__(self, meter: "Meter"):
+        self.histograms = {name: meter.create_histogram(name, unit="s", description=description)
+                           for name, description in zip(_DURATION_HISTOGRAMS,
+                                                        ("Duration of mapping package loads",
+                                                         "Duration of mapping package serialisations",
+                                                         "Duration of archive extractions",
+                                                         "Duration of repository clones"))}
+        self.histograms[MSSDK_METRIC_COMPRESSION_RATIO] = meter.create_histogram(
+            MSSDK_METRIC_COMPRESSION_RATIO, unit="1",
+            description="Ratio between the uncompressed and compressed size of archives")
+        self.histograms[MSSDK_METRIC_MONGODB_DOCUMENT_SIZE] = meter.create_histogram(
+            MSSDK_METRIC_MONGODB_DOCUMENT_SIZE, unit="By", description="BSON size of the MongoDB documents")
+        self.counters = {
+            MSSDK_METRIC_FILES_READ: meter.create_counter(MSSDK_METRIC_FILES_READ, unit="{file}",
+                                                          description="Package files read"),
+            MSSDK_METRIC_BYTES_READ: meter.create_counter(MSSDK_METRIC_BYTES_READ, unit="By",
+                                                          description="Bytes of package files read"),
+            MSSDK_METRIC_FILES_WRITTEN: meter.create_counter(MSSDK_METRIC_FILES_WRITTEN, unit="{file}",
+                                                             description="Package files written"),
+            MSSDK_METRIC_BYTES_WRITTEN: meter.create_counter(MSSDK_METRIC_BYTES_WRITTEN, unit="By",
+                                                             description="Bytes of package files written"),
+            MSSDK_METRIC_MONGODB_ROUND_TRIPS: meter.create_counter(MSSDK_METRIC_MONGODB_ROUND_TRIPS,
+                                                                   unit="{command}",
+                                                                   description="MongoDB commands sent"),
+            MSSDK_METRIC_CACHE_HITS: meter.create_counter(MSSDK_METRIC_CACHE_HITS, unit="{access}",
+                                                          description="SDK cache hits"),
+            MSSDK_METRIC_CACHE_MISSES: meter.create_counter(MSSDK_METRIC_CACHE_MISSES, unit="{access}",
+                                                            description="SDK cache misses"),
+        }
+
+
+# Each reader gets its own meter provider, as the readers of a provider are fixed when it is created.
+# The instruments tuple is replaced, never mutated, so recording reads it without locking.
+_MSSDK_METER_PROVIDERS: List["MeterProvider"] = []
+_MSSDK_INSTRUMENTS: Tuple[_MSSDKInstruments, ...] = ()
+_MSSDK_METER_PROVIDERS_LOCK = threading.Lock()
+
+
+def add_metric_reader_to_mssdk_meter_provider(metric_reader: "MetricReader") -> None:
+    """
+    Add a metric reader collecting the SDK metrics.
+
+    Args:
+        metric_reader: OpenTelemetry MetricReader, e.g. a PeriodicExportingMetricReader
+
+    Returns:
+        None
+    """
+    global _MSSDK_INSTRUMENTS
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import MetricReader
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+
+    if isinstance(metric_reader, MetricReader):
+        meter_provider = MeterProvider(metric_readers=[metric_reader],
+                                       resource=Resource(attributes={SERVICE_NAME: _MSSDK_METRICS_SERVICE_NAME}))
+        with _MSSDK_METER_PROVIDERS_LOCK:
+            _MSSDK_METER_PROVIDERS.append(meter_provider)
+            _MSSDK_INSTRUMENTS = _MSSDK_INSTRUMENTS + (_MSSDKInstruments(meter_provider.get_meter(__name__)),)
+
+
+def is_mssdk_metrics_enabled() -> bool:
+    """
+    Check if the SDK metrics are collected, i.e. if a metric reader was added.
+
+    Returns:
+        True if metrics are collected, False otherwise
+    """
+    return bool(_MSSDK_INSTRUMENTS)
+
+
+def _content_size(content: AnyStr) -> int:
+    if isinstance(content, bytes) or content.isascii():
+        return len(content)
+    return len(content.encode(MSSDK_DEFAULT_STR_ENCODE))
+
+
+def record_mssdk_histogram(metric_name: str, value: float, attributes: Optional[Mapping[str, str]] = None) -> None:
+    """Record a value of one of the SDK histograms."""
+    for instruments in _MSSDK_INSTRUMENTS:
+        instruments.histograms[metric_name].record(value, attributes)
+
+
+def record_mssdk_counter(metric_name: str, value: int, attributes: Optional[Mapping[str, str]] = None) -> None:
+    """Add a value to one of the SDK counters."""
+    for instruments in _MSSDK_INSTRUMENTS:
+        instruments.counters[metric_name].add(value, attributes)
+
+
+@contextmanager
+def measure_mssdk_duration(metric_name: str, attributes: Optional[Dict[str, str]] = None) -> Iterator[None]:
+    """
+    Record the duration of the body of the with statement in one of the SDK duration histograms.
+
+    The duration is recorded with a status attribute, "success" or "error" if the body raised.
+
+    Args:
+        metric_name: Name of the histogram, e.g. MSSDK_METRIC_LOAD_DURATION
+        attributes: Optional additional attributes of the measurement
+    """
+    if not _MSSDK_INSTRUMENTS:
+        yield
+        return
+
+    status = "success"
+    start_time = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        record_mssdk_histogram(metric_name, time.perf_counter() - start_time, {**(attributes or {}), "status": status})
+
+
+def record_mssdk_files_read(suite: str, contents: Iterable[AnyStr]) -> None:
+    """Count the files of a suite read, given their contents, and their bytes, also in the load report collected."""
+    if _MSSDK_INSTRUMENTS or is_mssdk_load_report_collected():
+        contents = list(contents)
+        files_read, bytes_read = len(contents), sum(map(_content_size, contents))
+        attributes = {"suite": suite}
+        record_mssdk_counter(MSSDK_METRIC_FILES_READ, files_read, attributes)
+        record_mssdk_counter(MSSDK_METRIC_BYTES_READ, bytes_read, attributes)
+        record_mssdk_load_files_read(suite, files_read, bytes_read)
+
+
+def record_mssdk_files_written(suite: str, contents: Iterable[AnyStr]) -> None:
+    """Count the files of a suite written, given their contents, and their bytes."""
+    if _MSSDK_INSTRUMENTS:
+        contents = list(contents)
+        attributes = {"suite": suite}
+        record_mssdk_counter(MSSDK_METRIC_FILES_WRITTEN, len(contents), attributes)
+        record_mssdk_counter(MSSDK_METRIC_BYTES_WRITTEN, sum(map(_content_size, contents)), attributes)
+
+
+def record_mssdk_compression_ratio(operation: str, uncompressed_size: int, compressed_size: int) -> None:
+    """Record the compression ratio of an archive extracted or packed."""
+    if _MSSDK_INSTRUMENTS and compressed_size > 0:
+        record_mssdk_histogram(MSSDK_METRIC_COMPRESSION_RATIO, uncompressed_size / compressed_size,
+                               {"operation": operation})
+
+
+def record_mssdk_mongodb_document_size(operation: str, size: int) -> None:
+    """Record the BSON size of a MongoDB document read or written, e.g. the length of its raw BSON."""
+    if _MSSDK_INSTRUMENTS:
+        record_mssdk_histogram(MSSDK_METRIC_MONGODB_DOCUMENT_SIZE, size, {"operation": operation})
+
+
+def record_mssdk_cache_access(cache: str, hit: bool) -> None:
+    """Count a hit or a miss of one of the SDK caches."""
+    if _MSSDK_INSTRUMENTS:
+        record_mssdk_counter(MSSDK_METRIC_CACHE_HITS if hit else MSSDK_METRIC_CACHE_MISSES, 1, {"cache": cache})
+
+
+def __getattr__(name: str) -> Any:
+    # MongoDBMetricsListener is imported, with pymongo, on first access
+    if name == "MongoDBMetricsListener":
+        from mapping_suite_sdk.adapters.mongodb_metrics import MongoDBMetricsListener
+        return MongoDBMetricsListener
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,501 @@
+"""
+Binary codec module for the Mapping Suite SDK.
+
+This module encodes models, e.g. mapping packages, in a compact msgpack-style binary format,
+for snapshots, caches and network transfer. Unlike the JSON form of the models, bytes are
+written raw rather than base64 encoded, and the field names and the folders of the asset
+paths are written once and then referenced by index; the encoded models may be compressed
+with zlib or, when available, zstd.
+
+An encoded model starts with a magic number, the format version, the compression and a checksum,
+followed by the (possibly compressed) msgpack encoding of [model class name, model]. Models are
+encoded as maps of their fields and their ID. Values use the msgpack types, and these extension types:
+
+- 1: interned string, first occurrence; the payload is the UTF-8 string
+- 2: interned string reference; the payload is the big-endian index of the string, in order of first occurrence
+- 3: path; the payload is the encoding of [folder (interned), name]
+- 4: content ID; the payload is the raw SHA-256 digest
+
+Other values (e.g. dates) are encoded in their JSON form, and converted back when the decoded
+model is validated.
+"""
+
+import struct
+import zlib
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from mapping_suite_sdk.adapters.tracer import traced_class
+from mapping_suite_sdk.models.core import CoreModel, MSSDK_DEFAULT_STR_ENCODE, _CONTENT_ID_KEY
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+T = TypeVar('T', bound=CoreModel)
+
+MSSDK_MODEL_CODEC_COMPRESSION_NONE = "none"
+MSSDK_MODEL_CODEC_COMPRESSION_ZLIB = "zlib"
+MSSDK_MODEL_CODEC_COMPRESSION_ZSTD = "zstd"
+MSSDK_MODEL_CODEC_VERSION = 1
+
+_MAGIC = b"MSSDKMC"
+# Magic number, version, compression and CRC-32 of the uncompressed body
+_HEADER = struct.Struct(">7sBBI")
+_COMPRESSION_IDS = {MSSDK_MODEL_CODEC_COMPRESSION_NONE: 0,
+                    MSSDK_MODEL_CODEC_COMPRESSION_ZLIB: 1,
+                    MSSDK_MODEL_CODEC_COMPRESSION_ZSTD: 2}
+_COMPRESSION_NAMES = {compression_id: name for name, compression_id in _COMPRESSION_IDS.items()}
+# The ID of a model is encoded under its alias
+_ID_KEY = "_id"
+_CONTENT_ID_SIZE = 32
+
+_EXT_INTERNED_STRING = 1
+_EXT_INTERNED_STRING_REFERENCE = 2
+_EXT_PATH = 3
+_EXT_CONTENT_ID = 4
+
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_FLOAT64 = struct.Struct(">d")
+_FIXED_EXT_CODES = {1: 0xd4, 2: 0xd5, 4: 0xd6, 8: 0xd7, 16: 0xd8}
+
+
+class ModelCodecError(ValueError):
+    pass
+
+
+def _get_zstd_codec() -> Optional[Tuple[Callable[[bytes, Optional[int]], bytes], Callable[[bytes], bytes]]]:
+    """Get the zstd compress and decompress functions, from the standard library or the zstandard package."""
+    try:
+        from compression import zstd
+
+        return (lambda data, level: zstd.compress(data, level=level),
+                zstd.decompress)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        return (lambda data, level: zstandard.ZstdCompressor(level=3 if level is None else level).compress(data),
+                lambda data: zstandard.ZstdDecompressor().decompress(data))
+    except ImportError:
+        return None
+
+
+def _get_zstd_codec_or_raise() -> Tuple[Callable[[bytes, Optional[int]], bytes], Callable[[bytes], bytes]]:
+    zstd_codec = _get_zstd_codec()
+    if zstd_codec is None:
+        raise ModelCodecError("zstd compression requires Python 3.14 or the zstandard package")
+    return zstd_codec
+
+
+class _Encoder:
+    """Encoder of values in msgpack, with interned strings and paths."""
+    __slots__ = ("buffer", "interned_strings")
+
+    def __init__(self, interned_strings: Dict[str, int]):
+        self.buffer = bytearray()
+        self.interned_strings = interned_strings
+
+    def encode(self, value: Any) -> None:
+        value_type = type(value)
+        if value_type is str:
+            self._encode_str(value)
+        elif value is None:
+            self.buffer.append(0xc0)
+        elif value_type is bool:
+            self.buffer.append(0xc3 if value else 0xc2)
+        elif value_type is int:
+            self._encode_int(value)
+        elif value_type is float:
+            self.buffer.append(0xcb)
+            self.buffer += _FLOAT64.pack(value)
+        elif value_type is bytes or value_type is bytearray:
+            self._encode_bin(value)
+        elif isinstance(value, BaseModel):
+            self._encode_model(value)
+        elif isinstance(value, PurePath):
+            self._encode_path(value)
+        elif value_type is list or value_type is tuple:
+            self._encode_container_header(len(value), 0x90, 0xdc, 0xdd)
+            for item in value:
+                self.encode(item)
+        elif value_type is dict:
+            self._encode_container_header(len(value), 0x80, 0xde, 0xdf)
+            for key, item in value.items():
+                self._encode_key(key)
+                self.encode(item)
+        elif isinstance(value, str):
+            self._encode_str(str(value))
+        else:
+            self.encode(to_jsonable_python(value))
+
+    def _encode_int(self, value: int) -> None:
+        buffer = self.buffer
+        if 0 <= value <= 0x7f:
+            buffer.append(value)
+        elif -32 <= value < 0:
+            buffer.append(value & 0xff)
+        elif -0x8000000000000000 <= value <= 0xffffffffffffffff:
+            # The smallest of the 1, 2, 4 and 8 bytes (u)int types holding the value
+            signed = value < 0
+            size_index = next(index for index, size in enumerate((1, 2, 4, 8))
+                              if (-(1 << (8 * size - 1)) <= value if signed else value < (1 << (8 * size))))
+            buffer.append((0xd0 if signed else 0xcc) + size_index)
+            buffer += value.to_bytes(1 << size_index, "big", signed=signed)
+        else:
+            raise ModelCodecError(f"Integer out of the 64 bits range: {value}")
+
+    def _encode_str(self, value: str) -> None:
+        content = value.encode(MSSDK_DEFAULT_STR_ENCODE)
+        size = len(content)
+        buffer = self.buffer
+        if size < 32:
+            buffer.append(0xa0 | size)
+        elif size <= 0xff:
+            buffer += bytes((0xd9, size))
+        elif size <= 0xffff:
+            buffer.append(0xda)
+            buffer += _UINT16.pack(size)
+        else:
+            buffer.append(0xdb)
+            buffer += _UINT32.pack(size)
+        buffer += content
+
+    def _encode_bin(self, value: bytes) -> None:
+        size = len(value)
+        buffer = self.buffer
+        if size <= 0xff:
+            buffer += bytes((0xc4, size))
+        elif size <= 0xffff:
+            buffer.append(0xc5)
+            buffer += _UINT16.pack(size)
+        else:
+            buffer.append(0xc6)
+            buffer += _UINT32.pack(size)
+        buffer += value
+
+    def _encode_container_header(self, size: int, fixed_code: int, code16: int, code32: int) -> None:
+        if size < 16:
+            self.buffer.append(fixed_code | size)
+        elif size <= 0xffff:
+            self.buffer.append(code16)
+            self.buffer += _UINT16.pack(size)
+        else:
+            self.buffer.append(code32)
+            self.buffer += _UINT32.pack(size)
+
+    def _encode_ext(self, ext_type: int, payload: bytes) -> None:
+        size = len(payload)
+        buffer = self.buffer
+        if size in _FIXED_EXT_CODES:
+            buffer += bytes((_FIXED_EXT_CODES[size], ext_type))
+        elif size <= 0xff:
+            buffer += bytes((0xc7, size, ext_type))
+        elif size <= 0xffff:
+            buffer.append(0xc8)
+            buffer += _UINT16.pack(size)
+            buffer.append(ext_type)
+        else:
+            buffer.append(0xc9)
+            buffer += _UINT32.pack(size)
+            buffer.append(ext_type)
+        buffer += payload
+
+    def _encode_interned_str(self, value: str) -> None:
+        index = self.interned_strings.get(value)
+        if index is None:
+            self.interned_strings[value] = len(self.interned_strings)
+            self._encode_ext(_EXT_INTERNED_STRING, value.encode(MSSDK_DEFAULT_STR_ENCODE))
+        else:
+            self._encode_ext(_EXT_INTERNED_STRING_REFERENCE,
+                             index.to_bytes(1 if index <= 0xff else 2 if index <= 0xffff else 4, "big"))
+
+    def _encode_key(self, key: Any) -> None:
+        if type(key) is str:
+            self._encode_interned_str(key)
+        else:
+            self.encode(key)
+
+    def _encode_path(self, value: PurePath) -> None:
+        payload_encoder = _Encoder(self.interned_strings)
+        payload_encoder.buffer.append(0x92)
+        payload_encoder._encode_interned_str(str(value.parent))
+        payload_encoder._encode_str(value.name)
+        self._encode_ext(_EXT_PATH, bytes(payload_encoder.buffer))
+
+    def _encode_model(self, model: BaseModel) -> None:
+        model_dict = model.__dict__
+        field_names = [field_name for field_name in type(model).model_fields if field_name != "id"]
+        model_id = model_dict.get("id")
+        has_id = isinstance(model, CoreModel) and model_id is not None
+
+        self._encode_container_header(len(field_names) + has_id, 0x80, 0xde, 0xdf)
+        if has_id:
+            self._encode_interned_str(_ID_KEY)
+            if model.has_content_id():
+                self._encode_ext(_EXT_CONTENT_ID, bytes.fromhex(model_id))
+            else:
+                self._encode_str(model_id)
+        for field_name in field_names:
+            self._encode_interned_str(field_name)
+            self.encode(model_dict[field_name])
+
+
+class _Decoder:
+    """Decoder of values encoded by _Encoder.
+
+    Content IDs are collected to be restored on the decoded models, if trusted, or decoded
+    as None, so they are generated again when the models are validated.
+    """
+    __slots__ = ("data", "position", "interned_strings", "trust_content_ids", "content_ids")
+
+    def __init__(self, data: memoryview, trust_content_ids: bool):
+        self.data = data
+        self.position = 0
+        self.interned_strings: List[str] = []
+        self.trust_content_ids = trust_content_ids
+        self.content_ids: Set[str] = set()
+
+    def _read(self, size: int) -> memoryview:
+        start = self.position
+        self.position += size
+        if self.position > len(self.data):
+            raise ModelCodecError("Unexpected end of the encoded model")
+        return self.data[start:self.position]
+
+    def _unpack(self, value_struct: struct.Struct) -> Any:
+        return value_struct.unpack(self._read(value_struct.size))[0]
+
+    def _read_str(self, size: int) -> str:
+        return str(self._read(size), MSSDK_DEFAULT_STR_ENCODE)
+
+    def decode(self) -> Any:
+        code = self._read(1)[0]
+        if code <= 0x7f:
+            return code
+        if code >= 0xe0:
+            return code - 0x100
+        if 0xa0 <= code <= 0xbf:
+            return self._read_str(code & 0x1f)
+        if 0x90 <= code <= 0x9f:
+            return self._decode_array(code & 0x0f)
+        if 0x80 <= code <= 0x8f:
+            return self._decode_map(code & 0x0f)
+        if code == 0xc0:
+            return None
+        if code == 0xc2:
+            return False
+        if code == 0xc3:
+            return True
+        if code == 0xd9:
+            return self._read_str(self._read(1)[0])
+        if code == 0xda:
+            return self._read_str(self._unpack(_UINT16))
+        if code == 0xdb:
+            return self._read_str(self._unpack(_UINT32))
+        if code == 0xc4:
+            return bytes(self._read(self._read(1)[0]))
+        if code == 0xc5:
+            return bytes(self._read(self._unpack(_UINT16)))
+        if code == 0xc6:
+            return bytes(self._read(self._unpack(_UINT32)))
+        if code == 0xdc:
+            return self._decode_array(self._unpack(_UINT16))
+        if code == 0xdd:
+            return self._decode_array(self._unpack(_UINT32))
+        if code == 0xde:
+            return self._decode_map(self._unpack(_UINT16))
+        if code == 0xdf:
+            return self._decode_map(self._unpack(_UINT32))
+        if code == 0xcb:
+            return self._unpack(_FLOAT64)
+        if code == 0xca:
+            return struct.unpack(">f", self._read(4))[0]
+        if 0xcc <= code <= 0xcf:
+            return int.from_bytes(self._read(1 << (code - 0xcc)), "big")
+        if 0xd0 <= code <= 0xd3:
+            return int.from_bytes(self._read(1 << (code - 0xd0)), "big", signed=True)
+        if 0xd4 <= code <= 0xd8:
+            ext_type = self._read(1)[0]
+            return self._decode_ext(ext_type, 1 << (code - 0xd4))
+        if code == 0xc7:
+            size = self._read(1)[0]
+            return self._decode_ext(self._read(1)[0], size)
+        if code == 0xc8:
+            size = self._unpack(_UINT16)
+            return self._decode_ext(self._read(1)[0], size)
+        if code == 0xc9:
+            size = self._unpack(_UINT32)
+            return self._decode_ext(self._read(1)[0], size)
+        raise ModelCodecError(f"Unsupported type code in the encoded model: {code:#x}")
+
+    def _decode_array(self, size: int) -> List[Any]:
+        return [self.decode() for _ in range(size)]
+
+    def _decode_map(self, size: int) -> Dict[Any, Any]:
+        decoded_map = {}
+        for _ in range(size):
+            key = self.decode()
+            decoded_map[key] = self.decode()
+        return decoded_map
+
+    def _decode_ext(self, ext_type: int, size: int) -> Any:
+        if ext_type == _EXT_INTERNED_STRING:
+            value = self._read_str(size)
+            self.interned_strings.append(value)
+            return value
+        if ext_type == _EXT_INTERNED_STRING_REFERENCE:
+            index = int.from_bytes(self._read(size), "big")
+            if index >= len(self.interned_strings):
+                raise ModelCodecError(f"Interned string {index} is referenced before its first occurrence")
+            return self.interned_strings[index]
+        if ext_type == _EXT_PATH:
+            end_position = self.position + size
+            path_parts = self.decode()
+            if self.position != end_position or not isinstance(path_parts, list) or len(path_parts) != 2:
+                raise ModelCodecError("Invalid path in the encoded model")
+            return Path(*path_parts)
+        if ext_type == _EXT_CONTENT_ID:
+            if size != _CONTENT_ID_SIZE:
+                raise ModelCodecError("Invalid content ID in the encoded model")
+            content_id = self._read(size).hex()
+            if not self.trust_content_ids:
+                return None
+            self.content_ids.add(content_id)
+            return content_id
+        raise ModelCodecError(f"Unsupported extension type in the encoded model: {ext_type}")
+
+
+def _restore_content_ids(value: Any, content_ids: Set[str]) -> None:
+    """Mark the IDs of the decoded models which were content IDs when encoded as content IDs again."""
+    if isinstance(value, CoreModel):
+        if value.id in content_ids:
+            value.__dict__[_CONTENT_ID_KEY] = value.id
+        for field_name in type(value).model_fields:
+            _restore_content_ids(value.__dict__[field_name], content_ids)
+    elif isinstance(value, list):
+        for item in value:
+            _restore_content_ids(item, content_ids)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _restore_content_ids(item, content_ids)
+
+
+@traced_class
+class BinaryModelCodec(Generic[T]):
+    """Encodes models to, and decodes them from, a compact binary form (see the module documentation).
+
+    Decoded models are validated, and equal to the encoded ones, with the same IDs. Content IDs
+    are encoded along with the models, and by default trusted when decoding, rather than hashed
+    again from the decoded fields, which is most of the cost of validating large models; the
+    encoded body is checked against its CRC-32, so corrupted data is not decoded. Decode data
+    which may have been tampered with using trust_content_ids=False.
+    Cached values, such as content digests or the persisted state of a model, are not encoded.
+    """
+
+    def __init__(self,
+                 model_class: Type[T] = MappingPackage,
+                 compression: Optional[str] = MSSDK_MODEL_CODEC_COMPRESSION_NONE,
+                 compression_level: Optional[int] = None,
+                 trust_content_ids: bool = True):
+        """
+        Args:
+            model_class: Class of the encoded models
+            compression: "none", "zlib", or "zstd" (requires Python 3.14 or the zstandard package)
+            compression_level: Optional compression level, by default the zlib or zstd default
+            trust_content_ids: Whether to restore the encoded content IDs when decoding, rather than
+                generating them again
+
+        Raises:
+            ValueError: If the compression is unknown or unavailable
+        """
+        compression = compression or MSSDK_MODEL_CODEC_COMPRESSION_NONE
+        if compression not in _COMPRESSION_IDS:
+            raise ValueError(f"Unsupported compression: {compression}, "
+                             f"expected one of {list(_COMPRESSION_IDS)}")
+        if compression == MSSDK_MODEL_CODEC_COMPRESSION_ZSTD:
+            _get_zstd_codec_or_raise()
+
+        self.model_class = model_class
+        self.compression = compression
+        self.compression_level = compression_level
+        self.trust_content_ids = trust_content_ids
+
+    def encode(self, model: T) -> bytes:
+        """
+        Encode a model.
+
+        Args:
+            model: The model to encode, an instance of the model class of the codec
+
+        Returns:
+            bytes: The encoded model
+        """
+        encoder = _Encoder({})
+        encoder.buffer.append(0x92)
+        encoder.encode(self.model_class.__name__)
+        encoder.encode(model)
+        body = bytes(encoder.buffer)
+        checksum = zlib.crc32(body)
+
+        if self.compression == MSSDK_MODEL_CODEC_COMPRESSION_ZLIB:
+            body = zlib.compress(body, -1 if self.compression_level is None else self.compression_level)
+        elif self.compression == MSSDK_MODEL_CODEC_COMPRESSION_ZSTD:
+            body = _get_zstd_codec_or_raise()[0](body, self.compression_level)
+        return _HEADER.pack(_MAGIC, MSSDK_MODEL_CODEC_VERSION, _COMPRESSION_IDS[self.compression], checksum) + body
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> T:
+        """
+        Decode a model encoded with any compression.
+
+        Args:
+            data: The encoded model
+
+        Returns:
+            The decoded model, validated
+
+        Raises:
+            ModelCodecError: If the data is not an encoded model of the model class of the codec
+        """
+        data = memoryview(data)
+        if len(data) < _HEADER.size:
+            raise ModelCodecError("The data is not an encoded model")
+        magic, version, compression_id, checksum = _HEADER.unpack(data[:_HEADER.size])
+        if magic != _MAGIC:
+            raise ModelCodecError("The data is not an encoded model")
+        if version != MSSDK_MODEL_CODEC_VERSION:
+            raise ModelCodecError(f"Unsupported encoded model version: {version}")
+        if compression_id not in _COMPRESSION_NAMES:
+            raise ModelCodecError(f"Unsupported encoded model compression: {compression_id}")
+
+        body = data[_HEADER.size:]
+        compression = _COMPRESSION_NAMES[compression_id]
+        try:
+            if compression == MSSDK_MODEL_CODEC_COMPRESSION_ZLIB:
+                body = memoryview(zlib.decompress(body))
+            elif compression == MSSDK_MODEL_CODEC_COMPRESSION_ZSTD:
+                body = memoryview(_get_zstd_codec_or_raise()[1](body))
+        except ModelCodecError:
+            raise
+        except Exception as e:
+            raise ModelCodecError(f"Failed to decompress the encoded model: {e}")
+        if zlib.crc32(body) != checksum:
+            raise ModelCodecError("The encoded model does not match its checksum")
+
+        decoder = _Decoder(body, self.trust_content_ids)
+        try:
+            decoded_value = decoder.decode()
+        except (struct.error, UnicodeDecodeError, TypeError) as e:
+            raise ModelCodecError(f"Invalid encoded model: {e}")
+        if decoder.position != len(body) or not isinstance(decoded_value, list) or len(decoded_value) != 2:
+            raise ModelCodecError("Invalid encoded model")
+
+        model_class_name, document = decoded_value
+        if model_class_name != self.model_class.__name__:
+            raise ModelCodecError(f"The data is an encoded {model_class_name}, not a {self.model_class.__name__}")
+        model = self.model_class.model_validate(document)
+        if decoder.content_ids:
+            _restore_content_ids(model, decoder.content_ids)
+        return model
@@ -0,0 +1,91 @@
+"""
+Model document module for the Mapping Suite SDK.
+
+This module provides the document form of the models shared by the repositories and
+streams: conversion of a model to a JSON document, the replacement of the long strings
+of a document by references to content-addressed blobs, and the evaluation of simple
+filters on the fields of a document.
+"""
+
+from typing import Any, Callable, Dict, Set
+
+from mapping_suite_sdk.models.core import CoreModel, MSSDK_DEFAULT_STR_ENCODE
+
+# Key of the documents referencing a blob, e.g. {"$blob": "<sha256 of the blob>"}
+MSSDK_BLOB_REFERENCE_KEY = "$blob"
+
+
+def model_to_document(model: CoreModel) -> Dict[str, Any]:
+    """Convert a model to a JSON document, with its ID as "_id"."""
+    model_dict = model.model_dump(by_alias=True, mode="json")
+    model_dict["_id"] = model.id
+    return model_dict
+
+
+def replace_long_strings(value: Any, min_size: int, store_blob: Callable[[bytes], str]) -> Any:
+    """Replace the strings of a document at least min_size long by references to the blobs storing them."""
+    if isinstance(value, dict):
+        return {key: replace_long_strings(item, min_size, store_blob) for key, item in value.items()}
+    if isinstance(value, list):
+        return [replace_long_strings(item, min_size, store_blob) for item in value]
+    if isinstance(value, str) and len(value) >= min_size:
+        return {MSSDK_BLOB_REFERENCE_KEY: store_blob(value.encode(MSSDK_DEFAULT_STR_ENCODE))}
+    return value
+
+
+def resolve_blob_references(value: Any, read_blob: Callable[[str], bytes]) -> Any:
+    """Replace the blob references of a manifest by the strings they store."""
+    if isinstance(value, dict):
+        if MSSDK_BLOB_REFERENCE_KEY in value:
+            return read_blob(value[MSSDK_BLOB_REFERENCE_KEY]).decode(MSSDK_DEFAULT_STR_ENCODE)
+        return {key: resolve_blob_references(item, read_blob) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_blob_references(item, read_blob) for item in value]
+    return value
+
+
+def collect_blob_references(value: Any, referenced_digests: Set[str]) -> None:
+    """Add the digests of the blobs referenced by a manifest to a set."""
+    if isinstance(value, dict):
+        if MSSDK_BLOB_REFERENCE_KEY in value:
+            referenced_digests.add(value[MSSDK_BLOB_REFERENCE_KEY])
+        for item in value.values():
+            collect_blob_references(item, referenced_digests)
+    elif isinstance(value, list):
+        for item in value:
+            collect_blob_references(item, referenced_digests)
+
+
+def get_document_field(manifest: Dict[str, Any], field_path: str, read_blob: Callable[[str], bytes]) -> Any:
+    """Get the value of a dotted field path of a manifest, resolving the blob references it contains."""
+    value: Any = manifest
+    for key in field_path.split("."):
+        if isinstance(value, dict) and MSSDK_BLOB_REFERENCE_KEY not in value:
+            value = value.get(key)
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+    return resolve_blob_references(value, read_blob)
+
+
+def matches_filter(value: Any, condition: Any) -> bool:
+    """Check a field value against a filter condition: a value, or a dict of $in and $ne operators.
+
+    As in MongoDB, a condition on a single value matches the lists containing it.
+    """
+    if isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+        for operator, operand in condition.items():
+            if operator == "$in":
+                if not any(matches_filter(value, item) for item in operand):
+                    return False
+            elif operator == "$ne":
+                if matches_filter(value, operand):
+                    return False
+            else:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+        return True
+    if isinstance(value, list) and not isinstance(condition, list):
+        return condition in value
+
+    return value == condition
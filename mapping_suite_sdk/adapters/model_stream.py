@@ -0,0 +1,179 @@
+import hashlib
+import json
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Set, Tuple
+
+from mapping_suite_sdk.adapters.filesystem_repository import MSSDK_FILESYSTEM_BLOB_MIN_SIZE
+from mapping_suite_sdk.adapters.model_document import model_to_document, replace_long_strings, \
+    resolve_blob_references
+from mapping_suite_sdk.models.core import CoreModel, MSSDK_DEFAULT_STR_ENCODE
+
+MSSDK_MODEL_STREAM_FORMAT_NDJSON = "ndjson"
+MSSDK_MODEL_STREAM_FORMAT_BINARY = "binary"
+MSSDK_MODEL_STREAM_VERSION = 1
+
+_MODEL_STREAM_NAME = "mssdk-model-stream"
+_BINARY_MAGIC = b"MSSDKMS\x01"
+_BINARY_FRAME_HEADER = struct.Struct(">cQ")
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+_RECORD_HEADER = "header"
+_RECORD_BLOB = "blob"
+_RECORD_MODEL = "model"
+_BINARY_RECORD_KINDS = {_RECORD_HEADER: b"H", _RECORD_BLOB: b"B", _RECORD_MODEL: b"M"}
+_BINARY_RECORD_NAMES = {kind: name for name, kind in _BINARY_RECORD_KINDS.items()}
+
+
+class ModelStreamError(ValueError):
+    pass
+
+
+class ModelStreamWriter:
+    """Writes models to a single NDJSON or length-prefixed binary stream, with deduplicated assets.
+
+    Long strings of the models (asset contents) are written once as blob records, keyed by their
+    SHA-256, before the first model referencing them; models are written as manifests referencing
+    the blobs. Only the digests of the written blobs are kept in memory.
+
+    NDJSON streams hold one JSON record per line. Binary streams start with a magic number,
+    followed by frames made of a one byte record kind, an 8 bytes big-endian payload length
+    and the payload; blob payloads are the raw digest followed by the raw content.
+    """
+
+    def __init__(self,
+                 output_stream: BinaryIO,
+                 stream_format: str = MSSDK_MODEL_STREAM_FORMAT_NDJSON,
+                 model_class_name: Optional[str] = None,
+                 blob_min_size: int = MSSDK_FILESYSTEM_BLOB_MIN_SIZE):
+        if stream_format not in (MSSDK_MODEL_STREAM_FORMAT_NDJSON, MSSDK_MODEL_STREAM_FORMAT_BINARY):
+            raise ValueError(f"Unsupported model stream format: {stream_format}")
+
+        self.output_stream = output_stream
+        self.stream_format = stream_format
+        self.blob_min_size = blob_min_size
+        self.model_count = 0
+        self._written_digests: Set[str] = set()
+        if stream_format == MSSDK_MODEL_STREAM_FORMAT_BINARY:
+            self.output_stream.write(_BINARY_MAGIC)
+        self._write_json_record(_RECORD_HEADER, {"format": _MODEL_STREAM_NAME,
+                                                 "version": MSSDK_MODEL_STREAM_VERSION,
+                                                 "model_class": model_class_name})
+
+    def _write_frame(self, record_kind: str, payload: bytes) -> None:
+        self.output_stream.write(_BINARY_FRAME_HEADER.pack(_BINARY_RECORD_KINDS[record_kind], len(payload)))
+        self.output_stream.write(payload)
+
+    def _write_json_record(self, record_kind: str, record: Dict[str, Any]) -> None:
+        if self.stream_format == MSSDK_MODEL_STREAM_FORMAT_BINARY:
+            self._write_frame(record_kind, json.dumps(record).encode(MSSDK_DEFAULT_STR_ENCODE))
+        else:
+            line = json.dumps({"kind": record_kind, **record}, separators=(",", ":")) + "\n"
+            self.output_stream.write(line.encode(MSSDK_DEFAULT_STR_ENCODE))
+
+    def _write_blob(self, content: bytes) -> str:
+        digest = hashlib.sha256(content)
+        hex_digest = digest.hexdigest()
+        if hex_digest not in self._written_digests:
+            if self.stream_format == MSSDK_MODEL_STREAM_FORMAT_BINARY:
+                self._write_frame(_RECORD_BLOB, digest.digest() + content)
+            else:
+                self._write_json_record(_RECORD_BLOB, {"digest": hex_digest,
+                                                       "content": content.decode(MSSDK_DEFAULT_STR_ENCODE)})
+            self._written_digests.add(hex_digest)
+        return hex_digest
+
+    def write(self, model: CoreModel) -> None:
+        """Write a model, preceded by the blobs of its assets which were not written yet."""
+        manifest = replace_long_strings(model_to_document(model), self.blob_min_size, self._write_blob)
+        self._write_json_record(_RECORD_MODEL, {"document": manifest})
+        self.model_count += 1
+
+
+class ModelStreamReader:
+    """Reads the model documents of a stream written by ModelStreamWriter, in either format.
+
+    Blobs are spooled to a temporary directory as they are read, so reading uses constant memory
+    whatever the size of the stream. Use the reader as a context manager, to delete the
+    temporary directory once done.
+    """
+
+    def __init__(self, input_stream: BinaryIO):
+        self.input_stream = input_stream
+
+        magic = self.input_stream.read(len(_BINARY_MAGIC))
+        self.stream_format = MSSDK_MODEL_STREAM_FORMAT_BINARY if magic == _BINARY_MAGIC else \
+            MSSDK_MODEL_STREAM_FORMAT_NDJSON
+        self._first_line_prefix = b"" if self.stream_format == MSSDK_MODEL_STREAM_FORMAT_BINARY else magic
+
+        self._records = self._iter_records()
+        record_kind, header = next(self._records, (None, None))
+        if record_kind != _RECORD_HEADER or header.get("format") != _MODEL_STREAM_NAME:
+            raise ModelStreamError("The stream is not a model stream")
+        if header.get("version") != MSSDK_MODEL_STREAM_VERSION:
+            raise ModelStreamError(f"Unsupported model stream version: {header.get('version')}")
+        self.model_class_name: Optional[str] = header.get("model_class")
+        # Created once the header is checked, so that no directory is left behind by invalid streams
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._blobs_path = Path(self._temporary_directory.name)
+
+    def close(self) -> None:
+        self._temporary_directory.cleanup()
+
+    def __enter__(self) -> 'ModelStreamReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _read_exactly(self, size: int) -> bytes:
+        content = self.input_stream.read(size)
+        if len(content) != size:
+            raise ModelStreamError("Unexpected end of the model stream")
+        return content
+
+    def _iter_records(self) -> Iterator[Tuple[str, Any]]:
+        if self.stream_format == MSSDK_MODEL_STREAM_FORMAT_BINARY:
+            while frame_header := self.input_stream.read(_BINARY_FRAME_HEADER.size):
+                if len(frame_header) != _BINARY_FRAME_HEADER.size:
+                    raise ModelStreamError("Unexpected end of the model stream")
+                record_kind, payload_size = _BINARY_FRAME_HEADER.unpack(frame_header)
+                if record_kind not in _BINARY_RECORD_NAMES:
+                    raise ModelStreamError(f"Unknown model stream record kind: {record_kind!r}")
+                payload = self._read_exactly(payload_size)
+                if _BINARY_RECORD_NAMES[record_kind] == _RECORD_BLOB:
+                    yield _RECORD_BLOB, (payload[:_DIGEST_SIZE].hex(), payload[_DIGEST_SIZE:])
+                else:
+                    yield _BINARY_RECORD_NAMES[record_kind], json.loads(payload)
+        else:
+            for line_index, line in enumerate(self.input_stream):
+                if line_index == 0:
+                    line = self._first_line_prefix + line
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                record_kind = record.pop("kind", None)
+                if record_kind == _RECORD_BLOB:
+                    yield _RECORD_BLOB, (record["digest"], record["content"].encode(MSSDK_DEFAULT_STR_ENCODE))
+                else:
+                    yield record_kind, record
+
+    def _read_blob(self, digest: str) -> bytes:
+        try:
+            return (self._blobs_path / digest).read_bytes()
+        except FileNotFoundError:
+            raise ModelStreamError(f"Blob {digest} is referenced before being written")
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the model documents of the stream, with their assets."""
+        for record_kind, record in self._records:
+            if record_kind == _RECORD_BLOB:
+                digest, content = record
+                if hashlib.sha256(content).hexdigest() != digest:
+                    raise ModelStreamError(f"Blob {digest} does not match its digest")
+                (self._blobs_path / digest).write_bytes(content)
+            elif record_kind == _RECORD_MODEL:
+                yield resolve_blob_references(record["document"], self._read_blob)
+            else:
+                raise ModelStreamError(f"Unexpected model stream record: {record_kind}")
@@ -0,0 +1,31 @@
+"""
+MongoDB metrics module for the Mapping Suite SDK.
+
+This module provides the pymongo command listener counting the MongoDB round trips in the
+SDK metrics. It is separate from the metrics module, so pymongo is only imported by the
+applications using it.
+"""
+
+from pymongo import monitoring
+
+from mapping_suite_sdk.adapters.metrics import record_mssdk_counter, MSSDK_METRIC_MONGODB_ROUND_TRIPS
+
+
+class MongoDBMetricsListener(monitoring.CommandListener):
+    """pymongo command listener counting the MongoDB round trips in the SDK metrics.
+
+    Every command sent to the server is a round trip; they are counted by command name
+    (e.g. "find", "getMore", "insert") and outcome. Pass the listener to the clients used
+    by the repositories, e.g. MongoClient(uri, event_listeners=[MongoDBMetricsListener()]).
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        record_mssdk_counter(MSSDK_METRIC_MONGODB_ROUND_TRIPS, 1,
+                             {"command": event.command_name, "status": "success"})
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        record_mssdk_counter(MSSDK_METRIC_MONGODB_ROUND_TRIPS, 1,
+                             {"command": event.command_name, "status": "error"})
@@ -0,0 +1,257 @@
+"""
+Profiling module for the Mapping Suite SDK.
+
+This module provides an opt-in profiling mode, which runs the outermost traced SDK calls
+(the functions and methods decorated with traced_routine or traced_class) under cProfile
+and/or tracemalloc. Each profiled call writes a pstats file or a top-N allocation report,
+and records summary numbers as attributes of its span when tracing is enabled.
+
+Profiling is rate limited: each operation is profiled at most once per interval, and a
+single call is profiled at a time in the process, as both profilers are process wide.
+"""
+
+import cProfile
+import itertools
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import ContextManager, Dict, Iterable, Iterator, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span
+
+MSSDK_PROFILER_CPROFILE = "cprofile"
+MSSDK_PROFILER_TRACEMALLOC = "tracemalloc"
+### Number of allocation sites listed in the tracemalloc reports
+MSSDK_PROFILING_TOP_N = 25
+### Minimum time, in seconds, between two profiles of the same operation
+MSSDK_PROFILING_MIN_INTERVAL = 60.0
+
+# Environment variables to control profiling state
+_MSSDK_PROFILE_VAR_NAME = "MSSDK_PROFILE"
+_MSSDK_PROFILE_FOLDER_VAR_NAME = "MSSDK_PROFILE_FOLDER"
+_MSSDK_DEFAULT_PROFILE_FOLDER_NAME = "mssdk-profiles"
+_MSSDK_PROFILERS = (MSSDK_PROFILER_CPROFILE, MSSDK_PROFILER_TRACEMALLOC)
+
+# Whether the current context runs in a profiled call, whose nested SDK calls are not profiled again
+_MSSDK_PROFILED_CALL: ContextVar[bool] = ContextVar("mssdk_profiled_call", default=False)
+# Held while a call is profiled: cProfile and tracemalloc can't profile two calls at once
+_MSSDK_PROFILER_LOCK = threading.Lock()
+_MSSDK_PROFILE_COUNTER = itertools.count()
+_NO_PROFILE = nullcontext()
+
+
+class _MSSDKProfilingState:
+    """Resolved profiling configuration, read by the tracing decorators on every call."""
+    __slots__ = ("enabled", "profilers", "output_folder_path", "top_n", "min_interval", "last_profile_times")
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.profilers: Tuple[str, ...] = (MSSDK_PROFILER_CPROFILE,)
+        self.output_folder_path: Path = Path(tempfile.gettempdir()) / _MSSDK_DEFAULT_PROFILE_FOLDER_NAME
+        self.top_n: int = MSSDK_PROFILING_TOP_N
+        self.min_interval: float = MSSDK_PROFILING_MIN_INTERVAL
+        # Monotonic time of the last profile of each operation, for rate limiting
+        self.last_profile_times: Dict[str, float] = {}
+
+
+_MSSDK_PROFILING_STATE = _MSSDKProfilingState()
+
+
+def refresh_mssdk_profiling() -> None:
+    """
+    Resolve the profiling state again from the MSSDK_PROFILE and MSSDK_PROFILE_FOLDER environment variables.
+
+    Returns:
+        None
+    """
+    _MSSDK_PROFILING_STATE.enabled = os.getenv(_MSSDK_PROFILE_VAR_NAME, 'false').casefold().strip() == 'true'
+    output_folder = os.getenv(_MSSDK_PROFILE_FOLDER_VAR_NAME)
+    if output_folder:
+        _MSSDK_PROFILING_STATE.output_folder_path = Path(output_folder)
+
+
+def set_mssdk_profiling(state: bool,
+                        profilers: Optional[Iterable[str]] = None,
+                        output_folder_path: Optional[Path] = None,
+                        top_n: Optional[int] = None,
+                        min_interval: Optional[float] = None) -> None:
+    """
+    Set the profiling state for the SDK.
+
+    Options which are not provided keep their current value.
+
+    Args:
+        state: The desired profiling state (ON or OFF)
+        profilers: Profilers to run, "cprofile" (the default) and/or "tracemalloc"
+        output_folder_path: Folder of the profile files, by default "mssdk-profiles" in the
+            temporary folder (or the MSSDK_PROFILE_FOLDER environment variable)
+        top_n: Number of allocation sites listed in the tracemalloc reports
+        min_interval: Minimum time, in seconds, between two profiles of the same operation
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If a profiler is unknown, or no profiler is given
+    """
+    if profilers is not None:
+        profilers = tuple(profilers)
+        unknown_profilers = set(profilers) - set(_MSSDK_PROFILERS)
+        if unknown_profilers or not profilers:
+            raise ValueError(f"The profilers must be among {list(_MSSDK_PROFILERS)}, got {list(profilers)}")
+        _MSSDK_PROFILING_STATE.profilers = profilers
+    if output_folder_path is not None:
+        _MSSDK_PROFILING_STATE.output_folder_path = Path(output_folder_path)
+        os.environ[_MSSDK_PROFILE_FOLDER_VAR_NAME] = str(output_folder_path)
+    if top_n is not None:
+        _MSSDK_PROFILING_STATE.top_n = top_n
+    if min_interval is not None:
+        _MSSDK_PROFILING_STATE.min_interval = min_interval
+        _MSSDK_PROFILING_STATE.last_profile_times = {}
+
+    os.environ[_MSSDK_PROFILE_VAR_NAME] = str(state).casefold().strip()
+    _MSSDK_PROFILING_STATE.enabled = os.environ[_MSSDK_PROFILE_VAR_NAME] == 'true'
+
+
+def get_mssdk_profiling() -> bool:
+    """
+    Get the current profiling state.
+
+    Returns:
+        The current profiling state (true or false)
+    """
+    return _MSSDK_PROFILING_STATE.enabled
+
+
+def _should_profile(operation_name: str) -> bool:
+    """Check if an operation can be profiled now, and if so take the profiler lock and record the profile time."""
+    state = _MSSDK_PROFILING_STATE
+    if not state.enabled or _MSSDK_PROFILED_CALL.get():
+        return False
+
+    now = time.monotonic()
+    last_profile_time = state.last_profile_times.get(operation_name)
+    if last_profile_time is not None and now - last_profile_time < state.min_interval:
+        return False
+    if not _MSSDK_PROFILER_LOCK.acquire(blocking=False):
+        return False
+    state.last_profile_times[operation_name] = now
+    return True
+
+
+def _profile_file_path(operation_name: str, suffix: str) -> Path:
+    output_folder_path = _MSSDK_PROFILING_STATE.output_folder_path
+    output_folder_path.mkdir(parents=True, exist_ok=True)
+    return output_folder_path / (f"{operation_name}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-"
+                                 f"{next(_MSSDK_PROFILE_COUNTER)}{suffix}")
+
+
+def _write_cprofile_report(operation_name: str, profile: cProfile.Profile, span: Optional["Span"]) -> None:
+    stats = pstats.Stats(profile)
+    profile_path = _profile_file_path(operation_name, ".pstats")
+    stats.dump_stats(profile_path)
+    if span is not None:
+        span.set_attribute("profile.cprofile.path", str(profile_path))
+        span.set_attribute("profile.cprofile.function_calls", stats.total_calls)
+        span.set_attribute("profile.cprofile.total_time_ms", stats.total_tt * 1000)
+
+
+def _write_tracemalloc_report(operation_name: str, start_snapshot: Optional[tracemalloc.Snapshot],
+                              start_memory: int, span: Optional["Span"]) -> None:
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    trace_filters = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+    snapshot = tracemalloc.take_snapshot().filter_traces(trace_filters)
+    if start_snapshot is not None:
+        statistics = snapshot.compare_to(start_snapshot.filter_traces(trace_filters), "lineno")
+    else:
+        statistics = snapshot.statistics("lineno")
+
+    report_path = _profile_file_path(operation_name, ".tracemalloc.txt")
+    top_n = _MSSDK_PROFILING_STATE.top_n
+    report_lines = [f"Operation: {operation_name}",
+                    f"Peak traced memory: {peak_memory - start_memory} B",
+                    f"Memory still allocated: {current_memory - start_memory} B",
+                    f"Top {top_n} allocation sites:",
+                    *(str(statistic) for statistic in statistics[:top_n])]
+    report_path.write_text("\n".join(report_lines) + "\n")
+    if span is not None:
+        span.set_attribute("profile.tracemalloc.path", str(report_path))
+        span.set_attribute("profile.tracemalloc.peak_bytes", peak_memory - start_memory)
+        span.set_attribute("profile.tracemalloc.allocated_bytes", current_memory - start_memory)
+
+
+@contextmanager
+def _profiled(operation_name: str, span: Optional["Span"]) -> Iterator[None]:
+    profilers = _MSSDK_PROFILING_STATE.profilers
+    profiled_call_token = _MSSDK_PROFILED_CALL.set(True)
+    profile = cProfile.Profile() if MSSDK_PROFILER_CPROFILE in profilers else None
+    trace_memory = MSSDK_PROFILER_TRACEMALLOC in profilers
+    stop_tracemalloc = False
+    start_snapshot, start_memory = None, 0
+    try:
+        if trace_memory:
+            if tracemalloc.is_tracing():
+                # Allocations traced before the call are reported as differences
+                start_snapshot = tracemalloc.take_snapshot()
+            else:
+                tracemalloc.start()
+                stop_tracemalloc = True
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError as e:
+                # Another profiler is active, e.g. a sys.monitoring tool since Python 3.12: profiling must
+                # not fail the profiled operation, which runs without cProfile
+                profile = None
+                if span is not None:
+                    span.set_attribute("profile.error", str(e))
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            try:
+                if profile is not None:
+                    _write_cprofile_report(operation_name, profile, span)
+                if trace_memory:
+                    _write_tracemalloc_report(operation_name, start_snapshot, start_memory, span)
+            except OSError as e:
+                # Profiling must not fail the profiled operation
+                if span is not None:
+                    span.set_attribute("profile.error", str(e))
+    finally:
+        if stop_tracemalloc:
+            tracemalloc.stop()
+        _MSSDK_PROFILED_CALL.reset(profiled_call_token)
+        _MSSDK_PROFILER_LOCK.release()
+
+
+def profiled_call(operation_name: str, span: Optional["Span"] = None) -> ContextManager[None]:
+    """
+    Profile the body of the with statement, if profiling is enabled and the operation can be profiled now.
+
+    Calls nested in a profiled call are not profiled again. Operations profiled less than the
+    minimum interval ago, and calls made while another call is profiled, are not profiled.
+
+    Args:
+        operation_name: Name of the operation, used for rate limiting and in the profile file names
+        span: Optional span of the call, to record the profile summary on
+
+    Returns:
+        A context manager profiling its body, or doing nothing
+    """
+    if not _MSSDK_PROFILING_STATE.enabled or not _should_profile(operation_name):
+        return _NO_PROFILE
+    return _profiled(operation_name, span)
+
+
+refresh_mssdk_profiling()
@@ -1,13 +1,41 @@
+import re
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterator, List, Mapping, Optional, Set, Tuple, Type, TypeVar, \
+    TYPE_CHECKING
 
-from pymongo import MongoClient
+from pymongo import MongoClient, IndexModel, ASCENDING
 
+from mapping_suite_sdk.adapters.metrics import record_mssdk_cache_access, record_mssdk_mongodb_document_size, \
+    is_mssdk_metrics_enabled
+from mapping_suite_sdk.adapters.model_document import model_to_document
 from mapping_suite_sdk.adapters.tracer import traced_class
 from mapping_suite_sdk.models.core import CoreModel
+from mapping_suite_sdk.models.mapping_package import MappingPackage, MappingPackageMetadata
+
+if TYPE_CHECKING:
+    # Motor is only needed by the callers of AsyncMongoDBRepository, which pass their client
+    from motor.motor_asyncio import AsyncIOMotorClient
 
 T = TypeVar('T', bound=CoreModel)
 
+### Declarative MongoDB indexes per model class (field paths use the field aliases, as stored)
+_MONGODB_INDEX_SPECS: Dict[Type[CoreModel], List[IndexModel]] = {
+    MappingPackage: [
+        IndexModel([("metadata.identifier", ASCENDING), ("metadata.mapping_version", ASCENDING)],
+                   name="metadata_identifier_mapping_version"),
+        IndexModel([("metadata.mapping_type", ASCENDING)], name="metadata_mapping_type"),
+    ],
+    MappingPackageMetadata: [
+        IndexModel([("identifier", ASCENDING), ("mapping_version", ASCENDING)], name="identifier_mapping_version"),
+        IndexModel([("mapping_type", ASCENDING)], name="mapping_type"),
+    ],
+}
+# Collections whose indexes were already ensured, per client, to avoid a round trip per repository
+_MONGODB_ENSURED_INDEXES: "weakref.WeakKeyDictionary[Any, Set[Tuple[str, str]]]" = weakref.WeakKeyDictionary()
+_MONGODB_ENSURED_INDEXES_LOCK = threading.Lock()
+
 
 class RepositoryError(Exception):
     pass
@@ -17,6 +45,10 @@ class ModelNotFoundError(RepositoryError):
     pass
 
 
+class ModelAlreadyExistsError(RepositoryError):
+    pass
+
+
 class RepositoryABC(Generic[T], ABC):
     @abstractmethod
     def create(self, model: T) -> str:
@@ -38,56 +70,389 @@ class RepositoryABC(Generic[T], ABC):
     def delete(self, model_id: str) -> None:
         raise NotImplementedError
 
+    def iter_many(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[T]:
+        return iter(self.read_many(filters))
+
+    def create_many(self, models: List[T]) -> List[T]:
+        return [self.create(model) for model in models]
+
+    def update_many(self, models: List[T]) -> List[T]:
+        return [self.update(model) for model in models]
+
+    def delete_many(self, model_ids: List[str]) -> None:
+        for model_id in model_ids:
+            self.delete(model_id)
+
+
+class AsyncRepositoryABC(Generic[T], ABC):
+    @abstractmethod
+    async def create(self, model: T) -> T:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read(self, model_id: str) -> T:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_many(self, filters: Optional[Dict[str, Any]] = None) -> List[T]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(self, model: T) -> T:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, model_id: str) -> None:
+        raise NotImplementedError
+
+    async def create_many(self, models: List[T]) -> List[T]:
+        return [await self.create(model) for model in models]
+
+    async def update_many(self, models: List[T]) -> List[T]:
+        return [await self.update(model) for model in models]
+
+    async def delete_many(self, model_ids: List[str]) -> None:
+        for model_id in model_ids:
+            await self.delete(model_id)
+
+
+class MongoClientRegistry:
+    """Registry handing out one shared MongoClient per connection URI.
+
+    A MongoClient holds a connection pool and is meant to be reused for the lifetime of
+    the application. Repositories created through MongoDBRepository.from_uri get their
+    client from a registry, so creating a repository per request reuses the same pool
+    instead of reconnecting. The registry owns the clients it creates; repositories never
+    close them.
+    """
+
+    def __init__(self, client_factory: Callable[..., MongoClient] = MongoClient):
+        self._client_factory = client_factory
+        self._clients: Dict[str, MongoClient] = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, mongo_uri: str, **client_kwargs: Any) -> MongoClient:
+        """Get the client for a URI, creating it on first use.
+
+        Args:
+            mongo_uri: MongoDB connection URI
+            **client_kwargs: Client options (e.g. maxPoolSize), only used when the client is created
+
+        Returns:
+            MongoClient: The shared client for the URI
+        """
+        with self._lock:
+            if mongo_uri not in self._clients:
+                self._clients[mongo_uri] = self._client_factory(mongo_uri, **client_kwargs)
+            return self._clients[mongo_uri]
+
+    def close_client(self, mongo_uri: str) -> None:
+        """Close and forget the client of a URI, if any."""
+        with self._lock:
+            client = self._clients.pop(mongo_uri, None)
+        if client is not None:
+            client.close()
+
+    def close_all(self) -> None:
+        """Close and forget all the clients of the registry (e.g. on application shutdown)."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+_MSSDK_MONGO_CLIENT_REGISTRY = MongoClientRegistry()
+
+
+def get_mssdk_mongo_client_registry() -> MongoClientRegistry:
+    """
+    Get the default MongoDB client registry of the SDK.
+
+    Returns:
+        The registry used by MongoDBRepository.from_uri when none is provided
+    """
+    return _MSSDK_MONGO_CLIENT_REGISTRY
+
+
+def register_mongodb_indexes(model_class: Type[CoreModel], index_specs: List[IndexModel]) -> None:
+    """
+    Declare the MongoDB indexes of a model class.
+
+    The indexes are created by the MongoDB repositories of this model class (or of its
+    subclasses without their own declaration) when they are initialised.
+
+    Args:
+        model_class: The model class
+        index_specs: The pymongo index models of the class collection
+
+    Returns:
+        None
+    """
+    _MONGODB_INDEX_SPECS[model_class] = list(index_specs)
+
+
+def get_mongodb_indexes(model_class: Type[CoreModel]) -> List[IndexModel]:
+    """
+    Get the MongoDB indexes declared for a model class or its closest declared parent class.
+
+    Args:
+        model_class: The model class
+
+    Returns:
+        The pymongo index models, empty if none are declared
+    """
+    for klass in model_class.__mro__:
+        if klass in _MONGODB_INDEX_SPECS:
+            return list(_MONGODB_INDEX_SPECS[klass])
+    return []
+
+
+def ensure_mongodb_indexes(collection: Any, index_specs: List[IndexModel]) -> None:
+    """
+    Create indexes on a collection, if they don't exist yet, once per client and collection.
+
+    Creating many repositories on the same collection therefore does not cost a round trip each.
+
+    Args:
+        collection: The pymongo collection
+        index_specs: The pymongo index models to create
+
+    Returns:
+        None
+    """
+    if not index_specs:
+        return
+
+    collection_key = (collection.database.name, collection.name)
+    with _MONGODB_ENSURED_INDEXES_LOCK:
+        ensured_collections = _MONGODB_ENSURED_INDEXES.setdefault(collection.database.client, set())
+        record_mssdk_cache_access("mongodb_indexes", collection_key in ensured_collections)
+        if collection_key not in ensured_collections:
+            collection.create_indexes(index_specs)
+            ensured_collections.add(collection_key)
+
+
+def _version_sort_key(version: str) -> Tuple[Tuple[int, Any], ...]:
+    """Sort key comparing the numeric components of a version as numbers (e.g. 1.10.0 > 1.9.0)."""
+    return tuple((1, int(part)) if part.isdigit() else (0, part) for part in re.split(r"[^0-9A-Za-z]+", version))
+
+
+def _raw_bson_collection(collection: Any) -> Optional[Any]:
+    """Get the collection returning raw BSON documents, or None if its driver does not support them (e.g. mongomock)."""
+    from bson.raw_bson import RawBSONDocument
+
+    try:
+        return collection.with_options(codec_options=collection.codec_options.with_options(
+            document_class=RawBSONDocument))
+    except NotImplementedError:
+        return None
+
+
+def _to_mongodb_document(model: CoreModel, raw_bson: bool) -> Mapping[str, Any]:
+    """Convert a model to the document to write, recording its size when metrics are collected.
+
+    The document is then encoded here, and written as raw BSON when the driver supports it,
+    so that it is not encoded again by the driver.
+    """
+    document = model_to_document(model)
+    if not is_mssdk_metrics_enabled():
+        return document
+
+    import bson
+    from bson.raw_bson import RawBSONDocument
+
+    raw_document = RawBSONDocument(bson.encode(document))
+    record_mssdk_mongodb_document_size("write", len(raw_document.raw))
+    return raw_document if raw_bson else document
+
+
+def _from_mongodb_document(model_class: Type[T], document: Mapping[str, Any]) -> T:
+    """Convert a document read to a model, recording its size if it was read as raw BSON."""
+    import bson
+    from bson.raw_bson import RawBSONDocument
+
+    if isinstance(document, RawBSONDocument):
+        record_mssdk_mongodb_document_size("read", len(document.raw))
+        document = bson.decode(document.raw)
+    elif is_mssdk_metrics_enabled():
+        # The driver does not return raw BSON documents, so the document is encoded to get its size
+        record_mssdk_mongodb_document_size("read", len(bson.encode(document)))
+    return model_class.model_validate(document)
+
+
+def _model_to_update(model: CoreModel) -> Optional[Dict[str, Any]]:
+    """Build the minimal update of a model changed since it was persisted, or None if it was never persisted."""
+    changes = model.get_changes()
+    if changes is None:
+        return None
+
+    set_fields, unset_fields = changes
+    update: Dict[str, Any] = {}
+    if set_fields:
+        update["$set"] = set_fields
+    if unset_fields:
+        update["$unset"] = {field: "" for field in unset_fields}
+    return update
+
+
+def raise_on_missing_ids(model_ids: List[str], existing_ids: List[str]) -> None:
+    """Raise a ModelNotFoundError if some of the model IDs are not among the existing IDs."""
+    missing_ids = set(model_ids) - set(existing_ids)
+    if missing_ids:
+        raise ModelNotFoundError(f"Assets with IDs {sorted(missing_ids)} not found")
+
 
 @traced_class
 class MongoDBRepository(RepositoryABC[T]):
+    """Repository storing models as documents of a MongoDB collection.
+
+    The repository only closes its client when it owns it (close_client=True); clients
+    passed by the caller or obtained from a MongoClientRegistry are left open, so that
+    short-lived repositories can share one connection pool. The repository can be used
+    as a context manager, which calls close() on exit.
+
+    The indexes declared for the model class are only created by ensure_indexes, or in the
+    constructor with ensure_indexes=True, as it needs write access to the database.
+    """
+
     def __init__(
             self,
             model_class: Type[T],
             mongo_client: MongoClient,
             database_name: str,
-            collection_name: Optional[str] = None
+            collection_name: Optional[str] = None,
+            close_client: bool = False,
+            ensure_indexes: bool = False,
+            track_changes: bool = True
     ):
         self.model_class = model_class
         self.client = mongo_client
         self.database = self.client[database_name]
         self.collection_name = collection_name or model_class.__name__
         self.collection = self.database[self.collection_name]
+        self._raw_bson_collection = _raw_bson_collection(self.collection)
+        self._owns_client = close_client
+        self.index_specs = get_mongodb_indexes(model_class)
+        self.track_changes = track_changes
+        if ensure_indexes:
+            self.ensure_indexes()
 
-    def create(self, model: T) -> T:
-        model_id = model.id
-        model_dict = model.model_dump(by_alias=True, mode="json")
-        model_dict["_id"] = model_id
-        self.collection.insert_one(model_dict)
+    @classmethod
+    def from_uri(
+            cls,
+            model_class: Type[T],
+            mongo_uri: str,
+            database_name: str,
+            collection_name: Optional[str] = None,
+            mongo_client_registry: Optional[MongoClientRegistry] = None
+    ) -> 'MongoDBRepository[T]':
+        """Create a repository using the shared client of a URI from a client registry.
+
+        Args:
+            model_class: Class of the stored models
+            mongo_uri: MongoDB connection URI
+            database_name: Name of the database
+            collection_name: Optional collection name, defaults to the model class name
+            mongo_client_registry: Optional registry, defaults to the SDK registry
+
+        Returns:
+            MongoDBRepository: A repository which does not own (and never closes) its client
+        """
+        mongo_client_registry = mongo_client_registry or get_mssdk_mongo_client_registry()
+
+        return cls(model_class=model_class,
+                   mongo_client=mongo_client_registry.get_client(mongo_uri),
+                   database_name=database_name,
+                   collection_name=collection_name)
 
+    def ensure_indexes(self) -> List[str]:
+        """Create the indexes declared for the model class, if they don't exist yet.
+
+        Indexes are only created once per client and collection, so that creating many
+        repositories does not cost a round trip each.
+
+        Returns:
+            List[str]: Names of the declared indexes
+        """
+        ensure_mongodb_indexes(self.collection, self.index_specs)
+
+        return [index_spec.document["name"] for index_spec in self.index_specs]
+
+    def close(self) -> None:
+        """Close the client if the repository owns it; shared clients are left open."""
+        if self._owns_client:
+            self.client.close()
+
+    def __enter__(self) -> 'MongoDBRepository[T]':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _track(self, model: T) -> T:
+        if self.track_changes:
+            model.mark_persisted()
+        else:
+            model.pin_id()
         return model
 
+    def _read_collection(self) -> Any:
+        # Documents are read as raw BSON when metrics are collected, so their size is known without encoding them
+        if self._raw_bson_collection is not None and is_mssdk_metrics_enabled():
+            return self._raw_bson_collection
+        return self.collection
+
+    def _to_document(self, model: T) -> Mapping[str, Any]:
+        return _to_mongodb_document(model, raw_bson=self._raw_bson_collection is not None)
+
+    def _write_update(self, model: T) -> bool:
+        query = {'_id': model.id}
+        update = _model_to_update(model) if self.track_changes else None
+        if update is None:
+            matched = self.collection.replace_one(query, self._to_document(model)).matched_count
+        elif update:
+            matched = self.collection.update_one(query, update).matched_count
+        else:
+            matched = self.collection.count_documents(query, limit=1)
+
+        self._track(model)
+        return matched > 0
+
+    def create(self, model: T) -> T:
+        self.collection.insert_one(self._to_document(model))
+
+        return self._track(model)
+
     def read(self, model_id: str) -> T:
-        result = self.collection.find_one({"_id": model_id})
+        result = self._read_collection().find_one({"_id": model_id})
         if result is None:
             raise ModelNotFoundError(f"Asset with ID {model_id} not found")
 
-        return self.model_class.model_validate(result)
+        return self._track(_from_mongodb_document(self.model_class, result))
 
     def read_many(self, filters: Optional[Dict[str, Any]] = None) -> List[T]:
         query = filters or {}
-        results = self.collection.find(query)
+        results = self._read_collection().find(query)
         models = []
         for doc in results:
-            models.append(self.model_class.model_validate(doc))
+            models.append(self._track(_from_mongodb_document(self.model_class, doc)))
 
         return models
 
+    def iter_many(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[T]:
+        """Iterate over the models matching the filters, fetching them from a cursor as they are consumed."""
+        for doc in self._read_collection().find(filters or {}):
+            yield self._track(_from_mongodb_document(self.model_class, doc))
+
     def update(self, model: T) -> T:
-        query = {'_id': model.id}
-        existing = self.collection.find_one(query)
-        if existing is None:
-            raise ModelNotFoundError(f"Asset with ID {model.id} not found")
+        """Update a stored model.
 
-        model_id = model.id
-        model_dict = model.model_dump(by_alias=True, mode="json")
-        model_dict["_id"] = model_id
-        self.collection.replace_one(query, model_dict)
+        Models read or written by a repository tracking changes are updated with a minimal
+        $set/$unset of the fields changed since, other models replace the whole document.
+        """
+        if not self._write_update(model):
+            raise ModelNotFoundError(f"Asset with ID {model.id} not found")
 
         return model
 
@@ -97,5 +462,255 @@ class MongoDBRepository(RepositoryABC[T]):
         if result.deleted_count < 1:
             raise ModelNotFoundError(f"Asset with ID {model_id} not found")
 
-    def __del__(self):
-        self.client.close()
+    def create_many(self, models: List[T]) -> List[T]:
+        if models:
+            self.collection.insert_many([self._to_document(model) for model in models])
+
+        return [self._track(model) for model in models]
+
+    def update_many(self, models: List[T]) -> List[T]:
+        model_ids = [model.id for model in models]
+        raise_on_missing_ids(model_ids, self.collection.distinct("_id", {"_id": {"$in": model_ids}}))
+
+        for model in models:
+            self._write_update(model)
+
+        return models
+
+    def delete_many(self, model_ids: List[str]) -> None:
+        raise_on_missing_ids(model_ids, self.collection.distinct("_id", {"_id": {"$in": model_ids}}))
+
+        self.collection.delete_many({"_id": {"$in": model_ids}})
+
+
+@traced_class
+class MongoDBMappingPackageRepository(MongoDBRepository[MappingPackage]):
+    """MongoDB repository of mapping packages with indexed query helpers.
+
+    The helpers rely on the metadata indexes declared for MappingPackage, and only
+    fetch the metadata of the packages when the full packages are not needed.
+    """
+
+    def __init__(
+            self,
+            mongo_client: MongoClient,
+            database_name: str,
+            collection_name: Optional[str] = None,
+            close_client: bool = False,
+            ensure_indexes: bool = False,
+            track_changes: bool = True,
+            model_class: Type[MappingPackage] = MappingPackage
+    ):
+        super().__init__(model_class=model_class,
+                         mongo_client=mongo_client,
+                         database_name=database_name,
+                         collection_name=collection_name,
+                         close_client=close_client,
+                         ensure_indexes=ensure_indexes,
+                         track_changes=track_changes)
+
+    def read_many_metadata(self, filters: Optional[Dict[str, Any]] = None) -> List[MappingPackageMetadata]:
+        """Read the metadata of the packages matching the filters, without their assets.
+
+        Args:
+            filters: Optional MongoDB query on the stored packages
+
+        Returns:
+            List[MappingPackageMetadata]: Metadata of the matching packages
+        """
+        return [MappingPackageMetadata.model_validate(doc["metadata"])
+                for doc in self.collection.find(filters or {}, {"metadata": 1})]
+
+    def find_by_identifier_and_version(self, identifier: str, mapping_version: str) -> Optional[MappingPackage]:
+        """Find the package with an identifier and a mapping version.
+
+        Args:
+            identifier: Identifier of the package (metadata.identifier)
+            mapping_version: Mapping version of the package (metadata.mapping_version)
+
+        Returns:
+            Optional[MappingPackage]: The package, or None if it is not stored
+        """
+        result = self._read_collection().find_one({"metadata.identifier": identifier,
+                                                   "metadata.mapping_version": mapping_version})
+
+        return self._track(_from_mongodb_document(self.model_class, result)) if result is not None else None
+
+    def find_latest_versions(self, identifiers: Optional[List[str]] = None) -> Dict[str, MappingPackage]:
+        """Find the latest mapping version of each package identifier.
+
+        Versions are compared component by component, numeric components as numbers
+        (e.g. "1.10.0" is later than "1.9.0"). The versions are listed with an aggregation
+        on the metadata identifier and mapping version only, sorted as the declared index so
+        that it is answered from the index, then only the latest packages are fetched.
+
+        Args:
+            identifiers: Optional identifiers to restrict the search to. If not provided,
+                all identifiers are considered
+
+        Returns:
+            Dict[str, MappingPackage]: The latest package of each identifier
+        """
+        identifier_filter: Dict[str, Any] = {"$exists": True} if identifiers is None else {"$in": identifiers}
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": {"metadata.identifier": identifier_filter}},
+            {"$sort": {"metadata.identifier": ASCENDING, "metadata.mapping_version": ASCENDING}},
+            {"$project": {"_id": 0, "metadata.identifier": 1, "metadata.mapping_version": 1}},
+            {"$group": {"_id": "$metadata.identifier", "versions": {"$push": "$metadata.mapping_version"}}},
+        ]
+
+        latest_versions = [{"metadata.identifier": group["_id"],
+                            "metadata.mapping_version": max(group["versions"], key=_version_sort_key)}
+                           for group in self.collection.aggregate(pipeline) if group["versions"]]
+        if not latest_versions:
+            return {}
+
+        return {mapping_package.metadata.identifier: mapping_package
+                for mapping_package in self.read_many({"$or": latest_versions})}
+
+    def find_latest_version(self, identifier: str) -> Optional[MappingPackage]:
+        """Find the latest mapping version of a package identifier.
+
+        Args:
+            identifier: Identifier of the package (metadata.identifier)
+
+        Returns:
+            Optional[MappingPackage]: The latest package, or None if no package has this identifier
+        """
+        return self.find_latest_versions([identifier]).get(identifier)
+
+
+@traced_class
+class AsyncMongoDBRepository(AsyncRepositoryABC[T]):
+    """Asynchronous counterpart of MongoDBRepository, built on the Motor asyncio driver.
+
+    All operations are coroutines, so fetching and storing models does not block the event loop.
+    As for MongoDBRepository, the client is only closed when the repository owns it
+    (close_client=True), and the repository can be used as an async context manager.
+    """
+
+    def __init__(
+            self,
+            model_class: Type[T],
+            mongo_client: "AsyncIOMotorClient",
+            database_name: str,
+            collection_name: Optional[str] = None,
+            close_client: bool = False,
+            track_changes: bool = True
+    ):
+        self.model_class = model_class
+        self.client = mongo_client
+        self.database = self.client[database_name]
+        self.collection_name = collection_name or model_class.__name__
+        self.collection = self.database[self.collection_name]
+        self._raw_bson_collection = _raw_bson_collection(self.collection)
+        self._owns_client = close_client
+        self.index_specs = get_mongodb_indexes(model_class)
+        self.track_changes = track_changes
+
+    async def ensure_indexes(self) -> List[str]:
+        """Create the indexes declared for the model class, if they don't exist yet.
+
+        Unlike MongoDBRepository, indexes can't be created in the constructor without
+        blocking the event loop, so there is no ensure_indexes option in the constructor.
+
+        Returns:
+            List[str]: Names of the declared indexes
+        """
+        if self.index_specs:
+            await self.collection.create_indexes(self.index_specs)
+
+        return [index_spec.document["name"] for index_spec in self.index_specs]
+
+    def close(self) -> None:
+        """Close the client if the repository owns it; shared clients are left open."""
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self) -> 'AsyncMongoDBRepository[T]':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _track(self, model: T) -> T:
+        if self.track_changes:
+            model.mark_persisted()
+        else:
+            model.pin_id()
+        return model
+
+    def _read_collection(self) -> Any:
+        # Documents are read as raw BSON when metrics are collected, so their size is known without encoding them
+        if self._raw_bson_collection is not None and is_mssdk_metrics_enabled():
+            return self._raw_bson_collection
+        return self.collection
+
+    def _to_document(self, model: T) -> Mapping[str, Any]:
+        return _to_mongodb_document(model, raw_bson=self._raw_bson_collection is not None)
+
+    async def _write_update(self, model: T) -> bool:
+        query = {'_id': model.id}
+        update = _model_to_update(model) if self.track_changes else None
+        if update is None:
+            matched = (await self.collection.replace_one(query, self._to_document(model))).matched_count
+        elif update:
+            matched = (await self.collection.update_one(query, update)).matched_count
+        else:
+            matched = await self.collection.count_documents(query, limit=1)
+
+        self._track(model)
+        return matched > 0
+
+    async def create(self, model: T) -> T:
+        await self.collection.insert_one(self._to_document(model))
+
+        return self._track(model)
+
+    async def read(self, model_id: str) -> T:
+        result = await self._read_collection().find_one({"_id": model_id})
+        if result is None:
+            raise ModelNotFoundError(f"Asset with ID {model_id} not found")
+
+        return self._track(_from_mongodb_document(self.model_class, result))
+
+    async def read_many(self, filters: Optional[Dict[str, Any]] = None) -> List[T]:
+        query = filters or {}
+        models = []
+        async for doc in self._read_collection().find(query):
+            models.append(self._track(_from_mongodb_document(self.model_class, doc)))
+
+        return models
+
+    async def update(self, model: T) -> T:
+        """Update a stored model, with a minimal $set/$unset when its changes are tracked (see MongoDBRepository)."""
+        if not await self._write_update(model):
+            raise ModelNotFoundError(f"Asset with ID {model.id} not found")
+
+        return model
+
+    async def delete(self, model_id: str) -> None:
+        result = await self.collection.delete_one({'_id': model_id})
+
+        if result.deleted_count < 1:
+            raise ModelNotFoundError(f"Asset with ID {model_id} not found")
+
+    async def create_many(self, models: List[T]) -> List[T]:
+        if models:
+            await self.collection.insert_many([self._to_document(model) for model in models])
+
+        return [self._track(model) for model in models]
+
+    async def update_many(self, models: List[T]) -> List[T]:
+        model_ids = [model.id for model in models]
+        raise_on_missing_ids(model_ids, await self.collection.distinct("_id", {"_id": {"$in": model_ids}}))
+
+        for model in models:
+            await self._write_update(model)
+
+        return models
+
+    async def delete_many(self, model_ids: List[str]) -> None:
+        raise_on_missing_ids(model_ids, await self.collection.distinct("_id", {"_id": {"$in": model_ids}}))
+
+        await self.collection.delete_many({"_id": {"$in": model_ids}})
@@ -4,7 +4,9 @@ from typing import Any, List, Protocol
 from mapping_suite_sdk.adapters.loader import RELATIVE_TECHNICAL_MAPPING_SUITE_PATH, \
     RELATIVE_VOCABULARY_MAPPING_SUITE_PATH, \
     RELATIVE_SUITE_METADATA_PATH, RELATIVE_CONCEPTUAL_MAPPING_PATH
-from mapping_suite_sdk.adapters.tracer import traced_class
+from mapping_suite_sdk.adapters.metrics import measure_mssdk_duration, record_mssdk_files_written, \
+    MSSDK_METRIC_SERIALISE_DURATION
+from mapping_suite_sdk.adapters.tracer import traced_class, write_traced_file_text, write_traced_file_bytes
 from mapping_suite_sdk.models.asset import (
     TechnicalMappingSuite, VocabularyMappingSuite, TestDataSuite,
     SAPRQLTestSuite, SHACLTestSuite, ConceptualMappingPackageAsset
@@ -32,6 +34,7 @@ class MappingPackageAssetSerialiser(Protocol):
         raise NotImplementedError
 
 
+@traced_class
 class TechnicalMappingSuiteSerialiser(MappingPackageAssetSerialiser):
     """Serialiser for technical mapping suite files."""
 
@@ -42,9 +45,11 @@ class TechnicalMappingSuiteSerialiser(MappingPackageAssetSerialiser):
         for tm_file in asset.files:
             file_path = package_folder_path / tm_file.path
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(tm_file.content)
+            write_traced_file_text(file_path, tm_file.content, package_folder_path)
+        record_mssdk_files_written("technical_mapping_suite", (tm_file.content for tm_file in asset.files))
 
 
+@traced_class
 class VocabularyMappingSuiteSerialiser(MappingPackageAssetSerialiser):
     """Serialiser for vocabulary mapping suite files."""
 
@@ -55,9 +60,11 @@ class VocabularyMappingSuiteSerialiser(MappingPackageAssetSerialiser):
         for vm_file in asset.files:
             file_path = package_folder_path / vm_file.path
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(vm_file.content)
+            write_traced_file_text(file_path, vm_file.content, package_folder_path)
+        record_mssdk_files_written("vocabulary_mapping_suite", (vm_file.content for vm_file in asset.files))
 
 
+@traced_class
 class TestDataSuitesSerialiser(MappingPackageAssetSerialiser):
     """Serialiser for test data suites."""
 
@@ -69,9 +76,12 @@ class TestDataSuitesSerialiser(MappingPackageAssetSerialiser):
             for test_file in suite.files:
                 file_path = package_folder_path / test_file.path
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(test_file.content)
+                write_traced_file_text(file_path, test_file.content, package_folder_path)
+        record_mssdk_files_written("test_data_suites",
+                                   (test_file.content for suite in asset for test_file in suite.files))
 
 
+@traced_class
 class SPARQLTestSuitesSerialiser(MappingPackageAssetSerialiser):
     """Serialiser for SPARQL test suites."""
 
@@ -83,9 +93,12 @@ class SPARQLTestSuitesSerialiser(MappingPackageAssetSerialiser):
             for query_file in suite.files:
                 file_path = package_folder_path / query_file.path
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(query_file.content)
+                write_traced_file_text(file_path, query_file.content, package_folder_path)
+        record_mssdk_files_written("test_suites_sparql",
+                                   (query_file.content for suite in asset for query_file in suite.files))
 
 
+@traced_class
 class SHACLTestSuitesSerialiser(MappingPackageAssetSerialiser):
     """Serialiser for SHACL test suites."""
 
@@ -97,25 +110,32 @@ class SHACLTestSuitesSerialiser(MappingPackageAssetSerialiser):
             for shape_file in suite.files:
                 file_path = package_folder_path / shape_file.path
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(shape_file.content)
+                write_traced_file_text(file_path, shape_file.content, package_folder_path)
+        record_mssdk_files_written("test_suites_shacl",
+                                   (shape_file.content for suite in asset for shape_file in suite.files))
 
 
+@traced_class
 class MappingPackageMetadataSerialiser(MappingPackageAssetSerialiser):
     """Serialiser for mapping package metadata."""
 
     def serialise(self, package_folder_path: Path, asset: MappingPackageMetadata) -> None:
         metadata_path = package_folder_path / RELATIVE_SUITE_METADATA_PATH
         metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        metadata_path.write_text(asset.model_dump_json(by_alias=True))
+        metadata_content = asset.model_dump_json(by_alias=True)
+        write_traced_file_text(metadata_path, metadata_content, package_folder_path)
+        record_mssdk_files_written("metadata", [metadata_content])
 
 
+@traced_class
 class ConceptualMappingFileSerialiser(MappingPackageAssetSerialiser):
     """Serialiser for conceptual mapping files."""
 
     def serialise(self, package_folder_path: Path, asset: ConceptualMappingPackageAsset) -> None:
         file_path = package_folder_path / RELATIVE_CONCEPTUAL_MAPPING_PATH
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(asset.content)
+        write_traced_file_bytes(file_path, asset.content, package_folder_path)
+        record_mssdk_files_written("conceptual_mapping_asset", [asset.content])
 
 
 @traced_class
@@ -140,10 +160,11 @@ class MappingPackageSerialiser(MappingPackageAssetSerialiser):
         """
 
         # Serialize each component
-        MappingPackageMetadataSerialiser().serialise(package_folder_path, asset.metadata)
-        ConceptualMappingFileSerialiser().serialise(package_folder_path, asset.conceptual_mapping_asset)
-        TechnicalMappingSuiteSerialiser().serialise(package_folder_path, asset.technical_mapping_suite)
-        VocabularyMappingSuiteSerialiser().serialise(package_folder_path, asset.vocabulary_mapping_suite)
-        TestDataSuitesSerialiser().serialise(package_folder_path, asset.test_data_suites)
-        SPARQLTestSuitesSerialiser().serialise(package_folder_path, asset.test_suites_sparql)
-        SHACLTestSuitesSerialiser().serialise(package_folder_path, asset.test_suites_shacl)
+        with measure_mssdk_duration(MSSDK_METRIC_SERIALISE_DURATION):
+            MappingPackageMetadataSerialiser().serialise(package_folder_path, asset.metadata)
+            ConceptualMappingFileSerialiser().serialise(package_folder_path, asset.conceptual_mapping_asset)
+            TechnicalMappingSuiteSerialiser().serialise(package_folder_path, asset.technical_mapping_suite)
+            VocabularyMappingSuiteSerialiser().serialise(package_folder_path, asset.vocabulary_mapping_suite)
+            TestDataSuitesSerialiser().serialise(package_folder_path, asset.test_data_suites)
+            SPARQLTestSuitesSerialiser().serialise(package_folder_path, asset.test_suites_sparql)
+            SHACLTestSuitesSerialiser().serialise(package_folder_path, asset.test_suites_shacl)
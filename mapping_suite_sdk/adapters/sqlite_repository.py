@@ -0,0 +1,416 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from mapping_suite_sdk.adapters.filesystem_repository import MSSDK_FILESYSTEM_BLOB_MIN_SIZE
+from mapping_suite_sdk.adapters.model_document import model_to_document, replace_long_strings, \
+    resolve_blob_references, get_document_field, matches_filter
+from mapping_suite_sdk.adapters.repository import RepositoryABC, T, ModelNotFoundError, ModelAlreadyExistsError, \
+    raise_on_missing_ids
+from mapping_suite_sdk.adapters.tracer import traced_class
+from mapping_suite_sdk.models.core import CoreModel
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+### Seconds a connection waits for a lock held by another connection before failing
+MSSDK_SQLITE_BUSY_TIMEOUT = 30.0
+
+### Indexed columns per model class, mapped to the dotted field paths (as stored) they are filled from
+_SQLITE_INDEXED_FIELDS: Dict[Type[CoreModel], Dict[str, str]] = {
+    MappingPackage: {
+        "identifier": "metadata.identifier",
+        "title": "metadata.title",
+        "created_at": "metadata.created_at",
+        "mapping_type": "metadata.mapping_type",
+        "mapping_version": "metadata.mapping_version",
+        "ontology_version": "metadata.ontology_version",
+        "eforms_subtype": "metadata.metadata_constraints.constraints.eforms_subtype",
+        "eforms_sdk_versions": "metadata.metadata_constraints.constraints.eforms_sdk_versions",
+        "start_date": "metadata.metadata_constraints.constraints.start_date",
+        "end_date": "metadata.metadata_constraints.constraints.end_date",
+    },
+}
+
+_SQL_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def register_sqlite_indexed_fields(model_class: Type[CoreModel], indexed_fields: Dict[str, str]) -> None:
+    """
+    Declare the indexed columns of a model class in SQLite repositories.
+
+    Args:
+        model_class: The model class
+        indexed_fields: Column names mapped to the dotted field paths (as stored, i.e. using
+            the field aliases) they are filled from
+
+    Returns:
+        None
+    """
+    _SQLITE_INDEXED_FIELDS[model_class] = dict(indexed_fields)
+
+
+def get_sqlite_indexed_fields(model_class: Type[CoreModel]) -> Dict[str, str]:
+    """
+    Get the indexed columns declared for a model class or its closest declared parent class.
+
+    Args:
+        model_class: The model class
+
+    Returns:
+        Column names mapped to dotted field paths, empty if none are declared
+    """
+    for klass in model_class.__mro__:
+        if klass in _SQLITE_INDEXED_FIELDS:
+            return dict(_SQLITE_INDEXED_FIELDS[klass])
+    return {}
+
+
+def _check_sql_identifier(name: str) -> str:
+    if not _SQL_IDENTIFIER_PATTERN.match(name):
+        raise ValueError(f"Invalid SQLite table or column name: {name}")
+    return name
+
+
+@contextmanager
+def _write_transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run writes in a transaction taking the database write lock upfront, so checks and writes are atomic."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.rollback()
+        raise
+    connection.commit()
+
+
+def _condition_to_sql(column: str, terms_table: str, condition: Any) -> Tuple[str, List[Any]]:
+    """Translate the condition on an indexed column to SQL, matching list values by any of their items."""
+    if isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+        clauses, parameters = [], []
+        for operator, operand in condition.items():
+            if operator == "$in":
+                placeholders = ", ".join("?" for _ in operand)
+                clauses.append(f'("{column}" IN ({placeholders}) OR id IN (SELECT model_id FROM "{terms_table}" '
+                               f'WHERE field = ? AND value IN ({placeholders})))')
+                parameters.extend([*operand, column, *operand])
+            elif operator == "$ne":
+                clauses.append(f'(("{column}" IS NULL OR "{column}" != ?) AND id NOT IN '
+                               f'(SELECT model_id FROM "{terms_table}" WHERE field = ? AND value = ?))')
+                parameters.extend([operand, column, operand])
+            else:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+        return " AND ".join(clauses), parameters
+    if condition is None:
+        return f'("{column}" IS NULL AND id NOT IN (SELECT model_id FROM "{terms_table}" WHERE field = ?))', [column]
+
+    return (f'("{column}" = ? OR id IN (SELECT model_id FROM "{terms_table}" WHERE field = ? AND value = ?))',
+            [condition, column, condition])
+
+
+@traced_class
+class SQLiteRepository(RepositoryABC[T]):
+    """Repository storing models in a SQLite database, with indexed metadata columns.
+
+    Each model is stored as a JSON manifest, in which long strings (asset contents) reference
+    rows of a blob table named after their SHA-256, so identical assets are stored once.
+    The fields declared for the model class (see register_sqlite_indexed_fields) are copied
+    into indexed columns; list values (e.g. the eForms subtypes of the eligibility constraints)
+    are indexed item by item in a terms table.
+
+    read_many translates the filters on indexed fields to SQL, and evaluates the other ones
+    on the manifests. The database is opened in WAL mode, with one connection per thread, so
+    readers don't block each other nor the writer. In-memory databases are therefore not
+    supported, as each connection would see its own empty database.
+
+    Updates rewrite the manifest and the indexed columns in place, and only write the blobs
+    of the assets that changed.
+    """
+
+    def __init__(
+            self,
+            model_class: Type[T],
+            database_path: Union[Path, str],
+            table_name: Optional[str] = None,
+            indexed_fields: Optional[Dict[str, str]] = None,
+            blob_min_size: int = MSSDK_FILESYSTEM_BLOB_MIN_SIZE
+    ):
+        if str(database_path) in ("", ":memory:"):
+            # Each connection would open its own private database, and there is one connection per thread
+            raise ValueError("SQLiteRepository needs a database file, as it opens one connection per thread")
+        self.model_class = model_class
+        self.database_path = str(database_path)
+        self.blob_min_size = blob_min_size
+        self.table_name = _check_sql_identifier(table_name or model_class.__name__)
+        self.terms_table_name = f"{self.table_name}_terms"
+        self.blobs_table_name = f"{self.table_name}_blobs"
+        self.blob_references_table_name = f"{self.table_name}_blob_references"
+        self.indexed_fields = {_check_sql_identifier(column): field_path for column, field_path in
+                               (indexed_fields if indexed_fields is not None else
+                                get_sqlite_indexed_fields(model_class)).items()}
+        self._columns_by_field_path = {field_path: column for column, field_path in self.indexed_fields.items()}
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._create_schema()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection of the current thread, opened on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.database_path, timeout=MSSDK_SQLITE_BUSY_TIMEOUT,
+                                         isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def __enter__(self) -> 'SQLiteRepository[T]':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _create_schema(self) -> None:
+        indexed_columns = "".join(f', "{column}"' for column in self.indexed_fields)
+        with _write_transaction(self.connection) as connection:
+            connection.execute(f'CREATE TABLE IF NOT EXISTS "{self.table_name}" '
+                               f'(id TEXT PRIMARY KEY, manifest TEXT NOT NULL{indexed_columns})')
+            existing_columns = {row[1] for row in connection.execute(f'PRAGMA table_info("{self.table_name}")')}
+            for column in self.indexed_fields:
+                if column not in existing_columns:
+                    connection.execute(f'ALTER TABLE "{self.table_name}" ADD COLUMN "{column}"')
+                connection.execute(f'CREATE INDEX IF NOT EXISTS "{self.table_name}_{column}" '
+                                   f'ON "{self.table_name}" ("{column}")')
+            connection.execute(f'CREATE TABLE IF NOT EXISTS "{self.terms_table_name}" '
+                               f'(model_id TEXT NOT NULL REFERENCES "{self.table_name}" (id) ON DELETE CASCADE, '
+                               f'field TEXT NOT NULL, value)')
+            connection.execute(f'CREATE INDEX IF NOT EXISTS "{self.terms_table_name}_field_value" '
+                               f'ON "{self.terms_table_name}" (field, value)')
+            connection.execute(f'CREATE INDEX IF NOT EXISTS "{self.terms_table_name}_model_id" '
+                               f'ON "{self.terms_table_name}" (model_id)')
+            connection.execute(f'CREATE TABLE IF NOT EXISTS "{self.blobs_table_name}" '
+                               f'(digest TEXT PRIMARY KEY, content BLOB NOT NULL)')
+            connection.execute(f'CREATE TABLE IF NOT EXISTS "{self.blob_references_table_name}" '
+                               f'(model_id TEXT NOT NULL REFERENCES "{self.table_name}" (id) ON DELETE CASCADE, '
+                               f'digest TEXT NOT NULL, PRIMARY KEY (model_id, digest))')
+            connection.execute(f'CREATE INDEX IF NOT EXISTS "{self.blob_references_table_name}_digest" '
+                               f'ON "{self.blob_references_table_name}" (digest)')
+
+    def _read_blob(self, digest: str) -> bytes:
+        row = self.connection.execute(f'SELECT content FROM "{self.blobs_table_name}" WHERE digest = ?',
+                                      (digest,)).fetchone()
+        if row is None:
+            raise ModelNotFoundError(f"Blob {digest} not found")
+        return row[0]
+
+    def _to_row(self, model: T) -> Tuple[List[Any], List[Tuple[str, Any]], Dict[str, bytes]]:
+        blobs: Dict[str, bytes] = {}
+
+        def store_blob(content: bytes) -> str:
+            digest = hashlib.sha256(content).hexdigest()
+            blobs[digest] = content
+            return digest
+
+        document = model_to_document(model)
+        manifest = replace_long_strings(document, self.blob_min_size, store_blob)
+        row: List[Any] = [model.id, json.dumps(manifest)]
+        terms: List[Tuple[str, Any]] = []
+        for column, field_path in self.indexed_fields.items():
+            value = get_document_field(document, field_path, self._read_blob)
+            if isinstance(value, list):
+                terms.extend((column, item) for item in value)
+                value = None
+            elif isinstance(value, dict):
+                value = json.dumps(value)
+            row.append(value)
+
+        return row, terms, blobs
+
+    def _write(self, connection: sqlite3.Connection, model: T, replace: bool) -> None:
+        row, terms, blobs = self._to_row(model)
+        columns = "".join(f', "{column}"' for column in self.indexed_fields)
+        if replace:
+            # The row is updated in place, so only the blobs of changed assets are written
+            assignments = ", ".join(f'"{column}" = ?' for column in ["manifest", *self.indexed_fields])
+            connection.execute(f'UPDATE "{self.table_name}" SET {assignments} WHERE id = ?', [*row[1:], model.id])
+            connection.execute(f'DELETE FROM "{self.terms_table_name}" WHERE model_id = ?', (model.id,))
+            previous_digests = {digest for (digest,) in connection.execute(
+                f'SELECT digest FROM "{self.blob_references_table_name}" WHERE model_id = ?', (model.id,))}
+        else:
+            placeholders = ", ".join("?" for _ in row)
+            try:
+                connection.execute(
+                    f'INSERT INTO "{self.table_name}" (id, manifest{columns}) VALUES ({placeholders})', row)
+            except sqlite3.IntegrityError:
+                raise ModelAlreadyExistsError(f"Asset with ID {model.id} already exists")
+            previous_digests = set()
+        connection.executemany(f'INSERT INTO "{self.terms_table_name}" (model_id, field, value) VALUES (?, ?, ?)',
+                               [(model.id, column, value) for column, value in terms])
+        added_digests = [digest for digest in blobs if digest not in previous_digests]
+        connection.executemany(f'INSERT OR IGNORE INTO "{self.blobs_table_name}" (digest, content) VALUES (?, ?)',
+                               [(digest, blobs[digest]) for digest in added_digests])
+        connection.executemany(f'INSERT INTO "{self.blob_references_table_name}" (model_id, digest) VALUES (?, ?)',
+                               [(model.id, digest) for digest in added_digests])
+        removed_digests = [digest for digest in previous_digests if digest not in blobs]
+        if removed_digests:
+            connection.executemany(f'DELETE FROM "{self.blob_references_table_name}" '
+                                   f'WHERE model_id = ? AND digest = ?',
+                                   [(model.id, digest) for digest in removed_digests])
+            self._delete_unreferenced_blobs(connection, removed_digests)
+        model.pin_id()
+
+    def _delete_rows(self, connection: sqlite3.Connection, model_ids: List[str]) -> None:
+        placeholders = ", ".join("?" for _ in model_ids)
+        referenced_digests = [row[0] for row in connection.execute(
+            f'SELECT DISTINCT digest FROM "{self.blob_references_table_name}" WHERE model_id IN ({placeholders})',
+            model_ids)]
+        connection.execute(f'DELETE FROM "{self.table_name}" WHERE id IN ({placeholders})', model_ids)
+        self._delete_unreferenced_blobs(connection, referenced_digests)
+
+    def _delete_unreferenced_blobs(self, connection: sqlite3.Connection, digests: List[str]) -> None:
+        connection.executemany(f'DELETE FROM "{self.blobs_table_name}" WHERE digest = ? AND NOT EXISTS '
+                               f'(SELECT 1 FROM "{self.blob_references_table_name}" WHERE digest = ?)',
+                               [(digest, digest) for digest in digests])
+
+    def _existing_ids(self, model_ids: List[str]) -> List[str]:
+        placeholders = ", ".join("?" for _ in model_ids)
+        return [row[0] for row in self.connection.execute(
+            f'SELECT id FROM "{self.table_name}" WHERE id IN ({placeholders})', model_ids)]
+
+    def _to_model(self, manifest: str) -> T:
+        return self.model_class.model_validate(resolve_blob_references(json.loads(manifest), self._read_blob))
+
+    def _build_query(self, filters: Optional[Dict[str, Any]], selected_columns: str) -> Tuple[
+        str, List[Any], Dict[str, Any]]:
+        """Build the SQL query of the filters on indexed fields, returning the filters left to evaluate."""
+        clauses, parameters, remaining_filters = [], [], {}
+        for field_path, condition in (filters or {}).items():
+            column = "id" if field_path == "_id" else self._columns_by_field_path.get(field_path)
+            if column == "id" and not isinstance(condition, dict):
+                clauses.append("id = ?")
+                parameters.append(condition)
+            elif column is not None and column != "id":
+                clause, clause_parameters = _condition_to_sql(column, self.terms_table_name, condition)
+                clauses.append(clause)
+                parameters.extend(clause_parameters)
+            else:
+                remaining_filters[field_path] = condition
+
+        query = f'SELECT {selected_columns} FROM "{self.table_name}"'
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        return query, parameters, remaining_filters
+
+    def create(self, model: T) -> T:
+        with _write_transaction(self.connection) as connection:
+            self._write(connection, model, replace=False)
+
+        return model
+
+    def read(self, model_id: str) -> T:
+        row = self.connection.execute(f'SELECT manifest FROM "{self.table_name}" WHERE id = ?',
+                                      (model_id,)).fetchone()
+        if row is None:
+            raise ModelNotFoundError(f"Asset with ID {model_id} not found")
+
+        return self._to_model(row[0])
+
+    def read_many(self, filters: Optional[Dict[str, Any]] = None) -> List[T]:
+        """Read the models matching the filters.
+
+        Filters map dotted field paths (as stored, i.e. using the field aliases) to a value, or to
+        a condition using the $in or $ne operators. A list field matches a value it contains.
+        Conditions on indexed fields are evaluated by SQLite, the other ones on the manifests.
+        """
+        return list(self.iter_many(filters))
+
+    def iter_many(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[T]:
+        """Iterate over the models matching the filters (see read_many), fetching them as they are consumed."""
+        query, parameters, remaining_filters = self._build_query(filters, "manifest")
+        for (manifest,) in self.connection.execute(query, parameters):
+            if remaining_filters:
+                document = json.loads(manifest)
+                if not all(matches_filter(get_document_field(document, field_path, self._read_blob), condition)
+                           for field_path, condition in remaining_filters.items()):
+                    continue
+            yield self._to_model(manifest)
+
+    def list_indexed_fields(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """List the indexed column values of the models matching the filters, without reading the models.
+
+        Only filters on indexed fields are supported here.
+
+        Args:
+            filters: Optional filters, as for read_many
+
+        Returns:
+            List[Dict[str, Any]]: The ID and the indexed column values of each model; list values are
+                read from the terms table
+        """
+        columns = ", ".join(f'"{column}"' for column in self.indexed_fields)
+        query, parameters, remaining_filters = self._build_query(filters, f"id{', ' if columns else ''}{columns}")
+        if remaining_filters:
+            raise ValueError(f"Filters on fields which are not indexed: {sorted(remaining_filters)}")
+
+        entries = {row[0]: {"_id": row[0], **dict(zip(self.indexed_fields, row[1:]))}
+                   for row in self.connection.execute(query, parameters)}
+        if entries:
+            placeholders = ", ".join("?" for _ in entries)
+            for model_id, column, value in self.connection.execute(
+                    f'SELECT model_id, field, value FROM "{self.terms_table_name}" '
+                    f'WHERE model_id IN ({placeholders}) ORDER BY rowid', list(entries)):
+                entry = entries[model_id]
+                entry[column] = (entry[column] or []) + [value]
+
+        return list(entries.values())
+
+    def update(self, model: T) -> T:
+        with _write_transaction(self.connection) as connection:
+            if not self._existing_ids([model.id]):
+                raise ModelNotFoundError(f"Asset with ID {model.id} not found")
+            self._write(connection, model, replace=True)
+
+        return model
+
+    def delete(self, model_id: str) -> None:
+        with _write_transaction(self.connection) as connection:
+            if not self._existing_ids([model_id]):
+                raise ModelNotFoundError(f"Asset with ID {model_id} not found")
+            self._delete_rows(connection, [model_id])
+
+    def create_many(self, models: List[T]) -> List[T]:
+        with _write_transaction(self.connection) as connection:
+            for model in models:
+                self._write(connection, model, replace=False)
+
+        return models
+
+    def update_many(self, models: List[T]) -> List[T]:
+        with _write_transaction(self.connection) as connection:
+            model_ids = [model.id for model in models]
+            raise_on_missing_ids(model_ids, self._existing_ids(model_ids))
+            for model in models:
+                self._write(connection, model, replace=True)
+
+        return models
+
+    def delete_many(self, model_ids: List[str]) -> None:
+        with _write_transaction(self.connection) as connection:
+            raise_on_missing_ids(model_ids, self._existing_ids(model_ids))
+            if model_ids:
+                self._delete_rows(connection, model_ids)
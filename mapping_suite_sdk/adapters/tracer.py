@@ -3,23 +3,145 @@ Tracing module for the Mapping Suite SDK.
 
 This module provides functionality to add OpenTelemetry tracing to the SDK,
 allowing users to monitor and debug performance and execution flow.
+
+The tracing configuration (enablement, sampling ratio and traced names) is resolved once,
+from the environment at import time, and afterwards whenever it is changed through the
+setters of this module or refresh_mssdk_tracing, so the decorators cost a couple of attribute
+lookups per call when tracing is disabled.
+
+OpenTelemetry is only imported, and the tracer provider of the SDK only set up, on first use:
+when the first span is recorded or a span processor is added.
 """
 
 import functools
+import inspect
+import locale
 import os
+import random
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from mapping_suite_sdk.adapters.profiler import _MSSDK_PROFILING_STATE, profiled_call
+
+if TYPE_CHECKING:
+    from opentelemetry.context import Context
+    from opentelemetry.sdk.trace import TracerProvider, SpanProcessor
+    from opentelemetry.trace import Span, Tracer
+
+# Environment variables to control tracing state
+_MSSDK_TRACE_VAR_NAME = "MSSDK_TRACE"
+_MSSDK_TRACE_SAMPLE_RATIO_VAR_NAME = "MSSDK_TRACE_SAMPLE_RATIO"
+_MSSDK_TRACE_NAMES_VAR_NAME = "MSSDK_TRACE_NAMES"
+_MSSDK_TRACE_FILE_SPAN_THRESHOLD_VAR_NAME = "MSSDK_TRACE_FILE_SPAN_THRESHOLD"
+### Error messages recorded on spans are truncated to this many characters, keeping spans bounded in size
+MSSDK_TRACE_MAX_ERROR_MESSAGE_LENGTH = 256
+# OpenTelemetry tracer provider of the SDK, and its tracer, set up on first use by _get_mssdk_tracer_provider
+_MSSDK_TRACER_PROVIDER: Optional["TracerProvider"] = None
+_MSSDK_TRACER: Optional["Tracer"] = None
+_MSSDK_TRACER_PROVIDER_LOCK = threading.Lock()
 
-from opentelemetry import trace
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider, SpanProcessor
+# Code of the functions returned by @contextmanager, to recognise the context manager functions to trace
+_CONTEXT_MANAGER_HELPER_CODE = contextmanager(lambda: iter(())).__code__
+# Sampling decision of the outermost traced SDK call of the current context, None outside of traced calls
+_MSSDK_TRACE_SAMPLED: ContextVar[Optional[bool]] = ContextVar("mssdk_trace_sampled", default=None)
 
-# Environment variable to control tracing state
-_MSSDK_TRACE_VAR_NAME = "MSSDK_TRACE"
-# Set up the OpenTelemetry tracer provider
-_MSSDK_TRACER_PROVIDER = TracerProvider(resource=Resource(attributes={SERVICE_NAME: "mapping-suite-sdk"}))
-trace.set_tracer_provider(_MSSDK_TRACER_PROVIDER)
 
+class _MSSDKTracingState:
+    """Resolved tracing configuration, read by the tracing decorators on every call."""
+    __slots__ = ("enabled", "sample_ratio", "traced_names", "traced_span_names", "file_span_threshold")
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.sample_ratio: float = 1.0
+        self.traced_names: Optional[List[str]] = None
+        # Cache of the filtering decision of each span name, cleared when the traced names change
+        self.traced_span_names: Dict[str, bool] = {}
+        self.file_span_threshold: Optional[int] = None
+
+
+_MSSDK_TRACING_STATE = _MSSDKTracingState()
+
+
+def _get_mssdk_tracer_provider() -> "TracerProvider":
+    """Get the tracer provider of the SDK, creating it and setting it as the global tracer provider on first use.
+
+    The SDK spans are recorded by this provider even when the application has already set another
+    global tracer provider, so the span processors added to it always get them.
+    """
+    global _MSSDK_TRACER_PROVIDER, _MSSDK_TRACER
+    if _MSSDK_TRACER_PROVIDER is None:
+        with _MSSDK_TRACER_PROVIDER_LOCK:
+            if _MSSDK_TRACER_PROVIDER is None:
+                from opentelemetry import trace
+                from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+                from opentelemetry.sdk.trace import TracerProvider
+
+                tracer_provider = TracerProvider(resource=Resource(attributes={SERVICE_NAME: "mapping-suite-sdk"}))
+                trace.set_tracer_provider(tracer_provider)
+                # From the SDK provider rather than the global one, which may already be set by the application
+                _MSSDK_TRACER = tracer_provider.get_tracer(__name__)
+                _MSSDK_TRACER_PROVIDER = tracer_provider
+    return _MSSDK_TRACER_PROVIDER
+
+
+def _get_mssdk_tracer() -> "Tracer":
+    """Get the tracer of the SDK spans, setting up the tracer provider on first use."""
+    if _MSSDK_TRACER is None:
+        _get_mssdk_tracer_provider()
+    return _MSSDK_TRACER
+
+
+def _parse_file_span_threshold(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    file_span_threshold = int(value)
+    if file_span_threshold < 0:
+        raise ValueError(f"The file span threshold must be positive, got {value}")
+    return file_span_threshold
+
+
+def _parse_sample_ratio(value: Any) -> float:
+    sample_ratio = float(value)
+    if not 0.0 <= sample_ratio <= 1.0:
+        raise ValueError(f"The tracing sample ratio must be between 0 and 1, got {value}")
+    return sample_ratio
+
+
+def refresh_mssdk_tracing() -> None:
+    """
+    Resolve the tracing configuration again from the environment variables.
+
+    Only needed when the MSSDK_TRACE, MSSDK_TRACE_SAMPLE_RATIO, MSSDK_TRACE_NAMES or
+    MSSDK_TRACE_FILE_SPAN_THRESHOLD environment variables are changed directly, rather than
+    through the setters of this module. Invalid sample ratios fall back to tracing every call,
+    and invalid file span thresholds to no file spans.
+
+    Returns:
+        None
+    """
+    _MSSDK_TRACING_STATE.enabled = os.getenv(_MSSDK_TRACE_VAR_NAME, 'false').casefold().strip() == 'true'
+
+    try:
+        _MSSDK_TRACING_STATE.sample_ratio = _parse_sample_ratio(os.getenv(_MSSDK_TRACE_SAMPLE_RATIO_VAR_NAME, '1'))
+    except ValueError:
+        _MSSDK_TRACING_STATE.sample_ratio = 1.0
+
+    traced_names = [name.strip() for name in os.getenv(_MSSDK_TRACE_NAMES_VAR_NAME, '').split(',') if name.strip()]
+    _MSSDK_TRACING_STATE.traced_names = traced_names or None
+    _MSSDK_TRACING_STATE.traced_span_names = {}
+
+    try:
+        _MSSDK_TRACING_STATE.file_span_threshold = _parse_file_span_threshold(
+            os.getenv(_MSSDK_TRACE_FILE_SPAN_THRESHOLD_VAR_NAME))
+    except ValueError:
+        _MSSDK_TRACING_STATE.file_span_threshold = None
 
-def add_span_processor_to_mssdk_tracer_provider(sp: SpanProcessor) -> None:
+
+def add_span_processor_to_mssdk_tracer_provider(sp: "SpanProcessor") -> None:
     """
     Set span processor to mssdk tracer provider.
 
@@ -29,8 +151,10 @@ def add_span_processor_to_mssdk_tracer_provider(sp: SpanProcessor) -> None:
     Returns:
         None
     """
+    from opentelemetry.sdk.trace import SpanProcessor
+
     if isinstance(sp, SpanProcessor):
-        _MSSDK_TRACER_PROVIDER.add_span_processor(sp)
+        _get_mssdk_tracer_provider().add_span_processor(sp)
 
 
 def set_mssdk_tracing(state: bool) -> None:
@@ -44,6 +168,7 @@ def set_mssdk_tracing(state: bool) -> None:
         None
     """
     os.environ[_MSSDK_TRACE_VAR_NAME] = str(state).casefold().strip()
+    _MSSDK_TRACING_STATE.enabled = os.environ[_MSSDK_TRACE_VAR_NAME] == 'true'
 
 
 def get_mssdk_tracing() -> bool:
@@ -53,7 +178,7 @@ def get_mssdk_tracing() -> bool:
     Returns:
         The current tracing state (true or false)
     """
-    return os.getenv(_MSSDK_TRACE_VAR_NAME, 'false').casefold().strip() == 'true'
+    return _MSSDK_TRACING_STATE.enabled
 
 
 def is_mssdk_tracing_enabled() -> bool:
@@ -63,57 +188,444 @@ def is_mssdk_tracing_enabled() -> bool:
     Returns:
         True if tracing is enabled, False otherwise
     """
-    return bool(get_mssdk_tracing())
+    return _MSSDK_TRACING_STATE.enabled
 
 
-def traced_routine(func):
+def set_mssdk_tracing_sample_ratio(sample_ratio: float) -> None:
     """
-    Decorator to add tracing to a function.
+    Set the ratio of the outermost traced SDK calls which are traced (head-based sampling).
 
-    Creates a span for the decorated function, capturing function details,
-    arguments, and any errors that occur during execution.
+    The decision is taken once per outermost call: the SDK calls it makes are traced if,
+    and only if, it is traced, so sampled traces are always complete.
 
     Args:
-        func: The function to trace
+        sample_ratio: Ratio between 0 (trace nothing) and 1 (trace every call)
 
     Returns:
-        The wrapped function with tracing capabilities
+        None
+
+    Raises:
+        ValueError: If the ratio is not between 0 and 1
     """
+    _MSSDK_TRACING_STATE.sample_ratio = _parse_sample_ratio(sample_ratio)
+    os.environ[_MSSDK_TRACE_SAMPLE_RATIO_VAR_NAME] = str(_MSSDK_TRACING_STATE.sample_ratio)
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        if is_mssdk_tracing_enabled():
-            with trace.get_tracer(__name__).start_as_current_span(f"{func.__module__}.{func.__name__}") as span:
 
-                span.set_attribute("function.name", func.__name__)
-                span.set_attribute("function.module", func.__module__)
-                span.set_attribute("function.args", args)
-                span.set_attribute("function.args_count", len(args))
+def get_mssdk_tracing_sample_ratio() -> float:
+    """
+    Get the current tracing sample ratio.
+
+    Returns:
+        The ratio of the outermost traced SDK calls which are traced
+    """
+    return _MSSDK_TRACING_STATE.sample_ratio
+
+
+def set_mssdk_traced_names(traced_names: Optional[Iterable[str]]) -> None:
+    """
+    Restrict tracing to the given classes, methods, modules or functions.
+
+    A span is created for a call if one of the names is its span name, i.e. "ClassName.method"
+    for traced classes and "module.function" for traced routines, or a prefix of it ending
+    before a dot, e.g. "MappingPackageLoader" or "mapping_suite_sdk.services.load_mapping_package".
+
+    Args:
+        traced_names: Names of the traced classes, methods, modules or functions, None to trace everything
+
+    Returns:
+        None
+    """
+    traced_names = list(traced_names) if traced_names is not None else None
+    _MSSDK_TRACING_STATE.traced_names = traced_names or None
+    _MSSDK_TRACING_STATE.traced_span_names = {}
+    if traced_names:
+        os.environ[_MSSDK_TRACE_NAMES_VAR_NAME] = ",".join(traced_names)
+    else:
+        os.environ.pop(_MSSDK_TRACE_NAMES_VAR_NAME, None)
+
+
+def get_mssdk_traced_names() -> Optional[List[str]]:
+    """
+    Get the names tracing is restricted to.
+
+    Returns:
+        The traced names, or None if everything is traced
+    """
+    return list(_MSSDK_TRACING_STATE.traced_names) if _MSSDK_TRACING_STATE.traced_names is not None else None
+
+
+def set_mssdk_file_span_threshold(file_span_threshold: Optional[int]) -> None:
+    """
+    Trace the package files read or written by the SDK which are at least this many bytes long.
+
+    Each such file gets a span, child of the span of the loader or serialiser handling it,
+    with its path, its size and the time spent on I/O and on decoding or encoding its content.
+    Files are only traced within traced (and sampled) SDK calls.
+
+    Args:
+        file_span_threshold: Minimum size of the traced files, in bytes (0 traces every file),
+            None to trace no file
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the threshold is negative
+    """
+    _MSSDK_TRACING_STATE.file_span_threshold = _parse_file_span_threshold(file_span_threshold)
+    if file_span_threshold is None:
+        os.environ.pop(_MSSDK_TRACE_FILE_SPAN_THRESHOLD_VAR_NAME, None)
+    else:
+        os.environ[_MSSDK_TRACE_FILE_SPAN_THRESHOLD_VAR_NAME] = str(file_span_threshold)
+
+
+def get_mssdk_file_span_threshold() -> Optional[int]:
+    """
+    Get the minimum size of the traced package files.
+
+    Returns:
+        The threshold in bytes, or None if no file is traced
+    """
+    return _MSSDK_TRACING_STATE.file_span_threshold
+
+
+def _is_file_traced() -> bool:
+    state = _MSSDK_TRACING_STATE
+    if not state.enabled or state.file_span_threshold is None or _MSSDK_TRACE_SAMPLED.get() is False:
+        return False
+    from opentelemetry import trace
+
+    return trace.get_current_span().is_recording()
+
+
+def _record_file_span(span_name: str, file_path: Path, root_path: Optional[Path], size: int,
+                      start_time: int, end_time: int, io_duration: int, codec_attribute: str,
+                      codec_duration: int) -> None:
+    """Record the span of a file read or written, once done, if the file is large enough."""
+    if size < _MSSDK_TRACING_STATE.file_span_threshold:
+        return
+    span = _get_mssdk_tracer().start_span(span_name, start_time=start_time, attributes={
+        "file.path": str(file_path.relative_to(root_path) if root_path is not None else file_path),
+        "file.size": size,
+        "file.io_duration_ms": io_duration / 1e6,
+        codec_attribute: codec_duration / 1e6,
+    })
+    span.end(end_time=end_time)
+
+
+def _decode_text(content: bytes) -> str:
+    # Same decoding as Path.read_text: locale encoding and universal newlines
+    return content.decode(locale.getpreferredencoding(False)).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_traced_file_text(file_path: Path, root_path: Optional[Path] = None) -> str:
+    """
+    Read the text of a package file, like Path.read_text, in a file span if file spans are enabled.
+
+    Args:
+        file_path: Path of the file to read
+        root_path: Optional folder the path recorded in the span is relative to, e.g. the package folder
+
+    Returns:
+        The text of the file
+    """
+    if not _is_file_traced():
+        return file_path.read_text()
+
+    start_time = time.time_ns()
+    content = file_path.read_bytes()
+    read_end_time = time.time_ns()
+    text = _decode_text(content)
+    end_time = time.time_ns()
+    _record_file_span("read_file", file_path, root_path, len(content), start_time, end_time,
+                      io_duration=read_end_time - start_time,
+                      codec_attribute="file.decode_duration_ms", codec_duration=end_time - read_end_time)
+    return text
 
-                try:
-                    func_result = func(*args, **kwargs)
 
-                    span.set_attribute("function.status", "success")
-                    return func_result
+def read_traced_file_bytes(file_path: Path, root_path: Optional[Path] = None) -> bytes:
+    """
+    Read the content of a package file, like Path.read_bytes, in a file span if file spans are enabled.
+
+    Args:
+        file_path: Path of the file to read
+        root_path: Optional folder the path recorded in the span is relative to, e.g. the package folder
 
-                except Exception as e:
-                    span.set_attribute("function.status", "error")
-                    span.set_attribute("error.type", e.__class__.__name__)
-                    span.set_attribute("error.message", str(e))
-                    span.record_exception(e)
+    Returns:
+        The content of the file
+    """
+    if not _is_file_traced():
+        return file_path.read_bytes()
+
+    start_time = time.time_ns()
+    content = file_path.read_bytes()
+    end_time = time.time_ns()
+    _record_file_span("read_file", file_path, root_path, len(content), start_time, end_time,
+                      io_duration=end_time - start_time,
+                      codec_attribute="file.decode_duration_ms", codec_duration=0)
+    return content
+
+
+def write_traced_file_text(file_path: Path, text: str, root_path: Optional[Path] = None) -> None:
+    """
+    Write the text of a package file, like Path.write_text, in a file span if file spans are enabled.
 
-                    raise
-        else:
+    Args:
+        file_path: Path of the file to write
+        text: Text to write
+        root_path: Optional folder the path recorded in the span is relative to, e.g. the package folder
+
+    Returns:
+        None
+    """
+    if not _is_file_traced():
+        file_path.write_text(text)
+        return
+
+    start_time = time.time_ns()
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    content = text.encode(locale.getpreferredencoding(False))
+    encode_end_time = time.time_ns()
+    file_path.write_bytes(content)
+    end_time = time.time_ns()
+    _record_file_span("write_file", file_path, root_path, len(content), start_time, end_time,
+                      io_duration=end_time - encode_end_time,
+                      codec_attribute="file.encode_duration_ms", codec_duration=encode_end_time - start_time)
+
+
+def write_traced_file_bytes(file_path: Path, content: bytes, root_path: Optional[Path] = None) -> None:
+    """
+    Write the content of a package file, like Path.write_bytes, in a file span if file spans are enabled.
+
+    Args:
+        file_path: Path of the file to write
+        content: Content to write
+        root_path: Optional folder the path recorded in the span is relative to, e.g. the package folder
+
+    Returns:
+        None
+    """
+    if not _is_file_traced():
+        file_path.write_bytes(content)
+        return
+
+    start_time = time.time_ns()
+    file_path.write_bytes(content)
+    end_time = time.time_ns()
+    _record_file_span("write_file", file_path, root_path, len(content), start_time, end_time,
+                      io_duration=end_time - start_time,
+                      codec_attribute="file.encode_duration_ms", codec_duration=0)
+
+
+def _is_span_name_traced(span_name: str) -> bool:
+    traced_span_names = _MSSDK_TRACING_STATE.traced_span_names
+    is_traced = traced_span_names.get(span_name)
+    if is_traced is None:
+        traced_names = _MSSDK_TRACING_STATE.traced_names
+        is_traced = traced_names is None or any(span_name == name or span_name.startswith(name + ".")
+                                                for name in traced_names)
+        traced_span_names[span_name] = is_traced
+    return is_traced
+
+
+def _sampling_decision(state: _MSSDKTracingState) -> Tuple[bool, bool]:
+    """Return whether a call is sampled, and whether it is an outermost call which took a new decision."""
+    if state.sample_ratio >= 1.0:
+        return True, False
+    sampled = _MSSDK_TRACE_SAMPLED.get()
+    if sampled is None:
+        return random.random() < state.sample_ratio, True
+    return sampled, False
+
+
+def _record_error(span: "Span", error: Exception) -> None:
+    span.set_attribute("function.status", "error")
+    span.set_attribute("error.type", error.__class__.__name__)
+    span.set_attribute("error.message", str(error)[:MSSDK_TRACE_MAX_ERROR_MESSAGE_LENGTH])
+    span.record_exception(error)
+
+
+@contextmanager
+def _current_span(span_name: str, span_attributes: Dict[str, Any], args_count: int) -> Iterator["Span"]:
+    """Run the body of the with statement in a new current span, recording its status."""
+    with _get_mssdk_tracer().start_as_current_span(span_name, attributes=span_attributes,
+                                                   record_exception=False) as span:
+        span.set_attribute("function.args_count", args_count)
+        try:
+            yield span
+            span.set_attribute("function.status", "success")
+        except Exception as e:
+            _record_error(span, e)
+            raise
+
+
+@contextmanager
+def _traced_context_manager(func, args, kwargs, span_name: str, span_attributes: Dict[str, Any],
+                            sampled: bool) -> Iterator[Any]:
+    """Run a context manager in a span lasting until it exits, so covering the body of the with statement.
+
+    The sampling decision applies until the context manager exits; if the call is not sampled,
+    only the decision is applied.
+    """
+    sampled_token = _MSSDK_TRACE_SAMPLED.set(sampled)
+    try:
+        with _current_span(span_name, span_attributes, len(args)) if sampled else nullcontext():
+            with func(*args, **kwargs) as value:
+                yield value
+    finally:
+        _MSSDK_TRACE_SAMPLED.reset(sampled_token)
+
+
+def _traced_generator(func, args, kwargs, span_name: str, span_attributes: Dict[str, Any],
+                      sampled: bool, parent_context: Optional["Context"]) -> Iterator[Any]:
+    """Run a generator in a span lasting until it is exhausted or closed.
+
+    The span, child of the context the generator function was called in, and the sampling
+    decision only apply while the generator runs, not while its consumer does, so the spans
+    of the consumer between two items are not nested in it. If the call is not sampled, only
+    the decision is applied.
+    """
+    from opentelemetry import context as otel_context
+    from opentelemetry import trace
+
+    if sampled:
+        span = _get_mssdk_tracer().start_span(span_name, context=parent_context, attributes=span_attributes)
+        span.set_attribute("function.args_count", len(args))
+        span_context = trace.set_span_in_context(span, parent_context)
+    else:
+        span, span_context = trace.INVALID_SPAN, None
+    generator = None
+    send_value, thrown_error = None, None
+
+    def resume():
+        nonlocal generator
+        context_token = otel_context.attach(span_context) if span_context is not None else None
+        sampled_token = _MSSDK_TRACE_SAMPLED.set(sampled)
+        try:
+            if generator is None:
+                generator = func(*args, **kwargs)
+            return generator.throw(thrown_error) if thrown_error is not None else generator.send(send_value)
+        finally:
+            _MSSDK_TRACE_SAMPLED.reset(sampled_token)
+            if context_token is not None:
+                otel_context.detach(context_token)
+
+    try:
+        while True:
+            item = resume()
+            try:
+                send_value, thrown_error = (yield item), None
+            except GeneratorExit:
+                span.set_attribute("function.status", "closed")
+                generator.close()
+                raise
+            except BaseException as e:
+                send_value, thrown_error = None, e
+    except StopIteration as stop:
+        span.set_attribute("function.status", "success")
+        return stop.value
+    except Exception as e:
+        _record_error(span, e)
+        raise
+    finally:
+        span.end()
+
+
+def _trace_call(func, span_name: str, span_attributes: Dict[str, Any]):
+    """Wrap a function so its calls are traced in spans named span_name, with the given attributes.
+
+    The span of a coroutine function lasts until the coroutine returns, the span of a generator
+    function until the generator is exhausted or closed, and the span of a @contextmanager
+    function until the context manager exits; the span of any other function lasts until it returns.
+    Calls of the other functions are also profiled when profiling is enabled, whether traced or not.
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            state = _MSSDK_TRACING_STATE
+            if not state.enabled or not _is_span_name_traced(span_name):
+                return await func(*args, **kwargs)
+
+            sampled, is_outermost = _sampling_decision(state)
+            sampled_token = _MSSDK_TRACE_SAMPLED.set(sampled) if is_outermost else None
+            try:
+                if not sampled:
+                    return await func(*args, **kwargs)
+                with _current_span(span_name, span_attributes, len(args)):
+                    return await func(*args, **kwargs)
+            finally:
+                if sampled_token is not None:
+                    _MSSDK_TRACE_SAMPLED.reset(sampled_token)
+
+        return async_wrapper
+
+    is_generator_function = inspect.isgeneratorfunction(func)
+    is_context_manager_function = getattr(func, "__code__", None) is _CONTEXT_MANAGER_HELPER_CODE
+    is_profiled = not is_generator_function and not is_context_manager_function
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        state = _MSSDK_TRACING_STATE
+        if not state.enabled or not _is_span_name_traced(span_name):
+            if is_profiled and _MSSDK_PROFILING_STATE.enabled:
+                with profiled_call(span_name):
+                    return func(*args, **kwargs)
             return func(*args, **kwargs)
 
+        sampled, is_outermost = _sampling_decision(state)
+        if is_generator_function or is_context_manager_function:
+            # The call only creates the generator or context manager, which carries the decision along:
+            # it may run after the traced call it was created in has returned, outside of its decision
+            if is_generator_function:
+                from opentelemetry import context as otel_context
+
+                return _traced_generator(func, args, kwargs, span_name, span_attributes, sampled,
+                                         otel_context.get_current() if sampled else None)
+            return _traced_context_manager(func, args, kwargs, span_name, span_attributes, sampled)
+
+        sampled_token = _MSSDK_TRACE_SAMPLED.set(sampled) if is_outermost else None
+        try:
+            if not sampled:
+                with profiled_call(span_name):
+                    return func(*args, **kwargs)
+            with _current_span(span_name, span_attributes, len(args)) as span, profiled_call(span_name, span):
+                return func(*args, **kwargs)
+        finally:
+            if sampled_token is not None:
+                _MSSDK_TRACE_SAMPLED.reset(sampled_token)
+
     return wrapper
 
 
+def traced_routine(func):
+    """
+    Decorator to add tracing to a function.
+
+    Creates a span for the decorated function, capturing function details,
+    the number of arguments, and any errors that occur during execution.
+    The arguments themselves are not recorded, keeping spans small and cheap to build.
+    The span of a coroutine, generator or @contextmanager function covers the lifetime of the
+    coroutine, generator or context manager, not only the call creating it.
+
+    Args:
+        func: The function to trace
+
+    Returns:
+        The wrapped function with tracing capabilities
+    """
+    return _trace_call(func,
+                       span_name=f"{func.__module__}.{func.__name__}",
+                       span_attributes={"function.name": func.__name__,
+                                        "function.module": func.__module__})
+
+
 def traced_class(cls):
     """
     Class decorator that applies tracing to all methods of a class.
 
-    Similar to traced_routine but works on all methods of a class.
+    Similar to traced_routine but works on all methods of a class, including coroutine,
+    generator and @contextmanager methods.
     Note: Currently does not work with static methods.
 
     Args:
@@ -124,33 +636,15 @@ def traced_class(cls):
     """
     class_name = cls.__name__
 
-    def class_traced_routine(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            if is_mssdk_tracing_enabled():
-                with trace.get_tracer(__name__).start_as_current_span(f"{class_name}.{func.__name__}") as span:
-                    span.set_attribute("function.name", func.__name__)
-                    span.set_attribute("class.name", class_name)
-                    span.set_attribute("function.args_count", len(args))
-
-                    try:
-                        func_result = func(*args, **kwargs)
-                        span.set_attribute("function.status", "success")
-                        return func_result
-                    except Exception as e:
-                        span.set_attribute("function.status", "error")
-                        span.set_attribute("error.type", e.__class__.__name__)
-                        span.set_attribute("error.message", str(e))
-                        span.record_exception(e)
-                        raise
-            else:
-                return func(*args, **kwargs)
-
-        return wrapper
-
     for attr_name, attr_value in cls.__dict__.items():
         # Skip special methods and non-callable attributes
         if callable(attr_value) and not attr_name.startswith('__'):
-            setattr(cls, attr_name, class_traced_routine(attr_value))
+            setattr(cls, attr_name, _trace_call(attr_value,
+                                                span_name=f"{class_name}.{attr_value.__name__}",
+                                                span_attributes={"function.name": attr_value.__name__,
+                                                                 "class.name": class_name}))
 
     return cls
+
+
+refresh_mssdk_tracing()
@@ -0,0 +1,282 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pydantic import Field
+from pymongo import MongoClient, IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from mapping_suite_sdk.adapters.filesystem_repository import MSSDK_FILESYSTEM_BLOB_MIN_SIZE
+from mapping_suite_sdk.adapters.model_document import model_to_document, replace_long_strings, \
+    resolve_blob_references, collect_blob_references
+from mapping_suite_sdk.adapters.repository import ModelNotFoundError, RepositoryError, ensure_mongodb_indexes
+from mapping_suite_sdk.adapters.tracer import traced_class
+from mapping_suite_sdk.models.core import CoreModel, MSSDK_DEFAULT_STR_ENCODE, get_document_changes, \
+    apply_document_changes
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+### A full snapshot is stored every this many revisions of a lineage, bounding the deltas to apply on rebuild
+MSSDK_VERSIONED_REPOSITORY_SNAPSHOT_INTERVAL = 10
+### Attempts of a commit racing with concurrent commits of the same lineage, before it fails
+MSSDK_VERSIONED_REPOSITORY_COMMIT_ATTEMPTS = 5
+
+_REVISIONS_COLLECTION_SUFFIX = "_revisions"
+_BLOBS_COLLECTION_SUFFIX = "_blobs"
+_DUPLICATE_KEY_ERROR_CODE = 11000
+# Fields of the revision documents storing the manifest (or its changes), and the blobs they reference
+_MANIFEST_FIELD = "manifest"
+_CHANGES_FIELD = "changes"
+_BLOB_DIGESTS_FIELD = "blob_digests"
+_REVISION_PROJECTION = {_MANIFEST_FIELD: 0, _CHANGES_FIELD: 0, _BLOB_DIGESTS_FIELD: 0}
+_REVISION_INDEX_SPECS = [
+    IndexModel([("identifier", ASCENDING), ("revision", ASCENDING)], name="identifier_revision", unique=True),
+    IndexModel([("identifier", ASCENDING), ("is_snapshot", ASCENDING), ("revision", DESCENDING)],
+               name="identifier_snapshot_revision"),
+    IndexModel([(_BLOB_DIGESTS_FIELD, ASCENDING)], name=_BLOB_DIGESTS_FIELD),
+]
+
+
+class RevisionConflictError(RepositoryError):
+    """Raised when a commit keeps conflicting with concurrent commits of the same lineage."""
+    pass
+
+
+class CorruptedRevisionError(RepositoryError):
+    """Raised when a stored revision references a blob which is not stored."""
+    pass
+
+
+class MappingPackageRevision(CoreModel):
+    """A revision of the lineage of a mapping package, i.e. of the packages sharing a metadata identifier."""
+    identifier: str = Field(..., description="Metadata identifier of the package lineage")
+    revision: int = Field(..., description="Number of the revision in the lineage, starting from 1")
+    parent_revision: Optional[int] = Field(default=None, description="Revision this revision is based on")
+    package_id: str = Field(..., description="ID of the mapping package of the revision")
+    mapping_version: str = Field(..., description="Mapping version of the package of the revision")
+    created_at: datetime = Field(..., description="Time the revision was stored")
+    is_snapshot: bool = Field(..., description="Whether the revision is stored in full, or as a delta")
+
+
+@traced_class
+class MongoDBVersionedMappingPackageRepository:
+    """Version history of mapping packages, stored in MongoDB with delta compression.
+
+    Each package is split into a manifest, in which asset contents are replaced by their
+    SHA-256, and content-addressed blobs stored once in a blob collection. Revisions of a
+    lineage (the packages sharing a metadata identifier) store the changes of their manifest
+    against their parent, i.e. the assets whose hash changed; every snapshot_interval-th
+    revision stores its full manifest, so rebuilding a revision applies a bounded number of deltas.
+
+    As for MongoDBRepository, the indexes of the revisions are only created by ensure_indexes,
+    or in the constructor with ensure_indexes=True, as it needs write access to the database.
+    """
+
+    def __init__(
+            self,
+            mongo_client: MongoClient,
+            database_name: str,
+            collection_name: Optional[str] = None,
+            snapshot_interval: int = MSSDK_VERSIONED_REPOSITORY_SNAPSHOT_INTERVAL,
+            blob_min_size: int = MSSDK_FILESYSTEM_BLOB_MIN_SIZE,
+            ensure_indexes: bool = False
+    ):
+        if snapshot_interval < 1:
+            raise ValueError("The snapshot interval must be at least 1")
+
+        self.client = mongo_client
+        self.database = self.client[database_name]
+        self.collection_name = collection_name or MappingPackage.__name__
+        self.revisions_collection = self.database[self.collection_name + _REVISIONS_COLLECTION_SUFFIX]
+        self.blobs_collection = self.database[self.collection_name + _BLOBS_COLLECTION_SUFFIX]
+        self.snapshot_interval = snapshot_interval
+        self.blob_min_size = blob_min_size
+        if ensure_indexes:
+            self.ensure_indexes()
+
+    def ensure_indexes(self) -> List[str]:
+        """Create the indexes of the revisions, if they don't exist yet, once per client and collection.
+
+        Returns:
+            List[str]: Names of the indexes
+        """
+        ensure_mongodb_indexes(self.revisions_collection, _REVISION_INDEX_SPECS)
+
+        return [index_spec.document["name"] for index_spec in _REVISION_INDEX_SPECS]
+
+    def _store_blobs(self, blobs: Dict[str, str]) -> List[str]:
+        """Store the blobs which are not stored yet, and return the digests of the blobs stored by this call."""
+        if not blobs:
+            return []
+        existing_digests = set(self.blobs_collection.distinct("_id", {"_id": {"$in": list(blobs)}}))
+        new_blobs = [{"_id": digest, "content": content} for digest, content in blobs.items()
+                     if digest not in existing_digests]
+        if not new_blobs:
+            return []
+        try:
+            self.blobs_collection.insert_many(new_blobs, ordered=False)
+        except BulkWriteError as error:
+            # Blobs stored concurrently by another writer are fine
+            write_errors = error.details.get("writeErrors", [])
+            if any(write_error["code"] != _DUPLICATE_KEY_ERROR_CODE for write_error in write_errors):
+                raise
+            concurrent_indexes = {write_error["index"] for write_error in write_errors}
+            return [blob["_id"] for index, blob in enumerate(new_blobs) if index not in concurrent_indexes]
+        return [blob["_id"] for blob in new_blobs]
+
+    def _remove_blobs(self, digests: List[str], blobs: Dict[str, str]) -> None:
+        """Remove the blobs stored by a failed commit, unless a concurrent commit references them.
+
+        The references are checked after the removal, so that a revision stored meanwhile either
+        has its blobs restored here, or finds them missing when it checks them (see commit).
+        """
+        if not digests:
+            return
+        self.blobs_collection.delete_many({"_id": {"$in": digests}})
+        referenced_digests = self.revisions_collection.distinct(_BLOB_DIGESTS_FIELD,
+                                                                {_BLOB_DIGESTS_FIELD: {"$in": digests}})
+        self._store_blobs({digest: blobs[digest] for digest in referenced_digests if digest in blobs})
+
+    def _to_manifest(self, mapping_package: MappingPackage) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Split a package into its manifest and the blobs it references, keyed by digest."""
+        blobs: Dict[str, str] = {}
+
+        def store_blob(content: bytes) -> str:
+            digest = hashlib.sha256(content).hexdigest()
+            blobs[digest] = content.decode(MSSDK_DEFAULT_STR_ENCODE)
+            return digest
+
+        manifest = replace_long_strings(model_to_document(mapping_package), self.blob_min_size, store_blob)
+        return manifest, blobs
+
+    def _read_manifest(self, identifier: str, revision: int) -> Dict[str, Any]:
+        snapshot = self.revisions_collection.find_one(
+            {"identifier": identifier, "is_snapshot": True, "revision": {"$lte": revision}},
+            sort=[("revision", DESCENDING)])
+        if snapshot is None:
+            raise ModelNotFoundError(f"Revision {revision} of {identifier} not found")
+
+        manifest = json.loads(snapshot[_MANIFEST_FIELD])
+        deltas = self.revisions_collection.find(
+            {"identifier": identifier, "revision": {"$gt": snapshot["revision"], "$lte": revision}},
+            sort=[("revision", ASCENDING)])
+        last_revision = snapshot["revision"]
+        for delta in deltas:
+            set_fields, unset_fields = json.loads(delta[_CHANGES_FIELD])
+            manifest = apply_document_changes(manifest, (set_fields, unset_fields))
+            last_revision = delta["revision"]
+        if last_revision != revision:
+            raise ModelNotFoundError(f"Revision {revision} of {identifier} not found")
+
+        return manifest
+
+    def _resolve_manifest(self, manifest: Dict[str, Any]) -> MappingPackage:
+        digests: Set[str] = set()
+        collect_blob_references(manifest, digests)
+        blobs = {blob["_id"]: blob["content"].encode(MSSDK_DEFAULT_STR_ENCODE)
+                 for blob in self.blobs_collection.find({"_id": {"$in": list(digests)}})}
+        missing_digests = digests - set(blobs)
+        if missing_digests:
+            raise CorruptedRevisionError(f"Blobs {sorted(missing_digests)} referenced by the revision are not stored")
+
+        return MappingPackage.model_validate(resolve_blob_references(manifest, blobs.__getitem__))
+
+    def get_latest_revision(self, identifier: str) -> Optional[MappingPackageRevision]:
+        """Get the latest revision of a lineage, or None if the lineage has no revision."""
+        result = self.revisions_collection.find_one({"identifier": identifier}, _REVISION_PROJECTION,
+                                                    sort=[("revision", DESCENDING)])
+
+        return MappingPackageRevision.model_validate(result) if result is not None else None
+
+    def commit(self, mapping_package: MappingPackage) -> MappingPackageRevision:
+        """Store a mapping package as the next revision of the lineage of its metadata identifier.
+
+        The blobs of the package are stored first and the revision last, so readers never see
+        a revision without its blobs. If another commit of the lineage stores the same revision
+        number first, the commit is retried against the new latest revision; if it still fails,
+        the blobs it stored are removed.
+
+        Args:
+            mapping_package: The mapping package to store
+
+        Returns:
+            MappingPackageRevision: The stored revision, or the latest one if it already stores this package
+
+        Raises:
+            RevisionConflictError: If the commit kept conflicting with concurrent commits of the lineage
+        """
+        identifier = mapping_package.metadata.identifier
+        manifest, blobs = self._to_manifest(mapping_package)
+        stored_digests = self._store_blobs(blobs)
+        try:
+            for _ in range(MSSDK_VERSIONED_REPOSITORY_COMMIT_ATTEMPTS):
+                parent = self.get_latest_revision(identifier)
+                revision_number = parent.revision + 1 if parent is not None else 1
+                is_snapshot = parent is None or (revision_number - 1) % self.snapshot_interval == 0
+
+                revision_document: Dict[str, Any] = {}
+                if parent is not None:
+                    changes = get_document_changes(self._read_manifest(identifier, parent.revision), manifest)
+                    if changes == ({}, []):
+                        return parent
+                    if not is_snapshot:
+                        revision_document[_CHANGES_FIELD] = json.dumps(changes)
+                        referenced_digests: Set[str] = set()
+                        collect_blob_references(changes[0], referenced_digests)
+                        revision_document[_BLOB_DIGESTS_FIELD] = sorted(referenced_digests)
+                if is_snapshot:
+                    revision_document[_MANIFEST_FIELD] = json.dumps(manifest)
+                    revision_document[_BLOB_DIGESTS_FIELD] = sorted(blobs)
+
+                revision = MappingPackageRevision(id=f"{identifier}@{revision_number}",
+                                                  identifier=identifier,
+                                                  revision=revision_number,
+                                                  parent_revision=parent.revision if parent is not None else None,
+                                                  package_id=mapping_package.id,
+                                                  mapping_version=mapping_package.metadata.mapping_version,
+                                                  created_at=datetime.now(timezone.utc),
+                                                  is_snapshot=is_snapshot)
+                try:
+                    self.revisions_collection.insert_one({**model_to_document(revision), **revision_document})
+                except DuplicateKeyError:
+                    # Another commit stored this revision number first
+                    continue
+                # Store again the blobs removed meanwhile by a failed concurrent commit, if any
+                self._store_blobs(blobs)
+                return revision
+        except BaseException:
+            self._remove_blobs(stored_digests, blobs)
+            raise
+
+        self._remove_blobs(stored_digests, blobs)
+        raise RevisionConflictError(f"Could not commit a revision of {identifier} after "
+                                    f"{MSSDK_VERSIONED_REPOSITORY_COMMIT_ATTEMPTS} attempts, as concurrent "
+                                    f"commits of the lineage stored it first")
+
+    def read(self, identifier: str, revision: Optional[int] = None) -> MappingPackage:
+        """Rebuild the mapping package of a revision of a lineage.
+
+        Args:
+            identifier: Metadata identifier of the lineage
+            revision: Number of the revision, the latest one if not provided
+
+        Returns:
+            MappingPackage: The mapping package of the revision
+        """
+        if revision is None:
+            latest_revision = self.get_latest_revision(identifier)
+            if latest_revision is None:
+                raise ModelNotFoundError(f"No revision of {identifier} found")
+            revision = latest_revision.revision
+
+        return self._resolve_manifest(self._read_manifest(identifier, revision))
+
+    def list_revisions(self, identifier: str) -> List[MappingPackageRevision]:
+        """List the revisions of a lineage, from the oldest to the latest."""
+        return [MappingPackageRevision.model_validate(result) for result in
+                self.revisions_collection.find({"identifier": identifier}, _REVISION_PROJECTION,
+                                               sort=[("revision", ASCENDING)])]
+
+    def list_identifiers(self) -> List[str]:
+        """List the identifiers of the stored lineages."""
+        return sorted(self.revisions_collection.distinct("identifier"))
@@ -1,10 +1,15 @@
+import hashlib
 from abc import ABC
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from pydantic import Field
 
-from mapping_suite_sdk.models.core import CoreModel
+from mapping_suite_sdk.models.core import CoreModel, MSSDK_DEFAULT_STR_ENCODE
+
+# Cache of the (content, SHA-256, size in bytes) of a file, kept in its instance __dict__; it is invalidated
+# when the content it holds is no longer the content of the file, i.e. once the content is replaced
+_CONTENT_DIGEST_KEY = "_mssdk_content_digest"
 
 
 ### Files
@@ -20,6 +25,24 @@ class PackageAsset(CoreModel):
     path: Path = Field(..., description="Path within a mapping package")
     content: str = Field(..., description="Content of the file")
 
+    def _get_content_digest_and_size(self) -> Tuple[str, int]:
+        # The digest is cached along with the content it was computed from, and recomputed once it is replaced
+        cached_content, digest, size = self.__dict__.get(_CONTENT_DIGEST_KEY, (None, None, None))
+        if cached_content is not self.content:
+            content = self.content if isinstance(self.content, bytes) else self.content.encode(
+                MSSDK_DEFAULT_STR_ENCODE)
+            digest, size = hashlib.sha256(content).hexdigest(), len(content)
+            self.__dict__[_CONTENT_DIGEST_KEY] = (self.content, digest, size)
+        return digest, size
+
+    def get_content_digest(self) -> str:
+        """Get the SHA-256 of the file content, computed once per content."""
+        return self._get_content_digest_and_size()[0]
+
+    def get_content_size(self) -> int:
+        """Get the size of the file content in bytes (UTF-8 encoded for text files)."""
+        return self._get_content_digest_and_size()[1]
+
     # Note: Potential future
     # @abstractmethod
     # @computed_field
@@ -1,7 +1,11 @@
+import copy
 import hashlib
 import json
+import time
+import weakref
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -9,6 +13,125 @@ MSSDK_STR_MIN_LENGTH = 1
 MSSDK_STR_MAX_LENGTH = 256
 MSSDK_DEFAULT_STR_ENCODE = 'utf-8'
 
+# Stored in the instance __dict__ (like a cached property), so it is ignored by equality and serialisation
+_PERSISTED_STATE_KEY = "_mssdk_persisted_state"
+_CONTENT_ID_KEY = "_mssdk_content_id"
+# Weak references to the models holding a model in their fields, by id(), so they refresh their content IDs
+_PARENTS_KEY = "_mssdk_parents"
+# Called with the wall and CPU time of each content ID generation, while a load report is collected
+_CONTENT_ID_OBSERVER: ContextVar[Optional[Callable[[float, float], None]]] = ContextVar("mssdk_content_id_observer",
+                                                                                       default=None)
+
+# A node of a persisted state: the digest of a value, and the nodes of its items (dict or list), if any
+_StateNode = Tuple[bytes, Any]
+ModelChanges = Tuple[Dict[str, Any], List[str]]
+
+
+def _build_state_node(value: Any) -> _StateNode:
+    """Build the hash tree of a JSON value, hashing each container from the digests of its items."""
+    if isinstance(value, dict):
+        children = {key: _build_state_node(item) for key, item in value.items()}
+        digest = hashlib.sha256(b"d" + b"".join(
+            hashlib.sha256(key.encode(MSSDK_DEFAULT_STR_ENCODE)).digest() + child[0]
+            for key, child in sorted(children.items()))).digest()
+        return digest, children
+    if isinstance(value, list):
+        children = [_build_state_node(item) for item in value]
+        return hashlib.sha256(b"l" + b"".join(child[0] for child in children)).digest(), children
+
+    return hashlib.sha256(b"v" + json.dumps(value).encode(MSSDK_DEFAULT_STR_ENCODE)).digest(), None
+
+
+def _collect_changes(node: _StateNode, current_node: _StateNode, value: Any, path: str,
+                     set_fields: Dict[str, Any], unset_fields: List[str]) -> None:
+    """Collect the dotted paths whose value differs between a persisted node and the current one."""
+    if current_node[0] == node[0]:
+        return
+
+    children, current_children = node[1], current_node[1]
+    if isinstance(children, dict) and isinstance(current_children, dict):
+        for key, item in value.items():
+            if key in children:
+                _collect_changes(children[key], current_children[key], item, f"{path}{key}.", set_fields,
+                                 unset_fields)
+            else:
+                set_fields[f"{path}{key}"] = item
+        unset_fields.extend(f"{path}{key}" for key in children if key not in value)
+    elif isinstance(children, list) and isinstance(current_children, list) and len(children) == len(value):
+        for index, item in enumerate(value):
+            _collect_changes(children[index], current_children[index], item, f"{path}{index}.", set_fields,
+                             unset_fields)
+    else:
+        set_fields[path.rstrip(".")] = value
+
+
+def _iter_models(value: Any) -> Iterator["CoreModel"]:
+    """Iterate over the models of a field value: the value itself, or the models in a list or dict."""
+    if isinstance(value, CoreModel):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_models(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_models(item)
+
+
+def get_document_changes(previous_document: Dict[str, Any], document: Dict[str, Any]) -> ModelChanges:
+    """
+    Get the changes between two JSON documents, as dotted paths.
+
+    Nested documents and lists of the same length are compared item by item, other
+    changed values are reported as a whole.
+
+    Args:
+        previous_document: The document before the changes
+        document: The document after the changes
+
+    Returns:
+        The changed paths with their new values, and the removed paths
+    """
+    set_fields: Dict[str, Any] = {}
+    unset_fields: List[str] = []
+    _collect_changes(_build_state_node(previous_document), _build_state_node(document), document, "", set_fields,
+                     unset_fields)
+
+    return set_fields, unset_fields
+
+
+def apply_document_changes(document: Dict[str, Any], changes: ModelChanges) -> Dict[str, Any]:
+    """
+    Apply changes, as returned by get_document_changes, to a copy of a JSON document.
+
+    Args:
+        document: The document to apply the changes to
+        changes: The changed paths with their new values, and the removed paths
+
+    Returns:
+        The changed copy of the document
+    """
+    changed_document = copy.deepcopy(document)
+    set_fields, unset_fields = changes
+
+    def get_parent(path: str) -> Tuple[Any, str]:
+        *parent_keys, key = path.split(".")
+        parent: Any = changed_document
+        for parent_key in parent_keys:
+            parent = parent[int(parent_key)] if isinstance(parent, list) else parent[parent_key]
+        return parent, key
+
+    for path, value in set_fields.items():
+        parent, key = get_parent(path)
+        if isinstance(parent, list):
+            parent[int(key)] = value
+        else:
+            parent[key] = value
+    for path in unset_fields:
+        parent, key = get_parent(path)
+        parent.pop(key, None)
+
+    return changed_document
+
 
 class CoreModel(BaseModel):
     """A base model class providing core functionality for all mapping-related models."""
@@ -27,14 +150,155 @@ class CoreModel(BaseModel):
 
     @model_validator(mode='after')
     def generate_id(self) -> 'CoreModel':
-        """Generate a unique ID based on the model data, excluding validation info."""
-        if self.id is None:
-            model_data = self.model_dump(exclude={'id'}, exclude_none=False, exclude_unset=False, mode='json')
-            data_string = json.dumps(model_data, sort_keys=True)
-            hash_value = hashlib.sha256(data_string.encode(MSSDK_DEFAULT_STR_ENCODE)).hexdigest()
-            object.__setattr__(self, 'id', hash_value)
+        """Generate a unique ID based on the model data, excluding validation info.
+
+        Generated IDs are content IDs: they are recomputed whenever a field of the model, or of
+        a model nested in it, is assigned. IDs given explicitly (or pinned, see pin_id) are kept
+        as they are.
+        """
+        self._link_child_models()
+        if self.id is None or self.has_content_id():
+            self._set_content_id()
+        self._refresh_parent_content_ids()
+        return self
+
+    def _iter_child_models(self) -> Iterator['CoreModel']:
+        model_dict = self.__dict__
+        for field_name in type(self).model_fields:
+            yield from _iter_models(model_dict.get(field_name))
+
+    def _link_child_models(self) -> None:
+        """Register the model as a parent of the models held in its fields."""
+        self_reference = weakref.ref(self)
+        for child_model in self._iter_child_models():
+            child_model.__dict__.setdefault(_PARENTS_KEY, {})[id(self)] = self_reference
+
+    def _refresh_parent_content_ids(self) -> None:
+        """Recompute the content IDs of the models holding this model, and of their own parents, after a change."""
+        parents = self.__dict__.get(_PARENTS_KEY)
+        if not parents:
+            return
+        for parent_key, parent_reference in list(parents.items()):
+            parent = parent_reference()
+            if parent is None or not any(child_model is self for child_model in parent._iter_child_models()):
+                # The parent was deleted, or no longer holds this model
+                del parents[parent_key]
+                continue
+            if parent.has_content_id():
+                parent._set_content_id()
+            parent._refresh_parent_content_ids()
+
+    def _set_content_id(self) -> None:
+        observer = _CONTENT_ID_OBSERVER.get()
+        if observer is not None:
+            start_time, start_cpu_time = time.perf_counter(), time.thread_time()
+        model_data = self.model_dump(exclude={'id'}, exclude_none=False, exclude_unset=False, mode='json')
+        data_string = json.dumps(model_data, sort_keys=True)
+        hash_value = hashlib.sha256(data_string.encode(MSSDK_DEFAULT_STR_ENCODE)).hexdigest()
+        object.__setattr__(self, 'id', hash_value)
+        self.__dict__[_CONTENT_ID_KEY] = hash_value
+        if observer is not None:
+            observer(time.perf_counter() - start_time, time.thread_time() - start_cpu_time)
+
+    def has_content_id(self) -> bool:
+        """Check if the ID of the model was generated from its content, rather than given explicitly."""
+        return self.id is not None and self.id == self.__dict__.get(_CONTENT_ID_KEY)
+
+    def pin_id(self) -> None:
+        """Keep the current ID from now on, even if the model changes (e.g. once it is the key of a stored model)."""
+        self.__dict__.pop(_CONTENT_ID_KEY, None)
+
+    def _relink_copy(self) -> 'CoreModel':
+        # A copy has no parents yet, and is a parent of the models it holds, copied or shared with the original
+        self.__dict__[_PARENTS_KEY] = {}
+        self._link_child_models()
         return self
 
+    def __copy__(self) -> 'CoreModel':
+        return super().__copy__()._relink_copy()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> 'CoreModel':
+        return super().__deepcopy__(memo)._relink_copy()
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        state = super().__getstate__()
+        # Weak references can't be pickled; the parents are linked again when unpickled
+        state["__dict__"] = {key: value for key, value in state["__dict__"].items() if key != _PARENTS_KEY}
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        self._link_child_models()
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'CoreModel':
+        copied_model = super().model_copy(update=update, deep=deep)._relink_copy()
+        # A copy is a new model, which was never persisted, even if it has the ID of a persisted model
+        copied_model.__dict__.pop(_PERSISTED_STATE_KEY, None)
+        if update and ("id" in update or "_id" in update):
+            copied_model.pin_id()
+        elif update and copied_model.has_content_id():
+            copied_model._set_content_id()
+        return copied_model
+
+    def __eq__(self, other: Any) -> bool:
+        # The ID is a field, so models with different IDs differ, and content IDs are always those of the
+        # current contents, so models with equal content IDs are equal, without comparing their (possibly
+        # large) contents. Models with explicit or pinned IDs are compared field by field
+        if isinstance(other, CoreModel) and type(self) is type(other):
+            if self.id != other.id:
+                return False
+            if self.has_content_id() and other.has_content_id():
+                return True
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        """Hash the model by its ID, which equal models share.
+
+        As for any mutable object, don't change a model with a content ID while it is hashed
+        (e.g. in a set or as a dict key), as its ID, and so its hash, changes with it.
+        """
+        return hash(self.id)
+
+    def _dump_persisted_state(self) -> Dict[str, Any]:
+        return self.model_dump(by_alias=True, mode='json')
+
+    def mark_persisted(self) -> None:
+        """Record the current field values as the persisted state, against which changes are tracked.
+
+        The ID is pinned, as it is the key of the persisted model.
+        """
+        self.pin_id()
+        self.__dict__[_PERSISTED_STATE_KEY] = _build_state_node(self._dump_persisted_state())
+
+    def get_changes(self) -> Optional[ModelChanges]:
+        """
+        Get the fields changed since the model was persisted (or loaded), as dotted paths.
+
+        Nested models and lists of the same length are compared item by item, so changing
+        one asset only reports that asset (e.g. "technical_mapping_suite.files.2.content").
+
+        Returns:
+            The changed paths with their new values and the removed paths, or None if the
+            model was never persisted
+        """
+        persisted_state = self.__dict__.get(_PERSISTED_STATE_KEY)
+        if persisted_state is None:
+            return None
+
+        set_fields: Dict[str, Any] = {}
+        unset_fields: List[str] = []
+        current_state = self._dump_persisted_state()
+        _collect_changes(persisted_state, _build_state_node(current_state), current_state, "", set_fields,
+                         unset_fields)
+
+        return set_fields, unset_fields
+
+    def is_modified(self) -> bool:
+        """Check if the model changed since it was persisted; models never persisted are considered modified."""
+        persisted_state = self.__dict__.get(_PERSISTED_STATE_KEY)
+
+        return persisted_state is None or _build_state_node(self._dump_persisted_state())[0] != persisted_state[0]
+
     class Config:
         validate_assignment = True
         extra = "forbid"
@@ -5,6 +5,7 @@ from pydantic import Field
 from mapping_suite_sdk.models.core import CoreModel, MSSDK_STR_MIN_LENGTH, MSSDK_STR_MAX_LENGTH
 from mapping_suite_sdk.models.asset import ConceptualMappingPackageAsset, TechnicalMappingSuite, VocabularyMappingSuite, TestDataSuite, \
     SAPRQLTestSuite, SHACLTestSuite
+from mapping_suite_sdk.models.memory_footprint import MappingPackageMemoryFootprint, get_fields_memory_footprint
 
 
 # class MappingSource(CoreModel):
@@ -93,3 +94,12 @@ class MappingPackage(CoreModel):
                                                     description="Collections of SHACL-based validation test suites")
     # Note: To implement when import will require transform results
     # test_results: List[TestResultSuite] = Field(..., description="Collections of test transformation results")
+
+    def memory_footprint(self) -> MappingPackageMemoryFootprint:
+        """Get the memory retained by the package, in total and per field (metadata, asset or suites).
+
+        The memory is split between the asset contents, the paths, the SDK caches and the
+        overhead of the model instances and containers; objects shared by several fields
+        are counted in the first of them.
+        """
+        return get_fields_memory_footprint(self)
@@ -0,0 +1,156 @@
+import sys
+from typing import Any, Dict, Set
+
+from pydantic import BaseModel, Field
+
+from mapping_suite_sdk.models.core import CoreModel
+
+# Keys of the SDK caches stored in the instance __dict__ of the models, e.g. content IDs and digests
+_CACHE_KEY_PREFIX = "_mssdk_"
+_CONTENT_FIELD_NAME = "content"
+_PATH_FIELD_NAME = "path"
+_NOT_SET = object()
+
+
+class MemoryFootprint(CoreModel):
+    """Memory retained by a model and the objects it references, in bytes.
+
+    Sizes are measured with sys.getsizeof, and objects referenced several times (e.g. interned
+    strings, or a content shared by two assets) are counted once. Allocator overheads are not
+    included, so the footprint is a lower bound of the memory released when the model is.
+    """
+    files: int = Field(default=0, description="Number of assets (package files)")
+    content_bytes: int = Field(default=0, description="Memory of the asset contents")
+    path_bytes: int = Field(default=0, description="Memory of the paths of the assets and suites")
+    cache_bytes: int = Field(default=0,
+                             description="Memory of the SDK caches (content digests, persisted states)")
+    overhead_bytes: int = Field(default=0,
+                                description="Memory of the model instances, their fields and containers")
+    total_bytes: int = Field(default=0, description="Total memory retained by the model")
+
+
+class MappingPackageMemoryFootprint(MemoryFootprint):
+    """Memory retained by a mapping package, with the footprint of each of its fields."""
+    fields: Dict[str, MemoryFootprint] = Field(default_factory=dict,
+                                               description="Footprint of each field, e.g. 'technical_mapping_suite'")
+
+
+def _sizeof(value: Any, seen: Set[int]) -> int:
+    """Get the memory of an object and of the objects it references, not counting the objects already seen."""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(_sizeof(key, seen) + _sizeof(item, seen) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_sizeof(item, seen) for item in value)
+
+    # Slotted objects (e.g. paths and the pydantic internals of models) and objects with a __dict__
+    for cls in type(value).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if slot not in ("__dict__", "__weakref__"):
+                slot_value = getattr(value, slot, _NOT_SET)
+                if slot_value is not _NOT_SET:
+                    size += _sizeof(slot_value, seen)
+    if hasattr(value, "__dict__"):
+        size += _sizeof(value.__dict__, seen)
+    return size
+
+
+def _add_model_footprint(model: BaseModel, footprint: Dict[str, int], seen: Set[int]) -> None:
+    """Add the memory of a model, by kind, to a footprint given as a dict of the MemoryFootprint fields."""
+    if id(model) in seen:
+        return
+    seen.add(id(model))
+    model_dict = model.__dict__
+    seen.add(id(model_dict))
+    footprint["overhead_bytes"] += sys.getsizeof(model) + sys.getsizeof(model_dict)
+    for slot in ("__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__"):
+        footprint["overhead_bytes"] += _sizeof(getattr(model, slot, None), seen)
+
+    for key, value in model_dict.items():
+        footprint["overhead_bytes"] += _sizeof(key, seen)
+        _add_value_footprint(key, value, footprint, seen)
+
+
+def _add_value_footprint(key: str, value: Any, footprint: Dict[str, int], seen: Set[int]) -> None:
+    if isinstance(value, BaseModel):
+        _add_model_footprint(value, footprint, seen)
+    elif isinstance(value, list) and any(isinstance(item, BaseModel) for item in value):
+        if id(value) not in seen:
+            seen.add(id(value))
+            footprint["overhead_bytes"] += sys.getsizeof(value)
+            for item in value:
+                _add_value_footprint(key, item, footprint, seen)
+    elif key.startswith(_CACHE_KEY_PREFIX):
+        footprint["cache_bytes"] += _sizeof(value, seen)
+    elif key == _CONTENT_FIELD_NAME:
+        footprint["files"] += 1
+        footprint["content_bytes"] += _sizeof(value, seen)
+    elif key == _PATH_FIELD_NAME:
+        footprint["path_bytes"] += _sizeof(value, seen)
+    else:
+        footprint["overhead_bytes"] += _sizeof(value, seen)
+
+
+def _new_footprint() -> Dict[str, int]:
+    return {"files": 0, "content_bytes": 0, "path_bytes": 0, "cache_bytes": 0, "overhead_bytes": 0}
+
+
+def _to_memory_footprint(footprint: Dict[str, int], footprint_class=MemoryFootprint, **kwargs) -> MemoryFootprint:
+    total_bytes = footprint["content_bytes"] + footprint["path_bytes"] + footprint["cache_bytes"] \
+                  + footprint["overhead_bytes"]
+    return footprint_class(**footprint, total_bytes=total_bytes, **kwargs)
+
+
+def get_memory_footprint(model: BaseModel) -> MemoryFootprint:
+    """
+    Get the memory retained by a model and the objects it references.
+
+    Args:
+        model: Any model, e.g. an asset, a suite or a mapping package
+
+    Returns:
+        MemoryFootprint: The memory of the model, by kind (contents, paths, caches and overhead)
+    """
+    footprint = _new_footprint()
+    _add_model_footprint(model, footprint, set())
+    return _to_memory_footprint(footprint)
+
+
+def get_fields_memory_footprint(model: BaseModel) -> MappingPackageMemoryFootprint:
+    """
+    Get the memory retained by a model, with the footprint of each of its fields.
+
+    Objects shared by several fields are counted in the first of them, in the field order.
+
+    Args:
+        model: The model, usually a mapping package
+
+    Returns:
+        MappingPackageMemoryFootprint: The memory of the model and of each of its fields
+    """
+    seen: Set[int] = {id(model), id(model.__dict__)}
+    total_footprint = _new_footprint()
+    total_footprint["overhead_bytes"] = sys.getsizeof(model) + sys.getsizeof(model.__dict__) + sum(
+        _sizeof(getattr(model, slot, None), seen)
+        for slot in ("__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__"))
+
+    fields: Dict[str, MemoryFootprint] = {}
+    for key, value in model.__dict__.items():
+        total_footprint["overhead_bytes"] += _sizeof(key, seen)
+        field_footprint = _new_footprint()
+        _add_value_footprint(key, value, field_footprint, seen)
+        if key.startswith(_CACHE_KEY_PREFIX):
+            # The caches of the model itself are not a field
+            total_footprint["cache_bytes"] += field_footprint["cache_bytes"]
+            continue
+        fields[key] = _to_memory_footprint(field_footprint)
+        for name in field_footprint:
+            total_footprint[name] += field_footprint[name]
+
+    return _to_memory_footprint(total_footprint, MappingPackageMemoryFootprint, fields=fields)
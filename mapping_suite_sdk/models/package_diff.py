@@ -0,0 +1,70 @@
+from typing import Any, List, Optional
+
+from pydantic import Field
+
+from mapping_suite_sdk.models.core import CoreModel
+
+ASSET_ADDED = "added"
+ASSET_REMOVED = "removed"
+ASSET_MODIFIED = "modified"
+
+
+class AssetChange(CoreModel):
+    """A change of one file of a suite between two mapping packages, identified by its path."""
+    path: str = Field(..., description="Path of the file within its suite")
+    change_type: str = Field(..., description="One of added, removed or modified")
+    old_digest: Optional[str] = Field(default=None, description="SHA-256 of the old content, if any")
+    new_digest: Optional[str] = Field(default=None, description="SHA-256 of the new content, if any")
+    old_size: int = Field(default=0, description="Size in bytes of the old content")
+    new_size: int = Field(default=0, description="Size in bytes of the new content")
+
+    @property
+    def byte_delta(self) -> int:
+        return self.new_size - self.old_size
+
+
+class SuiteDiff(CoreModel):
+    """The changed files of one suite of a mapping package."""
+    suite: str = Field(..., description="Name of the suite, with the path of the suite for suite lists")
+    changes: List[AssetChange] = Field(default_factory=list, description="Changed files, ordered by path")
+
+    @property
+    def added(self) -> List[AssetChange]:
+        return [change for change in self.changes if change.change_type == ASSET_ADDED]
+
+    @property
+    def removed(self) -> List[AssetChange]:
+        return [change for change in self.changes if change.change_type == ASSET_REMOVED]
+
+    @property
+    def modified(self) -> List[AssetChange]:
+        return [change for change in self.changes if change.change_type == ASSET_MODIFIED]
+
+    @property
+    def byte_delta(self) -> int:
+        return sum(change.byte_delta for change in self.changes)
+
+
+class MetadataFieldChange(CoreModel):
+    """A change of one metadata field, identified by its dotted path (using the field aliases)."""
+    field: str = Field(..., description="Dotted path of the field")
+    old_value: Any = Field(default=None, description="Old value, None if the field was added")
+    new_value: Any = Field(default=None, description="New value, None if the field was removed")
+
+
+class MappingPackageDiff(CoreModel):
+    """The differences between two mapping packages: metadata field changes and changed files per suite."""
+    metadata_changes: List[MetadataFieldChange] = Field(default_factory=list,
+                                                        description="Changed metadata fields, ordered by path")
+    suite_diffs: List[SuiteDiff] = Field(default_factory=list,
+                                         description="Suites with changed files, ordered by suite name")
+
+    @property
+    def byte_delta(self) -> int:
+        return sum(suite_diff.byte_delta for suite_diff in self.suite_diffs)
+
+    def has_changes(self) -> bool:
+        return bool(self.metadata_changes or self.suite_diffs)
+
+    def has_asset_changes(self) -> bool:
+        return bool(self.suite_diffs)
@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from mapping_suite_sdk.adapters.tracer import traced_routine
+from mapping_suite_sdk.models.asset import PackageAsset, PackageAssetCollection
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.models.package_diff import AssetChange, SuiteDiff, MetadataFieldChange, MappingPackageDiff, \
+    ASSET_ADDED, ASSET_REMOVED, ASSET_MODIFIED
+
+_SUITE_FIELDS = ("technical_mapping_suite", "vocabulary_mapping_suite")
+_SUITE_LIST_FIELDS = ("test_data_suites", "test_suites_sparql", "test_suites_shacl")
+_CONCEPTUAL_MAPPING_FIELD = "conceptual_mapping_asset"
+
+
+def _flatten_document(document: Any, path: str, flattened_document: Dict[str, Any]) -> Dict[str, Any]:
+    if isinstance(document, dict) and document:
+        for key, value in document.items():
+            _flatten_document(value, f"{path}{key}.", flattened_document)
+    else:
+        flattened_document[path.rstrip(".")] = document
+    return flattened_document
+
+
+def _diff_metadata(old_mapping_package: MappingPackage,
+                   new_mapping_package: MappingPackage) -> List[MetadataFieldChange]:
+    old_fields = _flatten_document(old_mapping_package.metadata.model_dump(by_alias=True, mode="json"), "", {})
+    new_fields = _flatten_document(new_mapping_package.metadata.model_dump(by_alias=True, mode="json"), "", {})
+
+    return [MetadataFieldChange(field=field, old_value=old_fields.get(field), new_value=new_fields.get(field))
+            for field in sorted(old_fields.keys() | new_fields.keys())
+            if old_fields.get(field) != new_fields.get(field)]
+
+
+def _diff_assets(suite: str, old_assets: Sequence[PackageAsset],
+                 new_assets: Sequence[PackageAsset]) -> Optional[SuiteDiff]:
+    old_assets_by_path = {str(asset.path): asset for asset in old_assets}
+    new_assets_by_path = {str(asset.path): asset for asset in new_assets}
+
+    changes = []
+    for path in sorted(old_assets_by_path.keys() | new_assets_by_path.keys()):
+        old_asset, new_asset = old_assets_by_path.get(path), new_assets_by_path.get(path)
+        if old_asset is None:
+            changes.append(AssetChange(path=path, change_type=ASSET_ADDED, new_digest=new_asset.get_content_digest(),
+                                       new_size=new_asset.get_content_size()))
+        elif new_asset is None:
+            changes.append(AssetChange(path=path, change_type=ASSET_REMOVED, old_digest=old_asset.get_content_digest(),
+                                       old_size=old_asset.get_content_size()))
+        elif old_asset.get_content_digest() != new_asset.get_content_digest():
+            changes.append(AssetChange(path=path, change_type=ASSET_MODIFIED,
+                                       old_digest=old_asset.get_content_digest(),
+                                       new_digest=new_asset.get_content_digest(),
+                                       old_size=old_asset.get_content_size(),
+                                       new_size=new_asset.get_content_size()))
+
+    return SuiteDiff(suite=suite, changes=changes) if changes else None
+
+
+def _suites_by_name(field: str, suites: List[PackageAssetCollection]) -> Dict[str, PackageAssetCollection]:
+    return {f"{field}/{suite.path}": suite for suite in suites}
+
+
+@traced_routine
+def diff_mapping_packages(old_mapping_package: MappingPackage,
+                          new_mapping_package: MappingPackage) -> MappingPackageDiff:
+    """
+    Compare two mapping packages, reporting their metadata changes and their changed files per suite.
+
+    Files are matched by path within their suite, and compared by the SHA-256 of their content.
+    Digests are cached on the assets, so once computed, comparing packages takes a time
+    proportional to their number of files rather than to their size. The packages can be loaded
+    from any source (folder, archive, GitHub, MongoDB).
+
+    Suites are named after the package field holding them, e.g. "technical_mapping_suite"; the
+    suites of suite lists are named after the field and the suite path, e.g.
+    "test_data_suites/test_data/cn_24". The conceptual mapping file is reported as the only file
+    of a "conceptual_mapping_asset" suite.
+
+    Args:
+        old_mapping_package: The package to compare from
+        new_mapping_package: The package to compare to
+
+    Returns:
+        MappingPackageDiff: The metadata field changes, and the changed files of each suite
+
+    Example:
+        >>> package_diff = diff_mapping_packages(deployed_package, candidate_package)
+        >>> if package_diff.has_asset_changes():
+        ...     for suite_diff in package_diff.suite_diffs:
+        ...         print(suite_diff.suite, [change.path for change in suite_diff.modified])
+    """
+    suite_diffs = [_diff_assets(_CONCEPTUAL_MAPPING_FIELD,
+                                [old_mapping_package.conceptual_mapping_asset],
+                                [new_mapping_package.conceptual_mapping_asset])]
+    for field in _SUITE_FIELDS:
+        suite_diffs.append(_diff_assets(field, getattr(old_mapping_package, field).files,
+                                        getattr(new_mapping_package, field).files))
+    for field in _SUITE_LIST_FIELDS:
+        old_suites = _suites_by_name(field, getattr(old_mapping_package, field))
+        new_suites = _suites_by_name(field, getattr(new_mapping_package, field))
+        for suite in sorted(old_suites.keys() | new_suites.keys()):
+            suite_diffs.append(_diff_assets(suite,
+                                            old_suites[suite].files if suite in old_suites else [],
+                                            new_suites[suite].files if suite in new_suites else []))
+
+    return MappingPackageDiff(metadata_changes=_diff_metadata(old_mapping_package, new_mapping_package),
+                              suite_diffs=sorted((suite_diff for suite_diff in suite_diffs if suite_diff is not None),
+                                                 key=lambda suite_diff: suite_diff.suite))
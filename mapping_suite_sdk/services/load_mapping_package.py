@@ -1,11 +1,20 @@
+import contextvars
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Union, BinaryIO, Iterator, TYPE_CHECKING
+
+from pydantic import TypeAdapter
 
 from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor, GithubPackageExtractor
-from mapping_suite_sdk.adapters.loader import MappingPackageAssetLoader, MappingPackageLoader
-from mapping_suite_sdk.adapters.repository import MongoDBRepository
+from mapping_suite_sdk.adapters.loader import MappingPackageAssetLoader, MappingPackageLoader, \
+    RELATIVE_SUITE_METADATA_PATH
 from mapping_suite_sdk.adapters.tracer import traced_routine
-from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.models.mapping_package import MappingPackage, MappingPackageMetadata
+
+if TYPE_CHECKING:
+    # Only imported for type checking, so loading packages doesn't import pymongo and motor
+    from mapping_suite_sdk.adapters.repository import MongoDBRepository, AsyncMongoDBRepository
 
 
 @traced_routine
@@ -89,6 +98,187 @@ def load_mapping_package_from_archive(
                                                 mapping_package_loader=mapping_package_loader)
 
 
+@traced_routine
+def load_mapping_packages_from_archive(
+        mapping_package_archive_path: Path,
+        packages_path_pattern: str,
+        mapping_package_loader: Optional[MappingPackageAssetLoader] = None,
+        archive_unpacker: Optional[ArchivePackageExtractor] = None,
+        max_workers: Optional[int] = None
+) -> List[MappingPackage]:
+    """Load all mapping packages of a multi-package archive concurrently.
+
+    This function supports archives containing many package folders (e.g. bulk exports).
+    The package folders matching the pattern are found from the archive central directory,
+    only these folders are extracted, in a single pass, to a temporary location and the
+    packages are then loaded concurrently. The temporary files are automatically cleaned up after loading is complete.
+
+    Args:
+        mapping_package_archive_path: Path to the archive file containing the mapping packages
+        packages_path_pattern: Glob pattern to match package paths within the archive
+            (e.g., "mappings/package*" or "mappings/*_can_*")
+        mapping_package_loader: Optional custom loader implementation for reading the mapping
+            package contents. If not provided, a default MappingPackageLoader will be used.
+            The loader is shared by all workers and must be thread-safe
+        archive_unpacker: Optional custom archive unpacker implementation. If not provided,
+            a default ArchivePackageExtractor will be used
+        max_workers: Optional maximum number of packages loaded concurrently. If not provided,
+            the ThreadPoolExecutor default is used
+
+    Returns:
+        List[MappingPackage]: The loaded mapping packages, in the sorted order of their paths
+            within the archive
+
+    Raises:
+        FileNotFoundError: If the archive file doesn't exist
+        ValueError: If the specified path is not a file, the pattern is empty or no
+            packages are found matching the pattern
+        Exception: Any additional exceptions that might be raised during archive extraction
+            or mapping package loading
+
+    Example:
+        >>> packages = load_mapping_packages_from_archive(
+        ...     mapping_package_archive_path=Path("eforms_packages.zip"),
+        ...     packages_path_pattern="mappings/package*"
+        ... )
+    """
+    archive_unpacker: ArchivePackageExtractor = archive_unpacker or ArchivePackageExtractor()
+    package_paths = _list_archive_packages(mapping_package_archive_path, packages_path_pattern, archive_unpacker)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        package_folder_paths = archive_unpacker.extract_packages(source_path=mapping_package_archive_path,
+                                                                 destination_path=Path(temp_dir),
+                                                                 package_paths=package_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each task runs in a copy of the current context to keep the tracing span hierarchy
+            futures = [executor.submit(contextvars.copy_context().run,
+                                       load_mapping_package_from_folder,
+                                       package_folder_path,
+                                       mapping_package_loader)
+                       for package_folder_path in package_folder_paths]
+
+            return [future.result() for future in futures]
+
+
+@traced_routine
+def iter_mapping_packages_from_archive(
+        mapping_package_archive_path: Path,
+        packages_path_pattern: str,
+        mapping_package_loader: Optional[MappingPackageAssetLoader] = None,
+        archive_unpacker: Optional[ArchivePackageExtractor] = None
+) -> Iterator[MappingPackage]:
+    """Lazily load the mapping packages of a multi-package archive, one at a time.
+
+    Unlike load_mapping_packages_from_archive, only the folder of the package being loaded
+    is extracted, and it is removed before the package is yielded. Disk usage is therefore
+    bounded by the largest package, and memory usage by the packages kept by the caller.
+
+    The archive and the pattern are validated when this function is called; the packages
+    are extracted and loaded as the returned iterator is consumed.
+
+    Args:
+        mapping_package_archive_path: Path to the archive file containing the mapping packages
+        packages_path_pattern: Glob pattern to match package paths within the archive
+            (e.g., "mappings/package*" or "mappings/*_can_*")
+        mapping_package_loader: Optional custom loader implementation for reading the mapping
+            package contents. If not provided, a default MappingPackageLoader will be used
+        archive_unpacker: Optional custom archive unpacker implementation. If not provided,
+            a default ArchivePackageExtractor will be used
+
+    Returns:
+        Iterator[MappingPackage]: Iterator over the mapping packages, in the sorted order of
+            their paths within the archive
+
+    Raises:
+        FileNotFoundError: If the archive file doesn't exist
+        ValueError: If the specified path is not a file, the pattern is empty or no
+            packages are found matching the pattern
+
+    Example:
+        >>> for package in iter_mapping_packages_from_archive(Path("eforms_packages.zip"), "mappings/*"):
+        ...     print(package.metadata.identifier)
+    """
+    archive_unpacker: ArchivePackageExtractor = archive_unpacker or ArchivePackageExtractor()
+    package_paths = _list_archive_packages(mapping_package_archive_path, packages_path_pattern, archive_unpacker)
+
+    return _iter_archive_packages(mapping_package_archive_path, package_paths, mapping_package_loader,
+                                  archive_unpacker)
+
+
+@traced_routine
+def _iter_archive_packages(mapping_package_archive_path: Path,
+                           package_paths: List[Path],
+                           mapping_package_loader: Optional[MappingPackageAssetLoader],
+                           archive_unpacker: ArchivePackageExtractor) -> Iterator[MappingPackage]:
+    """Extract and load the packages of an archive one at a time, as they are consumed."""
+    for package_path in package_paths:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_folder_path = archive_unpacker.extract(source_path=mapping_package_archive_path,
+                                                           destination_path=Path(temp_dir),
+                                                           package_path=package_path)
+            mapping_package = load_mapping_package_from_folder(mapping_package_folder_path=package_folder_path,
+                                                               mapping_package_loader=mapping_package_loader)
+        yield mapping_package
+
+
+def _list_archive_packages(mapping_package_archive_path: Path,
+                           packages_path_pattern: str,
+                           archive_unpacker: ArchivePackageExtractor) -> List[Path]:
+    """Validate a multi-package archive and return the package paths matching the pattern."""
+    if not mapping_package_archive_path.exists():
+        raise FileNotFoundError(f"Mapping package archive not found: {mapping_package_archive_path}")
+
+    if not mapping_package_archive_path.is_file():
+        raise ValueError(f"Specified path is not a file: {mapping_package_archive_path}")
+
+    if not packages_path_pattern:
+        raise ValueError("Packages path pattern is required")
+
+    package_paths = archive_unpacker.list_packages(mapping_package_archive_path, packages_path_pattern)
+    if len(package_paths) < 1:
+        raise ValueError(
+            f"No mapping packages found matching pattern '{packages_path_pattern}' "
+            f"in archive {mapping_package_archive_path}")
+
+    return package_paths
+
+
+@traced_routine
+def load_mapping_package_metadata_from_archive(
+        mapping_package_archive: Union[Path, BinaryIO],
+        archive_unpacker: Optional[ArchivePackageExtractor] = None
+) -> MappingPackageMetadata:
+    """Load only the metadata of a mapping package from an archive.
+
+    Unlike load_mapping_package_from_archive, this function does not extract the archive.
+    It reads the archive central directory and decompresses only the metadata.json entry,
+    which makes identifying an archive cheap regardless of its size.
+
+    Args:
+        mapping_package_archive: Path to the archive file or a seekable binary stream
+            containing the archive (e.g. an uploaded file)
+        archive_unpacker: Optional custom archive unpacker implementation. If not provided,
+            a default ArchivePackageExtractor will be used
+
+    Returns:
+        MappingPackageMetadata: The metadata of the mapping package
+
+    Raises:
+        FileNotFoundError: If the archive file or its metadata.json doesn't exist
+        ValueError: If the specified path is not a file or is not a valid archive
+        pydantic.ValidationError: If metadata.json is not valid mapping package metadata
+
+    Example:
+        >>> metadata = load_mapping_package_metadata_from_archive(Path("package.zip"))
+        >>> print(metadata.identifier, metadata.mapping_version)
+    """
+    archive_unpacker: ArchivePackageExtractor = archive_unpacker or ArchivePackageExtractor()
+
+    metadata_content = archive_unpacker.read_file(mapping_package_archive, RELATIVE_SUITE_METADATA_PATH)
+
+    return TypeAdapter(MappingPackageMetadata).validate_json(metadata_content)
+
+
 @traced_routine
 def load_mapping_packages_from_github(
         github_repository_url: str,
@@ -202,7 +392,7 @@ def load_mapping_packages_from_github(
 @traced_routine
 def load_mapping_package_from_mongo_db(
         mapping_package_id: str,
-        mapping_package_repository: MongoDBRepository[MappingPackage]
+        mapping_package_repository: "MongoDBRepository[MappingPackage]"
 ) -> MappingPackage:
     """
     Load a mapping package from a MongoDB database.
@@ -236,3 +426,39 @@ def load_mapping_package_from_mongo_db(
 
     return mapping_package_repository.read(mapping_package_id)
 
+
+@traced_routine
+async def load_mapping_package_from_mongo_db_async(
+        mapping_package_id: str,
+        mapping_package_repository: "AsyncMongoDBRepository[MappingPackage]"
+) -> MappingPackage:
+    """
+    Asynchronously load a mapping package from a MongoDB database.
+
+    This is the asyncio counterpart of load_mapping_package_from_mongo_db. The package is
+    retrieved using an AsyncMongoDBRepository, so the event loop is not blocked while
+    the package is fetched.
+
+    Args:
+        mapping_package_id: The unique identifier of the mapping package to load. This ID
+            corresponds to the '_id' field in the MongoDB collection.
+        mapping_package_repository: A configured AsyncMongoDBRepository instance specifically for
+            MappingPackage objects.
+
+    Returns:
+        MappingPackage: The loaded mapping package containing all components including
+            technical mappings, vocabulary mappings, test suites, and metadata.
+
+    Raises:
+        ValueError: If mapping_package_id or mapping_package_repository is not provided
+        ModelNotFoundError: If the mapping package with the specified ID is not found
+        Exception: Any additional exceptions that might be raised by the repository
+            implementation during the read operation
+    """
+    if not mapping_package_id:
+        raise ValueError("Mapping package ID must be provided")
+
+    if not mapping_package_repository:
+        raise ValueError("MongoDB repository must be provided")
+
+    return await mapping_package_repository.read(mapping_package_id)
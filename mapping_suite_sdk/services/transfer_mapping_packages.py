@@ -0,0 +1,84 @@
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from mapping_suite_sdk.adapters.model_stream import ModelStreamWriter, ModelStreamReader, \
+    MSSDK_MODEL_STREAM_FORMAT_NDJSON
+from mapping_suite_sdk.adapters.repository import RepositoryABC
+from mapping_suite_sdk.adapters.tracer import traced_routine
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+MSSDK_IMPORT_BATCH_SIZE = 100
+
+
+@traced_routine
+def export_mapping_packages(mapping_package_repository: RepositoryABC[MappingPackage],
+                            output_stream: BinaryIO,
+                            filters: Optional[Dict[str, Any]] = None,
+                            stream_format: str = MSSDK_MODEL_STREAM_FORMAT_NDJSON) -> int:
+    """
+    Export the mapping packages of a repository to a single NDJSON or binary stream.
+
+    The packages are read one at a time from the repository (see RepositoryABC.iter_many) and
+    written as they are read, so the export runs in constant memory whatever the size of the
+    collection. Assets shared by several packages are written once.
+
+    Args:
+        mapping_package_repository: Repository to export the packages from
+        output_stream: Binary stream to write to, e.g. a file opened in "wb" mode
+        filters: Optional filters selecting the packages to export, as for read_many
+        stream_format: "ndjson" (one JSON record per line) or "binary" (length-prefixed frames)
+
+    Returns:
+        int: Number of exported packages
+
+    Example:
+        >>> with open("packages.ndjson", "wb") as output_file:
+        ...     export_mapping_packages(repository, output_file, {"metadata.mapping_type": "eforms"})
+    """
+    writer = ModelStreamWriter(output_stream=output_stream,
+                               stream_format=stream_format,
+                               model_class_name=MappingPackage.__name__)
+    for mapping_package in mapping_package_repository.iter_many(filters):
+        writer.write(mapping_package)
+
+    return writer.model_count
+
+
+@traced_routine
+def import_mapping_packages(mapping_package_repository: RepositoryABC[MappingPackage],
+                            input_stream: BinaryIO,
+                            batch_size: int = MSSDK_IMPORT_BATCH_SIZE) -> int:
+    """
+    Import the mapping packages of a stream written by export_mapping_packages into a repository.
+
+    The stream format is detected. Packages are stored in batches with create_many, so at most
+    batch_size packages are held in memory; the deduplicated assets are spooled to a temporary
+    directory while reading.
+
+    Args:
+        mapping_package_repository: Repository to store the packages into
+        input_stream: Binary stream to read from, e.g. a file opened in "rb" mode
+        batch_size: Number of packages stored at once
+
+    Returns:
+        int: Number of imported packages
+
+    Raises:
+        ModelStreamError: If the stream is not a valid model stream
+    """
+    if batch_size < 1:
+        raise ValueError("The batch size must be at least 1")
+
+    imported_packages = 0
+    batch: List[MappingPackage] = []
+    with ModelStreamReader(input_stream) as reader:
+        for document in reader:
+            batch.append(MappingPackage.model_validate(document))
+            if len(batch) >= batch_size:
+                mapping_package_repository.create_many(batch)
+                imported_packages += len(batch)
+                batch = []
+        if batch:
+            mapping_package_repository.create_many(batch)
+            imported_packages += len(batch)
+
+    return imported_packages
@@ -0,0 +1,49 @@
+"""Fixtures of the benchmarks: a synthetic mapping package, generated once per session, in the
+forms it is loaded from (model, folder, archive and git repository).
+
+The size of the package is selected by the MSSDK_BENCHMARK_SIZE environment variable
+("small", the default, "medium" or "large").
+"""
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from tests.benchmarks.synthetic_package import SyntheticPackageSize, get_benchmark_package_size, \
+    generate_synthetic_mapping_package, write_synthetic_mapping_package, pack_synthetic_mapping_package
+
+SYNTHETIC_PACKAGE_REPOSITORY_PATTERN = "mappings/*"
+
+
+@pytest.fixture(scope="session")
+def benchmark_package_size() -> SyntheticPackageSize:
+    return get_benchmark_package_size()
+
+
+@pytest.fixture(scope="session")
+def synthetic_mapping_package(benchmark_package_size: SyntheticPackageSize) -> MappingPackage:
+    return generate_synthetic_mapping_package(benchmark_package_size)
+
+
+@pytest.fixture(scope="session")
+def synthetic_mapping_package_folder_path(tmp_path_factory, benchmark_package_size: SyntheticPackageSize) -> Path:
+    return write_synthetic_mapping_package(tmp_path_factory.mktemp("folder") / "package_synthetic_0",
+                                           benchmark_package_size)
+
+
+@pytest.fixture(scope="session")
+def synthetic_mapping_package_archive_path(tmp_path_factory, benchmark_package_size: SyntheticPackageSize) -> Path:
+    return pack_synthetic_mapping_package(tmp_path_factory.mktemp("archive") / "package_synthetic_0.zip",
+                                          benchmark_package_size)
+
+
+@pytest.fixture(scope="session")
+def synthetic_mapping_package_repository_path(tmp_path_factory, benchmark_package_size: SyntheticPackageSize) -> Path:
+    """A git repository holding the synthetic package in mappings/, cloned by the GitHub loader."""
+    repository_path = tmp_path_factory.mktemp("repository")
+    write_synthetic_mapping_package(repository_path / "mappings" / "package_synthetic_0", benchmark_package_size)
+    repository = Repo.init(repository_path)
+    repository.git.add(all=True)
+    repository.index.commit("Synthetic mapping package")
+    return repository_path
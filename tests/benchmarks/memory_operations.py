@@ -0,0 +1,87 @@
+"""Operations whose memory is benchmarked, measured with tracemalloc in-process, or for their peak
+RSS in a fresh process: python -m tests.benchmarks.memory_operations <operation> <archive path>.
+
+Each operation is prepared from the archive of a mapping package (e.g. the package is loaded
+for the hash and serialise operations), and its memory is measured from the end of the setup.
+"""
+import resource
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import mongomock
+
+from mapping_suite_sdk.adapters.repository import MongoDBMappingPackageRepository
+from mapping_suite_sdk.services.load_mapping_package import load_mapping_package_from_archive
+from mapping_suite_sdk.services.serialise_mapping_package import serialise_mapping_package
+
+# ru_maxrss is in kilobytes on Linux, and in bytes on macOS
+_MAX_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _setup_load(archive_path: Path) -> Callable[[], Any]:
+    return lambda: load_mapping_package_from_archive(archive_path)
+
+
+def _setup_hash(archive_path: Path) -> Callable[[], Any]:
+    mapping_package = load_mapping_package_from_archive(archive_path)
+    return mapping_package.generate_id
+
+
+def _setup_serialise(archive_path: Path) -> Callable[[], Any]:
+    mapping_package = load_mapping_package_from_archive(archive_path)
+
+    def serialise():
+        with tempfile.TemporaryDirectory() as temp_dir:
+            serialise_mapping_package(mapping_package, Path(temp_dir) / "package.zip")
+
+    return serialise
+
+
+def _setup_mongodb_round_trip(archive_path: Path) -> Callable[[], Any]:
+    mapping_package = load_mapping_package_from_archive(archive_path)
+    repository = MongoDBMappingPackageRepository(mongo_client=mongomock.MongoClient(),
+                                                 database_name="benchmark_memory_database")
+
+    def round_trip():
+        repository.create(mapping_package.model_copy())
+        repository.read(mapping_package.id)
+        repository.delete(mapping_package.id)
+
+    return round_trip
+
+
+MEMORY_OPERATIONS: Dict[str, Callable[[Path], Callable[[], Any]]] = {
+    "load": _setup_load,
+    "hash": _setup_hash,
+    "serialise": _setup_serialise,
+    "mongodb_round_trip": _setup_mongodb_round_trip,
+}
+
+
+def measure_tracemalloc_peak(operation_name: str, archive_path: Path) -> int:
+    """Get the peak memory allocated by an operation, traced by tracemalloc, in bytes."""
+    operation = MEMORY_OPERATIONS[operation_name](archive_path)
+    tracemalloc.start()
+    try:
+        start_memory = tracemalloc.get_traced_memory()[0]
+        operation()
+        return tracemalloc.get_traced_memory()[1] - start_memory
+    finally:
+        tracemalloc.stop()
+
+
+def measure_peak_rss(operation_name: str, archive_path: Path) -> Dict[str, int]:
+    """Get the peak RSS of the current process after the setup, and after an operation, in bytes."""
+    operation = MEMORY_OPERATIONS[operation_name](archive_path)
+    setup_peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAX_RSS_UNIT
+    operation()
+    return {"setup_peak_rss": setup_peak_rss,
+            "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAX_RSS_UNIT}
+
+
+if __name__ == "__main__":
+    rss = measure_peak_rss(sys.argv[1], Path(sys.argv[2]))
+    print(rss["setup_peak_rss"], rss["peak_rss"])
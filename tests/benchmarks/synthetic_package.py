@@ -0,0 +1,181 @@
+"""Generator of synthetic mapping packages of configurable size, for the benchmarks.
+
+The packages are deterministic for a given size and seed, so benchmark numbers are comparable
+between runs. The file contents mimic the assets of real packages (RML, CSV, XML, SPARQL and
+SHACL lines with varying tokens), so they compress like them.
+"""
+import os
+import random
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from pydantic import Field
+
+from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor
+from mapping_suite_sdk.adapters.loader import RELATIVE_TECHNICAL_MAPPING_SUITE_PATH, \
+    RELATIVE_VOCABULARY_MAPPING_SUITE_PATH, RELATIVE_TEST_DATA_PATH, RELATIVE_SPARQL_SUITE_PATH, \
+    RELATIVE_SHACL_SUITE_PATH, RELATIVE_CONCEPTUAL_MAPPING_PATH
+from mapping_suite_sdk.adapters.serialiser import MappingPackageSerialiser
+from mapping_suite_sdk.models.asset import ConceptualMappingPackageAsset, TechnicalMappingSuite, \
+    VocabularyMappingSuite, TestDataSuite, SAPRQLTestSuite, SHACLTestSuite, RMLMappingAsset, \
+    VocabularyMappingAsset, TestDataAsset, SPARQLQueryAsset, SHACLShapesAsset
+from mapping_suite_sdk.models.core import CoreModel
+from mapping_suite_sdk.models.mapping_package import MappingPackage, MappingPackageMetadata, \
+    MappingPackageEligibilityConstraints
+
+# Environment variable selecting the size of the packages of the benchmarks
+MSSDK_BENCHMARK_SIZE_VAR_NAME = "MSSDK_BENCHMARK_SIZE"
+
+_KIB = 1024
+_MIB = 1024 * _KIB
+
+
+class SyntheticPackageSize(CoreModel):
+    """Number and size of the files of each suite of a synthetic mapping package."""
+    technical_mapping_files: int = Field(..., description="Number of RML files")
+    technical_mapping_file_size: int = Field(..., description="Size of each RML file, in bytes")
+    vocabulary_mapping_files: int = Field(..., description="Number of resource files")
+    vocabulary_mapping_file_size: int = Field(..., description="Size of each resource file, in bytes")
+    test_data_suites: int = Field(..., description="Number of test data suites")
+    test_data_files_per_suite: int = Field(..., description="Number of test data files per suite")
+    test_data_file_size: int = Field(..., description="Size of each test data file, in bytes")
+    sparql_suites: int = Field(..., description="Number of SPARQL test suites")
+    sparql_files_per_suite: int = Field(..., description="Number of SPARQL queries per suite")
+    sparql_file_size: int = Field(..., description="Size of each SPARQL query, in bytes")
+    shacl_suites: int = Field(..., description="Number of SHACL test suites")
+    shacl_files_per_suite: int = Field(..., description="Number of SHACL shapes files per suite")
+    shacl_file_size: int = Field(..., description="Size of each SHACL shapes file, in bytes")
+    conceptual_mapping_size: int = Field(..., description="Size of the conceptual mapping file, in bytes")
+
+    def get_files_count(self) -> int:
+        """Get the number of files of the packages of this size, metadata included."""
+        return (2 + self.technical_mapping_files + self.vocabulary_mapping_files
+                + self.test_data_suites * self.test_data_files_per_suite
+                + self.sparql_suites * self.sparql_files_per_suite
+                + self.shacl_suites * self.shacl_files_per_suite)
+
+
+### Sizes of the benchmark packages: about 0.5 MB and 150 files, 15 MB and 1,300 files,
+### and 220 MB and 7,000 files
+SYNTHETIC_PACKAGE_SIZES: Dict[str, SyntheticPackageSize] = {
+    "small": SyntheticPackageSize(technical_mapping_files=20, technical_mapping_file_size=4 * _KIB,
+                                  vocabulary_mapping_files=10, vocabulary_mapping_file_size=16 * _KIB,
+                                  test_data_suites=3, test_data_files_per_suite=10, test_data_file_size=8 * _KIB,
+                                  sparql_suites=2, sparql_files_per_suite=40, sparql_file_size=_KIB,
+                                  shacl_suites=1, shacl_files_per_suite=5, shacl_file_size=8 * _KIB,
+                                  conceptual_mapping_size=64 * _KIB),
+    "medium": SyntheticPackageSize(technical_mapping_files=200, technical_mapping_file_size=8 * _KIB,
+                                   vocabulary_mapping_files=50, vocabulary_mapping_file_size=64 * _KIB,
+                                   test_data_suites=10, test_data_files_per_suite=50, test_data_file_size=16 * _KIB,
+                                   sparql_suites=5, sparql_files_per_suite=100, sparql_file_size=_KIB,
+                                   shacl_suites=3, shacl_files_per_suite=10, shacl_file_size=16 * _KIB,
+                                   conceptual_mapping_size=_MIB),
+    "large": SyntheticPackageSize(technical_mapping_files=1000, technical_mapping_file_size=16 * _KIB,
+                                  vocabulary_mapping_files=200, vocabulary_mapping_file_size=256 * _KIB,
+                                  test_data_suites=20, test_data_files_per_suite=200, test_data_file_size=32 * _KIB,
+                                  sparql_suites=10, sparql_files_per_suite=200, sparql_file_size=2 * _KIB,
+                                  shacl_suites=5, shacl_files_per_suite=20, shacl_file_size=64 * _KIB,
+                                  conceptual_mapping_size=8 * _MIB),
+}
+
+_RML_LINE = ('<#Map{number}> rr:predicateObjectMap [ rr:predicate epo:has{token} ; '
+             'rr:objectMap [ rml:reference "efac:{token}/cbc:ID" ] ] .\n')
+_CSV_LINE = '{number},{token},"http://data.europa.eu/a4g/resource/{token}",active\n'
+_XML_LINE = '  <cac:Item><cbc:ID schemeName="{token}">{number}</cbc:ID></cac:Item>\n'
+_SPARQL_LINE = 'ASK WHERE {{ ?s epo:has{token} ?o{number} . FILTER(?o{number} != "{token}") }}\n'
+_SHACL_LINE = 'epo:Shape{number} sh:property [ sh:path epo:has{token} ; sh:minCount 1 ] .\n'
+
+
+def get_benchmark_package_size() -> SyntheticPackageSize:
+    """Get the size of the benchmark packages, selected by the MSSDK_BENCHMARK_SIZE environment variable."""
+    return SYNTHETIC_PACKAGE_SIZES[os.getenv(MSSDK_BENCHMARK_SIZE_VAR_NAME, "small")]
+
+
+def _generate_text(rng: random.Random, line_template: str, size: int) -> str:
+    lines: List[str] = []
+    text_size = 0
+    while text_size < size:
+        line = line_template.format(number=len(lines), token=rng.randbytes(6).hex())
+        lines.append(line)
+        text_size += len(line)
+    return "".join(lines)[:size]
+
+
+def _generate_assets(rng: random.Random, asset_class: Callable, folder_path: Path, file_name: str,
+                     line_template: str, files: int, file_size: int) -> List:
+    return [asset_class(path=folder_path / file_name.format(index=index),
+                        content=_generate_text(rng, line_template, file_size))
+            for index in range(files)]
+
+
+def generate_synthetic_mapping_package(size: SyntheticPackageSize, seed: int = 0) -> MappingPackage:
+    """
+    Generate a synthetic mapping package of the given size.
+
+    Args:
+        size: Number and size of the files of each suite
+        seed: Seed of the generated contents; packages of the same size and seed are equal
+
+    Returns:
+        MappingPackage: The generated mapping package
+    """
+    rng = random.Random(seed)
+    metadata = MappingPackageMetadata(
+        identifier=f"package_synthetic_{seed}",
+        title=f"Synthetic package {seed}",
+        issue_date="2024-01-01 00:00:00+00:00",
+        type="eforms",
+        mapping_version="1.0.0",
+        ontology_version="4.0.0",
+        eligibility_constraints=MappingPackageEligibilityConstraints(
+            constraints={"eforms_subtype": [str(seed % 40 + 1)], "eforms_sdk_versions": ["1.9"]}),
+        signature=rng.randbytes(32).hex())
+
+    return MappingPackage(
+        metadata=metadata,
+        conceptual_mapping_asset=ConceptualMappingPackageAsset(path=RELATIVE_CONCEPTUAL_MAPPING_PATH,
+                                                               content=rng.randbytes(size.conceptual_mapping_size)),
+        technical_mapping_suite=TechnicalMappingSuite(
+            path=RELATIVE_TECHNICAL_MAPPING_SUITE_PATH,
+            files=_generate_assets(rng, RMLMappingAsset, RELATIVE_TECHNICAL_MAPPING_SUITE_PATH,
+                                   "mapping_{index:05}.rml.ttl", _RML_LINE, size.technical_mapping_files,
+                                   size.technical_mapping_file_size)),
+        vocabulary_mapping_suite=VocabularyMappingSuite(
+            path=RELATIVE_VOCABULARY_MAPPING_SUITE_PATH,
+            files=_generate_assets(rng, VocabularyMappingAsset, RELATIVE_VOCABULARY_MAPPING_SUITE_PATH,
+                                   "resource_{index:05}.csv", _CSV_LINE, size.vocabulary_mapping_files,
+                                   size.vocabulary_mapping_file_size)),
+        test_data_suites=[
+            TestDataSuite(path=RELATIVE_TEST_DATA_PATH / f"suite_{suite:03}",
+                          files=_generate_assets(rng, TestDataAsset, RELATIVE_TEST_DATA_PATH / f"suite_{suite:03}",
+                                                 "notice_{index:05}.xml", _XML_LINE, size.test_data_files_per_suite,
+                                                 size.test_data_file_size))
+            for suite in range(size.test_data_suites)],
+        test_suites_sparql=[
+            SAPRQLTestSuite(path=RELATIVE_SPARQL_SUITE_PATH / f"suite_{suite:03}",
+                            files=_generate_assets(rng, SPARQLQueryAsset,
+                                                   RELATIVE_SPARQL_SUITE_PATH / f"suite_{suite:03}",
+                                                   "query_{index:05}.rq", _SPARQL_LINE, size.sparql_files_per_suite,
+                                                   size.sparql_file_size))
+            for suite in range(size.sparql_suites)],
+        test_suites_shacl=[
+            SHACLTestSuite(path=RELATIVE_SHACL_SUITE_PATH / f"suite_{suite:03}",
+                           files=_generate_assets(rng, SHACLShapesAsset,
+                                                  RELATIVE_SHACL_SUITE_PATH / f"suite_{suite:03}",
+                                                  "shapes_{index:05}.ttl", _SHACL_LINE, size.shacl_files_per_suite,
+                                                  size.shacl_file_size))
+            for suite in range(size.shacl_suites)],
+    )
+
+
+def write_synthetic_mapping_package(package_folder_path: Path, size: SyntheticPackageSize, seed: int = 0) -> Path:
+    """Generate a synthetic mapping package of the given size, and write it to a package folder."""
+    MappingPackageSerialiser().serialise(package_folder_path, generate_synthetic_mapping_package(size, seed))
+    return package_folder_path
+
+
+def pack_synthetic_mapping_package(archive_path: Path, size: SyntheticPackageSize, seed: int = 0) -> Path:
+    """Generate a synthetic mapping package of the given size, and write it to a ZIP archive."""
+    package_folder_path = archive_path.parent / f"{archive_path.stem}_folder"
+    write_synthetic_mapping_package(package_folder_path, size, seed)
+    return ArchivePackageExtractor().pack_directory(package_folder_path, archive_path)
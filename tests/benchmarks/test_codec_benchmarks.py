@@ -0,0 +1,50 @@
+import pytest
+
+from mapping_suite_sdk.adapters.model_codec import BinaryModelCodec, MSSDK_MODEL_CODEC_COMPRESSION_NONE, \
+    MSSDK_MODEL_CODEC_COMPRESSION_ZLIB, MSSDK_MODEL_CODEC_COMPRESSION_ZSTD, _get_zstd_codec
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+pytest.importorskip("pytest_benchmark")
+
+CODEC_COMPRESSIONS = [MSSDK_MODEL_CODEC_COMPRESSION_NONE, MSSDK_MODEL_CODEC_COMPRESSION_ZLIB,
+                      pytest.param(MSSDK_MODEL_CODEC_COMPRESSION_ZSTD,
+                                   marks=pytest.mark.skipif(_get_zstd_codec() is None, reason="zstd not available"))]
+
+
+@pytest.mark.benchmark(group="codec-encode")
+@pytest.mark.parametrize("compression", CODEC_COMPRESSIONS)
+def test_benchmark_binary_encode(benchmark, synthetic_mapping_package: MappingPackage, compression: str):
+    encoded_package = benchmark(BinaryModelCodec(compression=compression).encode, synthetic_mapping_package)
+
+    benchmark.extra_info["encoded_bytes"] = len(encoded_package)
+
+
+@pytest.mark.benchmark(group="codec-encode")
+def test_benchmark_json_encode(benchmark, synthetic_mapping_package: MappingPackage):
+    """Baseline of the binary encoding."""
+    encoded_package = benchmark(synthetic_mapping_package.model_dump_json)
+
+    benchmark.extra_info["encoded_bytes"] = len(encoded_package)
+
+
+@pytest.mark.benchmark(group="codec-decode")
+@pytest.mark.parametrize("compression", CODEC_COMPRESSIONS)
+@pytest.mark.parametrize("trust_content_ids", [True, False])
+def test_benchmark_binary_decode(benchmark, synthetic_mapping_package: MappingPackage, compression: str,
+                                 trust_content_ids: bool):
+    codec = BinaryModelCodec(compression=compression, trust_content_ids=trust_content_ids)
+    encoded_package = codec.encode(synthetic_mapping_package)
+
+    decoded_package = benchmark(codec.decode, encoded_package)
+
+    assert decoded_package.model_dump() == synthetic_mapping_package.model_dump()
+
+
+@pytest.mark.benchmark(group="codec-decode")
+def test_benchmark_json_decode(benchmark, synthetic_mapping_package: MappingPackage):
+    """Baseline of the binary decoding."""
+    encoded_package = synthetic_mapping_package.model_dump_json()
+
+    decoded_package = benchmark(MappingPackage.model_validate_json, encoded_package)
+
+    assert decoded_package.model_dump() == synthetic_mapping_package.model_dump()
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+from typing import List, Tuple
+
+import pytest
+
+from tests import TESTS_PATH
+
+pytest.importorskip("pytest_benchmark")
+
+### Imports of typical short-lived applications, e.g. a CLI reading package metadata, and of the whole API
+IMPORT_STATEMENTS = {
+    "package": "import mapping_suite_sdk",
+    "load_metadata": "from mapping_suite_sdk import load_mapping_package_metadata_from_archive",
+    "load_package": "from mapping_suite_sdk import load_mapping_package_from_archive",
+    "mongodb_repository": "from mapping_suite_sdk import MongoDBMappingPackageRepository",
+    "whole_api": "from mapping_suite_sdk import *",
+}
+
+
+def _run_python(code: str) -> str:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=TESTS_PATH.parent, check=True,
+                          capture_output=True, text=True).stderr
+
+
+def _get_import_times(importtime_output: str) -> List[Tuple[str, int, int]]:
+    """Get the modules imported, their nesting level and their cumulative import time in microseconds.
+
+    The output of python -X importtime starts with a header line, followed by a line per module,
+    whose name is indented by two spaces per nesting level.
+    """
+    import_times = []
+    for line in importtime_output.splitlines()[1:]:
+        _, cumulative_time, module_name = line.split("|")
+        stripped_module_name = module_name.lstrip()
+        nesting_level = (len(module_name) - len(stripped_module_name) - 1) // 2
+        import_times.append((stripped_module_name, nesting_level, int(cumulative_time)))
+    return import_times
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize("import_name", list(IMPORT_STATEMENTS))
+def test_benchmark_import_time(benchmark, import_name: str):
+    """Time a fresh interpreter running the import, interpreter startup included."""
+    importtime_output = benchmark.pedantic(_run_python, args=(IMPORT_STATEMENTS[import_name],), rounds=5)
+
+    import_times = _get_import_times(importtime_output)
+    # Only the top level imports, as their cumulative time includes the nested ones
+    benchmark.extra_info["import_time_us"] = sum(import_time for _, nesting_level, import_time in import_times
+                                                 if nesting_level == 0)
+    benchmark.extra_info["modules_imported"] = len(import_times)
+    assert ("mapping_suite_sdk", 0) in {(module_name, nesting_level) for module_name, nesting_level, _ in import_times}
+
+
+@pytest.mark.benchmark(group="import")
+def test_benchmark_interpreter_startup(benchmark):
+    """Time a fresh interpreter importing nothing, the baseline of the import benchmarks."""
+    benchmark.pedantic(_run_python, args=("pass",), rounds=5)
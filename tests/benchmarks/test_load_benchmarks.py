@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import mongomock
+import pytest
+
+from mapping_suite_sdk.adapters.repository import MongoDBMappingPackageRepository
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.services.load_mapping_package import load_mapping_package_from_folder, \
+    load_mapping_package_from_archive, load_mapping_package_metadata_from_archive, \
+    load_mapping_packages_from_github, load_mapping_package_from_mongo_db
+from tests.benchmarks.conftest import SYNTHETIC_PACKAGE_REPOSITORY_PATTERN
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="load")
+def test_benchmark_load_from_folder(benchmark, synthetic_mapping_package_folder_path: Path):
+    mapping_package = benchmark(load_mapping_package_from_folder, synthetic_mapping_package_folder_path)
+
+    assert mapping_package.metadata.identifier == "package_synthetic_0"
+
+
+@pytest.mark.benchmark(group="load")
+def test_benchmark_load_from_archive(benchmark, synthetic_mapping_package_archive_path: Path):
+    mapping_package = benchmark(load_mapping_package_from_archive, synthetic_mapping_package_archive_path)
+
+    assert mapping_package.metadata.identifier == "package_synthetic_0"
+
+
+@pytest.mark.benchmark(group="load")
+def test_benchmark_load_metadata_from_archive(benchmark, synthetic_mapping_package_archive_path: Path):
+    metadata = benchmark(load_mapping_package_metadata_from_archive, synthetic_mapping_package_archive_path)
+
+    assert metadata.identifier == "package_synthetic_0"
+
+
+@pytest.mark.benchmark(group="load")
+def test_benchmark_load_from_git_repository(benchmark, synthetic_mapping_package_repository_path: Path):
+    mapping_packages = benchmark(load_mapping_packages_from_github,
+                                 github_repository_url=str(synthetic_mapping_package_repository_path),
+                                 packages_path_pattern=SYNTHETIC_PACKAGE_REPOSITORY_PATTERN)
+
+    assert len(mapping_packages) == 1
+
+
+@pytest.mark.benchmark(group="load")
+def test_benchmark_load_from_mongo_db(benchmark, synthetic_mapping_package: MappingPackage):
+    repository = MongoDBMappingPackageRepository(mongo_client=mongomock.MongoClient(),
+                                                 database_name="benchmark_load_database")
+    repository.create(synthetic_mapping_package.model_copy())
+
+    mapping_package = benchmark(load_mapping_package_from_mongo_db, synthetic_mapping_package.id, repository)
+
+    assert mapping_package.metadata == synthetic_mapping_package.metadata
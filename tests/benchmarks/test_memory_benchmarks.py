@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from tests import TESTS_PATH
+from tests.benchmarks.memory_operations import MEMORY_OPERATIONS, measure_tracemalloc_peak
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _measure_peak_rss(operation_name: str, archive_path: Path):
+    """Measure the peak RSS of an operation in a fresh process, so earlier benchmarks don't raise it."""
+    output = subprocess.run([sys.executable, "-m", "tests.benchmarks.memory_operations", operation_name,
+                             str(archive_path)],
+                            cwd=TESTS_PATH.parent, check=True, capture_output=True, text=True).stdout
+    setup_peak_rss, peak_rss = map(int, output.split())
+    return setup_peak_rss, peak_rss
+
+
+@pytest.mark.benchmark(group="memory")
+@pytest.mark.parametrize("operation_name", list(MEMORY_OPERATIONS))
+def test_benchmark_operation_memory(benchmark, operation_name: str, synthetic_mapping_package_archive_path: Path):
+    tracemalloc_peak = benchmark.pedantic(measure_tracemalloc_peak,
+                                          args=(operation_name, synthetic_mapping_package_archive_path), rounds=3)
+    setup_peak_rss, peak_rss = _measure_peak_rss(operation_name, synthetic_mapping_package_archive_path)
+
+    benchmark.extra_info["tracemalloc_peak_bytes"] = tracemalloc_peak
+    benchmark.extra_info["peak_rss_bytes"] = peak_rss
+    benchmark.extra_info["peak_rss_increase_bytes"] = peak_rss - setup_peak_rss
+    assert tracemalloc_peak > 0
+
+
+@pytest.mark.benchmark(group="memory")
+def test_benchmark_memory_footprint(benchmark, synthetic_mapping_package: MappingPackage):
+    footprint = benchmark(synthetic_mapping_package.memory_footprint)
+
+    benchmark.extra_info["footprint_total_bytes"] = footprint.total_bytes
+    benchmark.extra_info["footprint_overhead_bytes"] = footprint.overhead_bytes
+    benchmark.extra_info.update({f"footprint_{name}_bytes": field_footprint.total_bytes
+                                 for name, field_footprint in footprint.fields.items()})
+    assert footprint.content_bytes > 0
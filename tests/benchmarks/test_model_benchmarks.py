@@ -0,0 +1,35 @@
+import pytest
+
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="model")
+def test_benchmark_generate_package_id(benchmark, synthetic_mapping_package: MappingPackage):
+    mapping_package = synthetic_mapping_package.model_copy()
+
+    benchmark(mapping_package.generate_id)
+
+    assert mapping_package.id == synthetic_mapping_package.id
+
+
+@pytest.mark.benchmark(group="model")
+def test_benchmark_generate_asset_ids(benchmark, synthetic_mapping_package: MappingPackage):
+    files = synthetic_mapping_package.technical_mapping_suite.files
+
+    benchmark(lambda: [file.generate_id() for file in files])
+
+
+@pytest.mark.benchmark(group="model")
+def test_benchmark_validate_package(benchmark, synthetic_mapping_package: MappingPackage):
+    document = synthetic_mapping_package.model_dump()
+
+    mapping_package = benchmark(MappingPackage.model_validate, document)
+
+    assert mapping_package.model_dump() == synthetic_mapping_package.model_dump()
+
+
+@pytest.mark.benchmark(group="model")
+def test_benchmark_dump_package_json(benchmark, synthetic_mapping_package: MappingPackage):
+    assert benchmark(synthetic_mapping_package.model_dump_json)
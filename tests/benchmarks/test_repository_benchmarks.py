@@ -0,0 +1,74 @@
+import itertools
+from pathlib import Path
+
+import mongomock
+import pytest
+
+from mapping_suite_sdk.adapters.filesystem_repository import FileSystemRepository
+from mapping_suite_sdk.adapters.repository import MongoDBMappingPackageRepository, RepositoryABC, \
+    ModelNotFoundError
+from mapping_suite_sdk.adapters.sqlite_repository import SQLiteRepository
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+pytest.importorskip("pytest_benchmark")
+
+_DATABASE_NAMES = (f"benchmark_database_{index}" for index in itertools.count())
+
+
+@pytest.fixture(params=["mongodb", "filesystem", "sqlite"])
+def mapping_package_repository(request, tmp_path: Path) -> RepositoryABC[MappingPackage]:
+    if request.param == "mongodb":
+        # A database per repository, as the mongomock clients share their storage
+        yield MongoDBMappingPackageRepository(mongo_client=mongomock.MongoClient(),
+                                              database_name=next(_DATABASE_NAMES), ensure_indexes=True)
+    elif request.param == "filesystem":
+        yield FileSystemRepository(model_class=MappingPackage, root_path=tmp_path / "repository")
+    else:
+        with SQLiteRepository(model_class=MappingPackage, database_path=tmp_path / "repository.db") as repository:
+            yield repository
+
+
+@pytest.mark.benchmark(group="repository")
+def test_benchmark_repository_create(benchmark, mapping_package_repository: RepositoryABC[MappingPackage],
+                                     synthetic_mapping_package: MappingPackage):
+    def delete_stored_package():
+        try:
+            mapping_package_repository.delete(synthetic_mapping_package.id)
+        except ModelNotFoundError:
+            pass
+        return (synthetic_mapping_package.model_copy(),), {}
+
+    benchmark.pedantic(mapping_package_repository.create, setup=delete_stored_package, rounds=10)
+
+
+@pytest.mark.benchmark(group="repository")
+def test_benchmark_repository_read(benchmark, mapping_package_repository: RepositoryABC[MappingPackage],
+                                   synthetic_mapping_package: MappingPackage):
+    mapping_package_repository.create(synthetic_mapping_package.model_copy())
+
+    mapping_package = benchmark(mapping_package_repository.read, synthetic_mapping_package.id)
+
+    assert mapping_package.metadata == synthetic_mapping_package.metadata
+
+
+@pytest.mark.benchmark(group="repository")
+def test_benchmark_repository_update(benchmark, mapping_package_repository: RepositoryABC[MappingPackage],
+                                     synthetic_mapping_package: MappingPackage):
+    mapping_package = mapping_package_repository.create(synthetic_mapping_package.model_copy())
+    descriptions = (f"Revision {index}" for index in itertools.count())
+
+    def change_description():
+        mapping_package.description = next(descriptions)
+        return (mapping_package,), {}
+
+    benchmark.pedantic(mapping_package_repository.update, setup=change_description, rounds=10)
+
+
+@pytest.mark.benchmark(group="repository")
+def test_benchmark_repository_delete(benchmark, mapping_package_repository: RepositoryABC[MappingPackage],
+                                     synthetic_mapping_package: MappingPackage):
+    def store_package():
+        mapping_package_repository.create(synthetic_mapping_package.model_copy())
+        return (synthetic_mapping_package.id,), {}
+
+    benchmark.pedantic(mapping_package_repository.delete, setup=store_package, rounds=10)
@@ -0,0 +1,46 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor
+from mapping_suite_sdk.adapters.serialiser import MappingPackageSerialiser
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.services.serialise_mapping_package import serialise_mapping_package
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="serialise")
+def test_benchmark_serialise_to_folder(benchmark, synthetic_mapping_package: MappingPackage):
+    def serialise_to_temporary_folder():
+        with tempfile.TemporaryDirectory() as temp_dir:
+            MappingPackageSerialiser().serialise(Path(temp_dir), synthetic_mapping_package)
+
+    benchmark(serialise_to_temporary_folder)
+
+
+@pytest.mark.benchmark(group="serialise")
+def test_benchmark_serialise_to_archive(benchmark, tmp_path: Path, synthetic_mapping_package: MappingPackage):
+    archive_path = tmp_path / "package.zip"
+
+    benchmark(serialise_mapping_package, synthetic_mapping_package, archive_path)
+
+    assert archive_path.exists()
+
+
+@pytest.mark.benchmark(group="serialise")
+def test_benchmark_pack_directory(benchmark, tmp_path: Path, synthetic_mapping_package_folder_path: Path):
+    archive_path = benchmark(ArchivePackageExtractor().pack_directory, synthetic_mapping_package_folder_path,
+                             tmp_path / "package.zip")
+
+    assert archive_path.exists()
+
+
+@pytest.mark.benchmark(group="serialise")
+def test_benchmark_extract_archive(benchmark, synthetic_mapping_package_archive_path: Path):
+    def extract_to_temporary_folder():
+        with ArchivePackageExtractor().extract_temporary(synthetic_mapping_package_archive_path):
+            pass
+
+    benchmark(extract_to_temporary_folder)
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from mapping_suite_sdk.services.load_mapping_package import load_mapping_package_from_archive
+from tests.benchmarks.synthetic_package import SYNTHETIC_PACKAGE_SIZES, generate_synthetic_mapping_package, \
+    pack_synthetic_mapping_package
+
+
+def _files_by_path(mapping_package):
+    suites = [mapping_package.technical_mapping_suite, mapping_package.vocabulary_mapping_suite,
+              *mapping_package.test_data_suites, *mapping_package.test_suites_sparql,
+              *mapping_package.test_suites_shacl]
+    return {file.path: file.content for suite in suites for file in suite.files}
+
+
+def test_synthetic_package_is_deterministic():
+    size = SYNTHETIC_PACKAGE_SIZES["small"]
+
+    assert generate_synthetic_mapping_package(size, seed=1) == generate_synthetic_mapping_package(size, seed=1)
+    assert generate_synthetic_mapping_package(size, seed=1) != generate_synthetic_mapping_package(size, seed=2)
+
+
+def test_synthetic_package_has_requested_size():
+    size = SYNTHETIC_PACKAGE_SIZES["small"]
+    mapping_package = generate_synthetic_mapping_package(size)
+
+    files = _files_by_path(mapping_package)
+    assert len(files) + 2 == size.get_files_count()
+    assert len(mapping_package.test_data_suites) == size.test_data_suites
+    assert all(len(content) == size.sparql_file_size
+               for suite in mapping_package.test_suites_sparql for content in (file.content for file in suite.files))
+    assert len(mapping_package.conceptual_mapping_asset.content) == size.conceptual_mapping_size
+
+
+def test_synthetic_package_loads_from_archive(tmp_path: Path):
+    size = SYNTHETIC_PACKAGE_SIZES["small"]
+    archive_path = pack_synthetic_mapping_package(tmp_path / "package.zip", size)
+
+    loaded_package = load_mapping_package_from_archive(archive_path)
+    mapping_package = generate_synthetic_mapping_package(size)
+
+    assert loaded_package.metadata == mapping_package.metadata
+    assert loaded_package.conceptual_mapping_asset == mapping_package.conceptual_mapping_asset
+    assert _files_by_path(loaded_package) == _files_by_path(mapping_package)
@@ -1,17 +1,19 @@
 import json
 import shutil
 import tempfile
+import zipfile
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Set, Optional
 
 import mongomock
 import pytest
+from mongomock_motor import AsyncMongoMockClient
 from git import Repo
 from pydantic import TypeAdapter
 
 from mapping_suite_sdk.adapters.loader import MappingPackageAssetLoader
-from mapping_suite_sdk.adapters.repository import MongoDBRepository
+from mapping_suite_sdk.adapters.repository import MongoDBRepository, AsyncMongoDBRepository
 from mapping_suite_sdk.models.asset import ConceptualMappingPackageAsset, TechnicalMappingSuite, VocabularyMappingSuite, \
     TestDataSuite, \
     SAPRQLTestSuite, SHACLTestSuite
@@ -201,6 +203,18 @@ def _setup_temporary_test_git_repository(dummy_github_project_path: Path, dummy_
         yield repo_path
 
 
+@contextmanager
+def _setup_temporary_multi_package_archive(dummy_github_project_path: Path):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive_path = Path(tmp_dir) / f"{dummy_github_project_path.name}.zip"
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+            for file_path in dummy_github_project_path.rglob('*'):
+                if file_path.is_file():
+                    zip_ref.write(file_path, file_path.relative_to(dummy_github_project_path))
+
+        yield archive_path
+
+
 @pytest.fixture
 def dummy_mapping_package_path() -> Path:
     return TEST_DATA_EXAMPLE_MAPPING_PACKAGE_PATH
@@ -275,6 +289,20 @@ def dummy_mongo_repository(mongo_client: mongomock.MongoClient) -> MongoDBReposi
     )
 
 
+@pytest.fixture
+def async_mongo_client() -> AsyncMongoMockClient:
+    return AsyncMongoMockClient()
+
+
+@pytest.fixture
+def dummy_async_mongo_repository(async_mongo_client: AsyncMongoMockClient) -> AsyncMongoDBRepository:
+    return AsyncMongoDBRepository(
+        model_class=TestModel,
+        mongo_client=async_mongo_client,
+        database_name="test_db"
+    )
+
+
 @pytest.fixture
 def sample_model() -> TestModel:
     return TestModel(name="Test Model", description="Test Description", count=5)
@@ -282,7 +310,8 @@ def sample_model() -> TestModel:
 
 @pytest.fixture
 def updated_sample_model(sample_model: TestModel) -> TestModel:
-    updated_model = sample_model.model_copy()
+    # Pins the ID of the sample model, so that the updated model replaces it
+    updated_model = sample_model.model_copy(update={"id": sample_model.id})
     updated_model.name = "Updated Model"
     updated_model.description = "Updated Description"
     updated_model.count = 10
@@ -1,11 +1,12 @@
 import shutil
 import tempfile
+import zipfile
 from pathlib import Path
 
 import pytest
 
-from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor
-from tests.conftest import _compare_directories
+from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor, ArchiveExtractionLimitError
+from tests.conftest import _compare_directories, _get_all_files, _setup_temporary_multi_package_archive
 
 
 def test_archive_unpack_successful(dummy_mapping_package_path: Path) -> None:
@@ -63,3 +64,169 @@ def test_archive_extractor_gets_folder_instead_of_archive() -> None:
         with pytest.raises(ValueError):
             with ArchivePackageExtractor().extract(source_path=tmp_dir_path, destination_path=tmp_dir_path):
                 pass
+
+
+def _create_archive(archive_path: Path, files: dict) -> Path:
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        for file_name, content in files.items():
+            zip_ref.writestr(file_name, content)
+    return archive_path
+
+
+def test_archive_extractor_with_default_limits_extracts_package(dummy_mapping_package_path: Path,
+                                                                 dummy_mapping_package_extracted_path: Path) -> None:
+    with ArchivePackageExtractor().extract_temporary(dummy_mapping_package_path) as extracted_path:
+        is_equal, error_message = _compare_directories(dummy_mapping_package_extracted_path, extracted_path)
+        assert is_equal, f"Directory comparison failed:\n{error_message}"
+
+
+def test_archive_extractor_fails_on_too_many_entries() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        archive_path = _create_archive(tmp_dir_path / "many.zip", {f"file_{i}.txt": "x" for i in range(5)})
+
+        with pytest.raises(ArchiveExtractionLimitError):
+            ArchivePackageExtractor(max_entries=4).extract(archive_path, tmp_dir_path / "output")
+        assert not any((tmp_dir_path / "output").iterdir())
+
+
+def test_archive_extractor_fails_on_too_large_file() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        archive_path = _create_archive(tmp_dir_path / "large.zip", {"small.txt": "x", "large.txt": "x" * 2048})
+
+        with pytest.raises(ArchiveExtractionLimitError):
+            ArchivePackageExtractor(max_file_size=1024).extract(archive_path, tmp_dir_path / "output")
+        assert not any((tmp_dir_path / "output").iterdir())
+
+
+def test_archive_extractor_fails_on_too_large_total_size() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        archive_path = _create_archive(tmp_dir_path / "total.zip", {f"file_{i}.txt": "x" * 512 for i in range(4)})
+
+        with pytest.raises(ArchiveExtractionLimitError):
+            with ArchivePackageExtractor(max_total_size=1024).extract_temporary(archive_path):
+                pass
+
+
+def test_archive_extractor_fails_on_high_compression_ratio() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        archive_path = _create_archive(tmp_dir_path / "bomb.zip", {"bomb.txt": b"\0" * (8 * 1024 * 1024)})
+
+        with pytest.raises(ArchiveExtractionLimitError):
+            ArchivePackageExtractor().extract(archive_path, tmp_dir_path / "output")
+
+        extracted_path = ArchivePackageExtractor(max_compression_ratio=None).extract(archive_path,
+                                                                                     tmp_dir_path / "output")
+        assert (extracted_path / "bomb.txt").stat().st_size == 8 * 1024 * 1024
+
+
+def test_archive_extractor_fails_on_entry_outside_destination() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        archive_path = _create_archive(tmp_dir_path / "slip.zip", {"../outside.txt": "x"})
+
+        with pytest.raises(ValueError):
+            ArchivePackageExtractor().extract(archive_path, tmp_dir_path / "output")
+        assert not (tmp_dir_path / "outside.txt").exists()
+
+
+def test_archive_extractor_checks_all_entries_before_writing() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        archive_path = _create_archive(tmp_dir_path / "slip.zip", {"folder/inside.txt": "x", "../outside.txt": "x"})
+
+        with pytest.raises(ValueError):
+            ArchivePackageExtractor().extract(archive_path, tmp_dir_path / "output")
+        assert not any((tmp_dir_path / "output").iterdir())
+
+
+def test_archive_extractor_removes_partial_output_on_limit_error(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        archive_path = _create_archive(tmp_dir_path / "total.zip",
+                                       {f"folder_{i}/file.txt": "x" * 512 for i in range(4)})
+        (tmp_dir_path / "output").mkdir()
+        (tmp_dir_path / "output" / "existing.txt").write_text("kept")
+        # Simulate forged central directory sizes, so that the limit is only hit while streaming
+        monkeypatch.setattr(ArchivePackageExtractor, "_check_archive_limits", lambda self, members: None)
+
+        with pytest.raises(ArchiveExtractionLimitError):
+            ArchivePackageExtractor(max_total_size=1024).extract(archive_path, tmp_dir_path / "output")
+        assert [path.name for path in (tmp_dir_path / "output").iterdir()] == ["existing.txt"]
+
+
+def test_archive_extractor_read_file_from_path_and_stream(dummy_mapping_package_path: Path,
+                                                          dummy_mapping_package_extracted_path: Path) -> None:
+    expected_content = (dummy_mapping_package_extracted_path / "metadata.json").read_bytes()
+
+    assert ArchivePackageExtractor().read_file(dummy_mapping_package_path, Path("metadata.json")) == expected_content
+    with dummy_mapping_package_path.open("rb") as archive_stream:
+        assert ArchivePackageExtractor().read_file(archive_stream, Path("metadata.json")) == expected_content
+        assert not archive_stream.closed
+
+
+def test_archive_extractor_read_file_fails_on_missing_file(dummy_mapping_package_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        ArchivePackageExtractor().read_file(dummy_mapping_package_path, Path("non_existing.json"))
+    with pytest.raises(FileNotFoundError):
+        ArchivePackageExtractor().read_file(Path("nonexistent.zip"), Path("metadata.json"))
+
+
+def test_archive_extractor_read_file_fails_on_corrupted_archive(dummy_corrupted_mapping_package_path: Path) -> None:
+    with pytest.raises(ValueError):
+        ArchivePackageExtractor().read_file(dummy_corrupted_mapping_package_path, Path("metadata.json"))
+
+
+def test_archive_extractor_list_files(dummy_mapping_package_path: Path,
+                                      dummy_mapping_package_extracted_path: Path) -> None:
+    entries = ArchivePackageExtractor().list_files(dummy_mapping_package_path)
+
+    assert {entry.filename for entry in entries} == _get_all_files(dummy_mapping_package_extracted_path)
+    for entry in entries:
+        assert entry.file_size == (dummy_mapping_package_extracted_path / entry.filename).stat().st_size
+        assert entry.CRC is not None
+
+
+def test_archive_extractor_list_packages(dummy_github_project_path: Path,
+                                         dummy_packages_path_pattern: str,
+                                         dummy_non_existing_pattern: str) -> None:
+    with _setup_temporary_multi_package_archive(dummy_github_project_path) as archive_path:
+        assert ArchivePackageExtractor().list_packages(archive_path, dummy_packages_path_pattern) == [
+            Path("mappings/package_can_v1.10"), Path("mappings/package_can_v1.9")]
+        assert ArchivePackageExtractor().list_packages(archive_path, "mappings") == [Path("mappings")]
+        assert ArchivePackageExtractor().list_packages(archive_path, dummy_non_existing_pattern) == []
+
+
+def test_archive_extractor_extract_single_package(dummy_github_project_path: Path,
+                                                  dummy_repo_package_path: Path) -> None:
+    with _setup_temporary_multi_package_archive(dummy_github_project_path) as archive_path:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir_path = Path(tmp_dir)
+            package_path = ArchivePackageExtractor().extract(archive_path, tmp_dir_path, dummy_repo_package_path)
+
+            assert package_path == tmp_dir_path / dummy_repo_package_path
+            assert _get_all_files(tmp_dir_path / "mappings") == {
+                str(dummy_repo_package_path.relative_to("mappings") / file_path)
+                for file_path in _get_all_files(dummy_github_project_path / dummy_repo_package_path)}
+
+            with pytest.raises(ValueError):
+                ArchivePackageExtractor().extract(archive_path, tmp_dir_path, Path("mappings/non_existing"))
+
+
+def test_archive_extractor_extract_packages(dummy_github_project_path: Path) -> None:
+    with _setup_temporary_multi_package_archive(dummy_github_project_path) as archive_path:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir_path = Path(tmp_dir)
+            package_paths = [Path("mappings/package_can_v1.10"), Path("mappings/package_can_v1.9")]
+            package_folder_paths = ArchivePackageExtractor().extract_packages(archive_path, tmp_dir_path,
+                                                                              package_paths)
+
+            assert package_folder_paths == [tmp_dir_path / package_path for package_path in package_paths]
+            assert {path.name for path in tmp_dir_path.iterdir()} == {"mappings"}
+            assert _get_all_files(tmp_dir_path) == {
+                str(package_path / file_path)
+                for package_path in package_paths
+                for file_path in _get_all_files(dummy_github_project_path / package_path)}
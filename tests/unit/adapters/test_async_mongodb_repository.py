@@ -0,0 +1,136 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+from pymongo.errors import DuplicateKeyError
+
+from mapping_suite_sdk.adapters.repository import AsyncMongoDBRepository, ModelNotFoundError
+from tests.conftest import TestModel
+
+
+def test_create_with_success_non_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                                  sample_model: TestModel):
+    result = asyncio.run(dummy_async_mongo_repository.create(sample_model))
+    stored_result = asyncio.run(dummy_async_mongo_repository.collection.find_one({"_id": sample_model.id}))
+
+    assert result == sample_model
+    assert stored_result is not None
+    assert TestModel.model_validate(stored_result) == sample_model
+
+
+def test_create_fails_on_creating_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                                   sample_model: TestModel):
+    asyncio.run(dummy_async_mongo_repository.create(sample_model))
+
+    with pytest.raises(DuplicateKeyError):
+        asyncio.run(dummy_async_mongo_repository.create(sample_model))
+
+
+def test_read_with_success_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                            sample_model: TestModel):
+    asyncio.run(dummy_async_mongo_repository.create(sample_model))
+
+    stored_model = asyncio.run(dummy_async_mongo_repository.read(sample_model.id))
+
+    assert stored_model == sample_model
+    assert stored_model.id == sample_model.id
+
+
+def test_read_fails_on_non_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                            sample_model: TestModel):
+    with pytest.raises(ModelNotFoundError):
+        asyncio.run(dummy_async_mongo_repository.read(sample_model.id))
+
+
+def test_read_many_with_success_with_and_without_filters(dummy_async_mongo_repository: AsyncMongoDBRepository):
+    models = [
+        TestModel(id="test1", name="Model 1", count=1),
+        TestModel(id="test2", name="Model 2", count=2),
+        TestModel(id="test3", name="Model 2", count=3)
+    ]
+    asyncio.run(dummy_async_mongo_repository.create_many(models))
+
+    results = asyncio.run(dummy_async_mongo_repository.read_many())
+    assert {model.id for model in results} == {"test1", "test2", "test3"}
+
+    results = asyncio.run(dummy_async_mongo_repository.read_many({"name": "Model 2"}))
+    assert {model.id for model in results} == {"test2", "test3"}
+
+
+def test_update_with_success_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                              sample_model: TestModel,
+                                              updated_sample_model: TestModel):
+    asyncio.run(dummy_async_mongo_repository.create(sample_model))
+    result = asyncio.run(dummy_async_mongo_repository.update(updated_sample_model))
+
+    assert result == updated_sample_model
+    assert asyncio.run(dummy_async_mongo_repository.read(updated_sample_model.id)) == updated_sample_model
+
+
+def test_update_fails_on_non_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                              updated_sample_model: TestModel):
+    with pytest.raises(ModelNotFoundError):
+        asyncio.run(dummy_async_mongo_repository.update(updated_sample_model))
+
+
+def test_delete_with_success_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                              sample_model: TestModel):
+    asyncio.run(dummy_async_mongo_repository.create(sample_model))
+    asyncio.run(dummy_async_mongo_repository.delete(sample_model.id))
+
+    with pytest.raises(ModelNotFoundError):
+        asyncio.run(dummy_async_mongo_repository.read(sample_model.id))
+
+
+def test_delete_fails_on_non_existing_element(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                              sample_model: TestModel):
+    with pytest.raises(ModelNotFoundError):
+        asyncio.run(dummy_async_mongo_repository.delete(sample_model.id))
+
+
+def test_bulk_update_and_delete(dummy_async_mongo_repository: AsyncMongoDBRepository):
+    models = [TestModel(id=f"test{i}", name=f"Model {i}", count=i) for i in range(3)]
+    asyncio.run(dummy_async_mongo_repository.create_many(models))
+
+    updated_models = [TestModel(id=model.id, name="Updated", count=model.count) for model in models]
+    asyncio.run(dummy_async_mongo_repository.update_many(updated_models))
+    assert len(asyncio.run(dummy_async_mongo_repository.read_many({"name": "Updated"}))) == 3
+
+    with pytest.raises(ModelNotFoundError):
+        asyncio.run(dummy_async_mongo_repository.update_many([TestModel(id="missing", name="Missing")]))
+    with pytest.raises(ModelNotFoundError):
+        asyncio.run(dummy_async_mongo_repository.delete_many(["test0", "missing"]))
+    assert len(asyncio.run(dummy_async_mongo_repository.read_many())) == 3
+
+    asyncio.run(dummy_async_mongo_repository.delete_many(["test0", "test1"]))
+    assert [model.id for model in asyncio.run(dummy_async_mongo_repository.read_many())] == ["test2"]
+
+
+def test_async_repository_closes_only_owned_client(async_mongo_client: AsyncMongoMockClient):
+    async def _use_repository(close_client: bool) -> None:
+        async with AsyncMongoDBRepository(model_class=TestModel,
+                                          mongo_client=async_mongo_client,
+                                          database_name="test_db",
+                                          close_client=close_client) as repository:
+            await repository.read_many()
+
+    with mock.patch.object(async_mongo_client, "close") as close_mock:
+        asyncio.run(_use_repository(close_client=False))
+        close_mock.assert_not_called()
+
+        asyncio.run(_use_repository(close_client=True))
+        close_mock.assert_called_once()
+
+
+def test_update_sends_only_changed_fields(dummy_async_mongo_repository: AsyncMongoDBRepository,
+                                          sample_model: TestModel):
+    asyncio.run(dummy_async_mongo_repository.create(sample_model))
+    stored_model = asyncio.run(dummy_async_mongo_repository.read(sample_model.id))
+    stored_model.count = 42
+
+    with mock.patch.object(dummy_async_mongo_repository.collection, "replace_one") as replace_one:
+        asyncio.run(dummy_async_mongo_repository.update(stored_model))
+
+    replace_one.assert_not_called()
+    assert asyncio.run(dummy_async_mongo_repository.read(sample_model.id)).count == 42
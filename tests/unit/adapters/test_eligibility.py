@@ -0,0 +1,169 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+import mongomock
+import numpy as np
+import pytest
+
+from mapping_suite_sdk.adapters.eligibility import MappingPackageEligibilityIndex, \
+    MongoDBMappingPackageEligibilityIndex, MappingPackageEligibilityTable, ELIGIBILITY_AMBIGUOUS, \
+    ELIGIBILITY_AMBIGUITY_FIRST, ELIGIBILITY_NO_MATCH
+from mapping_suite_sdk.adapters.repository import MongoDBRepository
+from mapping_suite_sdk.models.mapping_package import MappingPackage, MappingPackageEligibilityConstraints
+
+
+def _package_with_constraints(mapping_package: MappingPackage, identifier: str, constraints: dict) -> MappingPackage:
+    metadata = mapping_package.metadata.model_copy(
+        update={"identifier": identifier,
+                "eligibility_constraints": MappingPackageEligibilityConstraints(constraints=constraints)})
+    return mapping_package.model_copy(update={"id": identifier, "metadata": metadata})
+
+
+@pytest.fixture
+def dummy_eligibility_packages(dummy_mapping_package_model: MappingPackage) -> List[MappingPackage]:
+    return [
+        _package_with_constraints(dummy_mapping_package_model, "package_29_v1.9",
+                                  {"eforms_subtype": ["29"], "eforms_sdk_versions": ["1.9"],
+                                   "start_date": None, "end_date": None}),
+        _package_with_constraints(dummy_mapping_package_model, "package_29_v1.10_2024",
+                                  {"eforms_subtype": ["29", "30"], "eforms_sdk_versions": ["eforms-sdk-1.10"],
+                                   "start_date": "2024-01-01", "end_date": "2024-12-31"}),
+        _package_with_constraints(dummy_mapping_package_model, "package_29_v1.10_2025",
+                                  {"eforms_subtype": ["29", "30"], "eforms_sdk_versions": ["1.10"],
+                                   "start_date": "2025-01-01", "end_date": None}),
+        _package_with_constraints(dummy_mapping_package_model, "package_any_subtype_v1.9",
+                                  {"eforms_subtype": [], "eforms_sdk_versions": ["1.9"]}),
+    ]
+
+
+def _identifiers(mapping_packages: List[MappingPackage]) -> List[str]:
+    return sorted(mapping_package.metadata.identifier for mapping_package in mapping_packages)
+
+
+def test_eligibility_index_selects_by_subtype_and_version(dummy_eligibility_packages: List[MappingPackage]):
+    index = MappingPackageEligibilityIndex(dummy_eligibility_packages)
+
+    assert len(index) == 4
+    assert _identifiers(index.select("29", "1.9")) == ["package_29_v1.9", "package_any_subtype_v1.9"]
+    assert _identifiers(index.select("16", "eforms-sdk-1.9")) == ["package_any_subtype_v1.9"]
+    assert _identifiers(index.select("30", "1.10")) == ["package_29_v1.10_2024", "package_29_v1.10_2025"]
+    assert index.select("29", "1.11") == []
+
+
+def test_eligibility_index_selects_by_notice_date(dummy_eligibility_packages: List[MappingPackage]):
+    index = MappingPackageEligibilityIndex(dummy_eligibility_packages)
+
+    assert _identifiers(index.select("29", "1.10", "2024-06-01")) == ["package_29_v1.10_2024"]
+    assert _identifiers(index.select("29", "1.10", date(2024, 12, 31))) == ["package_29_v1.10_2024"]
+    assert _identifiers(index.select("29", "1.10", "2030-01-01T10:00:00")) == ["package_29_v1.10_2025"]
+    assert index.select("29", "1.10", "2023-06-01") == []
+    assert _identifiers(index.select("29", "1.9", "2023-06-01")) == ["package_29_v1.9", "package_any_subtype_v1.9"]
+
+
+def test_eligibility_index_selects_overlapping_validity_periods(dummy_mapping_package_model: MappingPackage):
+    random_generator = np.random.default_rng(7)
+    first_day = date(2024, 1, 1)
+    periods = []
+    for _ in range(60):
+        start_offset, end_offset = sorted(random_generator.integers(0, 365, size=2).tolist())
+        periods.append((first_day + timedelta(days=start_offset) if random_generator.random() > 0.1 else None,
+                        first_day + timedelta(days=end_offset) if random_generator.random() > 0.1 else None))
+    # A period ending before it starts applies to no date
+    periods.append((date(2024, 6, 1), date(2024, 5, 1)))
+    mapping_packages = [
+        _package_with_constraints(dummy_mapping_package_model, f"package_{position}",
+                                  {"eforms_subtype": ["29"], "eforms_sdk_versions": ["1.9"],
+                                   "start_date": start_date and start_date.isoformat(),
+                                   "end_date": end_date and end_date.isoformat()})
+        for position, (start_date, end_date) in enumerate(periods)]
+    index = MappingPackageEligibilityIndex(mapping_packages)
+
+    for day_offset in range(-5, 370, 3):
+        notice_date = first_day + timedelta(days=day_offset)
+        expected = [mapping_package for mapping_package, (start_date, end_date) in zip(mapping_packages, periods)
+                    if (start_date is None or start_date <= notice_date)
+                    and (end_date is None or notice_date <= end_date)]
+        assert _identifiers(index.select("29", "1.9", notice_date)) == _identifiers(expected)
+    assert len(index.select("29", "1.9")) == len(mapping_packages)
+
+
+def test_mongodb_eligibility_index_matches_in_memory_index(mongo_client: mongomock.MongoClient,
+                                                           dummy_eligibility_packages: List[MappingPackage]):
+    repository = MongoDBRepository(model_class=MappingPackage, mongo_client=mongo_client, database_name="test_db")
+    repository.create_many(dummy_eligibility_packages)
+    mongodb_index = MongoDBMappingPackageEligibilityIndex(repository)
+    in_memory_index = MappingPackageEligibilityIndex(dummy_eligibility_packages)
+
+    index_names = mongodb_index.ensure_indexes()
+    assert mongodb_index.ensure_indexes() == index_names
+    assert set(index_names) <= set(repository.collection.index_information())
+
+    for notice in [("29", "1.9", None), ("16", "eforms-sdk-1.9", None), ("30", "1.10", None),
+                   ("29", "1.10", "2024-06-01"), ("29", "1.10", "2030-01-01"), ("29", "1.10", "2023-06-01"),
+                   ("29", "1.11", None)]:
+        assert _identifiers(mongodb_index.select(*notice)) == _identifiers(in_memory_index.select(*notice))
+
+
+def test_mongodb_eligibility_index_matches_in_memory_index_on_datetimes(
+        mongo_client: mongomock.MongoClient, dummy_mapping_package_model: MappingPackage):
+    datetime_packages = [
+        _package_with_constraints(dummy_mapping_package_model, "package_datetime_strings",
+                                  {"eforms_subtype": ["29"], "eforms_sdk_versions": ["1.9"],
+                                   "start_date": "2024-01-01T12:00:00", "end_date": "2024-06-30 18:00:00+02:00"}),
+        _package_with_constraints(dummy_mapping_package_model, "package_datetimes",
+                                  {"eforms_subtype": ["29"], "eforms_sdk_versions": ["1.9"],
+                                   "start_date": datetime(2024, 7, 1, 12, 0),
+                                   "end_date": datetime(2024, 12, 31, 23, 30, tzinfo=timezone(timedelta(hours=2)))}),
+    ]
+    repository = MongoDBRepository(model_class=MappingPackage, mongo_client=mongo_client, database_name="test_db")
+    repository.create(datetime_packages[0])
+    # Stored as BSON datetimes, as by tools writing the documents directly
+    repository.collection.insert_one({**repository.collection.find_one({"_id": datetime_packages[0].id}),
+                                      "_id": datetime_packages[1].id,
+                                      "metadata": datetime_packages[1].metadata.model_dump(by_alias=True)})
+    mongodb_index = MongoDBMappingPackageEligibilityIndex(repository)
+    in_memory_index = MappingPackageEligibilityIndex(datetime_packages)
+
+    for notice_date, expected_identifiers in [("2023-12-31", []),
+                                              ("2024-01-01", ["package_datetime_strings"]),
+                                              (date(2024, 6, 30), ["package_datetime_strings"]),
+                                              ("2024-07-01T08:00:00", ["package_datetimes"]),
+                                              (datetime(2024, 12, 31, 9, 0), ["package_datetimes"]),
+                                              ("2025-01-01", [])]:
+        assert _identifiers(in_memory_index.select("29", "1.9", notice_date)) == expected_identifiers
+        assert _identifiers(mongodb_index.select("29", "1.9", notice_date)) == expected_identifiers
+
+
+def test_eligibility_table_matches_in_memory_index(dummy_eligibility_packages: List[MappingPackage]):
+    table = MappingPackageEligibilityTable(dummy_eligibility_packages, chunk_size=2)
+    index = MappingPackageEligibilityIndex(dummy_eligibility_packages)
+    notices = [("16", "eforms-sdk-1.9", "2023-06-01"), ("29", "1.10", "2024-06-01"), ("29", "1.10", "2030-01-01"),
+               ("29", "1.10", "2023-06-01"), ("29", "1.11", "2024-06-01"), ("29", "1.9", "2024-06-01")]
+
+    assignments = table.match(np.array([notice[0] for notice in notices]),
+                              np.array([notice[1] for notice in notices]),
+                              np.array([notice[2] for notice in notices], dtype="datetime64[D]"),
+                              ambiguity=ELIGIBILITY_AMBIGUITY_FIRST)
+
+    for notice, assignment in zip(notices, assignments):
+        selected_packages = index.select(*notice)
+        if selected_packages:
+            assert table.mapping_packages[assignment] == selected_packages[0]
+        else:
+            assert assignment == ELIGIBILITY_NO_MATCH
+
+
+def test_eligibility_table_marks_ambiguous_notices(dummy_eligibility_packages: List[MappingPackage]):
+    table = MappingPackageEligibilityTable(dummy_eligibility_packages)
+
+    assignments = table.match(np.array(["16", "29", "29", "29"]),
+                              np.array(["1.9", "1.9", "1.10", "1.10"]),
+                              np.array(["2024-06-01", "2024-06-01", "NaT", "2024-06-01"], dtype="datetime64[D]"))
+
+    assert assignments.tolist() == [3, ELIGIBILITY_AMBIGUOUS, ELIGIBILITY_AMBIGUOUS, 1]
+    assert table.match(np.array(["29"]), np.array(["1.10"])).tolist() == [ELIGIBILITY_AMBIGUOUS]
+    assert table.match(np.array([]), np.array([])).tolist() == []
+    with pytest.raises(ValueError):
+        table.match(np.array(["29"]), np.array(["1.9", "1.10"]))
+    with pytest.raises(ValueError):
+        table.match(np.array(["29"]), np.array(["1.9"]), ambiguity="unknown")
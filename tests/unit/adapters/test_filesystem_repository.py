@@ -0,0 +1,151 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from mapping_suite_sdk.adapters.filesystem_repository import FileSystemRepository
+from mapping_suite_sdk.adapters.repository import ModelNotFoundError, ModelAlreadyExistsError
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from tests.conftest import TestModel
+
+
+@pytest.fixture
+def dummy_filesystem_repository(tmp_path: Path) -> FileSystemRepository:
+    return FileSystemRepository(model_class=TestModel, root_path=tmp_path)
+
+
+@pytest.fixture
+def dummy_mapping_package_filesystem_repository(tmp_path: Path) -> FileSystemRepository:
+    return FileSystemRepository(model_class=MappingPackage, root_path=tmp_path)
+
+
+def _blob_paths(repository: FileSystemRepository):
+    return sorted(repository.blobs_path.glob("*/*"))
+
+
+def test_create_and_read(dummy_filesystem_repository: FileSystemRepository, sample_model: TestModel):
+    assert dummy_filesystem_repository.create(sample_model) == sample_model
+
+    assert dummy_filesystem_repository.read(sample_model.id) == sample_model
+
+
+def test_create_fails_on_existing_element(dummy_filesystem_repository: FileSystemRepository,
+                                          sample_model: TestModel):
+    dummy_filesystem_repository.create(sample_model)
+
+    with pytest.raises(ModelAlreadyExistsError):
+        dummy_filesystem_repository.create(sample_model)
+
+
+def test_read_fails_on_non_existing_element(dummy_filesystem_repository: FileSystemRepository):
+    with pytest.raises(ModelNotFoundError):
+        dummy_filesystem_repository.read("non_existing_id")
+
+
+def test_read_many_with_filters(dummy_filesystem_repository: FileSystemRepository):
+    dummy_filesystem_repository.create_many([TestModel(id="test/1", name="Model 1", count=1),
+                                             TestModel(id="test/2", name="Model 2", count=2),
+                                             TestModel(id="test/3", name="Model 1", count=3)])
+
+    assert len(dummy_filesystem_repository.read_many()) == 3
+    assert {model.id for model in dummy_filesystem_repository.read_many({"name": "Model 1"})} == {"test/1", "test/3"}
+    assert {model.id for model in dummy_filesystem_repository.read_many({"count": {"$in": [2, 3]}})} == {"test/2",
+                                                                                                          "test/3"}
+    assert {model.id for model in dummy_filesystem_repository.read_many({"name": {"$ne": "Model 1"}})} == {"test/2"}
+    with pytest.raises(ValueError):
+        dummy_filesystem_repository.read_many({"count": {"$gt": 1}})
+
+
+def test_update_and_delete(dummy_filesystem_repository: FileSystemRepository, sample_model: TestModel,
+                           updated_sample_model: TestModel):
+    with pytest.raises(ModelNotFoundError):
+        dummy_filesystem_repository.update(sample_model)
+    dummy_filesystem_repository.create(sample_model)
+
+    dummy_filesystem_repository.update(updated_sample_model)
+
+    assert dummy_filesystem_repository.read(sample_model.id) == updated_sample_model
+    dummy_filesystem_repository.delete(sample_model.id)
+    with pytest.raises(ModelNotFoundError):
+        dummy_filesystem_repository.delete(sample_model.id)
+
+
+def test_bulk_operations_check_all_ids_first(dummy_filesystem_repository: FileSystemRepository):
+    models = [TestModel(id="test1", name="Model 1", count=1), TestModel(id="test2", name="Model 2", count=2)]
+    dummy_filesystem_repository.create_many(models)
+
+    with pytest.raises(ModelNotFoundError):
+        dummy_filesystem_repository.delete_many(["test1", "missing"])
+    assert len(dummy_filesystem_repository.read_many()) == 2
+
+    dummy_filesystem_repository.delete_many(["test1", "test2"])
+    assert dummy_filesystem_repository.read_many() == []
+
+
+def test_mapping_package_round_trip_deduplicates_assets(
+        dummy_mapping_package_filesystem_repository: FileSystemRepository,
+        dummy_mapping_package_model: MappingPackage):
+    repository = dummy_mapping_package_filesystem_repository
+    repository.create(dummy_mapping_package_model)
+    blob_paths = _blob_paths(repository)
+
+    stored_package = repository.read(dummy_mapping_package_model.id)
+    assert stored_package.model_dump() == dummy_mapping_package_model.model_dump()
+    assert blob_paths
+
+    copied_package = dummy_mapping_package_model.model_copy(update={"id": "copied_package"})
+    repository.create(copied_package)
+
+    assert _blob_paths(repository) == blob_paths
+    assert len(repository.read_many({"metadata.identifier": dummy_mapping_package_model.metadata.identifier})) == 2
+
+
+def test_collect_garbage_deletes_unreferenced_blobs(
+        dummy_mapping_package_filesystem_repository: FileSystemRepository,
+        dummy_mapping_package_model: MappingPackage):
+    repository = dummy_mapping_package_filesystem_repository
+    repository.create(dummy_mapping_package_model)
+    blob_count = len(_blob_paths(repository))
+
+    assert repository.collect_garbage(grace_period=0) == 0
+
+    repository.delete(dummy_mapping_package_model.id)
+    assert repository.collect_garbage() == 0
+    assert repository.collect_garbage(grace_period=0) == blob_count
+    assert _blob_paths(repository) == []
+
+
+def test_blobs_collected_while_being_stored_are_rewritten(
+        dummy_mapping_package_filesystem_repository: FileSystemRepository,
+        dummy_mapping_package_model: MappingPackage, monkeypatch: pytest.MonkeyPatch):
+    repository = dummy_mapping_package_filesystem_repository
+    repository.create(dummy_mapping_package_model)
+    repository.delete(dummy_mapping_package_model.id)
+    utime = os.utime
+
+    def collect_garbage_then_utime(path, *args, **kwargs):
+        repository.collect_garbage(grace_period=0)
+        return utime(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "utime", collect_garbage_then_utime)
+    repository.create(dummy_mapping_package_model)
+
+    assert repository.read(dummy_mapping_package_model.id).model_dump() == dummy_mapping_package_model.model_dump()
+
+
+def test_repositories_share_a_root_directory(tmp_path: Path, sample_model: TestModel):
+    FileSystemRepository(model_class=TestModel, root_path=tmp_path).create(sample_model)
+
+    assert FileSystemRepository(model_class=TestModel, root_path=tmp_path).read(sample_model.id) == sample_model
+    assert FileSystemRepository(model_class=TestModel, root_path=tmp_path, collection_name="other").read_many() == []
+    assert os.listdir(tmp_path / "tmp") == []
+
+
+def test_created_model_keeps_its_id_when_changed(dummy_filesystem_repository: FileSystemRepository,
+                                                 sample_model: TestModel):
+    dummy_filesystem_repository.create(sample_model)
+    sample_model.count = 42
+
+    dummy_filesystem_repository.update(sample_model)
+
+    assert dummy_filesystem_repository.read(sample_model.id).count == 42
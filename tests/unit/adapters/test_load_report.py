@@ -0,0 +1,74 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor
+from mapping_suite_sdk.adapters.load_report import (
+    collect_mssdk_load_report,
+    measure_mssdk_load_phase,
+    MappingPackageLoadReport,
+    MSSDK_LOAD_PHASE_EXTRACT,
+    MSSDK_LOAD_PHASE_VALIDATION,
+    MSSDK_LOAD_PHASE_ID_HASHING,
+)
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.services.load_mapping_package import load_mapping_package_from_archive, \
+    load_mapping_package_from_folder
+
+
+def _phases_by_name(report: MappingPackageLoadReport):
+    return {phase.name: phase for phase in report.phases}
+
+
+def test_load_report_of_archive_load(dummy_mapping_package_path: Path):
+    reports = []
+    with collect_mssdk_load_report(callback=reports.append) as recorder:
+        mapping_package = load_mapping_package_from_archive(dummy_mapping_package_path)
+
+    report = recorder.report
+    assert reports == [report]
+    assert report.status == "success"
+    assert report.peak_memory is None
+    phases = _phases_by_name(report)
+    assert [phase.name for phase in report.phases][:2] == [MSSDK_LOAD_PHASE_EXTRACT, "read.metadata"]
+    assert phases[MSSDK_LOAD_PHASE_EXTRACT].runs == 1
+    assert phases[MSSDK_LOAD_PHASE_VALIDATION].runs == 1
+    assert phases[MSSDK_LOAD_PHASE_ID_HASHING].runs > 1
+
+    technical_phase = phases["read.technical_mapping_suite"]
+    assert technical_phase.files_read == len(mapping_package.technical_mapping_suite.files)
+    assert technical_phase.bytes_read > 0
+    assert technical_phase.wall_time > 0
+    assert phases["read.metadata"].files_read == 1
+    assert report.files_read == sum(phase.files_read for phase in report.phases)
+    assert report.wall_time >= phases[MSSDK_LOAD_PHASE_EXTRACT].wall_time
+
+
+def test_load_report_traces_peak_memory(dummy_mapping_package_extracted_path: Path):
+    with collect_mssdk_load_report(trace_memory=True) as recorder:
+        load_mapping_package_from_folder(dummy_mapping_package_extracted_path)
+
+    assert recorder.report.peak_memory > 0
+
+
+def test_load_report_of_failing_load(dummy_mapping_package_path: Path):
+    reports = []
+    with pytest.raises(ValueError):
+        with collect_mssdk_load_report(callback=reports.append):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                ArchivePackageExtractor().extract(dummy_mapping_package_path, Path(temp_dir))
+                raise ValueError("Test error")
+
+    assert reports[0].status == "error"
+    assert _phases_by_name(reports[0])[MSSDK_LOAD_PHASE_EXTRACT].runs == 1
+
+
+def test_no_load_report_outside_collection(dummy_mapping_package_model: MappingPackage):
+    with collect_mssdk_load_report() as recorder:
+        pass
+    with measure_mssdk_load_phase(MSSDK_LOAD_PHASE_VALIDATION):
+        MappingPackage.model_validate(dummy_mapping_package_model.model_dump())
+
+    assert recorder.report.phases == []
+    assert recorder.report.files_read == 0
@@ -0,0 +1,160 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from bson.raw_bson import RawBSONDocument
+from opentelemetry.sdk.metrics import Counter, Histogram
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader, AggregationTemporality
+
+from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor
+from mapping_suite_sdk.adapters.metrics import (
+    add_metric_reader_to_mssdk_meter_provider,
+    is_mssdk_metrics_enabled,
+    measure_mssdk_duration,
+    MongoDBMetricsListener,
+    _MSSDK_METER_PROVIDERS,
+    MSSDK_METRIC_LOAD_DURATION,
+    MSSDK_METRIC_SERIALISE_DURATION,
+    MSSDK_METRIC_EXTRACT_DURATION,
+    MSSDK_METRIC_FILES_READ,
+    MSSDK_METRIC_BYTES_READ,
+    MSSDK_METRIC_FILES_WRITTEN,
+    MSSDK_METRIC_COMPRESSION_RATIO,
+    MSSDK_METRIC_MONGODB_ROUND_TRIPS,
+    MSSDK_METRIC_MONGODB_DOCUMENT_SIZE,
+    MSSDK_METRIC_CACHE_HITS,
+    MSSDK_METRIC_CACHE_MISSES,
+)
+from mapping_suite_sdk.adapters.repository import MongoDBRepository, _to_mongodb_document, _from_mongodb_document
+from mapping_suite_sdk.adapters.serialiser import MappingPackageSerialiser
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.services.load_mapping_package import load_mapping_package_from_archive
+
+# Set up a memory reader to collect the metrics for testing; each collection only holds the new measurements
+metric_reader = InMemoryMetricReader(preferred_temporality={Counter: AggregationTemporality.DELTA,
+                                                            Histogram: AggregationTemporality.DELTA})
+add_metric_reader_to_mssdk_meter_provider(metric_reader)
+
+
+def _collect_data_points():
+    """Collect the data points of the SDK metrics measured since the last collection, by metric name."""
+    data_points = {}
+    metrics_data = metric_reader.get_metrics_data()
+    if metrics_data is None:
+        return data_points
+    for resource_metrics in metrics_data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                data_points.setdefault(metric.name, []).extend(metric.data.data_points)
+    return data_points
+
+
+def _sum_by_attribute(data_points, attribute_name):
+    sums = {}
+    for data_point in data_points:
+        key = data_point.attributes.get(attribute_name)
+        sums[key] = sums.get(key, 0) + data_point.value
+    return sums
+
+
+def test_add_metric_reader_to_mssdk_meter_provider_gets_invalid_value():
+    current_len = len(_MSSDK_METER_PROVIDERS)
+    add_metric_reader_to_mssdk_meter_provider(None)
+    assert len(_MSSDK_METER_PROVIDERS) == current_len
+    assert is_mssdk_metrics_enabled() is True
+
+
+def test_load_and_extract_metrics(dummy_mapping_package_path: Path):
+    _collect_data_points()
+    mapping_package = load_mapping_package_from_archive(dummy_mapping_package_path)
+
+    data_points = _collect_data_points()
+
+    load_durations = data_points[MSSDK_METRIC_LOAD_DURATION]
+    assert sum(data_point.count for data_point in load_durations) == 1
+    assert all(data_point.attributes["status"] == "success" for data_point in load_durations)
+    assert sum(data_point.count for data_point in data_points[MSSDK_METRIC_EXTRACT_DURATION]) >= 1
+    assert any(data_point.attributes["operation"] == "extract"
+               for data_point in data_points[MSSDK_METRIC_COMPRESSION_RATIO])
+
+    files_read = _sum_by_attribute(data_points[MSSDK_METRIC_FILES_READ], "suite")
+    assert files_read["technical_mapping_suite"] == len(mapping_package.technical_mapping_suite.files)
+    assert files_read["metadata"] == 1
+    bytes_read = _sum_by_attribute(data_points[MSSDK_METRIC_BYTES_READ], "suite")
+    assert bytes_read["conceptual_mapping_asset"] == len(mapping_package.conceptual_mapping_asset.content)
+
+
+def test_serialise_metrics(dummy_mapping_package_model: MappingPackage):
+    _collect_data_points()
+    with tempfile.TemporaryDirectory() as temp_directory:
+        MappingPackageSerialiser().serialise(Path(temp_directory), dummy_mapping_package_model)
+        ArchivePackageExtractor().pack_directory(Path(temp_directory), Path(temp_directory) / "output" / "package")
+
+    data_points = _collect_data_points()
+    assert sum(data_point.count for data_point in data_points[MSSDK_METRIC_SERIALISE_DURATION]) >= 1
+    files_written = _sum_by_attribute(data_points[MSSDK_METRIC_FILES_WRITTEN], "suite")
+    assert files_written["vocabulary_mapping_suite"] == len(dummy_mapping_package_model.vocabulary_mapping_suite.files)
+    assert any(data_point.attributes["operation"] == "pack"
+               for data_point in data_points[MSSDK_METRIC_COMPRESSION_RATIO])
+
+
+def test_measure_mssdk_duration_records_errors():
+    _collect_data_points()
+    with pytest.raises(ValueError):
+        with measure_mssdk_duration(MSSDK_METRIC_LOAD_DURATION, {"source": "test"}):
+            raise ValueError("Test error")
+
+    data_points = _collect_data_points()[MSSDK_METRIC_LOAD_DURATION]
+    assert any(data_point.attributes == {"source": "test", "status": "error"} for data_point in data_points)
+
+
+def test_mongodb_repository_metrics(mongo_client, dummy_database_name, sample_model):
+    _collect_data_points()
+    repository = MongoDBRepository(model_class=type(sample_model),
+                                   mongo_client=mongo_client,
+                                   database_name=dummy_database_name)
+    repository.create(sample_model)
+    repository.read(sample_model.id)
+
+    document_sizes = {data_point.attributes["operation"]: data_point
+                      for data_point in _collect_data_points()[MSSDK_METRIC_MONGODB_DOCUMENT_SIZE]}
+    assert document_sizes["write"].count == 1
+    assert document_sizes["read"].sum > 0
+
+
+def test_mongodb_document_sizes_are_taken_from_the_raw_bson(sample_model):
+    _collect_data_points()
+    # As written and read by the drivers supporting raw BSON documents
+    raw_document = _to_mongodb_document(sample_model, raw_bson=True)
+    assert isinstance(raw_document, RawBSONDocument)
+    assert _from_mongodb_document(type(sample_model), raw_document) == sample_model
+
+    document_sizes = {data_point.attributes["operation"]: data_point
+                      for data_point in _collect_data_points()[MSSDK_METRIC_MONGODB_DOCUMENT_SIZE]}
+    assert document_sizes["write"].sum == document_sizes["read"].sum == len(raw_document.raw)
+
+
+def test_mongodb_indexes_cache_metrics(mongo_client):
+    _collect_data_points()
+    # A database of its own, as the indexes ensured by the other tests are cached for equal clients
+    for _ in range(2):
+        MongoDBRepository(model_class=MappingPackage, mongo_client=mongo_client, database_name="metrics_database",
+                          ensure_indexes=True)
+
+    data_points = _collect_data_points()
+    assert _sum_by_attribute(data_points[MSSDK_METRIC_CACHE_MISSES], "cache")["mongodb_indexes"] == 1
+    assert _sum_by_attribute(data_points[MSSDK_METRIC_CACHE_HITS], "cache")["mongodb_indexes"] == 1
+
+
+def test_mongodb_metrics_listener_counts_round_trips():
+    _collect_data_points()
+    listener = MongoDBMetricsListener()
+    listener.succeeded(MagicMock(command_name="find"))
+    listener.succeeded(MagicMock(command_name="find"))
+    listener.failed(MagicMock(command_name="insert"))
+
+    round_trips = {(data_point.attributes["command"], data_point.attributes["status"]): data_point.value
+                   for data_point in _collect_data_points()[MSSDK_METRIC_MONGODB_ROUND_TRIPS]}
+    assert round_trips[("find", "success")] == 2
+    assert round_trips[("insert", "error")] == 1
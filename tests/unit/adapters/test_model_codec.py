@@ -0,0 +1,165 @@
+import struct
+from typing import Any
+
+import pytest
+
+from mapping_suite_sdk.adapters.model_codec import BinaryModelCodec, ModelCodecError, \
+    MSSDK_MODEL_CODEC_COMPRESSION_ZLIB, MSSDK_MODEL_CODEC_COMPRESSION_ZSTD, _get_zstd_codec, _HEADER, _Encoder, \
+    _Decoder
+from mapping_suite_sdk.models.asset import TechnicalMappingSuite
+from mapping_suite_sdk.models.core import CoreModel
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+
+class ValueModel(CoreModel):
+    value: Any = None
+
+
+def _assert_same_model(decoded_model, model):
+    assert decoded_model == model
+    assert decoded_model.id == model.id
+    assert decoded_model.has_content_id() == model.has_content_id()
+    assert decoded_model.model_dump() == model.model_dump()
+
+
+@pytest.mark.parametrize("trust_content_ids", [True, False])
+def test_round_trip(dummy_mapping_package_model: MappingPackage, trust_content_ids: bool):
+    codec = BinaryModelCodec(trust_content_ids=trust_content_ids)
+
+    decoded_package = codec.decode(codec.encode(dummy_mapping_package_model))
+
+    _assert_same_model(decoded_package, dummy_mapping_package_model)
+    _assert_same_model(decoded_package.technical_mapping_suite.files[0],
+                       dummy_mapping_package_model.technical_mapping_suite.files[0])
+    assert decoded_package.conceptual_mapping_asset.content == dummy_mapping_package_model.conceptual_mapping_asset.content
+
+
+def test_round_trip_keeps_explicit_ids(dummy_mapping_package_model: MappingPackage):
+    dummy_mapping_package_model.pin_id()
+    dummy_mapping_package_model.technical_mapping_suite.files[0].id = "explicit_id"
+    codec = BinaryModelCodec()
+
+    decoded_package = codec.decode(codec.encode(dummy_mapping_package_model))
+
+    _assert_same_model(decoded_package, dummy_mapping_package_model)
+    assert decoded_package.technical_mapping_suite.files[0].id == "explicit_id"
+    assert not decoded_package.technical_mapping_suite.files[0].has_content_id()
+
+
+def test_encoding_is_smaller_than_json(dummy_mapping_package_model: MappingPackage):
+    encoded_package = BinaryModelCodec().encode(dummy_mapping_package_model)
+
+    assert len(encoded_package) < len(dummy_mapping_package_model.model_dump_json())
+    assert encoded_package == BinaryModelCodec().encode(dummy_mapping_package_model)
+
+
+def test_zlib_compression(dummy_mapping_package_model: MappingPackage):
+    codec = BinaryModelCodec(compression=MSSDK_MODEL_CODEC_COMPRESSION_ZLIB)
+
+    encoded_package = codec.encode(dummy_mapping_package_model)
+
+    assert len(encoded_package) < len(BinaryModelCodec().encode(dummy_mapping_package_model))
+    # Any codec decodes any compression
+    _assert_same_model(BinaryModelCodec().decode(encoded_package), dummy_mapping_package_model)
+
+
+def test_zstd_compression(dummy_mapping_package_model: MappingPackage):
+    if _get_zstd_codec() is None:
+        with pytest.raises(ValueError):
+            BinaryModelCodec(compression=MSSDK_MODEL_CODEC_COMPRESSION_ZSTD)
+        return
+
+    codec = BinaryModelCodec(compression=MSSDK_MODEL_CODEC_COMPRESSION_ZSTD)
+    _assert_same_model(codec.decode(codec.encode(dummy_mapping_package_model)), dummy_mapping_package_model)
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        BinaryModelCodec(compression="lzma")
+
+
+def test_decode_invalid_data(dummy_mapping_package_model: MappingPackage):
+    codec = BinaryModelCodec()
+    encoded_package = codec.encode(dummy_mapping_package_model)
+
+    with pytest.raises(ModelCodecError):
+        codec.decode(b"not an encoded model")
+    with pytest.raises(ModelCodecError):
+        codec.decode(encoded_package[:-10])
+    corrupted_package = bytearray(encoded_package)
+    corrupted_package[len(corrupted_package) // 2] ^= 0xff
+    with pytest.raises(ModelCodecError):
+        codec.decode(corrupted_package)
+    with pytest.raises(ModelCodecError):
+        BinaryModelCodec(model_class=TechnicalMappingSuite).decode(encoded_package)
+
+
+def test_encoded_body_is_msgpack(dummy_mapping_package_model: MappingPackage):
+    """The body of an uncompressed encoded model is a msgpack array of the model class name and the model."""
+    body = BinaryModelCodec().encode(dummy_mapping_package_model)[_HEADER.size:]
+
+    assert body[0] == 0x92
+    assert body[1:16] == b"\xae" + b"MappingPackage"
+
+
+@pytest.mark.parametrize("value, type_code", [
+    (127, 0x7f), (128, 0xcc), (255, 0xcc), (256, 0xcd), (65535, 0xcd), (65536, 0xce), (2 ** 32 - 1, 0xce),
+    (2 ** 32, 0xcf), (2 ** 64 - 1, 0xcf), (-1, 0xff), (-32, 0xe0), (-33, 0xd0), (-128, 0xd0), (-129, 0xd1),
+    (-2 ** 15 - 1, 0xd2), (-2 ** 31 - 1, 0xd3), (-2 ** 63, 0xd3),
+])
+def test_round_trip_integers(value: int, type_code: int):
+    encoder = _Encoder({})
+    encoder.encode(value)
+    codec = BinaryModelCodec(model_class=ValueModel)
+
+    assert encoder.buffer[0] == type_code
+    assert codec.decode(codec.encode(ValueModel(value=value))).value == value
+
+
+def test_integers_out_of_the_64_bits_range():
+    codec = BinaryModelCodec(model_class=ValueModel)
+
+    for value in (2 ** 64, -2 ** 63 - 1):
+        with pytest.raises(ModelCodecError):
+            codec.encode(ValueModel(value=value))
+
+
+@pytest.mark.parametrize("value", [
+    True, False, 0.0, -0.0, 0.1, -1.5, 1e-310, 1.7976931348623157e308, -2.0 ** 70,
+    "", "x" * 31, "x" * 32, "x" * 255, "x" * 256, "x" * 65535, "x" * 65536, "\u00e9" * 200,
+    b"", b"x" * 255, b"x" * 256, b"x" * 65535, b"x" * 65536,
+    list(range(15)), list(range(16)), list(range(65536)),
+    {f"key_{index}": index for index in range(15)}, {f"key_{index}": index for index in range(16)},
+], ids=lambda value: f"{type(value).__name__}_{len(value) if hasattr(value, '__len__') else value}")
+def test_round_trip_values(value: Any):
+    codec = BinaryModelCodec(model_class=ValueModel)
+
+    decoded_value = codec.decode(codec.encode(ValueModel(value=value))).value
+
+    assert decoded_value == value
+    assert type(decoded_value) is type(value)
+
+
+@pytest.mark.parametrize("key_size", [1, 2, 3, 4, 8, 16, 17, 255, 256, 65535, 65536])
+def test_round_trip_extension_sizes(key_size: int):
+    """Map keys are interned strings, encoded as extensions of the size of their UTF-8 encoding."""
+    codec = BinaryModelCodec(model_class=ValueModel)
+    value = {"k" * key_size: 1, "other": {"k" * key_size: 2}}
+
+    assert codec.decode(codec.encode(ValueModel(value=value))).value == value
+
+
+def test_round_trip_interned_string_references():
+    """References to the interned strings take 1, 2 or 4 bytes, depending on their index; maps of more than
+    65535 keys have a 32 bits size."""
+    codec = BinaryModelCodec(model_class=ValueModel)
+    keys = {f"key_{index}": index for index in range(70000)}
+    value = {"first": keys, "second": keys}
+
+    assert codec.decode(codec.encode(ValueModel(value=value))).value == value
+
+
+def test_decode_msgpack_types_not_written_by_the_encoder():
+    assert _Decoder(memoryview(b"\xca" + struct.pack(">f", 1.5)), trust_content_ids=True).decode() == 1.5
+    with pytest.raises(ModelCodecError):
+        _Decoder(memoryview(b"\xc1"), trust_content_ids=True).decode()
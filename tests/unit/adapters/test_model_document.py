@@ -0,0 +1,45 @@
+import hashlib
+from typing import Dict, Set
+
+import pytest
+
+from mapping_suite_sdk.adapters.model_document import model_to_document, replace_long_strings, \
+    resolve_blob_references, collect_blob_references, get_document_field, matches_filter, MSSDK_BLOB_REFERENCE_KEY
+from mapping_suite_sdk.models.core import CoreModel
+
+
+def test_model_to_document_includes_id(sample_model: CoreModel):
+    document = model_to_document(sample_model)
+
+    assert document["_id"] == sample_model.id
+    assert type(sample_model).model_validate(document) == sample_model
+
+
+def test_blob_references_round_trip():
+    blobs: Dict[str, bytes] = {}
+
+    def store_blob(content: bytes) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        blobs[digest] = content
+        return digest
+
+    document = {"name": "short", "files": [{"content": "x" * 10}, {"content": "x" * 10}], "path": "p"}
+    manifest = replace_long_strings(document, 5, store_blob)
+    referenced_digests: Set[str] = set()
+    collect_blob_references(manifest, referenced_digests)
+
+    assert manifest["name"] == {MSSDK_BLOB_REFERENCE_KEY: hashlib.sha256(b"short").hexdigest()}
+    assert manifest["path"] == "p"
+    assert referenced_digests == set(blobs) and len(blobs) == 2
+    assert resolve_blob_references(manifest, blobs.__getitem__) == document
+    assert get_document_field(manifest, "files.1.content", blobs.__getitem__) == "x" * 10
+    assert get_document_field(manifest, "files.2.content", blobs.__getitem__) is None
+
+
+def test_matches_filter():
+    assert matches_filter("a", "a")
+    assert matches_filter(["a", "b"], "b")
+    assert matches_filter("a", {"$in": ["a", "b"]})
+    assert not matches_filter("a", {"$ne": "a"})
+    with pytest.raises(ValueError):
+        matches_filter("a", {"$gt": "a"})
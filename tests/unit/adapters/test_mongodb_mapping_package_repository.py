@@ -0,0 +1,127 @@
+import asyncio
+
+import mongomock
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from mapping_suite_sdk.adapters.repository import MongoDBMappingPackageRepository, MongoDBRepository, \
+    AsyncMongoDBRepository, get_mongodb_indexes
+from mapping_suite_sdk.models.mapping_package import MappingPackage, MappingPackageMetadata
+from tests.conftest import TestModel
+
+
+def _package_with_version(mapping_package: MappingPackage, identifier: str, mapping_version: str) -> MappingPackage:
+    metadata = mapping_package.metadata.model_copy(update={"identifier": identifier,
+                                                           "mapping_version": mapping_version})
+    return mapping_package.model_copy(update={"id": f"{identifier}_{mapping_version}", "metadata": metadata})
+
+
+@pytest.fixture
+def dummy_mapping_package_repository(mongo_client: mongomock.MongoClient,
+                                     dummy_database_name: str) -> MongoDBMappingPackageRepository:
+    return MongoDBMappingPackageRepository(mongo_client=mongo_client, database_name=dummy_database_name,
+                                           ensure_indexes=True)
+
+
+@pytest.fixture
+def dummy_versioned_packages(dummy_mapping_package_model: MappingPackage):
+    return [
+        _package_with_version(dummy_mapping_package_model, "package_a", "1.9.0"),
+        _package_with_version(dummy_mapping_package_model, "package_a", "1.10.0"),
+        _package_with_version(dummy_mapping_package_model, "package_a", "1.2.0"),
+        _package_with_version(dummy_mapping_package_model, "package_b", "0.1.0"),
+    ]
+
+
+def test_repository_creates_declared_indexes(dummy_mapping_package_repository: MongoDBMappingPackageRepository):
+    index_names = set(dummy_mapping_package_repository.collection.index_information())
+
+    assert {"metadata_identifier_mapping_version", "metadata_mapping_type"} <= index_names
+    assert dummy_mapping_package_repository.ensure_indexes() == ["metadata_identifier_mapping_version",
+                                                                 "metadata_mapping_type"]
+
+
+def test_repository_ensures_indexes_once_per_collection(mongo_client: mongomock.MongoClient,
+                                                        dummy_database_name: str):
+    MongoDBMappingPackageRepository(mongo_client=mongo_client, database_name=dummy_database_name).ensure_indexes()
+    mongo_client[dummy_database_name][MappingPackage.__name__].drop_indexes()
+
+    MongoDBMappingPackageRepository(mongo_client=mongo_client, database_name=dummy_database_name).ensure_indexes()
+
+    assert "metadata_identifier_mapping_version" not in \
+           mongo_client[dummy_database_name][MappingPackage.__name__].index_information()
+
+
+def test_repository_does_not_create_indexes_by_default(mongo_client: mongomock.MongoClient,
+                                                       dummy_database_name: str):
+    repository = MongoDBMappingPackageRepository(mongo_client=mongo_client, database_name=dummy_database_name)
+
+    assert set(repository.collection.index_information()) <= {"_id_"}
+
+
+def test_repository_without_declared_indexes(dummy_mongo_repository: MongoDBRepository):
+    assert get_mongodb_indexes(TestModel) == []
+    assert dummy_mongo_repository.ensure_indexes() == []
+    assert set(dummy_mongo_repository.collection.index_information()) <= {"_id_"}
+
+
+def test_find_by_identifier_and_version(dummy_mapping_package_repository: MongoDBMappingPackageRepository,
+                                        dummy_versioned_packages):
+    dummy_mapping_package_repository.create_many(dummy_versioned_packages)
+
+    result = dummy_mapping_package_repository.find_by_identifier_and_version("package_a", "1.10.0")
+
+    assert result.id == dummy_versioned_packages[1].id
+    assert result.metadata.mapping_version == "1.10.0"
+    assert dummy_mapping_package_repository.find_by_identifier_and_version("package_a", "9.9.9") is None
+
+
+def test_find_latest_versions(dummy_mapping_package_repository: MongoDBMappingPackageRepository,
+                              dummy_versioned_packages):
+    dummy_mapping_package_repository.create_many(dummy_versioned_packages)
+
+    latest_versions = dummy_mapping_package_repository.find_latest_versions()
+
+    assert {identifier: package.metadata.mapping_version for identifier, package in latest_versions.items()} == {
+        "package_a": "1.10.0", "package_b": "0.1.0"}
+    assert dummy_mapping_package_repository.find_latest_version("package_b").id == dummy_versioned_packages[3].id
+    assert dummy_mapping_package_repository.find_latest_version("package_c") is None
+
+
+def test_find_latest_versions_runs_on_the_declared_index(
+        dummy_mapping_package_repository: MongoDBMappingPackageRepository, dummy_versioned_packages, monkeypatch):
+    dummy_mapping_package_repository.create_many(dummy_versioned_packages)
+    collection = dummy_mapping_package_repository.collection
+    pipelines = []
+    aggregate = collection.aggregate
+    monkeypatch.setattr(collection, "aggregate", lambda pipeline: pipelines.append(pipeline) or aggregate(pipeline))
+
+    dummy_mapping_package_repository.find_latest_versions()
+
+    index_keys = next(index_spec.document["key"] for index_spec in get_mongodb_indexes(MappingPackage)
+                      if index_spec.document["name"] == "metadata_identifier_mapping_version")
+    match_stage, sort_stage = pipelines[0][:2]
+    assert list(match_stage["$match"]) == ["metadata.identifier"]
+    assert list(sort_stage["$sort"].items()) == list(index_keys.items())
+
+
+def test_read_many_metadata(dummy_mapping_package_repository: MongoDBMappingPackageRepository,
+                            dummy_versioned_packages):
+    dummy_mapping_package_repository.create_many(dummy_versioned_packages)
+
+    metadata = dummy_mapping_package_repository.read_many_metadata({"metadata.identifier": "package_a"})
+
+    assert all(isinstance(package_metadata, MappingPackageMetadata) for package_metadata in metadata)
+    assert sorted(package_metadata.mapping_version for package_metadata in metadata) == ["1.10.0", "1.2.0", "1.9.0"]
+
+
+def test_async_repository_ensures_declared_indexes(dummy_database_name: str):
+    async def ensure_indexes():
+        repository = AsyncMongoDBRepository(model_class=MappingPackage, mongo_client=AsyncMongoMockClient(),
+                                            database_name=dummy_database_name)
+        index_names = await repository.ensure_indexes()
+        return index_names, set(await repository.collection.index_information())
+
+    index_names, stored_index_names = asyncio.run(ensure_indexes())
+
+    assert set(index_names) <= stored_index_names
@@ -1,8 +1,10 @@
+from unittest import mock
+
 import mongomock
 import pytest
 from pymongo.errors import DuplicateKeyError
 
-from mapping_suite_sdk.adapters.repository import MongoDBRepository, ModelNotFoundError
+from mapping_suite_sdk.adapters.repository import MongoDBRepository, ModelNotFoundError, MongoClientRegistry
 from tests.conftest import TestModel
 
 
@@ -127,3 +129,113 @@ def test_repository_use_custom_collection_name(mongo_client: mongomock.MongoClie
     )
 
     assert repository.collection_name == dummy_collection_name
+
+
+def test_bulk_create_update_and_delete(dummy_mongo_repository: MongoDBRepository):
+    models = [TestModel(id=f"test{i}", name=f"Model {i}", count=i) for i in range(3)]
+    assert dummy_mongo_repository.create_many(models) == models
+    assert len(dummy_mongo_repository.read_many()) == 3
+
+    updated_models = [TestModel(id=model.id, name="Updated", count=model.count) for model in models]
+    dummy_mongo_repository.update_many(updated_models)
+    assert len(dummy_mongo_repository.read_many({"name": "Updated"})) == 3
+
+    with pytest.raises(ModelNotFoundError):
+        dummy_mongo_repository.update_many([TestModel(id="missing", name="Missing")])
+    with pytest.raises(ModelNotFoundError):
+        dummy_mongo_repository.delete_many(["test0", "missing"])
+    assert len(dummy_mongo_repository.read_many()) == 3
+
+    dummy_mongo_repository.delete_many(["test0", "test1"])
+    assert [model.id for model in dummy_mongo_repository.read_many()] == ["test2"]
+
+
+def test_repository_does_not_close_shared_client(mongo_client: mongomock.MongoClient, dummy_database_name: str):
+    with mock.patch.object(mongo_client, "close") as close_mock:
+        with MongoDBRepository(model_class=TestModel,
+                               mongo_client=mongo_client,
+                               database_name=dummy_database_name) as repository:
+            repository.read_many()
+        del repository
+
+        close_mock.assert_not_called()
+
+
+def test_repository_closes_owned_client(mongo_client: mongomock.MongoClient, dummy_database_name: str):
+    with mock.patch.object(mongo_client, "close") as close_mock:
+        with MongoDBRepository(model_class=TestModel,
+                               mongo_client=mongo_client,
+                               database_name=dummy_database_name,
+                               close_client=True):
+            pass
+
+        close_mock.assert_called_once()
+
+
+def test_repository_from_uri_shares_registry_client(dummy_database_name: str):
+    registry = MongoClientRegistry(client_factory=mongomock.MongoClient)
+
+    with MongoDBRepository.from_uri(model_class=TestModel,
+                                    mongo_uri="mongodb://localhost:27017",
+                                    database_name=dummy_database_name,
+                                    mongo_client_registry=registry) as first_repository:
+        first_repository.create(TestModel(id="test1", name="Model 1"))
+    second_repository = MongoDBRepository.from_uri(model_class=TestModel,
+                                                   mongo_uri="mongodb://localhost:27017",
+                                                   database_name=dummy_database_name,
+                                                   mongo_client_registry=registry)
+
+    assert second_repository.client is first_repository.client
+    assert second_repository.read("test1").name == "Model 1"
+    assert registry.get_client("mongodb://other:27017") is not first_repository.client
+
+
+def test_client_registry_closes_clients():
+    registry = MongoClientRegistry(client_factory=lambda mongo_uri, **client_kwargs: mock.MagicMock())
+    client = registry.get_client("mongodb://localhost:27017", maxPoolSize=10)
+
+    assert registry.get_client("mongodb://localhost:27017") is client
+    registry.close_all()
+
+    client.close.assert_called_once()
+    assert registry.get_client("mongodb://localhost:27017") is not client
+
+
+def test_update_sends_only_changed_fields(dummy_mongo_repository: MongoDBRepository, sample_model: TestModel):
+    dummy_mongo_repository.create(sample_model)
+    stored_model = dummy_mongo_repository.read(sample_model.id)
+    stored_model.count = 42
+
+    with mock.patch.object(dummy_mongo_repository.collection, "replace_one") as replace_one, \
+            mock.patch.object(dummy_mongo_repository.collection, "update_one",
+                              wraps=dummy_mongo_repository.collection.update_one) as update_one:
+        dummy_mongo_repository.update(stored_model)
+
+    replace_one.assert_not_called()
+    update_one.assert_called_once_with({"_id": sample_model.id}, {"$set": {"count": 42}})
+    assert dummy_mongo_repository.read(sample_model.id) == stored_model
+    assert not stored_model.is_modified()
+
+
+def test_update_without_changes_checks_existence(dummy_mongo_repository: MongoDBRepository, sample_model: TestModel):
+    dummy_mongo_repository.create(sample_model)
+    dummy_mongo_repository.delete(sample_model.id)
+
+    with pytest.raises(ModelNotFoundError):
+        dummy_mongo_repository.update(sample_model)
+
+
+def test_update_replaces_untracked_models(mongo_client: mongomock.MongoClient, dummy_database_name: str,
+                                         sample_model: TestModel):
+    repository = MongoDBRepository(model_class=TestModel, mongo_client=mongo_client,
+                                   database_name=dummy_database_name, track_changes=False)
+    repository.create(sample_model)
+    stored_model = repository.read(sample_model.id)
+    stored_model.count = 42
+
+    assert stored_model.get_changes() is None
+    with mock.patch.object(repository.collection, "update_one") as update_one:
+        repository.update(stored_model)
+
+    update_one.assert_not_called()
+    assert repository.read(sample_model.id).count == 42
@@ -0,0 +1,178 @@
+import cProfile
+import os
+import pstats
+from pathlib import Path
+
+import pytest
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from mapping_suite_sdk.adapters.profiler import (
+    set_mssdk_profiling,
+    get_mssdk_profiling,
+    refresh_mssdk_profiling,
+    profiled_call,
+    _MSSDK_PROFILE_VAR_NAME,
+    _MSSDK_PROFILE_FOLDER_VAR_NAME,
+    _MSSDK_PROFILING_STATE,
+    MSSDK_PROFILER_CPROFILE,
+    MSSDK_PROFILER_TRACEMALLOC,
+    MSSDK_PROFILING_MIN_INTERVAL,
+)
+from mapping_suite_sdk.adapters.tracer import set_mssdk_tracing, traced_routine, _get_mssdk_tracer_provider
+from mapping_suite_sdk.services.load_mapping_package import load_mapping_package_from_archive
+
+memory_exporter = InMemorySpanExporter()
+_get_mssdk_tracer_provider().add_span_processor(SimpleSpanProcessor(memory_exporter))
+
+
+@traced_routine
+def _allocate(size: int) -> bytes:
+    return bytes(size)
+
+
+@traced_routine
+def _allocate_twice(size: int) -> int:
+    return len(_allocate(size)) + len(_allocate(size))
+
+
+@pytest.fixture(autouse=True)
+def restore_profiling_settings(monkeypatch: pytest.MonkeyPatch):
+    """Restore the profiling environment variables and output folder set by the tests."""
+    var_names = (_MSSDK_PROFILE_VAR_NAME, _MSSDK_PROFILE_FOLDER_VAR_NAME)
+    previous_values = {var_name: os.environ.get(var_name) for var_name in var_names}
+    monkeypatch.setattr(_MSSDK_PROFILING_STATE, "output_folder_path", _MSSDK_PROFILING_STATE.output_folder_path)
+    yield
+    for var_name, previous_value in previous_values.items():
+        if previous_value is None:
+            os.environ.pop(var_name, None)
+        else:
+            os.environ[var_name] = previous_value
+
+
+@pytest.fixture
+def profile_folder_path(tmp_path: Path):
+    """Enable profiling of every call into a temporary folder, and disable it afterwards."""
+    set_mssdk_profiling(True, profilers=[MSSDK_PROFILER_CPROFILE], output_folder_path=tmp_path, min_interval=0)
+    yield tmp_path
+    set_mssdk_profiling(False, profilers=[MSSDK_PROFILER_CPROFILE], min_interval=MSSDK_PROFILING_MIN_INTERVAL)
+    set_mssdk_tracing(False)
+    memory_exporter.clear()
+
+
+def test_set_mssdk_profiling():
+    set_mssdk_profiling(True)
+    assert os.environ[_MSSDK_PROFILE_VAR_NAME] == "true"
+    assert get_mssdk_profiling() is True
+
+    set_mssdk_profiling(False)
+    assert os.environ[_MSSDK_PROFILE_VAR_NAME] == "false"
+    assert get_mssdk_profiling() is False
+
+
+def test_refresh_mssdk_profiling():
+    os.environ[_MSSDK_PROFILE_VAR_NAME] = "TRUE"
+    refresh_mssdk_profiling()
+    assert get_mssdk_profiling() is True
+
+    os.environ[_MSSDK_PROFILE_VAR_NAME] = "false"
+    refresh_mssdk_profiling()
+    assert get_mssdk_profiling() is False
+
+
+def test_set_mssdk_profiling_rejects_unknown_profilers():
+    with pytest.raises(ValueError):
+        set_mssdk_profiling(True, profilers=["perf"])
+    with pytest.raises(ValueError):
+        set_mssdk_profiling(True, profilers=[])
+    assert _MSSDK_PROFILING_STATE.profilers == (MSSDK_PROFILER_CPROFILE,)
+    set_mssdk_profiling(False)
+
+
+def test_profiling_disabled_writes_nothing(tmp_path: Path):
+    set_mssdk_profiling(False, output_folder_path=tmp_path, min_interval=0)
+    _allocate(10)
+    assert list(tmp_path.iterdir()) == []
+    set_mssdk_profiling(False, min_interval=MSSDK_PROFILING_MIN_INTERVAL)
+
+
+def test_cprofile_profiles_outermost_call_only(profile_folder_path: Path):
+    assert _allocate_twice(10) == 20
+
+    profile_files = list(profile_folder_path.glob("*.pstats"))
+    assert len(profile_files) == 1
+    assert profile_files[0].name.startswith(f"{__name__}._allocate_twice-")
+    profiled_functions = {function_name for _, _, function_name in pstats.Stats(str(profile_files[0])).stats}
+    assert "_allocate" in profiled_functions
+
+
+def test_profiling_is_rate_limited(profile_folder_path: Path):
+    set_mssdk_profiling(True, min_interval=3600)
+    for _ in range(3):
+        _allocate(10)
+    _allocate_twice(10)
+
+    assert len(list(profile_folder_path.glob("*._allocate-*.pstats"))) == 1
+    assert len(list(profile_folder_path.glob("*._allocate_twice-*.pstats"))) == 1
+
+
+def test_tracemalloc_report_and_span_attributes(profile_folder_path: Path):
+    set_mssdk_profiling(True, profilers=[MSSDK_PROFILER_CPROFILE, MSSDK_PROFILER_TRACEMALLOC], top_n=5)
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+
+    _allocate(1_000_000)
+
+    span = next(span for span in memory_exporter.get_finished_spans() if span.name.endswith("._allocate"))
+    assert span.attributes["profile.cprofile.function_calls"] >= 1
+    assert span.attributes["profile.cprofile.total_time_ms"] >= 0
+    assert span.attributes["profile.tracemalloc.peak_bytes"] >= 1_000_000
+    assert Path(span.attributes["profile.cprofile.path"]).exists()
+
+    report = Path(span.attributes["profile.tracemalloc.path"]).read_text()
+    assert report.startswith(f"Operation: {__name__}._allocate\n")
+    assert "Top 5 allocation sites:" in report
+
+
+def test_profiled_call_profiles_failing_calls(profile_folder_path: Path):
+    with pytest.raises(ValueError):
+        with profiled_call("failing_operation"):
+            raise ValueError("Test error")
+
+    assert len(list(profile_folder_path.glob("failing_operation-*.pstats"))) == 1
+    # The profiler lock was released, so the next call is profiled
+    with profiled_call("next_operation"):
+        pass
+    assert len(list(profile_folder_path.glob("next_operation-*.pstats"))) == 1
+
+
+def test_profiled_call_runs_when_another_profiler_is_active(profile_folder_path: Path, monkeypatch):
+    class _ActiveProfile(cProfile.Profile):
+        def enable(self, *args, **kwargs):
+            # As Profile.enable does since Python 3.12 when another profiler is active
+            raise ValueError("Another profiling tool is already active")
+
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cProfile, "Profile", _ActiveProfile)
+        assert _allocate(10) == bytes(10)
+
+    span = next(span for span in memory_exporter.get_finished_spans() if span.name.endswith("._allocate"))
+    assert span.attributes["function.status"] == "success"
+    assert span.attributes["profile.error"] == "Another profiling tool is already active"
+    assert list(profile_folder_path.glob("*.pstats")) == []
+    # The profiler lock was released, so the next call is profiled
+    _allocate(10)
+    assert len(list(profile_folder_path.glob("*.pstats"))) == 1
+
+
+def test_profile_package_load(profile_folder_path: Path, dummy_mapping_package_path: Path):
+    load_mapping_package_from_archive(dummy_mapping_package_path)
+
+    profile_files = list(profile_folder_path.glob("*.pstats"))
+    assert [profile_file.name.split("-")[0] for profile_file in profile_files] == [
+        "mapping_suite_sdk.services.load_mapping_package.load_mapping_package_from_archive"]
+    profiled_functions = {function_name for _, _, function_name in pstats.Stats(str(profile_files[0])).stats}
+    assert "load" in profiled_functions
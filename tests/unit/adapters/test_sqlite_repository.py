@@ -0,0 +1,173 @@
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from mapping_suite_sdk.adapters.repository import ModelNotFoundError, ModelAlreadyExistsError
+from mapping_suite_sdk.adapters.sqlite_repository import SQLiteRepository
+from mapping_suite_sdk.models.mapping_package import MappingPackage, MappingPackageEligibilityConstraints
+from tests.conftest import TestModel
+
+
+def _package_with_constraints(mapping_package: MappingPackage, identifier: str, mapping_version: str,
+                              eforms_subtypes: List[str]) -> MappingPackage:
+    metadata = mapping_package.metadata.model_copy(
+        update={"identifier": identifier, "mapping_version": mapping_version,
+                "eligibility_constraints": MappingPackageEligibilityConstraints(
+                    constraints={"eforms_subtype": eforms_subtypes, "eforms_sdk_versions": ["1.9"]})})
+    return mapping_package.model_copy(update={"id": f"{identifier}_{mapping_version}", "metadata": metadata})
+
+
+@pytest.fixture
+def dummy_sqlite_repository(tmp_path: Path) -> SQLiteRepository:
+    with SQLiteRepository(model_class=TestModel, database_path=tmp_path / "repository.db") as repository:
+        yield repository
+
+
+@pytest.fixture
+def dummy_mapping_package_sqlite_repository(tmp_path: Path) -> SQLiteRepository:
+    with SQLiteRepository(model_class=MappingPackage, database_path=tmp_path / "repository.db") as repository:
+        yield repository
+
+
+@pytest.fixture
+def dummy_sqlite_packages(dummy_mapping_package_model: MappingPackage) -> List[MappingPackage]:
+    return [_package_with_constraints(dummy_mapping_package_model, "package_a", "1.0.0", ["16", "29"]),
+            _package_with_constraints(dummy_mapping_package_model, "package_a", "1.1.0", ["29"]),
+            _package_with_constraints(dummy_mapping_package_model, "package_b", "1.0.0", ["30"])]
+
+
+def _ids(models) -> set:
+    return {model.id for model in models}
+
+
+def test_create_read_update_delete(dummy_sqlite_repository: SQLiteRepository, sample_model: TestModel,
+                                   updated_sample_model: TestModel):
+    dummy_sqlite_repository.create(sample_model)
+    with pytest.raises(ModelAlreadyExistsError):
+        dummy_sqlite_repository.create(sample_model)
+    assert dummy_sqlite_repository.read(sample_model.id) == sample_model
+
+    dummy_sqlite_repository.update(updated_sample_model)
+    assert dummy_sqlite_repository.read(sample_model.id) == updated_sample_model
+
+    dummy_sqlite_repository.delete(sample_model.id)
+    with pytest.raises(ModelNotFoundError):
+        dummy_sqlite_repository.read(sample_model.id)
+    with pytest.raises(ModelNotFoundError):
+        dummy_sqlite_repository.update(sample_model)
+    with pytest.raises(ModelNotFoundError):
+        dummy_sqlite_repository.delete(sample_model.id)
+
+
+def test_read_many_filters_on_manifests_without_indexed_fields(dummy_sqlite_repository: SQLiteRepository):
+    dummy_sqlite_repository.create_many([TestModel(id="test1", name="Model 1", count=1),
+                                         TestModel(id="test2", name="Model 2", count=2)])
+
+    assert _ids(dummy_sqlite_repository.read_many()) == {"test1", "test2"}
+    assert _ids(dummy_sqlite_repository.read_many({"name": "Model 2"})) == {"test2"}
+    assert _ids(dummy_sqlite_repository.read_many({"_id": "test1"})) == {"test1"}
+
+
+def test_bulk_operations_are_atomic(dummy_sqlite_repository: SQLiteRepository):
+    models = [TestModel(id="test1", name="Model 1", count=1), TestModel(id="test2", name="Model 2", count=2)]
+    dummy_sqlite_repository.create_many(models)
+
+    with pytest.raises(ModelAlreadyExistsError):
+        dummy_sqlite_repository.create_many([TestModel(id="test3", name="Model 3", count=3), models[0]])
+    with pytest.raises(ModelNotFoundError):
+        dummy_sqlite_repository.delete_many(["test1", "missing"])
+
+    assert _ids(dummy_sqlite_repository.read_many()) == {"test1", "test2"}
+    dummy_sqlite_repository.delete_many(["test1", "test2"])
+    assert dummy_sqlite_repository.read_many() == []
+
+
+def test_read_many_translates_indexed_filters(dummy_mapping_package_sqlite_repository: SQLiteRepository,
+                                              dummy_sqlite_packages: List[MappingPackage]):
+    repository = dummy_mapping_package_sqlite_repository
+    repository.create_many(dummy_sqlite_packages)
+
+    assert _ids(repository.read_many({"metadata.identifier": "package_a"})) == {"package_a_1.0.0", "package_a_1.1.0"}
+    assert _ids(repository.read_many({"metadata.metadata_constraints.constraints.eforms_subtype": "29"})) == {
+        "package_a_1.0.0", "package_a_1.1.0"}
+    assert _ids(repository.read_many({"metadata.metadata_constraints.constraints.eforms_subtype": {"$in": ["16", "30"]},
+                                      "metadata.mapping_version": "1.0.0"})) == {"package_a_1.0.0", "package_b_1.0.0"}
+    assert _ids(repository.read_many({"metadata.identifier": {"$ne": "package_a"}})) == {"package_b_1.0.0"}
+    with pytest.raises(ValueError):
+        repository.read_many({"metadata.identifier": {"$regex": "package"}})
+
+
+def test_list_indexed_fields(dummy_mapping_package_sqlite_repository: SQLiteRepository,
+                             dummy_sqlite_packages: List[MappingPackage]):
+    repository = dummy_mapping_package_sqlite_repository
+    repository.create_many(dummy_sqlite_packages)
+
+    entries = repository.list_indexed_fields({"metadata.identifier": "package_a"})
+
+    assert sorted((entry["mapping_version"], entry["eforms_subtype"]) for entry in entries) == [
+        ("1.0.0", ["16", "29"]), ("1.1.0", ["29"])]
+    with pytest.raises(ValueError):
+        repository.list_indexed_fields({"metadata.mapping_suite_hash_digest": "digest"})
+
+
+def test_assets_are_stored_once_and_deleted_with_last_reference(
+        dummy_mapping_package_sqlite_repository: SQLiteRepository, dummy_sqlite_packages: List[MappingPackage]):
+    repository = dummy_mapping_package_sqlite_repository
+    repository.create(dummy_sqlite_packages[0])
+    blob_count = repository.connection.execute(f'SELECT COUNT(*) FROM "{repository.blobs_table_name}"').fetchone()[0]
+
+    repository.create(dummy_sqlite_packages[1])
+    assert repository.read(dummy_sqlite_packages[1].id).model_dump() == dummy_sqlite_packages[1].model_dump()
+    assert repository.connection.execute(
+        f'SELECT COUNT(*) FROM "{repository.blobs_table_name}"').fetchone()[0] == blob_count
+
+    repository.delete(dummy_sqlite_packages[0].id)
+    assert repository.connection.execute(
+        f'SELECT COUNT(*) FROM "{repository.blobs_table_name}"').fetchone()[0] == blob_count
+    repository.delete(dummy_sqlite_packages[1].id)
+    assert repository.connection.execute(
+        f'SELECT COUNT(*) FROM "{repository.blobs_table_name}"').fetchone()[0] == 0
+
+
+def test_update_only_writes_the_blobs_of_changed_assets(
+        dummy_mapping_package_sqlite_repository: SQLiteRepository, dummy_sqlite_packages: List[MappingPackage]):
+    repository = dummy_mapping_package_sqlite_repository
+    mapping_package = dummy_sqlite_packages[0]
+    repository.create(mapping_package)
+
+    blob_count = repository.connection.execute(f'SELECT COUNT(*) FROM "{repository.blobs_table_name}"').fetchone()[0]
+    changed_asset = mapping_package.test_data_suites[0].files[0]
+    changed_asset.content = "changed " * repository.blob_min_size
+    statements = []
+    repository.connection.set_trace_callback(statements.append)
+    repository.update(mapping_package)
+    repository.connection.set_trace_callback(None)
+
+    assert len([statement for statement in statements if repository.blobs_table_name in statement
+                and statement.startswith("INSERT")]) == 1
+    assert repository.connection.execute(
+        f'SELECT COUNT(*) FROM "{repository.blobs_table_name}"').fetchone()[0] == blob_count
+    assert repository.read(mapping_package.id).model_dump() == mapping_package.model_dump()
+    assert repository.read_many({"metadata.identifier": "package_a"})[0].id == mapping_package.id
+
+
+def test_in_memory_databases_are_rejected():
+    with pytest.raises(ValueError):
+        SQLiteRepository(model_class=TestModel, database_path=":memory:")
+
+
+def test_repository_is_usable_from_several_threads(dummy_sqlite_repository: SQLiteRepository):
+    def create_models(thread_index: int) -> None:
+        for model_index in range(10):
+            dummy_sqlite_repository.create(TestModel(id=f"test_{thread_index}_{model_index}", name="Model",
+                                                     count=model_index))
+
+    threads = [threading.Thread(target=create_models, args=(thread_index,)) for thread_index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(dummy_sqlite_repository.read_many({"name": "Model"})) == 40
@@ -1,4 +1,8 @@
+import asyncio
 import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
 
 import pytest
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
@@ -8,17 +12,28 @@ from mapping_suite_sdk.adapters.tracer import (
     set_mssdk_tracing,
     get_mssdk_tracing,
     is_mssdk_tracing_enabled,
+    refresh_mssdk_tracing,
+    set_mssdk_tracing_sample_ratio,
+    get_mssdk_tracing_sample_ratio,
+    set_mssdk_traced_names,
+    get_mssdk_traced_names,
+    set_mssdk_file_span_threshold,
+    get_mssdk_file_span_threshold,
+    read_traced_file_text,
     traced_routine,
     traced_class,
     _MSSDK_TRACE_VAR_NAME,
-    _MSSDK_TRACER_PROVIDER,
+    _get_mssdk_tracer_provider,
     add_span_processor_to_mssdk_tracer_provider,
 )
+from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor
+from mapping_suite_sdk.adapters.loader import MappingPackageLoader
+from mapping_suite_sdk.adapters.serialiser import MappingPackageSerialiser
 
 # Set up a memory exporter to capture spans for testing
 memory_exporter = InMemorySpanExporter()
 span_processor = SimpleSpanProcessor(memory_exporter)
-_MSSDK_TRACER_PROVIDER.add_span_processor(span_processor)
+_get_mssdk_tracer_provider().add_span_processor(span_processor)
 
 def test_set_mssdk_tracing():
     """Test setting the trace state via environment variable."""
@@ -35,39 +50,67 @@ def test_get_mssdk_tracing():
     """Test getting the trace state."""
     # Test with ON state
     os.environ[_MSSDK_TRACE_VAR_NAME] = "true"
+    refresh_mssdk_tracing()
     assert get_mssdk_tracing() == True
 
     # Test with OFF state
     os.environ[_MSSDK_TRACE_VAR_NAME] = "false"
+    refresh_mssdk_tracing()
     assert get_mssdk_tracing() == False
 
     # Test default state (when environment variable isn't set)
     if _MSSDK_TRACE_VAR_NAME in os.environ:
         del os.environ[_MSSDK_TRACE_VAR_NAME]
+    refresh_mssdk_tracing()
     assert get_mssdk_tracing() == False
 
 
 def test_add_span_processor_to_mssdk_tracer_provider_gets_invalid_value():
-    current_len = len(_MSSDK_TRACER_PROVIDER._active_span_processor._span_processors)
+    current_len = len(_get_mssdk_tracer_provider()._active_span_processor._span_processors)
     add_span_processor_to_mssdk_tracer_provider(None)
-    assert len(_MSSDK_TRACER_PROVIDER._active_span_processor._span_processors) == current_len
+    assert len(_get_mssdk_tracer_provider()._active_span_processor._span_processors) == current_len
 
 
 def test_add_span_processor_to_mssdk_tracer_provider_gets_valid_value():
-    current_len = len(_MSSDK_TRACER_PROVIDER._active_span_processor._span_processors)
+    current_len = len(_get_mssdk_tracer_provider()._active_span_processor._span_processors)
     _memory_exporter = InMemorySpanExporter()
     add_span_processor_to_mssdk_tracer_provider(SimpleSpanProcessor(_memory_exporter))
-    assert len(_MSSDK_TRACER_PROVIDER._active_span_processor._span_processors) == current_len + 1
+    assert len(_get_mssdk_tracer_provider()._active_span_processor._span_processors) == current_len + 1
+
+
+def test_mssdk_tracer_provider_records_spans_when_a_global_provider_is_already_set(monkeypatch):
+    """Test that the SDK spans go to the SDK provider, even if the application set its own global provider first."""
+    from mapping_suite_sdk.adapters import tracer
+
+    # The global tracer provider is already set by the module setup, as an application would do
+    monkeypatch.setattr(tracer, "_MSSDK_TRACER_PROVIDER", None)
+    monkeypatch.setattr(tracer, "_MSSDK_TRACER", None)
+    _memory_exporter = InMemorySpanExporter()
+    add_span_processor_to_mssdk_tracer_provider(SimpleSpanProcessor(_memory_exporter))
+    set_mssdk_tracing(True)
+
+    @traced_routine
+    def test_func():
+        return 1
+
+    try:
+        assert test_func() == 1
+        assert [span.name for span in _memory_exporter.get_finished_spans()] == [
+            f"{test_func.__module__}.test_func"]
+    finally:
+        set_mssdk_tracing(False)
 
 
 def test_is_mssdk_tracing_enabled():
     """Test checking if tracing is enabled."""
     # Test with ON state
     os.environ[_MSSDK_TRACE_VAR_NAME] = "true"
+    refresh_mssdk_tracing()
     assert is_mssdk_tracing_enabled() is True
 
     # Test with OFF state
     os.environ[_MSSDK_TRACE_VAR_NAME] = "false"
+    refresh_mssdk_tracing()
     assert is_mssdk_tracing_enabled() is False
 
 
@@ -75,6 +118,7 @@ def test_traced_routine_with_tracing_enabled():
     """Test traced_routine decorator when tracing is enabled."""
     # Set tracing to enabled
     os.environ[_MSSDK_TRACE_VAR_NAME] = "true"
+    refresh_mssdk_tracing()
     memory_exporter.clear()
 
     # Define a test function
@@ -104,6 +148,7 @@ def test_traced_routine_with_tracing_disabled():
     """Test traced_routine decorator when tracing is disabled."""
     # Set tracing to disabled
     os.environ[_MSSDK_TRACE_VAR_NAME] = "false"
+    refresh_mssdk_tracing()
     memory_exporter.clear()
 
     # Define a test function
@@ -126,6 +171,7 @@ def test_traced_routine_with_exception():
     """Test traced_routine decorator when function raises an exception."""
     # Set tracing to enabled
     os.environ[_MSSDK_TRACE_VAR_NAME] = "true"
+    refresh_mssdk_tracing()
     memory_exporter.clear()
 
     # Define a test function that raises an exception
@@ -155,6 +201,7 @@ def test_traced_class_decorator():
     """Test traced_class decorator."""
     # Set tracing to enabled
     os.environ[_MSSDK_TRACE_VAR_NAME] = "true"
+    refresh_mssdk_tracing()
     memory_exporter.clear()
 
     # Define a test class
@@ -204,6 +251,7 @@ def test_traced_class_with_tracing_disabled():
     """Test traced_class decorator when tracing is disabled."""
     # Set tracing to disabled
     os.environ[_MSSDK_TRACE_VAR_NAME] = "false"
+    refresh_mssdk_tracing()
     memory_exporter.clear()
 
     # Define a test class
@@ -221,3 +269,407 @@ def test_traced_class_with_tracing_disabled():
     # Verify no span was created
     spans = memory_exporter.get_finished_spans()
     assert len(spans) == 0
+
+
+def test_tracing_state_is_resolved_once():
+    """Test that changing the environment variable directly needs a refresh to take effect."""
+    set_mssdk_tracing(False)
+    os.environ[_MSSDK_TRACE_VAR_NAME] = "true"
+    assert get_mssdk_tracing() is False
+
+    refresh_mssdk_tracing()
+    assert get_mssdk_tracing() is True
+
+    set_mssdk_tracing(False)
+    assert is_mssdk_tracing_enabled() is False
+
+
+def test_traced_routine_does_not_record_arguments():
+    """Test that the arguments of traced calls are not stringified into span attributes."""
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+
+    @traced_routine
+    def test_func(arg):
+        return arg
+
+    test_func({"large": "x" * 10000})
+
+    span = memory_exporter.get_finished_spans()[0]
+    assert "function.args" not in span.attributes
+    assert span.attributes.get("function.args_count") == 1
+    set_mssdk_tracing(False)
+
+
+def test_traced_routine_truncates_error_messages():
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+
+    @traced_routine
+    def test_func():
+        raise ValueError("x" * 10000)
+
+    with pytest.raises(ValueError):
+        test_func()
+
+    span = memory_exporter.get_finished_spans()[0]
+    assert len(span.attributes.get("error.message")) < 10000
+    assert len([event for event in span.events if event.name == "exception"]) == 1
+    set_mssdk_tracing(False)
+
+
+def test_set_mssdk_tracing_sample_ratio():
+    set_mssdk_tracing_sample_ratio(0.25)
+    assert get_mssdk_tracing_sample_ratio() == 0.25
+
+    with pytest.raises(ValueError):
+        set_mssdk_tracing_sample_ratio(1.5)
+    assert get_mssdk_tracing_sample_ratio() == 0.25
+
+    set_mssdk_tracing_sample_ratio(1)
+    assert get_mssdk_tracing_sample_ratio() == 1.0
+
+
+def test_sampling_decision_applies_to_the_whole_call_tree():
+    """Test that nested traced calls follow the sampling decision of the outermost call."""
+    set_mssdk_tracing(True)
+
+    @traced_routine
+    def inner():
+        return 1
+
+    @traced_routine
+    def outer():
+        return inner() + inner()
+
+    try:
+        set_mssdk_tracing_sample_ratio(0)
+        memory_exporter.clear()
+        assert outer() == 2
+        assert len(memory_exporter.get_finished_spans()) == 0
+
+        set_mssdk_tracing_sample_ratio(0.5)
+        memory_exporter.clear()
+        for _ in range(50):
+            outer()
+        span_count = len(memory_exporter.get_finished_spans())
+        assert span_count % 3 == 0
+        assert 0 < span_count < 150
+    finally:
+        set_mssdk_tracing_sample_ratio(1)
+        set_mssdk_tracing(False)
+
+
+def test_set_mssdk_traced_names():
+    """Test that tracing can be restricted to classes, methods and modules."""
+    set_mssdk_tracing(True)
+
+    @traced_class
+    class TracedClass:
+        def method1(self):
+            return 1
+
+        def method2(self):
+            return 2
+
+    @traced_class
+    class OtherClass:
+        def method1(self):
+            return 1
+
+    try:
+        set_mssdk_traced_names(["TracedClass.method1", "OtherClass"])
+        assert get_mssdk_traced_names() == ["TracedClass.method1", "OtherClass"]
+        memory_exporter.clear()
+        TracedClass().method1()
+        TracedClass().method2()
+        OtherClass().method1()
+        assert sorted(span.name for span in memory_exporter.get_finished_spans()) == ["OtherClass.method1",
+                                                                                      "TracedClass.method1"]
+
+        set_mssdk_traced_names(["Traced"])
+        memory_exporter.clear()
+        TracedClass().method1()
+        assert len(memory_exporter.get_finished_spans()) == 0
+    finally:
+        set_mssdk_traced_names(None)
+        set_mssdk_tracing(False)
+
+    assert get_mssdk_traced_names() is None
+
+
+def test_sub_loaders_and_files_are_traced(dummy_mapping_package_extracted_path: Path):
+    """Test that the sub-loaders get child spans, and the files above the threshold file spans."""
+    set_mssdk_tracing(True)
+    try:
+        set_mssdk_file_span_threshold(0)
+        assert get_mssdk_file_span_threshold() == 0
+        memory_exporter.clear()
+        mapping_package = MappingPackageLoader().load(dummy_mapping_package_extracted_path)
+
+        spans = memory_exporter.get_finished_spans()
+        load_span = next(span for span in spans if span.name == "MappingPackageLoader.load")
+        technical_mapping_span = next(span for span in spans if span.name == "TechnicalMappingSuiteLoader.load")
+        assert technical_mapping_span.parent.span_id == load_span.context.span_id
+
+        file_spans = {span.attributes["file.path"]: span for span in spans if span.name == "read_file"}
+        tm_file = mapping_package.technical_mapping_suite.files[0]
+        tm_file_span = file_spans[str(tm_file.path)]
+        assert tm_file_span.parent.span_id == technical_mapping_span.context.span_id
+        assert tm_file_span.attributes["file.size"] == len(tm_file.content.encode())
+        assert tm_file_span.attributes["file.decode_duration_ms"] >= 0
+        assert "metadata.json" in file_spans
+
+        set_mssdk_file_span_threshold(1024 * 1024 * 1024)
+        memory_exporter.clear()
+        MappingPackageLoader().load(dummy_mapping_package_extracted_path)
+        assert not [span for span in memory_exporter.get_finished_spans() if span.name == "read_file"]
+    finally:
+        set_mssdk_file_span_threshold(None)
+        set_mssdk_tracing(False)
+
+    assert get_mssdk_file_span_threshold() is None
+
+
+def test_sub_serialisers_and_files_are_traced(dummy_mapping_package_model):
+    set_mssdk_tracing(True)
+    try:
+        set_mssdk_file_span_threshold(0)
+        memory_exporter.clear()
+        with tempfile.TemporaryDirectory() as temp_directory:
+            MappingPackageSerialiser().serialise(Path(temp_directory), dummy_mapping_package_model)
+
+        spans = memory_exporter.get_finished_spans()
+        span_names = {span.name for span in spans}
+        assert {"MappingPackageSerialiser.serialise", "TestDataSuitesSerialiser.serialise",
+                "ConceptualMappingFileSerialiser.serialise"} <= span_names
+        file_spans = [span for span in spans if span.name == "write_file"]
+        assert any(span.attributes["file.path"] == "metadata.json" for span in file_spans)
+        assert all("file.encode_duration_ms" in span.attributes for span in file_spans)
+    finally:
+        set_mssdk_file_span_threshold(None)
+        set_mssdk_tracing(False)
+
+
+def test_set_mssdk_file_span_threshold_rejects_negative_values():
+    with pytest.raises(ValueError):
+        set_mssdk_file_span_threshold(-1)
+    assert get_mssdk_file_span_threshold() is None
+
+
+def test_read_traced_file_text_decodes_like_read_text():
+    set_mssdk_tracing(True)
+
+    @traced_routine
+    def read_file(file_path):
+        return read_traced_file_text(file_path)
+
+    try:
+        set_mssdk_file_span_threshold(0)
+        with tempfile.TemporaryDirectory() as temp_directory:
+            file_path = Path(temp_directory) / "file.txt"
+            file_path.write_bytes("line 1\r\nline 2\rline 3 \u00e9\n".encode())
+            assert read_file(file_path) == file_path.read_text()
+    finally:
+        set_mssdk_file_span_threshold(None)
+        set_mssdk_tracing(False)
+
+
+def _span_by_name(spans, name):
+    return next(span for span in spans if span.name.endswith(name))
+
+
+def test_traced_generator_span_covers_the_iteration():
+    """Test that the span of a generator lasts until it is exhausted, with the calls it makes as children."""
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+
+    @traced_routine
+    def inner(value):
+        return value
+
+    @traced_routine
+    def consumer_call():
+        return None
+
+    @traced_routine
+    def generate(count):
+        for index in range(count):
+            yield inner(index)
+        return "done"
+
+    try:
+        generator = generate(3)
+        assert memory_exporter.get_finished_spans() == ()
+        items = []
+        for item in generator:
+            consumer_call()
+            items.append(item)
+        assert items == [0, 1, 2]
+
+        spans = memory_exporter.get_finished_spans()
+        generator_span = _span_by_name(spans, ".generate")
+        inner_spans = [span for span in spans if span.name.endswith(".inner")]
+        assert len(inner_spans) == 3
+        assert all(span.parent.span_id == generator_span.context.span_id for span in inner_spans)
+        assert _span_by_name(spans, ".consumer_call").parent is None
+        assert generator_span.end_time >= max(span.end_time for span in inner_spans)
+        assert generator_span.attributes["function.status"] == "success"
+    finally:
+        set_mssdk_tracing(False)
+
+
+def test_traced_generator_closed_or_failing():
+    set_mssdk_tracing(True)
+
+    @traced_routine
+    def generate():
+        yield 1
+        raise ValueError("Test generator error")
+
+    try:
+        memory_exporter.clear()
+        generator = generate()
+        assert next(generator) == 1
+        generator.close()
+        assert _span_by_name(memory_exporter.get_finished_spans(), ".generate").attributes[
+                   "function.status"] == "closed"
+
+        memory_exporter.clear()
+        with pytest.raises(ValueError):
+            list(generate())
+        span = _span_by_name(memory_exporter.get_finished_spans(), ".generate")
+        assert span.attributes["function.status"] == "error"
+        assert span.attributes["error.type"] == "ValueError"
+    finally:
+        set_mssdk_tracing(False)
+
+
+def test_traced_context_manager_span_covers_the_with_statement():
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+
+    @traced_routine
+    def inner():
+        return None
+
+    @traced_class
+    class TestClass:
+        @contextmanager
+        def open(self, value):
+            inner()
+            yield value
+            inner()
+
+    try:
+        with TestClass().open(5) as value:
+            assert value == 5
+            assert not [span for span in memory_exporter.get_finished_spans() if span.name == "TestClass.open"]
+            inner()
+
+        spans = memory_exporter.get_finished_spans()
+        open_span = _span_by_name(spans, "TestClass.open")
+        inner_spans = [span for span in spans if span.name.endswith(".inner")]
+        assert len(inner_spans) == 3
+        assert all(span.parent.span_id == open_span.context.span_id for span in inner_spans)
+        assert open_span.attributes["function.status"] == "success"
+    finally:
+        set_mssdk_tracing(False)
+
+
+def test_archive_extract_temporary_span_covers_the_extraction(dummy_mapping_package_path: Path):
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+    try:
+        with ArchivePackageExtractor().extract_temporary(dummy_mapping_package_path) as temp_path:
+            assert temp_path.exists()
+
+        spans = memory_exporter.get_finished_spans()
+        extract_temporary_span = _span_by_name(spans, "ArchivePackageExtractor.extract_temporary")
+        extract_span = _span_by_name(spans, "ArchivePackageExtractor.extract")
+        assert extract_span.parent.span_id == extract_temporary_span.context.span_id
+    finally:
+        set_mssdk_tracing(False)
+
+
+def test_traced_coroutine_span_covers_the_awaiting():
+    set_mssdk_tracing(True)
+    memory_exporter.clear()
+
+    @traced_routine
+    def inner():
+        return 1
+
+    @traced_routine
+    async def load():
+        await asyncio.sleep(0)
+        return inner()
+
+    try:
+        assert asyncio.run(load()) == 1
+
+        spans = memory_exporter.get_finished_spans()
+        load_span = _span_by_name(spans, ".load")
+        assert _span_by_name(spans, ".inner").parent.span_id == load_span.context.span_id
+        assert load_span.attributes["function.status"] == "success"
+    finally:
+        set_mssdk_tracing(False)
+
+
+def test_unsampled_generator_does_not_trace_its_calls():
+    set_mssdk_tracing(True)
+
+    @traced_routine
+    def inner(value):
+        return value
+
+    @traced_routine
+    def generate():
+        yield inner(1)
+
+    try:
+        set_mssdk_tracing_sample_ratio(0)
+        memory_exporter.clear()
+        assert list(generate()) == [1]
+        assert memory_exporter.get_finished_spans() == ()
+    finally:
+        set_mssdk_tracing_sample_ratio(1)
+        set_mssdk_tracing(False)
+
+
+def test_generators_and_context_managers_follow_the_sampling_decision_once_returned():
+    """Test that generators and context managers created in a traced call keep its decision once it returned."""
+    set_mssdk_tracing(True)
+
+    @traced_routine
+    def inner(value):
+        return value
+
+    @traced_routine
+    def generate():
+        yield inner(1)
+
+    @traced_routine
+    @contextmanager
+    def manage():
+        yield inner(2)
+
+    @traced_routine
+    def create():
+        return generate(), manage()
+
+    try:
+        set_mssdk_tracing_sample_ratio(0.5)
+        memory_exporter.clear()
+        for _ in range(50):
+            generator, context_manager = create()
+            assert list(generator) == [1]
+            with context_manager as value:
+                assert value == 2
+        span_names = [span.name.rsplit(".", 1)[-1] for span in memory_exporter.get_finished_spans()]
+        assert 0 < span_names.count("create") < 50
+        assert span_names.count("generate") == span_names.count("manage") == span_names.count("create")
+        assert span_names.count("inner") == 2 * span_names.count("create")
+    finally:
+        set_mssdk_tracing_sample_ratio(1)
+        set_mssdk_tracing(False)
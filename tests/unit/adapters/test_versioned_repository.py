@@ -0,0 +1,136 @@
+import mongomock
+import pytest
+
+from mapping_suite_sdk.adapters.repository import ModelNotFoundError
+from mapping_suite_sdk.adapters.versioned_repository import MongoDBVersionedMappingPackageRepository, \
+    RevisionConflictError, CorruptedRevisionError, MSSDK_VERSIONED_REPOSITORY_COMMIT_ATTEMPTS
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+
+
+@pytest.fixture
+def dummy_versioned_repository(mongo_client: mongomock.MongoClient,
+                               dummy_database_name: str) -> MongoDBVersionedMappingPackageRepository:
+    return MongoDBVersionedMappingPackageRepository(mongo_client=mongo_client, database_name=dummy_database_name,
+                                                    snapshot_interval=3, ensure_indexes=True)
+
+
+def _next_revision(mapping_package: MappingPackage, revision: int) -> MappingPackage:
+    technical_mapping_suite = mapping_package.technical_mapping_suite.model_copy(deep=True)
+    technical_mapping_suite.files[0].content = f"{technical_mapping_suite.files[0].content}\n# revision {revision}"
+    metadata = mapping_package.metadata.model_copy(update={"mapping_version": f"1.{revision}.0"})
+    return mapping_package.model_copy(update={"id": f"package_{revision}", "metadata": metadata,
+                                              "technical_mapping_suite": technical_mapping_suite})
+
+
+def test_commit_and_rebuild_revisions(dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+                                      dummy_mapping_package_model: MappingPackage):
+    packages = [dummy_mapping_package_model]
+    for revision in range(2, 8):
+        packages.append(_next_revision(packages[-1], revision))
+
+    revisions = [dummy_versioned_repository.commit(mapping_package) for mapping_package in packages]
+
+    identifier = dummy_mapping_package_model.metadata.identifier
+    assert [revision.revision for revision in revisions] == list(range(1, 8))
+    assert [revision.is_snapshot for revision in revisions] == [True, False, False, True, False, False, True]
+    assert dummy_versioned_repository.list_revisions(identifier) == revisions
+    assert dummy_versioned_repository.list_identifiers() == [identifier]
+    for revision, mapping_package in zip(revisions, packages):
+        rebuilt_package = dummy_versioned_repository.read(identifier, revision.revision)
+        assert rebuilt_package.model_dump() == mapping_package.model_dump()
+        assert rebuilt_package.id == mapping_package.id
+    assert dummy_versioned_repository.read(identifier).id == packages[-1].id
+
+
+def test_revisions_store_only_changed_assets(dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+                                             dummy_mapping_package_model: MappingPackage):
+    dummy_versioned_repository.commit(dummy_mapping_package_model)
+    blob_count = dummy_versioned_repository.blobs_collection.count_documents({})
+
+    dummy_versioned_repository.commit(_next_revision(dummy_mapping_package_model, 2))
+
+    assert dummy_versioned_repository.blobs_collection.count_documents({}) == blob_count + 1
+    delta = dummy_versioned_repository.revisions_collection.find_one({"revision": 2})
+    assert "manifest" not in delta
+    assert len(delta["changes"]) < 1024
+
+
+def test_commit_of_unchanged_package_returns_latest_revision(
+        dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+        dummy_mapping_package_model: MappingPackage):
+    revision = dummy_versioned_repository.commit(dummy_mapping_package_model)
+
+    assert dummy_versioned_repository.commit(dummy_mapping_package_model) == revision
+    assert len(dummy_versioned_repository.list_revisions(dummy_mapping_package_model.metadata.identifier)) == 1
+
+
+def test_read_fails_on_missing_revision(dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+                                        dummy_mapping_package_model: MappingPackage):
+    with pytest.raises(ModelNotFoundError):
+        dummy_versioned_repository.read("missing")
+
+    dummy_versioned_repository.commit(dummy_mapping_package_model)
+    with pytest.raises(ModelNotFoundError):
+        dummy_versioned_repository.read(dummy_mapping_package_model.metadata.identifier, 2)
+
+
+def test_commit_retries_on_concurrent_commit(dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+                                             dummy_mapping_package_model: MappingPackage, monkeypatch):
+    dummy_versioned_repository.commit(dummy_mapping_package_model)
+    get_latest_revision = dummy_versioned_repository.get_latest_revision
+    latest_revisions = iter([None])
+    # The first attempt sees the lineage as it was before a concurrent commit of revision 1
+    monkeypatch.setattr(dummy_versioned_repository, "get_latest_revision",
+                        lambda identifier: next(latest_revisions, None) or get_latest_revision(identifier))
+
+    revision = dummy_versioned_repository.commit(_next_revision(dummy_mapping_package_model, 2))
+
+    assert revision.revision == 2 and revision.parent_revision == 1
+    assert dummy_versioned_repository.read(revision.identifier).id == "package_2"
+
+
+def test_failed_commit_removes_its_blobs(dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+                                         dummy_mapping_package_model: MappingPackage, monkeypatch):
+    dummy_versioned_repository.commit(dummy_mapping_package_model)
+    blob_count = dummy_versioned_repository.blobs_collection.count_documents({})
+    latest_revision_calls = []
+    monkeypatch.setattr(dummy_versioned_repository, "get_latest_revision",
+                        lambda identifier: latest_revision_calls.append(identifier))
+
+    with pytest.raises(RevisionConflictError):
+        dummy_versioned_repository.commit(_next_revision(dummy_mapping_package_model, 2))
+
+    assert len(latest_revision_calls) == MSSDK_VERSIONED_REPOSITORY_COMMIT_ATTEMPTS
+    assert dummy_versioned_repository.blobs_collection.count_documents({}) == blob_count
+
+
+def test_removed_blobs_referenced_by_revisions_are_restored(
+        dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+        dummy_mapping_package_model: MappingPackage):
+    revision = dummy_versioned_repository.commit(dummy_mapping_package_model)
+    _, blobs = dummy_versioned_repository._to_manifest(dummy_mapping_package_model)
+
+    # As by a failed commit of the same blobs, concurrent with this one
+    dummy_versioned_repository._remove_blobs(list(blobs), blobs)
+
+    assert dummy_versioned_repository.blobs_collection.count_documents({}) == len(blobs)
+    assert dummy_versioned_repository.read(revision.identifier).id == dummy_mapping_package_model.id
+
+
+def test_read_fails_on_missing_blob(dummy_versioned_repository: MongoDBVersionedMappingPackageRepository,
+                                    dummy_mapping_package_model: MappingPackage):
+    revision = dummy_versioned_repository.commit(dummy_mapping_package_model)
+    dummy_versioned_repository.blobs_collection.delete_one({})
+
+    with pytest.raises(CorruptedRevisionError):
+        dummy_versioned_repository.read(revision.identifier)
+
+
+def test_versioned_repository_does_not_create_indexes_by_default(mongo_client: mongomock.MongoClient):
+    # A database of its own, as the indexes ensured by the other tests are cached for equal clients
+    repository = MongoDBVersionedMappingPackageRepository(mongo_client=mongo_client,
+                                                          database_name="versioned_indexes_database")
+
+    assert set(repository.revisions_collection.index_information()) <= {"_id_"}
+    index_names = repository.ensure_indexes()
+    assert set(index_names) <= set(repository.revisions_collection.index_information())
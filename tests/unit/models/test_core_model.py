@@ -1,13 +1,139 @@
+from mapping_suite_sdk.models.core import get_document_changes, apply_document_changes
 from tests.conftest import TestModel
 
 
-def test_core_model_has_same_id_on_changing_fields(sample_model: TestModel):
+def test_core_model_content_id_changes_on_changing_fields(sample_model: TestModel):
     another_model: TestModel = sample_model.model_copy()
 
     assert sample_model == another_model
     assert sample_model.id == another_model.id
+    assert another_model.has_content_id()
 
     another_model.name = "another_name"
 
     assert sample_model != another_model
-    assert sample_model.id == another_model.id
+    assert sample_model.id != another_model.id
+    assert another_model == TestModel(name="another_name", description="Test Description", count=5)
+
+    another_model.name = sample_model.name
+
+    assert sample_model == another_model
+
+
+def test_core_model_has_same_id_on_changing_fields_with_explicit_id():
+    model = TestModel(id="test1", name="Model 1", count=1)
+    another_model: TestModel = model.model_copy()
+
+    another_model.name = "another_name"
+
+    assert model != another_model
+    assert model.id == another_model.id
+    assert not another_model.has_content_id()
+
+
+def test_core_model_pinned_id_is_kept(sample_model: TestModel):
+    sample_model_id = sample_model.id
+
+    sample_model.pin_id()
+    sample_model.name = "another_name"
+
+    assert sample_model.id == sample_model_id
+    assert sample_model.model_copy(update={"id": "test1"}).id == "test1"
+
+
+def test_core_model_copy_with_update_recomputes_content_id(sample_model: TestModel):
+    another_model = sample_model.model_copy(update={"name": "another_name"})
+
+    assert another_model.id != sample_model.id
+    assert another_model == TestModel(name="another_name", description="Test Description", count=5)
+
+
+def test_core_models_are_hashable(sample_model: TestModel, dummy_mapping_package_model):
+    assert len({sample_model, sample_model.model_copy(), TestModel(name="other", count=1)}) == 2
+    assert {dummy_mapping_package_model: 1}[dummy_mapping_package_model.model_copy(deep=True)] == 1
+
+
+def test_core_model_content_id_changes_on_changing_nested_models(dummy_mapping_package_model):
+    another_package = dummy_mapping_package_model.model_copy(deep=True)
+    changed_file = another_package.technical_mapping_suite.files[0]
+
+    changed_file.content = "totally different"
+
+    assert another_package.id != dummy_mapping_package_model.id
+    assert another_package != dummy_mapping_package_model
+    assert len({dummy_mapping_package_model, another_package}) == 2
+    assert another_package.id == type(another_package).model_validate(another_package.model_dump()).id
+
+    changed_file.content = dummy_mapping_package_model.technical_mapping_suite.files[0].content
+
+    assert another_package == dummy_mapping_package_model
+    assert another_package in {dummy_mapping_package_model}
+    # The original package, sharing no models with the deep copy, is unchanged
+    assert dummy_mapping_package_model.technical_mapping_suite.files[0].content != "totally different"
+
+
+def test_core_model_shallow_copies_refresh_their_content_ids(dummy_mapping_package_model):
+    package_id = dummy_mapping_package_model.id
+    another_package = dummy_mapping_package_model.model_copy()
+
+    # Both packages hold the same metadata, so both are refreshed
+    another_package.metadata.title = "another title"
+
+    assert another_package.id == dummy_mapping_package_model.id != package_id
+
+
+def test_core_model_tracks_changes_since_persisted(sample_model: TestModel):
+    assert sample_model.get_changes() is None
+    assert sample_model.is_modified()
+
+    sample_model.mark_persisted()
+
+    assert sample_model.get_changes() == ({}, [])
+    assert not sample_model.is_modified()
+
+    sample_model.name = "another_name"
+
+    assert sample_model.get_changes() == ({"name": "another_name"}, [])
+    assert sample_model.is_modified()
+
+
+def test_core_model_reports_nested_changes_by_path(dummy_mapping_package_model):
+    dummy_mapping_package_model.mark_persisted()
+    technical_mapping_file = dummy_mapping_package_model.technical_mapping_suite.files[0]
+
+    technical_mapping_file.content = "changed content"
+
+    set_fields, unset_fields = dummy_mapping_package_model.get_changes()
+    assert set_fields == {"technical_mapping_suite.files.0.content": "changed content"}
+    assert unset_fields == []
+
+
+def test_core_model_copies_are_not_persisted(sample_model: TestModel):
+    sample_model.mark_persisted()
+
+    copied_model: TestModel = sample_model.model_copy(update={"id": "other_id"})
+
+    assert copied_model.get_changes() is None
+    assert copied_model.is_modified()
+    assert sample_model.model_copy(deep=True).get_changes() is None
+    assert sample_model.get_changes() == ({}, [])
+
+
+def test_core_model_change_tracking_does_not_affect_equality(sample_model: TestModel):
+    another_model: TestModel = sample_model.model_copy()
+
+    sample_model.mark_persisted()
+
+    assert sample_model == another_model
+    assert sample_model.model_dump() == another_model.model_dump()
+
+
+def test_document_changes_round_trip():
+    previous_document = {"name": "a", "files": [{"content": "x"}, {"content": "y"}], "removed": 1, "items": [1]}
+    document = {"name": "b", "files": [{"content": "x"}, {"content": "z", "path": "p"}], "items": [1, 2]}
+
+    changes = get_document_changes(previous_document, document)
+
+    assert changes == ({"name": "b", "files.1.content": "z", "files.1.path": "p", "items": [1, 2]}, ["removed"])
+    assert apply_document_changes(previous_document, changes) == document
+    assert previous_document["name"] == "a"
@@ -0,0 +1,54 @@
+import sys
+
+from mapping_suite_sdk.models.asset import RMLMappingAsset, TechnicalMappingSuite
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.models.memory_footprint import get_memory_footprint
+
+
+def test_asset_memory_footprint():
+    content = "x" * 10_000
+    asset = RMLMappingAsset(path="transformation/mappings/mapping.rml.ttl", content=content)
+
+    footprint = get_memory_footprint(asset)
+
+    assert footprint.files == 1
+    assert footprint.content_bytes == sys.getsizeof(content)
+    assert footprint.path_bytes > 0
+    assert footprint.overhead_bytes > 0
+    assert footprint.total_bytes == (footprint.content_bytes + footprint.path_bytes + footprint.cache_bytes
+                                     + footprint.overhead_bytes)
+
+
+def test_shared_contents_are_counted_once():
+    content = "x" * 10_000
+    suite = TechnicalMappingSuite(path="transformation/mappings",
+                                  files=[RMLMappingAsset(path=f"transformation/mappings/{index}.rml.ttl",
+                                                         content=content) for index in range(3)])
+
+    footprint = get_memory_footprint(suite)
+
+    assert footprint.files == 3
+    assert footprint.content_bytes == sys.getsizeof(content)
+
+
+def test_content_digest_cache_is_counted():
+    asset = RMLMappingAsset(path="transformation/mappings/mapping.rml.ttl", content="x" * 10_000)
+    cache_bytes = get_memory_footprint(asset).cache_bytes
+
+    asset.get_content_digest()
+
+    assert get_memory_footprint(asset).cache_bytes > cache_bytes
+
+
+def test_mapping_package_memory_footprint(dummy_mapping_package_model: MappingPackage):
+    footprint = dummy_mapping_package_model.memory_footprint()
+
+    technical_footprint = footprint.fields["technical_mapping_suite"]
+    assert technical_footprint.files == len(dummy_mapping_package_model.technical_mapping_suite.files)
+    assert technical_footprint.content_bytes >= sum(
+        len(file.content) for file in dummy_mapping_package_model.technical_mapping_suite.files)
+    assert footprint.fields["conceptual_mapping_asset"].content_bytes >= len(
+        dummy_mapping_package_model.conceptual_mapping_asset.content)
+    assert footprint.files == sum(field_footprint.files for field_footprint in footprint.fields.values())
+    assert footprint.total_bytes > sum(field_footprint.total_bytes for field_footprint in footprint.fields.values())
+    assert footprint.total_bytes == get_memory_footprint(dummy_mapping_package_model).total_bytes
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+from mapping_suite_sdk.models.asset import TechnicalMappingAsset
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.models.package_diff import ASSET_ADDED, ASSET_MODIFIED, ASSET_REMOVED
+from mapping_suite_sdk.services.diff_mapping_packages import diff_mapping_packages
+
+
+def test_diff_of_identical_packages_is_empty(dummy_mapping_package_model: MappingPackage):
+    package_diff = diff_mapping_packages(dummy_mapping_package_model, dummy_mapping_package_model.model_copy())
+
+    assert not package_diff.has_changes()
+    assert package_diff.byte_delta == 0
+
+
+def test_diff_reports_asset_changes_per_suite(dummy_mapping_package_model: MappingPackage):
+    new_package = dummy_mapping_package_model.model_copy(deep=True)
+    technical_mapping_files = new_package.technical_mapping_suite.files
+    modified_file, removed_file = technical_mapping_files[0], technical_mapping_files[1]
+    modified_file.content += "\n# changed"
+    technical_mapping_files.remove(removed_file)
+    technical_mapping_files.append(TechnicalMappingAsset(path=Path("added.rml.ttl"), content="added"))
+
+    package_diff = diff_mapping_packages(dummy_mapping_package_model, new_package)
+
+    assert package_diff.has_asset_changes()
+    assert [suite_diff.suite for suite_diff in package_diff.suite_diffs] == ["technical_mapping_suite"]
+    suite_diff = package_diff.suite_diffs[0]
+    assert [change.path for change in suite_diff.added] == ["added.rml.ttl"]
+    assert [change.path for change in suite_diff.removed] == [str(removed_file.path)]
+    assert [change.path for change in suite_diff.modified] == [str(modified_file.path)]
+    assert {change.change_type for change in suite_diff.changes} == {ASSET_ADDED, ASSET_REMOVED, ASSET_MODIFIED}
+    assert suite_diff.modified[0].byte_delta == len("\n# changed")
+    assert package_diff.byte_delta == len("\n# changed") + len("added") - len(removed_file.content.encode())
+
+
+def test_diff_reports_removed_suites_and_metadata_changes(dummy_mapping_package_model: MappingPackage):
+    metadata = dummy_mapping_package_model.metadata.model_copy(update={"mapping_version": "9.9.9"})
+    new_package = dummy_mapping_package_model.model_copy(update={"metadata": metadata, "test_suites_sparql": []})
+
+    package_diff = diff_mapping_packages(dummy_mapping_package_model, new_package)
+
+    assert [(change.field, change.new_value) for change in package_diff.metadata_changes] == [
+        ("mapping_version", "9.9.9")]
+    assert package_diff.suite_diffs
+    assert all(suite_diff.suite.startswith("test_suites_sparql/") for suite_diff in package_diff.suite_diffs)
+    assert all(change.change_type == ASSET_REMOVED for suite_diff in package_diff.suite_diffs
+               for change in suite_diff.changes)
+
+
+def test_asset_content_digest_is_recomputed_on_content_change(dummy_mapping_package_model: MappingPackage):
+    asset = dummy_mapping_package_model.technical_mapping_suite.files[0]
+    digest = asset.get_content_digest()
+
+    assert asset.get_content_digest() == digest
+    asset.content = asset.content + " "
+    assert asset.get_content_digest() != digest
@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 import tempfile
 from pathlib import Path
@@ -5,14 +6,18 @@ from typing import List
 
 import mongomock
 import pytest
+from mongomock_motor import AsyncMongoMockClient
 
 from mapping_suite_sdk.adapters.extractor import ArchivePackageExtractor
 from mapping_suite_sdk.adapters.loader import MappingPackageLoader
 from mapping_suite_sdk.models.mapping_package import MappingPackage
 from mapping_suite_sdk.services.load_mapping_package import load_mapping_package_from_folder, \
-    load_mapping_package_from_archive, load_mapping_packages_from_github, load_mapping_package_from_mongo_db
-from tests.conftest import assert_valid_mapping_package, _setup_temporary_test_git_repository
-from mapping_suite_sdk.adapters.repository import MongoDBRepository, ModelNotFoundError
+    load_mapping_package_from_archive, load_mapping_packages_from_github, load_mapping_package_from_mongo_db, \
+    load_mapping_package_metadata_from_archive, load_mapping_packages_from_archive, iter_mapping_packages_from_archive, \
+    load_mapping_package_from_mongo_db_async
+from tests.conftest import assert_valid_mapping_package, _setup_temporary_test_git_repository, \
+    _setup_temporary_multi_package_archive
+from mapping_suite_sdk.adapters.repository import MongoDBRepository, ModelNotFoundError, AsyncMongoDBRepository
 
 
 def test_load_mapping_package_from_folder(dummy_mapping_package_path: Path):
@@ -80,6 +85,65 @@ def test_load_mapping_package_from_archive_with_success(dummy_mapping_package_pa
     assert_valid_mapping_package(mapping_package=mapping_package)
 
 
+def test_load_mapping_package_metadata_from_archive_with_success(dummy_mapping_package_path: Path):
+    mapping_package: MappingPackage = load_mapping_package_from_archive(
+        mapping_package_archive_path=dummy_mapping_package_path)
+
+    metadata = load_mapping_package_metadata_from_archive(mapping_package_archive=dummy_mapping_package_path)
+    assert metadata == mapping_package.metadata
+
+    with dummy_mapping_package_path.open("rb") as archive_stream:
+        metadata = load_mapping_package_metadata_from_archive(mapping_package_archive=archive_stream,
+                                                              archive_unpacker=ArchivePackageExtractor())
+    assert metadata == mapping_package.metadata
+
+
+def test_load_mapping_package_metadata_from_archive_gets_invalid_archive(dummy_corrupted_mapping_package_path: Path):
+    with pytest.raises(FileNotFoundError):
+        load_mapping_package_metadata_from_archive(mapping_package_archive=Path("/non/existing/path"))
+    with pytest.raises(ValueError):
+        load_mapping_package_metadata_from_archive(mapping_package_archive=dummy_corrupted_mapping_package_path)
+
+
+def test_load_mapping_packages_from_archive_with_success(dummy_github_project_path: Path,
+                                                         dummy_packages_path_pattern: str):
+    with _setup_temporary_multi_package_archive(dummy_github_project_path) as archive_path:
+        mapping_packages: List[MappingPackage] = load_mapping_packages_from_archive(
+            mapping_package_archive_path=archive_path,
+            packages_path_pattern=dummy_packages_path_pattern,
+            max_workers=2)
+
+        assert len(mapping_packages) == 2
+        for mapping_package in mapping_packages:
+            assert_valid_mapping_package(mapping_package)
+
+        lazy_mapping_packages = iter_mapping_packages_from_archive(
+            mapping_package_archive_path=archive_path,
+            packages_path_pattern=dummy_packages_path_pattern)
+
+        assert list(lazy_mapping_packages) == mapping_packages
+
+
+def test_load_mapping_packages_from_archive_fails_on_non_existing_pattern(dummy_github_project_path: Path,
+                                                                          dummy_non_existing_pattern: str):
+    with _setup_temporary_multi_package_archive(dummy_github_project_path) as archive_path:
+        with pytest.raises(ValueError):
+            load_mapping_packages_from_archive(mapping_package_archive_path=archive_path,
+                                               packages_path_pattern=dummy_non_existing_pattern)
+        with pytest.raises(ValueError):
+            iter_mapping_packages_from_archive(mapping_package_archive_path=archive_path,
+                                               packages_path_pattern=dummy_non_existing_pattern)
+        with pytest.raises(ValueError):
+            load_mapping_packages_from_archive(mapping_package_archive_path=archive_path,
+                                               packages_path_pattern=None)
+
+
+def test_load_mapping_packages_from_archive_fails_on_invalid_path(dummy_packages_path_pattern: str):
+    with pytest.raises(FileNotFoundError):
+        load_mapping_packages_from_archive(mapping_package_archive_path=Path("/non/existing/path"),
+                                           packages_path_pattern=dummy_packages_path_pattern)
+
+
 def test_load_mapping_packages_from_github_with_success(dummy_github_project_path: Path,
                                                         dummy_github_branch_name: str,
                                                         dummy_packages_path_pattern: str):
@@ -199,3 +263,32 @@ def test_load_mapping_package_from_mongo_db_with_success(mongo_client: mongomock
 
     assert mapping_package == dummy_mapping_package_model
 
+
+def test_load_mapping_package_from_mongo_db_async_with_success(async_mongo_client: AsyncMongoMockClient,
+                                                               dummy_mapping_package_model: MappingPackage):
+    mongodb_repo = AsyncMongoDBRepository(
+        model_class=MappingPackage,
+        mongo_client=async_mongo_client,
+        database_name="test_db"
+    )
+    asyncio.run(mongodb_repo.create(dummy_mapping_package_model))
+
+    mapping_package = asyncio.run(load_mapping_package_from_mongo_db_async(
+        mapping_package_id=dummy_mapping_package_model.id,
+        mapping_package_repository=mongodb_repo
+    ))
+
+    assert mapping_package == dummy_mapping_package_model
+
+
+def test_load_mapping_package_from_mongo_db_async_fails_on_invalid_args(
+        dummy_async_mongo_repository: AsyncMongoDBRepository):
+    with pytest.raises(ValueError):
+        asyncio.run(load_mapping_package_from_mongo_db_async(mapping_package_id="",
+                                                             mapping_package_repository=dummy_async_mongo_repository))
+    with pytest.raises(ValueError):
+        asyncio.run(load_mapping_package_from_mongo_db_async(mapping_package_id="some_id",
+                                                             mapping_package_repository=None))
+    with pytest.raises(ModelNotFoundError):
+        asyncio.run(load_mapping_package_from_mongo_db_async(mapping_package_id="non_existing_id",
+                                                             mapping_package_repository=dummy_async_mongo_repository))
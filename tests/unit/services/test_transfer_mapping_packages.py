@@ -0,0 +1,79 @@
+import io
+import tempfile
+from pathlib import Path
+from typing import List
+
+import mongomock
+import pytest
+
+from mapping_suite_sdk.adapters.filesystem_repository import FileSystemRepository
+from mapping_suite_sdk.adapters.model_stream import ModelStreamError, MSSDK_MODEL_STREAM_FORMAT_BINARY, \
+    MSSDK_MODEL_STREAM_FORMAT_NDJSON
+from mapping_suite_sdk.adapters.repository import MongoDBRepository
+from mapping_suite_sdk.models.mapping_package import MappingPackage
+from mapping_suite_sdk.services.transfer_mapping_packages import export_mapping_packages, import_mapping_packages
+
+
+@pytest.fixture
+def dummy_mapping_packages(dummy_mapping_package_model: MappingPackage) -> List[MappingPackage]:
+    mapping_packages = []
+    for index in range(3):
+        metadata = dummy_mapping_package_model.metadata.model_copy(update={"identifier": f"package_{index}"})
+        mapping_packages.append(dummy_mapping_package_model.model_copy(update={"id": f"package_{index}",
+                                                                               "metadata": metadata}))
+    return mapping_packages
+
+
+@pytest.fixture
+def dummy_mapping_package_mongo_repository(mongo_client: mongomock.MongoClient,
+                                           dummy_database_name: str) -> MongoDBRepository:
+    return MongoDBRepository(model_class=MappingPackage, mongo_client=mongo_client,
+                             database_name=dummy_database_name)
+
+
+@pytest.mark.parametrize("stream_format", [MSSDK_MODEL_STREAM_FORMAT_NDJSON, MSSDK_MODEL_STREAM_FORMAT_BINARY])
+def test_export_and_import_round_trip(dummy_mapping_package_mongo_repository: MongoDBRepository,
+                                      dummy_mapping_packages: List[MappingPackage], tmp_path: Path,
+                                      stream_format: str):
+    dummy_mapping_package_mongo_repository.create_many(dummy_mapping_packages)
+    output_stream = io.BytesIO()
+
+    assert export_mapping_packages(dummy_mapping_package_mongo_repository, output_stream,
+                                   stream_format=stream_format) == 3
+
+    target_repository = FileSystemRepository(model_class=MappingPackage, root_path=tmp_path)
+    assert import_mapping_packages(target_repository, io.BytesIO(output_stream.getvalue()), batch_size=2) == 3
+    imported_packages = {mapping_package.id: mapping_package for mapping_package in target_repository.read_many()}
+    for mapping_package in dummy_mapping_packages:
+        assert imported_packages[mapping_package.id].model_dump() == mapping_package.model_dump()
+
+
+def test_export_writes_shared_assets_once(dummy_mapping_package_mongo_repository: MongoDBRepository,
+                                          dummy_mapping_packages: List[MappingPackage]):
+    dummy_mapping_package_mongo_repository.create_many(dummy_mapping_packages[:1])
+    single_package_stream = io.BytesIO()
+    export_mapping_packages(dummy_mapping_package_mongo_repository, single_package_stream)
+    dummy_mapping_package_mongo_repository.create_many(dummy_mapping_packages[1:])
+    all_packages_stream = io.BytesIO()
+    export_mapping_packages(dummy_mapping_package_mongo_repository, all_packages_stream)
+
+    assert len(all_packages_stream.getvalue()) < 2 * len(single_package_stream.getvalue())
+
+
+def test_export_with_filters(dummy_mapping_package_mongo_repository: MongoDBRepository,
+                             dummy_mapping_packages: List[MappingPackage]):
+    dummy_mapping_package_mongo_repository.create_many(dummy_mapping_packages)
+
+    assert export_mapping_packages(dummy_mapping_package_mongo_repository, io.BytesIO(),
+                                   filters={"metadata.identifier": "package_1"}) == 1
+
+
+def test_import_fails_on_invalid_stream(dummy_mapping_package_mongo_repository: MongoDBRepository,
+                                       tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    with pytest.raises(ModelStreamError):
+        import_mapping_packages(dummy_mapping_package_mongo_repository, io.BytesIO(b'{"kind": "model"}\n'))
+    with pytest.raises(ModelStreamError):
+        import_mapping_packages(dummy_mapping_package_mongo_repository, io.BytesIO(b"MSSDKMS\x01H"))
+    assert list(tmp_path.iterdir()) == []
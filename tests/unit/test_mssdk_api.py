@@ -1,6 +1,11 @@
+import subprocess
 import sys
 
 import mapping_suite_sdk
+from tests import TESTS_PATH
+
+# Dependencies only imported when the adapters using them are
+_HEAVY_DEPENDENCIES = {"git", "pymongo", "bson", "motor", "numpy", "opentelemetry"}
 
 
 def test_module_imports():
@@ -24,3 +29,37 @@ def test_all_list_consistency():
         # Should be able to import each item from mapping_suite_sdk
         imported_item = getattr(mapping_suite_sdk, item)
         assert imported_item is not None, f"Failed to import {item} from mapping_suite_sdk"
+
+
+def test_unknown_attribute_raises_attribute_error():
+    assert not hasattr(mapping_suite_sdk, "UnknownComponent")
+
+
+def _get_imported_modules(code: str) -> set:
+    """Run code in a fresh interpreter, and get the top level packages of the modules it imported."""
+    output = subprocess.run([sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+                            cwd=TESTS_PATH.parent, check=True, capture_output=True, text=True).stdout
+    return {module_name.split(".")[0] for module_name in output.split()}
+
+
+def test_package_import_is_lazy():
+    imported_modules = _get_imported_modules("import mapping_suite_sdk")
+
+    assert "mapping_suite_sdk" in imported_modules
+    assert not imported_modules & _HEAVY_DEPENDENCIES
+
+
+def test_loading_packages_does_not_import_unused_adapters():
+    imported_modules = _get_imported_modules(
+        "from mapping_suite_sdk import load_mapping_package_metadata_from_archive, load_mapping_package_from_archive\n"
+        "import mapping_suite_sdk.adapters.tracer as tracer\n"
+        "assert tracer._MSSDK_TRACER_PROVIDER is None")
+
+    assert not imported_modules & _HEAVY_DEPENDENCIES
+
+
+def test_sync_mongodb_repositories_do_not_import_motor():
+    imported_modules = _get_imported_modules("from mapping_suite_sdk import MongoDBRepository")
+
+    assert "pymongo" in imported_modules
+    assert "motor" not in imported_modules